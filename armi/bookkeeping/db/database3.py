@@ -41,6 +41,8 @@ import re
 import shutil
 import subprocess
 import sys
+import zlib
+from concurrent import futures
 from platform import uname
 from typing import (
     Optional,
@@ -67,9 +69,10 @@ from armi.bookkeeping.db.layout import (
     replaceNonesWithNonsense,
     replaceNonsenseWithNones,
 )
-from armi.bookkeeping.db.typedefs import History, Histories
+from armi.bookkeeping.db.typedefs import History, Histories, HistoryArrays
 from armi.nucDirectory import nuclideBases
 from armi.physics.neutronics.settings import CONF_LOADING_FILE
+from armi.reactor import composites
 from armi.reactor import grids
 from armi.reactor import parameters
 from armi.reactor import systemLayoutInput
@@ -87,6 +90,20 @@ from armi.utils.textProcessors import resolveMarkupInclusions
 # CONSTANTS
 _SERIALIZER_NAME = "serializerName"
 _SERIALIZER_VERSION = "serializerVersion"
+COMPRESSION_OPTIONS = ("gzip", "lzf", "none")
+# target uncompressed size of a chunk when chunks are not specified explicitly
+_TARGET_CHUNK_BYTES = 2**20
+# parameters that are always loaded, even if not requested, because they are needed to
+# rebuild and process the reactor model
+_STRUCTURAL_PARAMS = frozenset(
+    {"serialNum", "flags", "type", "assemNum", "height", "molesHmBOL"}
+)
+
+# component parameters that, along with the dimensions, define the geometry and
+# composition of a component
+_COMPONENT_STATE_PARAMS = frozenset(
+    {"mult", "modArea", "temperatureInC", "numberDensities", "zrFrac"}
+)
 
 
 def getH5GroupName(cycle: int, timeNode: int, statePointName: str = None) -> str:
@@ -153,6 +170,21 @@ class Database3:
             self._versionMajor = None
             self._versionMinor = None
 
+        # How parameter datasets are stored; see ``setDatasetOptions``
+        self._datasetOptions: Dict[str, Any] = getDatasetOptions()
+        self._paramDatasetOptions: Dict[str, Dict[str, Any]] = {}
+
+        # If True, parameter data are compressed and written on a background thread so
+        # that the caller of ``writeToDB`` can move on. See ``waitForWrites``.
+        self.writeInBackground: bool = False
+        self._compressionPool: Optional[futures.ThreadPoolExecutor] = None
+        self._writerPool: Optional[futures.ThreadPoolExecutor] = None
+        self._pendingWrite: Optional[futures.Future] = None
+
+        # Serial number lookups for time nodes that have been read for histories, keyed
+        # by time node group name. See ``_getTimeNodeIndex``.
+        self._timeNodeIndices: Dict[str, _TimeNodeIndex] = {}
+
     @property
     def version(self) -> str:
         return self._version
@@ -183,6 +215,7 @@ class Database3:
             )
         filePath = self._fileName
         self._openCount += 1
+        self._timeNodeIndices = {}
 
         if self._permission in {"r", "a"}:
             self._fullPath = os.path.abspath(filePath)
@@ -289,6 +322,16 @@ class Database3:
         if self.h5db is None:
             return
 
+        try:
+            self.waitForWrites()
+        finally:
+            for pool in (self._writerPool, self._compressionPool):
+                if pool is not None:
+                    pool.shutdown()
+            self._writerPool = None
+            self._compressionPool = None
+            self._timeNodeIndices = {}
+
         if self._permission == "w":
             self.h5db.attrs["successfulCompletion"] = completedSuccessfully
             # a bit redundant to call flush, but with unreliable IO issues, why not?
@@ -333,6 +376,7 @@ class Database3:
         if self.h5db is None:
             raise ValueError("There is no open database to split.")
 
+        self.waitForWrites()
         self.h5db.close()
 
         backupDBPath = os.path.abspath(label.join(os.path.splitext(self._fileName)))
@@ -341,6 +385,8 @@ class Database3:
             shutil.move(self._fullPath, backupDBPath)
 
         self.h5db = h5py.File(self._fullPath, self._permission)
+        # the time nodes are copied into a new layout, and some of them renamed
+        self._timeNodeIndices = {}
         dbOut = self.h5db
 
         with h5py.File(backupDBPath, "r") as dbIn:
@@ -514,6 +560,8 @@ class Database3:
         The current time step (being loaded from) should not be copied, as that
         time steps data will be written at the end of the time step.
         """
+        self.waitForWrites()
+        inputDB.waitForWrites()
         # iterate over the top level H5Groups and copy
         for time, h5ts in zip(inputDB.genTimeSteps(), inputDB.genTimeStepGroups()):
             cyc, tn = time
@@ -561,6 +609,8 @@ class Database3:
     def __delitem__(self, tn: Tuple[int, int, Optional[str]]):
         cycle, timeNode, statePointName = tn
         name = getH5GroupName(cycle, timeNode, statePointName)
+        self.waitForWrites()
+        self._timeNodeIndices.pop("/" + name, None)
         if self.h5db is not None:
             del self.h5db[name]
 
@@ -571,6 +621,7 @@ class Database3:
         assert (
             self.h5db is not None
         ), "Must open the database before calling genTimeStepGroups"
+        self.waitForWrites()
         if timeSteps is None:
             for groupName, h5TimeNodeGroup in sorted(self.h5db.items()):
                 match = self.timeNodeGroupPattern.match(groupName)
@@ -584,6 +635,7 @@ class Database3:
         """Return a Layout object representing the requested cycle and time node."""
         version = (self._versionMajor, self._versionMinor)
         timeGroupName = getH5GroupName(cycle, node)
+        self.waitForWrites()
 
         return Layout(version, self.h5db[timeGroupName])
 
@@ -592,6 +644,7 @@ class Database3:
         assert (
             self.h5db is not None
         ), "Must open the database before calling genTimeSteps"
+        self.waitForWrites()
         for groupName in sorted(self.h5db.keys()):
             match = self.timeNodeGroupPattern.match(groupName)
             if match:
@@ -604,6 +657,7 @@ class Database3:
         assert (
             self.h5db is not None
         ), "Must open the database before calling genAuxiliaryData"
+        self.waitForWrites()
         cycle, node = ts
         groupName = getH5GroupName(cycle, node)
         timeGroup = self.h5db[groupName]
@@ -626,6 +680,7 @@ class Database3:
         at the correct timestep.
         """
         groupName = getH5GroupName(r.p.cycle, r.p.timeNode, statePointName)
+        self.waitForWrites()
         if groupName in self.h5db:
             return self.h5db[groupName]
         else:
@@ -636,19 +691,72 @@ class Database3:
 
     def hasTimeStep(self, cycle, timeNode, statePointName=""):
         """Returns True if (cycle, timeNode, statePointName) is contained in the database."""
+        self.waitForWrites()
         return getH5GroupName(cycle, timeNode, statePointName) in self.h5db
 
+    def setDatasetOptions(self, compression="gzip", paramOptions=None):
+        """
+        Configure how parameter datasets are stored in the HDF5 file.
+
+        Parameters
+        ----------
+        compression : str, optional
+            The compression filter to use for all parameters; one of
+            ``COMPRESSION_OPTIONS``.
+        paramOptions : dict, optional
+            Parameter name keys and dicts of keyword arguments to
+            :py:func:`getDatasetOptions` values, overriding the default storage for
+            specific parameters. For instance, frequently-written scalar parameters
+            can be stored without compression, or with ``lzf``.
+        """
+        self._datasetOptions = getDatasetOptions(compression)
+        self._paramDatasetOptions = {}
+        for paramName, options in (paramOptions or {}).items():
+            options = dict(options)
+            options.setdefault("compression", compression)
+            self._paramDatasetOptions[paramName] = getDatasetOptions(**options)
+
     def writeToDB(self, reactor, statePointName=None):
+        """
+        Write the state of the reactor to the database.
+
+        Parameter data for each composite type are gathered from the reactor first.
+        Then they are compressed and written to the HDF5 file. If ``writeInBackground``
+        is set, the second step runs on a background thread and this returns as soon as
+        the data are gathered. Any operation on the database that needs the data will
+        wait for the write to finish (see ``waitForWrites``).
+        """
         assert self.h5db is not None, "Database must be open before writing."
-        # _createLayout is recursive
         h5group = self.getH5Group(reactor, statePointName)
         runLog.info("Writing to database for statepoint: {}".format(h5group.name))
+        self._timeNodeIndices.pop(h5group.name, None)
         layout = Layout((self.versionMajor, self.versionMinor), comp=reactor)
         layout.writeToDB(h5group)
         groupedComps = layout.groupedComps
 
+        datasets = []
         for comps in groupedComps.values():
-            self._writeParams(h5group, comps)
+            datasets.extend(self._collectParams(comps))
+
+        if self.writeInBackground:
+            if self._writerPool is None:
+                self._writerPool = futures.ThreadPoolExecutor(max_workers=1)
+            self._pendingWrite = self._writerPool.submit(
+                self._writeParams, h5group, datasets
+            )
+        else:
+            self._writeParams(h5group, datasets)
+
+    def waitForWrites(self):
+        """
+        Block until any parameter data being written in the background are in the file.
+
+        Errors encountered while writing in the background are raised here.
+        """
+        if self._pendingWrite is not None:
+            pendingWrite = self._pendingWrite
+            self._pendingWrite = None
+            pendingWrite.result()
 
     def syncToSharedFolder(self):
         """
@@ -664,6 +772,7 @@ class Database3:
         would render this kind of operation unnecessary.
         """
         runLog.extra("Copying DB to shared working directory.")
+        self.waitForWrites()
         self.h5db.flush()
         shutil.copy(self._fullPath, self._fileName)
 
@@ -675,6 +784,7 @@ class Database3:
         bp=None,
         statePointName=None,
         allowMissing=False,
+        params=None,
     ):
         """Load a new reactor from (cycle, node).
 
@@ -704,6 +814,13 @@ class Database3:
         allowMissing : bool, optional
             Whether to emit a warning, rather than crash if reading a database
             with undefined parameters. Default False.
+        params : iterable of str, optional
+            If provided, only these parameters are read; all others are left at their
+            defaults. This makes loading much faster when only a few parameters are of
+            interest (e.g., in post-processing). The few parameters needed to rebuild
+            the reactor (e.g., ``flags``), and the dimensions, temperatures and number
+            densities of Components, are always read. More parameters can be read
+            later with :py:meth:`loadParams`, for all objects or only selected ones.
 
         Returns
         -------
@@ -723,14 +840,28 @@ class Database3:
                 )
             node = numNodes + node
 
+        self.waitForWrites()
         h5group = self.h5db[getH5GroupName(cycle, node, statePointName)]
 
         layout = Layout((self.versionMajor, self.versionMinor), h5group=h5group)
         comps, groupedComps = layout._initComps(cs.caseTitle, bp)
 
         # populate data onto initialized components
+        requestedParams = None if params is None else _STRUCTURAL_PARAMS.union(params)
         for compType, compTypeList in groupedComps.items():
-            self._readParams(h5group, compType, compTypeList, allowMissing=allowMissing)
+            Klass = ArmiObject.TYPES[compType]
+            typeParams = requestedParams
+            if requestedParams is not None and issubclass(Klass, Component):
+                typeParams = requestedParams.union(
+                    _COMPONENT_STATE_PARAMS, Klass.DIMENSION_NAMES
+                )
+            self._readParams(
+                h5group,
+                compType,
+                compTypeList,
+                allowMissing=allowMissing,
+                params=typeParams,
+            )
 
         # assign params from blueprints
         if bp is not None:
@@ -756,6 +887,96 @@ class Database3:
             )
         return root
 
+    def loadParams(
+        self,
+        root,
+        cycle,
+        node,
+        params,
+        statePointName=None,
+        allowMissing=False,
+        predicate=None,
+    ):
+        """
+        Read parameters from the database onto an existing reactor model.
+
+        This is intended to complement ``load(..., params=...)``: load a reactor with
+        only the parameters needed up front, and read others as they are needed. The
+        objects are matched to the database by serial number, so ``root`` must have
+        been loaded from this database, though it may be any object in the tree.
+
+        Parameters
+        ----------
+        root : ArmiObject
+            The object to read parameters onto, along with all of its children.
+        cycle : int
+            Cycle number
+        node : int
+            Time node
+        params : iterable of str
+            The names of the parameters to read.
+        statePointName : str, optional
+            Optional arbitrary statepoint name
+        allowMissing : bool, optional
+            Whether to emit a warning, rather than crash if reading a database
+            with undefined parameters. Default False.
+        predicate : callable, optional
+            Only read parameters onto the objects under ``root`` (and ``root`` itself)
+            for which this returns True, e.g., to select objects by type, flags or
+            location. All of them are read onto by default.
+
+        Examples
+        --------
+        >>> db.loadParams(
+        ...     r.core, 1, 0, ["percentBu"],
+        ...     predicate=lambda o: isinstance(o, Block) and o.hasFlags(Flags.FUEL),
+        ... )
+        """
+        self.waitForWrites()
+        h5group = self.h5db[getH5GroupName(cycle, node, statePointName)]
+        layout = Layout((self.versionMajor, self.versionMinor), h5group=h5group)
+
+        compsByType = collections.defaultdict(list)
+        rowsByType = collections.defaultdict(list)
+        allComps = [root] if predicate is None or predicate(root) else []
+        allComps.extend(root.getChildren(deep=True, predicate=predicate))
+        for comp in allComps:
+            compType = comp.__class__.__name__
+            try:
+                layoutIndex = layout._snToLayoutIndex[comp.p.serialNum]
+            except KeyError:
+                raise KeyError(
+                    "{} is not in the {} time node of {}; was it loaded from this "
+                    "database?".format(comp, h5group.name, self)
+                )
+            assert layout.type[layoutIndex] == compType
+            compsByType[compType].append(comp)
+            rowsByType[compType].append(layout.indexInData[layoutIndex])
+
+        params = set(params)
+        for compType, comps in compsByType.items():
+            if compType not in h5group:
+                continue
+            self._readParams(
+                h5group,
+                compType,
+                comps,
+                allowMissing=allowMissing,
+                params=params,
+                rows=numpy.array(rowsByType[compType]),
+            )
+
+        # linked dimensions are read as "name.dimension" strings, like in ``load``
+        parents = {
+            id(c.parent): c.parent
+            for c in allComps
+            if isinstance(c, Component) and c.parent is not None
+        }
+        for parent in parents.values():
+            siblings = {c.name: c for c in parent if isinstance(c, Component)}
+            for c in siblings.values():
+                c.resolveLinkedDims(siblings)
+
     @staticmethod
     def _assignBlueprintsParams(blueprints, groupedComps):
         for compType, designs in (
@@ -835,16 +1056,22 @@ class Database3:
 
         return comp
 
-    def _writeParams(self, h5group, comps):
+    def _collectParams(self, comps):
+        """
+        Gather the parameter data for a group of composites of the same type.
+
+        This reads everything that needs to be stored out of the reactor model, so that
+        the data may be written to the file without touching the reactor afterwards.
+
+        Returns
+        -------
+        list
+            ``(groupName, datasetName, data, attrs)`` tuples, one for each dataset to
+            create; see ``_writeParams``.
+        """
         c = comps[0]
         groupName = c.__class__.__name__
-        if groupName not in h5group:
-            # Only create the group if it doesnt already exist. This happens when
-            # re-writing params in the same time node (e.g. something changed between
-            # EveryNode and EOC)
-            g = h5group.create_group(groupName)
-        else:
-            g = h5group[groupName]
+        datasets = []
 
         for paramDef in c.p.paramDefs.toWriteToDB():
             attrs = {}
@@ -866,9 +1093,13 @@ class Database3:
                 if any(linkedDims):
                     attrs["linkedDims"] = numpy.array(linkedDims).astype("S")
             else:
-                # NOTE: after loading, the previously unset values will be defaulted
-                temp = [c.p.get(paramDef.name, paramDef.default) for c in comps]
+                # NOTE: after loading, the previously unset values will be defaulted.
+                # Going straight to the underlying field is equivalent to
+                # ``c.p.get(paramDef.name, paramDef.default)``, but much faster.
+                fieldName = paramDef.fieldName
+                default = paramDef.default
                 if paramDef.serializer is not None:
+                    temp = [getattr(c.p, fieldName, default) for c in comps]
                     data, sAttrs = paramDef.serializer.pack(temp)
                     assert (
                         data.dtype.kind != "O"
@@ -878,9 +1109,15 @@ class Database3:
                     attrs.update(sAttrs)
                     attrs[_SERIALIZER_NAME] = paramDef.serializer.__name__
                     attrs[_SERIALIZER_VERSION] = paramDef.serializer.version
+                elif c.p.usesArrayStorage() and default is not parameters.NoDefault:
+                    # the same values, but read a whole column at a time
+                    data = parameters.getParamValues(
+                        (c.p for c in comps), paramDef.name
+                    )
                 else:
-                    data = numpy.array(temp)
-                    del temp
+                    data = numpy.array(
+                        [getattr(c.p, fieldName, default) for c in comps]
+                    )
 
             # Convert Unicode to byte-string
             if data.dtype.kind == "U":
@@ -918,41 +1155,96 @@ class Database3:
             if data is None:
                 continue
 
+            datasets.append((groupName, paramDef.name, data, attrs))
+
+        if isinstance(c, Block):
+            datasets.extend(
+                (groupName, nucName, numDens, {})
+                for nucName, numDens in self._getHomogenizedNumberDensityParams(comps)
+            )
+
+        return datasets
+
+    def _writeParams(self, h5group, datasets):
+        """
+        Write parameter data gathered by ``_collectParams`` to a time node group.
+
+        Parameters
+        ----------
+        h5group : h5py.Group
+            The time node group to write to.
+        datasets : list
+            ``(groupName, datasetName, data, attrs)`` tuples. Each dataset is written
+            to ``h5group/groupName/datasetName``, using the storage options for that
+            dataset name.
+        """
+        if self._compressionPool is None:
+            self._compressionPool = futures.ThreadPoolExecutor(
+                max_workers=min(4, os.cpu_count() or 1)
+            )
+
+        for groupName, name, data, attrs in datasets:
+            if groupName not in h5group:
+                # Only create the group if it doesnt already exist. This happens when
+                # re-writing params in the same time node (e.g. something changed
+                # between EveryNode and EOC)
+                g = h5group.create_group(groupName)
+            else:
+                g = h5group[groupName]
+
             try:
-                if paramDef.name in g:
+                if name in g:
                     raise ValueError(
                         "`{}` was already in `{}`. This time node "
-                        "should have been empty".format(paramDef.name, g)
+                        "should have been empty".format(name, g)
                     )
 
-                dataset = g.create_dataset(paramDef.name, data=data, compression="gzip")
+                options = self._paramDatasetOptions.get(name, self._datasetOptions)
+                dataset = _createDataset(
+                    g, name, data, self._compressionPool, **options
+                )
                 if any(attrs):
                     Database3._writeAttrs(dataset, h5group, attrs)
             except Exception:
                 runLog.error(
-                    "Failed to write {} to database. Data: "
-                    "{}".format(paramDef.name, data)
+                    "Failed to write {} to database. Data: " "{}".format(name, data)
                 )
                 raise
-        if isinstance(c, Block):
-            self._addHomogenizedNumberDensityParams(comps, g)
 
     @staticmethod
-    def _addHomogenizedNumberDensityParams(blocks, h5group):
+    def _getHomogenizedNumberDensityParams(blocks):
         """
-        Create on-the-fly block homog. number density params for XTVIEW viewing.
+        Compute on-the-fly block homog. number density params for XTVIEW viewing.
 
         See Also
         --------
         collectBlockNumberDensities
         """
-        nDens = collectBlockNumberDensities(blocks)
-
-        for nucName, numDens in nDens.items():
-            h5group.create_dataset(nucName, data=numDens, compression="gzip")
+        return collectBlockNumberDensities(blocks).items()
 
     @staticmethod
-    def _readParams(h5group, compTypeName, comps, allowMissing=False):
+    def _readParams(
+        h5group, compTypeName, comps, allowMissing=False, params=None, rows=None
+    ):
+        """
+        Read parameter data for all objects of one type from a time node group.
+
+        Parameters
+        ----------
+        h5group : h5py.Group
+            The time node group
+        compTypeName : str
+            The name of the class of the ``comps``
+        comps : list of ArmiObject
+            The objects to read parameters onto
+        allowMissing : bool, optional
+            Whether to warn, rather than fail, on parameters that are not defined
+        params : set of str, optional
+            If provided, only these parameters are read
+        rows : numpy.ndarray, optional
+            The row in the datasets that belongs to each of the ``comps``. By default,
+            the ``comps`` are all objects of this type, in the order they were written.
+        """
         g = h5group[compTypeName]
 
         renames = getApp().getParamRenames()
@@ -966,12 +1258,15 @@ class Database3:
             while paramName in renames:
                 paramName = renames[paramName]
 
+            if params is not None and paramName not in params:
+                continue
+
             try:
                 pDef = pDefs[paramName]
             except KeyError:
                 if re.match(r"^n[A-Z][a-z]?\d*", paramName):
                     # This is a temporary viz param (number density) made by
-                    # _addHomogenizedNumberDensityParams ignore it safely
+                    # _getHomogenizedNumberDensityParams ignore it safely
                     continue
                 else:
                     # If a parameter exists in the database but not in the application
@@ -1010,6 +1305,11 @@ class Database3:
             if "linkedDims" in attrs:
                 linkedDims = numpy.char.decode(attrs["linkedDims"])
 
+            if rows is not None:
+                data = data[rows]
+                if len(linkedDims):
+                    linkedDims = linkedDims[rows]
+
             # iterating of numpy is not fast...
             for c, val, linkedDim in itertools.zip_longest(
                 comps, data.tolist(), linkedDims, fillvalue=""
@@ -1128,9 +1428,7 @@ class Database3:
 
             cycle = h5TimeNodeGroup.attrs["cycle"]
             timeNode = h5TimeNodeGroup.attrs["timeNode"]
-            layout = Layout(
-                (self.versionMajor, self.versionMinor), h5group=h5TimeNodeGroup
-            )
+            layout = self._getTimeNodeIndex(h5TimeNodeGroup).layout
 
             ancestors = layout.computeAncestors(
                 layout.serialNum, layout.numChildren, depth=anchorDistance
@@ -1265,17 +1563,81 @@ class Database3:
             Dictionary ArmiObject (input): dict of str/list pairs containing ((cycle,
             node), value).
         """
+        histArrays = self.getHistoryArrays(comps, params, timeSteps)
         histData: Histories = {
             c: collections.defaultdict(collections.OrderedDict) for c in comps
         }
-        types = {c.__class__ for c in comps}
-        compsByTypeThenSerialNum: Dict[Type[ArmiObject], Dict[int, ArmiObject]] = {
-            t: dict() for t in types
-        }
+        for paramName, values in histArrays.values.items():
+            present = histArrays.present[paramName]
+            for c, compValues, compPresent in zip(comps, values.tolist(), present):
+                if not compPresent.any():
+                    continue
+                hist = histData[c][paramName]
+                for ts, val, isPresent in zip(
+                    histArrays.timeSteps, compValues, compPresent
+                ):
+                    if isPresent:
+                        if isinstance(val, list):
+                            val = numpy.array(val)
+                        hist[ts] = val
 
-        for c in comps:
-            compsByTypeThenSerialNum[c.__class__][c.p.serialNum] = c
+        r = comps[0].getAncestorWithFlags(Flags.REACTOR)
+        cycleNode = r.p.cycle, r.p.timeNode
+        for c, paramHistories in histData.items():
+            for paramName, hist in paramHistories.items():
+                if cycleNode not in hist:
+                    try:
+                        hist[cycleNode] = c.p[paramName]
+                    except:  # noqa: bare-except
+                        if paramName == "location":
+                            hist[cycleNode] = c.spatialLocator.indices
+
+        return histData
+
+    def getHistoryArrays(
+        self,
+        comps: Sequence[ArmiObject],
+        params: Optional[Sequence[str]] = None,
+        timeSteps: Optional[Sequence[Tuple[int, int]]] = None,
+    ) -> HistoryArrays:
+        """
+        Get the parameter histories for a sequence of ARMI Objects, as arrays.
+
+        This is the engine behind :py:meth:`getHistories`, which arranges the same data
+        into nested dictionaries. Objects are found in each time node by serial number,
+        using lookups that are cached for as long as the database is open, and each
+        parameter is read with a single contiguous read per time node and object type.
+        Unlike ``getHistories``, only data in the database are returned.
+
+        Parameters
+        ----------
+        comps
+            The objects to get histories for. These set the order of the first
+            dimension of the returned arrays.
+        params
+            parameters to gather. If omitted, all parameters in the database for the
+            types of the ``comps`` are gathered.
+        timeSteps
+            Selection of time nodes to get data for. If omitted, return full history
+
+        Returns
+        -------
+        HistoryArrays
+            The time steps that were read, and the value and presence arrays for each
+            parameter, indexed by (object, time step).
+        """
+        self.waitForWrites()
+        comps = list(comps)
+        compIndicesByType: Dict[Type[ArmiObject], List[int]] = collections.defaultdict(
+            list
+        )
+        for i, c in enumerate(comps):
+            compIndicesByType[c.__class__].append(i)
+        serialNums = numpy.array([c.p.serialNum for c in comps])
 
+        readTimeSteps = []
+        # param name -> [(time step index, object indices, data), ...]
+        pieces = collections.defaultdict(list)
         for h5TimeNodeGroup in self.genTimeStepGroups(timeSteps):
             if "layout" not in h5TimeNodeGroup:
                 # Layout hasn't been written for this time step, so whatever is in there
@@ -1286,11 +1648,11 @@ class Database3:
 
             cycle = h5TimeNodeGroup.attrs["cycle"]
             timeNode = h5TimeNodeGroup.attrs["timeNode"]
-            layout = Layout(
-                (self.versionMajor, self.versionMinor), h5group=h5TimeNodeGroup
-            )
+            timeStepIndex = len(readTimeSteps)
+            readTimeSteps.append((cycle, timeNode))
+            timeNodeIndex = self._getTimeNodeIndex(h5TimeNodeGroup)
 
-            for compType, compsBySerialNum in compsByTypeThenSerialNum.items():
+            for compType, compIndices in compIndicesByType.items():
                 compTypeName = compType.__name__
                 try:
                     h5GroupForType = h5TimeNodeGroup[compTypeName]
@@ -1301,21 +1663,15 @@ class Database3:
                         )
                     )
                     raise ee
-                layoutIndicesForType = numpy.where(layout.type == compTypeName)[0]
-                serialNumsForType = layout.serialNum[layoutIndicesForType].tolist()
-                layoutIndexInData = layout.indexInData[layoutIndicesForType].tolist()
-
-                indexInData = []
-                reorderedComps = []
 
-                for ii, sn in zip(layoutIndexInData, serialNumsForType):
-                    d = compsBySerialNum.get(sn, None)
-                    if d is not None:
-                        indexInData.append(ii)
-                        reorderedComps.append(d)
-
-                if not indexInData:
+                compIndices = numpy.array(compIndices)
+                found, layoutIndices = timeNodeIndex.find(
+                    compTypeName, serialNums[compIndices]
+                )
+                if not found.any():
                     continue
+                compIndices = compIndices[found]
+                indexInData = timeNodeIndex.layout.indexInData[layoutIndices]
 
                 # note this is very similar to _readParams, but there are some important
                 # differences.
@@ -1324,14 +1680,25 @@ class Database3:
                 # 3) not performing parameter renaming. This may become necessary
                 for paramName in params or h5GroupForType.keys():
                     if paramName == "location":
-                        # cast to a numpy array so that we can use list indices
-                        data = numpy.array(layout.location)[layoutIndicesForType][
-                            indexInData
-                        ]
+                        data = timeNodeIndex.locations[layoutIndices]
                     elif paramName in h5GroupForType:
                         dataSet = h5GroupForType[paramName]
+                        if dataSet.attrs.get(
+                            "specialFormatting", False
+                        ) and not dataSet.attrs.get("nones", False):
+                            raise ValueError(
+                                "History tracking for non-none special formatting "
+                                "not supported: {}, {}".format(
+                                    paramName,
+                                    {k: v for k, v in dataSet.attrs.items()},
+                                )
+                            )
+                        # reading the covering slab and selecting from it in memory is
+                        # much faster than an h5py fancy-indexed read
+                        lo = indexInData.min()
+                        hi = indexInData.max() + 1
                         try:
-                            data = dataSet[indexInData]
+                            data = dataSet[lo:hi][indexInData - lo]
                         except:
                             runLog.error(
                                 "Failed to load index {} from {}@{}".format(
@@ -1344,42 +1711,35 @@ class Database3:
                             data = numpy.char.decode(data)
 
                         if dataSet.attrs.get("specialFormatting", False):
-                            if dataSet.attrs.get("nones", False):
-                                data = replaceNonsenseWithNones(data, paramName)
-                            else:
-                                raise ValueError(
-                                    "History tracking for non-none special formatting "
-                                    "not supported: {}, {}".format(
-                                        paramName,
-                                        {k: v for k, v in dataSet.attrs.items()},
-                                    )
-                                )
+                            data = replaceNonsenseWithNones(data, paramName)
                     else:
                         # Nothing in the database, so use the default value
                         data = numpy.repeat(
                             parameters.byNameAndType(paramName, compType).default,
-                            len(reorderedComps),
+                            len(compIndices),
                         )
 
-                    # iterating of numpy is not fast..
-                    for c, val in zip(reorderedComps, data.tolist()):
-                        if isinstance(val, list):
-                            val = numpy.array(val)
+                    pieces[paramName].append((timeStepIndex, compIndices, data))
 
-                        histData[c][paramName][cycle, timeNode] = val
+        values = {}
+        present = {}
+        for paramName, paramPieces in pieces.items():
+            values[paramName], present[paramName] = _assembleHistory(
+                paramPieces, len(comps), len(readTimeSteps)
+            )
 
-        r = comps[0].getAncestorWithFlags(Flags.REACTOR)
-        cycleNode = r.p.cycle, r.p.timeNode
-        for c, paramHistories in histData.items():
-            for paramName, hist in paramHistories.items():
-                if cycleNode not in hist:
-                    try:
-                        hist[cycleNode] = c.p[paramName]
-                    except:  # noqa: bare-except
-                        if paramName == "location":
-                            hist[cycleNode] = c.spatialLocator.indices
+        return HistoryArrays(readTimeSteps, values, present)
 
-        return histData
+    def _getTimeNodeIndex(self, h5TimeNodeGroup) -> "_TimeNodeIndex":
+        """Return the (cached) serial number lookup for a time node group."""
+        index = self._timeNodeIndices.get(h5TimeNodeGroup.name)
+        if index is None:
+            layout = Layout(
+                (self.versionMajor, self.versionMinor), h5group=h5TimeNodeGroup
+            )
+            index = _TimeNodeIndex(layout)
+            self._timeNodeIndices[h5TimeNodeGroup.name] = index
+        return index
 
     @staticmethod
     def _writeAttrs(obj, group, attrs):
@@ -1456,6 +1816,209 @@ class Database3:
         return resolved
 
 
+def getDatasetOptions(
+    compression: str = "gzip",
+    compressionLevel: Optional[int] = None,
+    chunks: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Validate and normalize the storage options for a parameter dataset.
+
+    Parameters
+    ----------
+    compression : str, optional
+        The HDF5 compression filter; one of ``COMPRESSION_OPTIONS``.
+    compressionLevel : int, optional
+        The gzip compression level, 0-9. Defaults to the HDF5 default of 4.
+    chunks : int, optional
+        The number of composites to store in each HDF5 chunk. Chunks always span all
+        other dimensions of the data. By default, chunks are sized to about 1 MiB.
+    """
+    if compression not in COMPRESSION_OPTIONS:
+        raise ValueError(
+            "Unsupported database compression `{}`; expected one of {}".format(
+                compression, COMPRESSION_OPTIONS
+            )
+        )
+    if compressionLevel is not None:
+        if compression != "gzip":
+            raise ValueError(
+                "A compression level can only be given for gzip compression, not "
+                "`{}`".format(compression)
+            )
+        if not 0 <= compressionLevel <= 9:
+            raise ValueError(
+                "The gzip compression level must be between 0 and 9, not {}".format(
+                    compressionLevel
+                )
+            )
+    if chunks is not None and chunks < 1:
+        raise ValueError("Chunks must contain at least one row, not {}".format(chunks))
+
+    return {
+        "compression": compression,
+        "compressionLevel": 4 if compressionLevel is None else compressionLevel,
+        "chunks": chunks,
+    }
+
+
+def _createDataset(
+    group: h5py.Group,
+    name: str,
+    data: numpy.ndarray,
+    compressionPool: "futures.ThreadPoolExecutor",
+    compression: str,
+    compressionLevel: int,
+    chunks: Optional[int],
+) -> h5py.Dataset:
+    """
+    Create a dataset, compressing its chunks in parallel where possible.
+
+    Letting HDF5 apply the gzip filter is serial, and holds the GIL while it does it.
+    Instead, gzip chunks are deflated with ``zlib`` on the ``compressionPool`` threads
+    (``zlib`` releases the GIL) and handed to HDF5 pre-compressed. The result is exactly
+    what the HDF5 deflate filter would have produced, so readers cannot tell the
+    difference.
+    """
+    if data.ndim == 0 or data.size == 0:
+        # nothing worth chunking; fall back to HDF5 doing whatever it does
+        return group.create_dataset(
+            name, data=data, compression=None if compression == "none" else compression
+        )
+
+    rowBytes = max(data[0].nbytes, 1)
+    rowsPerChunk = min(chunks or max(_TARGET_CHUNK_BYTES // rowBytes, 1), len(data))
+    chunkShape = (rowsPerChunk,) + data.shape[1:]
+
+    if compression == "none":
+        return group.create_dataset(
+            name, data=data, chunks=chunkShape if chunks else None
+        )
+    if compression == "lzf" or data.dtype.kind not in "biufcS":
+        return group.create_dataset(
+            name,
+            data=data,
+            chunks=chunkShape,
+            compression=compression,
+            compression_opts=compressionLevel if compression == "gzip" else None,
+        )
+
+    dataset = group.create_dataset(
+        name,
+        shape=data.shape,
+        dtype=data.dtype,
+        chunks=chunkShape,
+        compression="gzip",
+        compression_opts=compressionLevel,
+    )
+
+    def compressChunk(start):
+        chunk = data[start : start + rowsPerChunk]
+        if len(chunk) < rowsPerChunk:
+            # HDF5 always stores full chunks, so the last one needs padding
+            chunk = numpy.concatenate(
+                [
+                    chunk,
+                    numpy.zeros(
+                        (rowsPerChunk - len(chunk),) + chunk.shape[1:], chunk.dtype
+                    ),
+                ]
+            )
+        return zlib.compress(numpy.ascontiguousarray(chunk).tobytes(), compressionLevel)
+
+    starts = range(0, len(data), rowsPerChunk)
+    offsetTail = (0,) * (data.ndim - 1)
+    for start, compressed in zip(starts, compressionPool.map(compressChunk, starts)):
+        dataset.id.write_direct_chunk((start,) + offsetTail, compressed)
+
+    return dataset
+
+
+class _TimeNodeIndex:
+    """
+    Find the objects with given serial numbers in the layout of one time node.
+
+    Lookups for each object type are built on first use and kept, so that repeated
+    history queries against the same database do not rebuild them.
+    """
+
+    def __init__(self, layout: Layout):
+        self.layout = layout
+        self._locations = None
+        self._byType: Dict[str, Tuple[numpy.ndarray, numpy.ndarray]] = {}
+
+    @property
+    def locations(self) -> numpy.ndarray:
+        """The locations of all objects in the layout, as an object array of tuples."""
+        if self._locations is None:
+            # locations have different lengths, so fill element by element rather than
+            # letting numpy try to make a regular array
+            self._locations = numpy.empty(len(self.layout.location), dtype=object)
+            for i, loc in enumerate(self.layout.location):
+                self._locations[i] = loc
+        return self._locations
+
+    def find(
+        self, compTypeName: str, serialNums: numpy.ndarray
+    ) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Find objects of a type by serial number.
+
+        Returns
+        -------
+        found : numpy.ndarray
+            Whether each of the ``serialNums`` is in this time node
+        layoutIndices : numpy.ndarray
+            The layout indices of the serial numbers that were found
+        """
+        if compTypeName not in self._byType:
+            layoutIndices = numpy.where(self.layout.type == compTypeName)[0]
+            typeSerialNums = self.layout.serialNum[layoutIndices]
+            order = numpy.argsort(typeSerialNums)
+            self._byType[compTypeName] = (typeSerialNums[order], layoutIndices[order])
+        sortedSerialNums, layoutIndices = self._byType[compTypeName]
+
+        if not len(sortedSerialNums):
+            return numpy.zeros(len(serialNums), dtype=bool), layoutIndices
+        positions = numpy.searchsorted(sortedSerialNums, serialNums)
+        positions = numpy.minimum(positions, len(sortedSerialNums) - 1)
+        found = sortedSerialNums[positions] == serialNums
+        return found, layoutIndices[positions[found]]
+
+
+def _assembleHistory(pieces, numComps: int, numTimeSteps: int):
+    """
+    Arrange the pieces of data read from each time node into (object, time step) arrays.
+
+    Data that cannot be combined into a regular array (e.g., mixed types, or shapes that
+    change over time) are returned in an object array.
+    """
+    present = numpy.zeros((numComps, numTimeSteps), dtype=bool)
+    try:
+        dtype = numpy.result_type(*(data.dtype for _, _, data in pieces))
+        shapes = {data.shape[1:] for _, _, data in pieces}
+        areStrings = {data.dtype.kind == "U" for _, _, data in pieces}
+        if len(shapes) != 1 or len(areStrings) != 1 or dtype == numpy.dtype(object):
+            raise ValueError("Irregular history data")
+        values = numpy.zeros((numComps, numTimeSteps) + shapes.pop(), dtype=dtype)
+    except (TypeError, ValueError):
+        values = numpy.empty((numComps, numTimeSteps), dtype=object)
+        for timeStepIndex, compIndices, data in pieces:
+            present[compIndices, timeStepIndex] = True
+            for compIndex, val in zip(compIndices, data.tolist()):
+                if isinstance(val, list):
+                    val = numpy.array(val)
+                values[compIndex, timeStepIndex] = val
+        return values, present
+
+    if dtype.kind in "fc":
+        values.fill(numpy.nan)
+    for timeStepIndex, compIndices, data in pieces:
+        present[compIndices, timeStepIndex] = True
+        values[compIndices, timeStepIndex] = data
+    return values, present
+
+
 def packSpecialData(
     data: numpy.ndarray, paramName: str
 ) -> Tuple[Optional[numpy.ndarray], Dict[str, Any]]:
@@ -1700,13 +2263,10 @@ def collectBlockNumberDensities(blocks) -> Dict[str, numpy.ndarray]:
     """
     nucNames = sorted(list(set(nucName for b in blocks for nucName in b.getNuclides())))
     nucBases = [nuclideBases.byName[nn] for nn in nucNames]
-    # it's faster to loop over blocks first and get all number densities from each
-    # than it is to get one nuclide at a time from each block because of area fraction
-    # calculations. So we use some RAM here instead.
-    nucDensityMatrix = []
-    for block in blocks:
-        nucDensityMatrix.append(block.getNuclideNumberDensities(nucNames))
-    nucDensityMatrix = numpy.array(nucDensityMatrix)
+    # it's faster to gather the component number densities of all blocks into one
+    # matrix and homogenize them all at once than it is to go block-by-block (or to get
+    # one nuclide at a time from each block). So we use some RAM here instead.
+    nucDensityMatrix = composites.getHomogenizedNumberDensities(blocks, nucNames)
 
     dataDict = dict()
     for ni, nb in enumerate(nucBases):
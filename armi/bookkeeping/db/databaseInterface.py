@@ -36,6 +36,9 @@ from armi.reactor.composites import ArmiObject
 from armi.bookkeeping.db.typedefs import History, Histories
 from armi.utils import getPreviousTimeNode, getStepLengths
 from armi.settings.fwSettings.databaseSettings import (
+    CONF_DB_COMPRESSION,
+    CONF_DB_PARAM_STORAGE,
+    CONF_DB_WRITE_IN_BACKGROUND,
     CONF_SYNC_AFTER_WRITE,
     CONF_FORCE_DB_PARAMS,
 )
@@ -123,6 +126,10 @@ class DatabaseInterface(interfaces.Interface):
                 "case."
             )
         self._db = Database3(self._dbPath, "w")
+        self._db.setDatasetOptions(
+            self.cs[CONF_DB_COMPRESSION], self.cs[CONF_DB_PARAM_STORAGE]
+        )
+        self._db.writeInBackground = self.cs[CONF_DB_WRITE_IN_BACKGROUND]
         self._db.open()
 
         # Grab geomString here because the DB-level has no access to the reactor or
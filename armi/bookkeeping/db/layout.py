@@ -191,7 +191,7 @@ class Layout:
             self.material[layoutIndex],
         )
 
-    def _createLayout(self, comp):
+    def _createLayout(self, root):
         """
         Populate a hierarchical representation and group the reactor model items by type.
 
@@ -199,54 +199,59 @@ class Layout:
 
         Notes
         -----
-        This is recursive.
+        The tree is walked depth-first with an explicit stack, visiting the children of
+        each object in sorted order.
 
         See Also
         --------
         _readLayout : does the opposite
         """
-        compList = self.groupedComps[type(comp)]
-        compList.append(comp)
-
-        self.type.append(comp.__class__.__name__)
-        self.name.append(comp.name)
-        self.serialNum.append(comp.p.serialNum)
-        self.indexInData.append(len(compList) - 1)
-        self.numChildren.append(len(comp))
-
-        # determine how many components have been read in, to set the grid index
-        if comp.spatialGrid is not None:
-            gridType = type(comp.spatialGrid).__name__
-            gridParams = (gridType, comp.spatialGrid.reduce())
-            if gridParams not in self._seenGridParams:
-                self._seenGridParams[gridParams] = len(self.gridParams)
-                self.gridParams.append(gridParams)
-            self.gridIndex.append(self._seenGridParams[gridParams])
-        else:
-            self.gridIndex.append(None)
+        stack = [root]
+        while stack:
+            comp = stack.pop()
+            compList = self.groupedComps[type(comp)]
+            compList.append(comp)
+
+            self.type.append(comp.__class__.__name__)
+            self.name.append(comp.name)
+            self.serialNum.append(comp.p.serialNum)
+            self.indexInData.append(len(compList) - 1)
+            self.numChildren.append(len(comp))
+
+            # determine how many components have been read in, to set the grid index
+            if comp.spatialGrid is not None:
+                gridType = type(comp.spatialGrid).__name__
+                gridParams = (gridType, comp.spatialGrid.reduce())
+                if gridParams not in self._seenGridParams:
+                    self._seenGridParams[gridParams] = len(self.gridParams)
+                    self.gridParams.append(gridParams)
+                self.gridIndex.append(self._seenGridParams[gridParams])
+            else:
+                self.gridIndex.append(None)
 
-        self._spatialLocators.append(comp.spatialLocator)
+            self._spatialLocators.append(comp.spatialLocator)
 
-        # set the materials and temperatures
-        try:
-            self.temperatures.append((comp.inputTemperatureInC, comp.temperatureInC))
-            self.material.append(comp.material.__class__.__name__)
-        except:  # noqa: bare-except
-            self.temperatures.append((-900, -900))  # an impossible temperature
-            self.material.append("")
-
-        try:
-            comps = sorted(list(comp))
-        except ValueError:
-            runLog.error(
-                "Failed to sort some collection of ArmiObjects for database output: {} "
-                "value {}".format(type(comp), list(comp))
-            )
-            raise
+            # set the materials and temperatures
+            try:
+                self.temperatures.append(
+                    (comp.inputTemperatureInC, comp.temperatureInC)
+                )
+                self.material.append(comp.material.__class__.__name__)
+            except:  # noqa: bare-except
+                self.temperatures.append((-900, -900))  # an impossible temperature
+                self.material.append("")
+
+            try:
+                comps = sorted(list(comp))
+            except ValueError:
+                runLog.error(
+                    "Failed to sort some collection of ArmiObjects for database output: "
+                    "{} value {}".format(type(comp), list(comp))
+                )
+                raise
 
-        # depth-first search recursion of all components
-        for c in comps:
-            self._createLayout(c)
+            # push in reverse, so that the first child is visited next
+            stack.extend(reversed(comps))
 
     def _readLayout(self, h5group):
         """
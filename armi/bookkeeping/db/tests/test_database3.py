@@ -14,7 +14,9 @@
 """Tests for the Database3 class."""
 from distutils.spawn import find_executable
 import subprocess
+import time
 import unittest
+from unittest import mock
 
 import h5py
 import numpy
@@ -23,6 +25,8 @@ from armi.bookkeeping.db import _getH5File
 from armi.bookkeeping.db import database3
 from armi.bookkeeping.db.databaseInterface import DatabaseInterface
 from armi.reactor import parameters
+from armi.reactor.blocks import HexBlock
+from armi.reactor.flags import Flags
 from armi.reactor.tests.test_reactors import loadTestReactor, reduceTestReactorRings
 from armi.settings.fwSettings.globalSettings import CONF_SORT_REACTOR
 from armi.tests import TEST_ROOT
@@ -109,6 +113,79 @@ class TestDatabase3(unittest.TestCase):
             sorted(self.db.h5db["c00n00"]["Reactor"].keys()), sorted(rKeys)
         )
 
+    def test_writeToDBInBackground(self):
+        self.r.p.cycle = 0
+        self.r.p.timeNode = 0
+        self.db.writeToDB(self.r)
+
+        self.db.setDatasetOptions("lzf", {"buRate": {"compression": "none"}})
+        self.db.writeInBackground = True
+        self.r.p.timeNode = 1
+        self.db.writeToDB(self.r)
+        self.db.waitForWrites()
+        self.assertIsNone(self.db._pendingWrite)
+
+        n0 = self.db.h5db["c00n00/HexBlock"]
+        n1 = self.db.h5db["c00n01/HexBlock"]
+        self.assertEqual(sorted(n0.keys()), sorted(n1.keys()))
+        for name in n0:
+            numpy.testing.assert_array_equal(n0[name][()], n1[name][()])
+        self.assertEqual(n0["buRate"].compression, "gzip")
+        self.assertEqual(n1["buRate"].compression, None)
+        self.assertEqual(n1["height"].compression, "lzf")
+
+    def test_loadAfterBackgroundWrite(self):
+        self.r.p.cycle = 0
+        self.r.p.timeNode = 0
+        self.r.core.getFirstBlock().p.power = 123.0
+        self.db.writeInBackground = True
+
+        # hold up the write so that it is still going when the data are read back
+        writeParams = self.db._writeParams
+
+        def slowWriteParams(*args):
+            time.sleep(0.5)
+            writeParams(*args)
+
+        with mock.patch.object(self.db, "_writeParams", slowWriteParams):
+            self.db.writeToDB(self.r)
+            self.assertIsNotNone(self.db._pendingWrite)
+            self.assertEqual(list(self.db.genTimeSteps()), [(0, 0)])
+            self.assertIsNone(self.db._pendingWrite)
+
+            self.r.p.timeNode = 1
+            self.db.writeToDB(self.r)
+            r2 = self.db.load(0, 1)
+            self.assertIsNone(self.db._pendingWrite)
+        self.assertEqual(r2.core.getFirstBlock().p.power, 123.0)
+
+    def test_createDataset(self):
+        pool = database3.futures.ThreadPoolExecutor(max_workers=2)
+        datas = {
+            "floats": numpy.linspace(0.0, 1.0, 1001),
+            "ints2D": numpy.arange(3000).reshape(1000, 3),
+            "strings": numpy.array(["one", "two", "three"] * 11).astype("S"),
+            "empty": numpy.zeros((10, 0)),
+        }
+        for compression in database3.COMPRESSION_OPTIONS:
+            group = self.db.h5db.create_group(compression)
+            for name, data in datas.items():
+                options = database3.getDatasetOptions(compression, chunks=16)
+                dataset = database3._createDataset(group, name, data, pool, **options)
+                numpy.testing.assert_array_equal(dataset[()], data)
+                if data.size:
+                    self.assertEqual(dataset.chunks[0], 16)
+        pool.shutdown()
+
+        with self.assertRaises(ValueError):
+            database3.getDatasetOptions("bzip2")
+        with self.assertRaises(ValueError):
+            database3.getDatasetOptions("lzf", compressionLevel=2)
+        with self.assertRaises(ValueError):
+            database3.getDatasetOptions("gzip", compressionLevel=12)
+        with self.assertRaises(ValueError):
+            database3.getDatasetOptions("gzip", chunks=0)
+
     def test_getH5File(self):
         """
         Get the h5 file for the database, because that file format is language-agnostic.
@@ -389,6 +466,91 @@ class TestDatabase3(unittest.TestCase):
         with self.assertRaises(RuntimeError):
             self.db.fileName = "whatever.h5"
 
+    def test_loadPartial(self):
+        for c in self.r.core.getFirstBlock(Flags.FUEL):
+            c.p.percentBu = 5.0
+        self.makeShuffleHistory()
+        rFull = self.db.load(1, 0, allowMissing=True)
+        r = self.db.load(1, 0, allowMissing=True, params=["timeNode"])
+
+        # unrequested params keep their defaults, but the model is still complete
+        defaultCycleLength = self.r.p.pDefs["cycleLength"].default
+        self.assertEqual(rFull.p.cycleLength, 1)
+        self.assertEqual(r.p.cycleLength, defaultCycleLength)
+        self.assertEqual(r.p.timeNode, 0)
+        blocks = r.core.getBlocks()
+        fullBlocks = rFull.core.getBlocks()
+        self.assertEqual(
+            [b.p.serialNum for b in blocks], [b.p.serialNum for b in fullBlocks]
+        )
+        self.assertEqual([b.p.height for b in blocks], [b.p.height for b in fullBlocks])
+        self.assertEqual(
+            [c.temperatureInC for c in blocks[0]],
+            [c.temperatureInC for c in fullBlocks[0]],
+        )
+        self.assertEqual(
+            [c.getArea() for b in blocks for c in b],
+            [c.getArea() for b in fullBlocks for c in b],
+        )
+
+        # component params are not read unless requested, either
+        percentBu = [c.p.percentBu for b in fullBlocks for c in b]
+        self.assertIn(5.0, percentBu)
+        self.assertFalse(any(c.p.percentBu for b in blocks for c in b))
+
+        # more params can be read later, onto the whole tree or just a part of it
+        self.db.loadParams(r, 1, 0, ["cycleLength"])
+        self.assertEqual(r.p.cycleLength, 1)
+
+        self.db.loadParams(
+            r, 1, 0, ["percentBu"], predicate=lambda o: o.hasFlags(Flags.FUEL)
+        )
+        self.assertEqual(
+            [c.p.percentBu for b in blocks for c in b],
+            [
+                c.p.percentBu if c.hasFlags(Flags.FUEL) else 0.0
+                for b in fullBlocks
+                for c in b
+            ],
+        )
+        self.db.loadParams(r, 1, 0, ["percentBu"])
+        self.assertEqual([c.p.percentBu for b in blocks for c in b], percentBu)
+
+        blocks[0].p.height = 0.0
+        self.db.loadParams(blocks[0], 1, 0, ["height"])
+        self.assertEqual(blocks[0].p.height, fullBlocks[0].p.height)
+
+        # linked dimensions are linked up again
+        i, b = next((i, b) for i, b in enumerate(blocks) if b.hasFlags(Flags.FUEL))
+        self.db.loadParams(b, 1, 0, ["od", "id"])
+        fuel = b.getComponent(Flags.FUEL)
+        self.assertTrue(
+            any(c.dimensionIsLinked("id") for c in fuel.getDependentComponents())
+        )
+        self.assertEqual([c.getArea() for c in b], [c.getArea() for c in fullBlocks[i]])
+
+        # objects that did not come from this time node cannot be matched up
+        with self.assertRaises(KeyError):
+            self.db.loadParams(HexBlock("newBlock"), 1, 0, ["height"])
+
+    def test_loadParamsUpdatesAreas(self):
+        self.r.p.cycle = 0
+        self.r.p.timeNode = 0
+        b = self.r.core.getFirstBlock(Flags.FUEL)
+        fuel = b.getComponent(Flags.FUEL)
+        dependents = fuel.getDependentComponents()
+        self.assertTrue(dependents)
+        areas = [c.getArea() for c in [fuel] + dependents]
+        self.db.writeToDB(self.r)
+
+        fuel.setDimension("od", fuel.getDimension("od", cold=True) * 0.9)
+        changedAreas = [c.getArea() for c in [fuel] + dependents]
+        self.assertNotEqual(changedAreas[0], areas[0])
+
+        # the dimensions are read straight into the parameters
+        self.db.loadParams(b, 0, 0, ["od"])
+        self.assertEqual([c.getArea() for c in [fuel] + dependents], areas)
+
     def test_loadSortSetting(self):
         self.makeShuffleHistory()
 
@@ -438,6 +600,42 @@ class TestDatabase3(unittest.TestCase):
         self.assertIn((2, 0), hist["chargeTime"].keys())
         self.assertEqual(hist["chargeTime"][(2, 0)], 2)
 
+    def test_historyArrays(self):
+        self.makeShuffleHistory()
+        blocks = self.r.core.getFirstAssembly().getBlocks()
+        comps = blocks + [HexBlock("neverWritten")]
+
+        arrays = self.db.getHistoryArrays(comps, ["serialNum", "height", "location"])
+        self.assertEqual(arrays.timeSteps, [(0, 0), (0, 1), (1, 0), (1, 1)])
+        self.assertEqual(arrays.values["height"].shape, (len(comps), 4))
+        self.assertEqual(
+            arrays.values["location"][0, -1],
+            blocks[0].spatialLocator.getCompleteIndices(),
+        )
+        self.assertTrue(arrays.present["serialNum"][:-1].all())
+        self.assertFalse(arrays.present["serialNum"][-1].any())
+        numpy.testing.assert_array_equal(
+            arrays.values["serialNum"][:-1, 0], [b.p.serialNum for b in blocks]
+        )
+        numpy.testing.assert_allclose(
+            arrays.values["height"][:-1, -1], [b.p.height for b in blocks]
+        )
+        self.assertTrue(numpy.isnan(arrays.values["height"][-1]).all())
+
+        # the dictionary-based histories are built on the same data, plus the current
+        # state of the reactor
+        hists = self.db.getHistories(blocks, ["height"], timeSteps=[(0, 1), (1, 0)])
+        self.assertEqual(
+            list(hists[blocks[0]]["height"].items()),
+            [(ts, blocks[0].p.height) for ts in [(0, 1), (1, 0), (2, 0)]],
+        )
+
+        # layout lookups are cached until the time node is removed
+        self.assertEqual(len(self.db._timeNodeIndices), 4)
+        del self.db[1, 1, None]
+        self.assertNotIn("/c01n01", self.db._timeNodeIndices)
+        self.assertIn("/c01n00", self.db._timeNodeIndices)
+
     def test_auxData(self):
         path = self.db.getAuxiliaryDataPath((2, 0), "test_stuff")
         self.assertEqual(path, "c02n00/test_stuff")
@@ -561,6 +759,53 @@ class TestDatabase3(unittest.TestCase):
                 [(c, n) for c in (0, 1) for n in range(2)], "-all-iterations"
             )
 
+    def test_historyArraysAfterSplit(self):
+        self.makeShuffleHistory()
+        blocks = self.r.core.childrenByLocator[
+            self.r.core.spatialGrid[0, 0, 0]
+        ].getBlocks()
+        before = self.db.getHistoryArrays(blocks, ["location"])
+        self.assertEqual(len(self.db._timeNodeIndices), 4)
+
+        self.db.splitDatabase([(1, 0), (1, 1)], "-all-iterations")
+        self.assertEqual(self.db._timeNodeIndices, {})
+
+        after = self.db.getHistoryArrays(blocks, ["location"])
+        self.assertEqual(len(after.timeSteps), 2)
+        self.assertEqual(
+            after.values["location"].tolist(),
+            before.values["location"][:, 2:].tolist(),
+        )
+
+    def test_splitDatabaseAfterBackgroundWrite(self):
+        self.makeHistory()
+        self.db.writeInBackground = True
+        writeParams = self.db._writeParams
+
+        def slowWriteParams(*args):
+            time.sleep(0.5)
+            writeParams(*args)
+
+        self.r.p.cycle = 2
+        self.r.p.timeNode = 0
+        self.r.p.cycleLength = 2
+        with mock.patch.object(self.db, "_writeParams", slowWriteParams):
+            self.db.writeToDB(self.r)
+            self.assertIsNotNone(self.db._pendingWrite)
+            self.assertTrue(self.db.hasTimeStep(2, 0))
+            self.assertIsNone(self.db._pendingWrite)
+
+            self.r.p.timeNode = 1
+            self.db.writeToDB(self.r)
+            self.db.splitDatabase([(1, 1), (2, 1)], "-all-iterations")
+            self.assertIsNone(self.db._pendingWrite)
+
+        self.db.close()
+        with h5py.File("test_splitDatabaseAfterBackgroundWrite.h5", "r") as newDb:
+            self.assertEqual(sorted(newDb.keys()), ["c00n01", "c01n01", "inputs"])
+            self.assertEqual(newDb["c01n01/Reactor/cycle"][()], 1)
+            self.assertEqual(newDb["c01n01/Reactor/cycleLength"][()][0], 2)
+
     @unittest.skipIf(GIT_EXE is None, "This test needs Git.")
     def test_grabLocalCommitHash(self):
         """Test of static method to grab a local commit hash with ARMI version."""
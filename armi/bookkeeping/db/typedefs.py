@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Dict, Tuple, Any
+from typing import Dict, Tuple, Any, List, NamedTuple
+
+import numpy
 
 from armi.reactor.composites import ArmiObject
 from armi.reactor.grids import LocationBase
@@ -23,3 +25,18 @@ from armi.reactor.grids import LocationBase
 History = Dict[str, Dict[Tuple[int, int], Any]]
 Histories = Dict[ArmiObject, History]
 LocationHistories = Dict[LocationBase, History]
+
+
+class HistoryArrays(NamedTuple):
+    """
+    Return type for the getHistoryArrays() method.
+
+    ``values`` and ``present`` are keyed by parameter name. Each value array is indexed
+    by (object, time step), followed by any dimensions of the parameter itself. The
+    boolean ``present`` arrays tell which entries were actually found in the database;
+    the others are filler (NaN for floating point parameters).
+    """
+
+    timeSteps: List[Tuple[int, int]]
+    values: Dict[str, numpy.ndarray]
+    present: Dict[str, numpy.ndarray]
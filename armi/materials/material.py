@@ -23,6 +23,7 @@ from scipy.optimize import fsolve
 import numpy
 
 from armi import runLog
+from armi.materials import propertyTables
 from armi.nucDirectory import nuclideBases
 from armi.reactor.flags import TypeSpec
 from armi.utils import densityTools
@@ -540,6 +541,21 @@ class Material:
             self._setCache(propName, (Tk, val))
             return val
 
+    def getPropertyTable(
+        self, propName: str, rtol: float = propertyTables.DEFAULT_RTOL
+    ) -> "propertyTables.PropertyTable":
+        """
+        Return a table of a property over its valid temperature range.
+
+        The table evaluates arrays of temperatures at once and is shared with other
+        materials in the same state.
+
+        See Also
+        --------
+        armi.materials.propertyTables.getPropertyTable
+        """
+        return propertyTables.getPropertyTable(self, propName, rtol=rtol)
+
     def getMassFrac(
         self,
         nucName=None,
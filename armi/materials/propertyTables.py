@@ -0,0 +1,308 @@
+# Copyright 2019 TerraPower, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Tabulated material properties for evaluating many temperatures at once.
+
+Material properties like :py:meth:`linearExpansionPercent
+<armi.materials.material.Material.linearExpansionPercent>` are written as functions of a
+single temperature. Evaluating them for every component of a core, one temperature at a
+time, is mostly Python overhead. A :py:class:`PropertyTable` samples a property once on
+a grid of temperatures within its valid range and then evaluates arrays of temperatures
+by linear interpolation. The grid is refined until the interpolation error, measured at
+the midpoints of the grid, is within a given tolerance.
+
+Materials that are in the same state (same class, mass fractions and other scalar
+attributes) have the same properties, so tables are kept in a module-level cache, of
+up to :py:data:`MAX_TABLES` tables, and shared between them. Use
+:py:func:`getPropertyTable` (or :py:meth:`Material.getPropertyTable
+<armi.materials.material.Material.getPropertyTable>`) to get one.
+"""
+import copy
+from typing import Dict, Optional, Tuple
+
+import numpy
+
+from armi import runLog
+from armi.utils.units import C_TO_K
+
+# Labels of ``Material.propertyValidTemperature`` that may hold the valid range of each
+# property, in order of preference. Materials are not consistent in how they name them.
+PROPERTY_LABELS = {
+    "linearExpansionPercent": (
+        "linear expansion percent",
+        "linear expansion",
+        "cumulative linear expansion",
+        "thermal expansion",
+    ),
+    "density": ("density", "pseudoDensity"),
+    "pseudoDensity": ("pseudoDensity", "density"),
+    "thermalConductivity": ("thermal conductivity",),
+    "heatCapacity": ("heat capacity",),
+}
+
+DEFAULT_RTOL = 1e-6
+DEFAULT_MIN_POINTS = 17
+DEFAULT_MAX_POINTS = 4097
+
+# Most tables to keep in the shared cache. The oldest ones are dropped beyond this.
+MAX_TABLES = 256
+
+_TABLES: Dict[Tuple, "PropertyTable"] = {}
+
+
+class PropertyTable:
+    """
+    A material property sampled on a temperature grid.
+
+    Parameters
+    ----------
+    material : Material
+        The material to sample. The table keeps a copy of it, detached from its
+        component, to evaluate temperatures outside of the sampled range.
+    propName : str
+        Name of the material method to sample, which must accept ``Tk`` and ``Tc``
+        keyword arguments and return a float.
+    minT, maxT : float, optional
+        The temperature range to sample. Defaults to the valid range of the property in
+        ``material.propertyValidTemperature``.
+    units : str, optional
+        Units of ``minT`` and ``maxT``, either ``"C"`` or ``"K"``.
+    rtol : float, optional
+        Tolerance on the interpolation error, relative to the largest absolute value of
+        the property over the range.
+    minPoints, maxPoints : int, optional
+        Number of grid points to start from and the most to refine to. The grid is
+        refined by adding the midpoints of the grid, so they should be ``2**k + 1``.
+
+    Attributes
+    ----------
+    temperaturesInC : numpy.ndarray
+        The sampled temperatures in C.
+    values : numpy.ndarray
+        The property at the sampled temperatures.
+    maxError : float
+        The largest interpolation error found at the midpoints of the last grid that was
+        checked.
+
+    Notes
+    -----
+    Temperatures outside of the sampled range are passed to the material method one
+    at a time, so that they warn or fail in the same way as they would without the
+    table.
+    """
+
+    def __init__(
+        self,
+        material,
+        propName: str,
+        minT: Optional[float] = None,
+        maxT: Optional[float] = None,
+        units: str = "C",
+        rtol: float = DEFAULT_RTOL,
+        minPoints: int = DEFAULT_MIN_POINTS,
+        maxPoints: int = DEFAULT_MAX_POINTS,
+    ):
+        self.propName = propName
+        self.materialName = material.getName()
+        self._func = getattr(_detach(material), propName)
+        if minT is None or maxT is None:
+            (minT, maxT), units = getValidRange(material, propName)
+        if units not in ("C", "K"):
+            raise ValueError(f"Unknown temperature units `{units}` for {propName}")
+        minT, maxT = sorted((float(minT), float(maxT)))
+
+        # sample in the units of the range so that the end points are exactly in range
+        self._inK = units == "K"
+        grid = numpy.linspace(minT, maxT, max(minPoints, 2))
+        values = self._sample(grid)
+        while True:
+            mids = 0.5 * (grid[1:] + grid[:-1])
+            midValues = self._sample(mids)
+            self.maxError = numpy.abs(numpy.interp(mids, grid, values) - midValues).max(
+                initial=0.0
+            )
+            merged = numpy.empty(len(grid) + len(mids))
+            merged[0::2], merged[1::2] = grid, mids
+            mergedValues = numpy.empty_like(merged)
+            mergedValues[0::2], mergedValues[1::2] = values, midValues
+            grid, values = merged, mergedValues
+            tolerance = rtol * numpy.abs(values).max(initial=0.0)
+            if self.maxError <= tolerance:
+                break
+            if len(grid) >= maxPoints:
+                runLog.warning(
+                    f"Table of {propName} for {self.materialName} did not reach a "
+                    f"relative tolerance of {rtol} with {len(grid)} points. The "
+                    f"largest interpolation error found is {self.maxError}.",
+                    single=True,
+                    label=f"Unconverged table of {propName} for {self.materialName}",
+                )
+                break
+
+        self.temperaturesInC = grid - C_TO_K if self._inK else grid
+        self.values = values
+        self.minTc = self.temperaturesInC[0]
+        self.maxTc = self.temperaturesInC[-1]
+
+    def __repr__(self):
+        return "<PropertyTable {} of {} from {} to {} C with {} points>".format(
+            self.propName,
+            self.materialName,
+            self.minTc,
+            self.maxTc,
+            len(self.values),
+        )
+
+    def _sample(self, grid):
+        if self._inK:
+            return numpy.array([self._func(Tk=t) for t in grid], dtype=float)
+        return numpy.array([self._func(Tc=t) for t in grid], dtype=float)
+
+    def __call__(self, Tk=None, Tc=None):
+        """
+        Return the property at one or more temperatures.
+
+        Parameters
+        ----------
+        Tk : float or array_like, optional
+            Temperatures in K.
+        Tc : float or array_like, optional
+            Temperatures in C.
+
+        Returns
+        -------
+        numpy.ndarray
+            The property at each temperature, with the same shape as the input.
+        """
+        if not ((Tc is not None) ^ (Tk is not None)):
+            raise ValueError(
+                f"Cannot evaluate {self.propName} at Tc={Tc} and Tk={Tk}. "
+                "Please supply a single temperature."
+            )
+        Tc = numpy.asarray(Tc if Tc is not None else numpy.asarray(Tk) - C_TO_K)
+        result = numpy.interp(Tc, self.temperaturesInC, self.values)
+        outside = ~((Tc >= self.minTc) & (Tc <= self.maxTc))
+        if outside.any():
+            result = numpy.array(result, dtype=float)
+            result[outside] = [self._func(Tc=t) for t in Tc[outside]]
+        return result
+
+
+def getValidRange(material, propName: str):
+    """
+    Return the valid temperature range of a property of a material.
+
+    Returns
+    -------
+    range : tuple
+        ``((minT, maxT), units)``, as given in ``material.propertyValidTemperature``.
+
+    Raises
+    ------
+    ValueError
+        If the material does not define a valid range for the property.
+    """
+    for label in PROPERTY_LABELS.get(propName, (propName,)):
+        if label in material.propertyValidTemperature:
+            return material.propertyValidTemperature[label]
+    raise ValueError(
+        f"{material} has no valid temperature range for {propName}. Please supply one "
+        "to tabulate it."
+    )
+
+
+def getMaterialKey(material) -> Tuple:
+    """
+    Return a hashable key for the state of a material that its properties depend on.
+
+    This is the class of the material, its mass fractions and its scalar attributes,
+    like the reference and theoretical densities or the inputs it was made with.
+    """
+    state = tuple(
+        sorted(
+            (name, value)
+            for name, value in vars(material).items()
+            if name != "massFrac"
+            and (value is None or isinstance(value, (bool, int, float, str)))
+        )
+    )
+    return (type(material), tuple(sorted(material.massFrac.items())), state)
+
+
+def getPropertyTable(
+    material,
+    propName: str,
+    minT: Optional[float] = None,
+    maxT: Optional[float] = None,
+    units: str = "C",
+    rtol: float = DEFAULT_RTOL,
+) -> PropertyTable:
+    """
+    Return a table of a material property, shared with materials in the same state.
+
+    See :py:class:`PropertyTable` for the parameters. The table is made the first time
+    it is asked for and then reused for any material with the same
+    :py:func:`key <getMaterialKey>`.
+    """
+    key = (getMaterialKey(material), propName, minT, maxT, units, rtol)
+    table = _TABLES.get(key)
+    if table is None:
+        table = PropertyTable(material, propName, minT, maxT, units, rtol)
+        while len(_TABLES) >= MAX_TABLES:
+            del _TABLES[next(iter(_TABLES))]
+        _TABLES[key] = table
+    return table
+
+
+def _detach(material):
+    """
+    Return a copy of a material without its parent.
+
+    Tables outlive the component that asked for them, so they must not keep it, and the
+    reactor above it, alive.
+    """
+    detached = copy.copy(material)
+    detached.parent = None
+    detached.massFrac = dict(material.massFrac)
+    detached.cached = {}
+    detached._backupCache = None
+    return detached
+
+
+def linearExpansionFactors(material, Tc, T0, rtol: float = DEFAULT_RTOL):
+    """
+    Return dL/L factors relative to T0, like :py:meth:`Material.linearExpansionFactor
+    <armi.materials.material.Material.linearExpansionFactor>`, for arrays of temperatures.
+
+    Parameters
+    ----------
+    material : Material
+        The material to expand.
+    Tc : float or array_like
+        Current (hot) temperatures in C.
+    T0 : float or array_like
+        Cold temperatures in C.
+    rtol : float, optional
+        Tolerance on the interpolation error of the linear expansion percent table.
+    """
+    table = getPropertyTable(material, "linearExpansionPercent", rtol=rtol)
+    dLLhot = table(Tc=Tc)
+    dLLcold = table(Tc=T0)
+    return (dLLhot - dLLcold) / (100.0 + dLLcold)
+
+
+def clearPropertyTables():
+    """Forget all of the shared property tables."""
+    _TABLES.clear()
@@ -0,0 +1,109 @@
+# Copyright 2019 TerraPower, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for tabulated material properties."""
+import gc
+import unittest
+from unittest import mock
+import weakref
+
+import numpy
+
+from armi.materials import propertyTables
+from armi.materials.b4c import B4C
+from armi.materials.ht9 import HT9
+from armi.materials.void import Void
+from armi.reactor.components import Circle
+from armi.tests import mockRunLogs
+from armi.utils import units
+
+
+class TestPropertyTable(unittest.TestCase):
+    def setUp(self):
+        propertyTables.clearPropertyTables()
+        self.mat = HT9()
+
+    def tearDown(self):
+        propertyTables.clearPropertyTables()
+
+    def test_interpolationError(self):
+        table = self.mat.getPropertyTable("linearExpansionPercent")
+        (minTk, maxTk), _units = self.mat.propertyValidTemperature["linear expansion"]
+        self.assertAlmostEqual(table.minTc, minTk - units.C_TO_K)
+        self.assertAlmostEqual(table.maxTc, maxTk - units.C_TO_K)
+
+        temps = numpy.linspace(table.minTc, table.maxTc, 301)
+        expected = [self.mat.linearExpansionPercent(Tc=t) for t in temps]
+        scale = numpy.abs(table.values).max()
+        self.assertLess(numpy.abs(table(Tc=temps) - expected).max(), 1e-6 * scale)
+        self.assertLessEqual(table.maxError, 1e-6 * scale)
+
+        # Kelvin, scalars and shapes
+        self.assertAlmostEqual(
+            float(table(Tk=600.0)), self.mat.linearExpansionPercent(Tk=600.0), 6
+        )
+        self.assertEqual(table(Tc=temps.reshape(7, 43)).shape, (7, 43))
+        with self.assertRaises(ValueError):
+            table(Tc=400.0, Tk=600.0)
+
+    def test_outOfRange(self):
+        table = self.mat.getPropertyTable("linearExpansionPercent")
+        tooHot = table.maxTc + 100.0
+        with mockRunLogs.BufferLog() as mock:
+            values = table(Tc=[400.0, tooHot])
+            self.assertIn("out of range", mock.getStdout())
+        self.assertEqual(values[1], self.mat.linearExpansionPercent(Tc=tooHot))
+
+    def test_sharedTables(self):
+        table = self.mat.getPropertyTable("linearExpansionPercent")
+        self.assertIs(HT9().getPropertyTable("linearExpansionPercent"), table)
+
+        other = HT9()
+        other.setMassFrac("C", 0.01)
+        self.assertIsNot(other.getPropertyTable("linearExpansionPercent"), table)
+
+        b4c = B4C()
+        self.assertIsNot(b4c.getPropertyTable("linearExpansionPercent"), table)
+
+    def test_tablesDoNotKeepComponents(self):
+        component = Circle("clad", HT9(), 25.0, 25.0, od=1.0)
+        ref = weakref.ref(component)
+        table = component.material.getPropertyTable("linearExpansionPercent")
+        del component
+        gc.collect()
+        self.assertIsNone(ref())
+        self.assertIsNotNone(table(Tc=table.maxTc + 100.0))
+
+    def test_maxTables(self):
+        with mock.patch.object(propertyTables, "MAX_TABLES", 2):
+            first = self.mat.getPropertyTable("linearExpansionPercent")
+            self.mat.getPropertyTable("linearExpansionPercent", rtol=1e-4)
+            B4C().getPropertyTable("linearExpansionPercent")
+            self.assertEqual(len(propertyTables._TABLES), 2)
+            self.assertIsNot(self.mat.getPropertyTable("linearExpansionPercent"), first)
+
+    def test_validRange(self):
+        with self.assertRaises(ValueError):
+            propertyTables.getPropertyTable(Void(), "density")
+
+        table = propertyTables.getPropertyTable(
+            Void(), "linearExpansionPercent", minT=20.0, maxT=800.0
+        )
+        numpy.testing.assert_array_equal(table(Tc=[100.0, 200.0]), [0.0, 0.0])
+
+    def test_linearExpansionFactors(self):
+        hot = numpy.linspace(100.0, 700.0, 50)
+        cold = numpy.full_like(hot, 25.0)
+        factors = propertyTables.linearExpansionFactors(self.mat, hot, cold)
+        expected = [self.mat.linearExpansionFactor(Tc=t, T0=25.0) for t in hot]
+        numpy.testing.assert_allclose(factors, expected, rtol=0, atol=1e-8)
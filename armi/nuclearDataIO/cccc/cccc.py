@@ -18,6 +18,7 @@ for reactor physics codes.
 """
 import io
 import itertools
+import mmap
 import struct
 import os
 from copy import deepcopy
@@ -31,6 +32,16 @@ from armi.nuclearDataIO import nuclearFileMetadata
 IMPLICIT_INT = "IJKLMN"
 """Letters that trigger implicit integer types in old FORTRAN 77 codes"""
 
+_BINARY_TYPES = {
+    "int": numpy.dtype("i"),
+    "float": numpy.dtype("f"),
+    "double": numpy.dtype("d"),
+}
+"""numpy types of the values in binary CCCC records, for reading and writing in bulk"""
+
+_RESULT_TYPES = {"int": int, "float": float, "double": float}
+"""Types of the arrays that list reads return, which do not depend on the precision"""
+
 
 class IORecord:
     """
@@ -238,9 +249,9 @@ class IORecord:
 
         Notes
         -----
-        This can be important for performance when reading large matrices (e.g. scatter
-        matrices). It may be worth investigating ``numpy.frombuffer`` on read and
-        something similar on write.
+        This reads or writes one value at a time, which is slow for large matrices
+        (e.g. scatter matrices). The binary records override the ``rw*Matrix`` methods
+        to read and write whole matrices at once with numpy instead.
 
         With shape, the first shape argument should be the outermost loop because
         these are stored in column major order (the FORTRAN way).
@@ -343,6 +354,51 @@ class BinaryRecordReader(IORecord):
         (s,) = struct.unpack("%ds" % length, self._stream.read(length))
         return s.rstrip().decode()  # convert bytes to string on reading.
 
+    def rwList(self, contents, containedType, length, strLength=0):
+        """
+        Read a list of values of a specific type.
+
+        Numeric lists are read from the stream in one piece and converted by numpy,
+        rather than one value at a time.
+        """
+        dtype = _BINARY_TYPES.get(containedType)
+        if dtype is None:
+            return IORecord.rwList(self, contents, containedType, length, strLength)
+        return self._readArray(dtype, length).astype(_RESULT_TYPES[containedType])
+
+    def rwMatrix(self, contents, *shape):
+        """Read a matrix of single precision floating point values."""
+        return self._readMatrix(contents, _BINARY_TYPES["float"], shape)
+
+    def rwDoubleMatrix(self, contents, *shape):
+        """Read a matrix of double precision floating point values."""
+        return self._readMatrix(contents, _BINARY_TYPES["double"], shape)
+
+    def rwIntMatrix(self, contents, *shape):
+        """Read a matrix of int values."""
+        return self._readMatrix(contents, _BINARY_TYPES["int"], shape)
+
+    def _readArray(self, dtype, count):
+        """Read ``count`` consecutive values of a numpy dtype from the stream."""
+        numBytes = dtype.itemsize * count
+        self.byteCount += numBytes
+        return numpy.frombuffer(self._stream.read(numBytes), dtype, count)
+
+    def _readMatrix(self, contents, dtype, shape):
+        """
+        Read a matrix stored in column major order.
+
+        See Also
+        --------
+        IORecord._rwMatrix
+        """
+        fortranShape = tuple(reversed(shape))
+        values = self._readArray(dtype, int(numpy.prod(shape))).reshape(shape).T
+        if contents is None or contents.size == 0:
+            contents = numpy.empty(fortranShape)
+        contents[tuple(slice(n) for n in fortranShape)] = values
+        return contents
+
 
 class BinaryRecordWriter(IORecord):
     r"""a single record from a CCCC file.
@@ -404,6 +460,57 @@ class BinaryRecordWriter(IORecord):
         self.data.append(struct.pack("%ds" % length, val.ljust(length).encode("utf-8")))
         return val
 
+    def rwList(self, contents, containedType, length, strLength=0):
+        """
+        Write a list of values of a specific type.
+
+        Numeric lists are packed by numpy in one piece, rather than one value at a time.
+        """
+        dtype = _BINARY_TYPES.get(containedType)
+        if dtype is None:
+            return IORecord.rwList(self, contents, containedType, length, strLength)
+        values = numpy.array(contents[:length])
+        self._writeArray(values, dtype, length)
+        return values
+
+    def rwMatrix(self, contents, *shape):
+        """Write a matrix of single precision floating point values."""
+        return self._writeMatrix(contents, _BINARY_TYPES["float"], shape)
+
+    def rwDoubleMatrix(self, contents, *shape):
+        """Write a matrix of double precision floating point values."""
+        return self._writeMatrix(contents, _BINARY_TYPES["double"], shape)
+
+    def rwIntMatrix(self, contents, *shape):
+        """Write a matrix of int values."""
+        return self._writeMatrix(contents, _BINARY_TYPES["int"], shape)
+
+    def _writeArray(self, values, dtype, count):
+        if len(values) != count:
+            raise ValueError(
+                "Cannot write {} values to a record expecting {}.".format(
+                    len(values), count
+                )
+            )
+        packed = numpy.asarray(values).astype(dtype, casting="same_kind").tobytes()
+        self.numBytes += len(packed)
+        self.data.append(packed)
+
+    def _writeMatrix(self, contents, dtype, shape):
+        """
+        Write a matrix in column major order.
+
+        See Also
+        --------
+        IORecord._rwMatrix
+        """
+        fortranShape = tuple(reversed(shape))
+        values = contents[tuple(slice(n) for n in fortranShape)]
+        # column major order is the row major order of the transpose
+        values = numpy.asarray(values).T.ravel()
+        self._writeArray(values, dtype, values.size)
+        return contents
+
 
 class AsciiRecordReader(BinaryRecordReader):
     """Reads a single CCCC record in ASCII format.
@@ -413,6 +520,12 @@ class AsciiRecordReader(BinaryRecordReader):
     AsciiRecordWriter
     """
 
+    # ASCII values have to be parsed one at a time
+    rwList = IORecord.rwList
+    rwMatrix = IORecord.rwMatrix
+    rwDoubleMatrix = IORecord.rwDoubleMatrix
+    rwIntMatrix = IORecord.rwIntMatrix
+
     def close(self):
         BinaryRecordReader.close(self)
         # read one extra character for the new line \n... python somehow correctly figures out
@@ -559,6 +672,8 @@ class Stream:
         except IOError:
             runLog.error("Cannot find {} in {}".format(self._fileName, os.getcwd()))
             raise
+        if self._fileMode == "rb":
+            self._stream = _mapFile(self._stream)
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
@@ -573,6 +688,29 @@ class Stream:
         recordClass = self._fileModes[self._fileMode]
         return recordClass(self._stream, hasRecordBoundaries)
 
+    def skipRecord(self):
+        """
+        Move past the next record of a binary file without reading its contents.
+
+        Returns
+        -------
+        offset : int
+            The byte position of the contents of the record in the file.
+        numBytes : int
+            The size of the contents of the record.
+        """
+        (numBytes,) = struct.unpack("i", self._stream.read(4))
+        offset = self._stream.tell()
+        self._stream.seek(offset + numBytes)
+        (numBytes2,) = struct.unpack("i", self._stream.read(4))
+        if numBytes2 != numBytes:
+            raise BufferError(
+                "Number of bytes specified at end the of record, {}, "
+                "does not match the originally specified number, {}."
+                "".format(numBytes2, numBytes)
+            )
+        return offset, numBytes
+
     @classmethod
     def readBinary(cls, fileName: str):
         """Read data from a binary file into a data structure."""
@@ -646,6 +784,177 @@ class StreamWithDataContainer(Stream):
         return data
 
 
+class LazyRecordArray:
+    """
+    A read-only array of values that stay in the records of a binary CCCC file until used.
+
+    Large CCCC arrays are often written as one record for each combination of some of
+    their indices, such as one record per energy group and axial plane. This reads only
+    the records holding the values that are indexed, when they are indexed, from a memory
+    map of the file. Nothing is kept in memory between lookups, so e.g. the scalar flux
+    of every node can be pulled out of a file much larger than the memory available.
+
+    Integers, slices, integer lists and boolean masks can be used as indices, but each
+    index applies to its own axis (indices are never broadcast against each other).
+    Indexing returns a new numpy array, and ``numpy.asarray`` reads the whole array.
+    Pickled copies are plain numpy arrays holding all of the values.
+
+    Parameters
+    ----------
+    shape : tuple
+        The shape of the whole array.
+    recordAxes : tuple
+        The axes whose indices select a record.
+    readRecord : callable
+        Called with the index along each of the ``recordAxes``; returns the values for
+        them as an array over the other axes.
+    """
+
+    dtype = numpy.dtype(float)
+
+    def __init__(self, shape, recordAxes, readRecord):
+        self.shape = tuple(shape)
+        self.recordAxes = tuple(recordAxes)
+        self._readRecord = readRecord
+
+    def __repr__(self):
+        return "<{} of shape {}>".format(self.__class__.__name__, self.shape)
+
+    def __len__(self):
+        return self.shape[0]
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    @property
+    def size(self):
+        return int(numpy.prod(self.shape))
+
+    def __array__(self, dtype=None):
+        return self[...].astype(dtype or self.dtype, copy=False)
+
+    def __reduce__(self):
+        return (numpy.asarray, (self[...],))
+
+    def __getitem__(self, key):
+        key = self._expandKey(key)
+        recordKeys = [key[axis] for axis in self.recordAxes]
+        otherKeys = [k for axis, k in enumerate(key) if axis not in self.recordAxes]
+        recordIndices = [
+            numpy.arange(self.shape[axis])[k]
+            for axis, k in zip(self.recordAxes, recordKeys)
+        ]
+        recordIndices = [numpy.atleast_1d(indices) for indices in recordIndices]
+
+        values = None
+        for position in itertools.product(*(range(len(i)) for i in recordIndices)):
+            recordValues = self._readRecord(
+                *(int(indices[p]) for indices, p in zip(recordIndices, position))
+            )
+            recordValues = _indexEachAxis(recordValues, otherKeys)
+            if values is None:
+                values = numpy.empty(
+                    tuple(len(i) for i in recordIndices) + recordValues.shape,
+                    dtype=self.dtype,
+                )
+            values[position] = recordValues
+        if values is None:
+            # nothing was selected along the record axes
+            recordValues = _indexEachAxis(
+                self._readRecord(*(0 for _ in self.recordAxes)), otherKeys
+            )
+            values = numpy.empty(
+                tuple(len(i) for i in recordIndices) + recordValues.shape,
+                dtype=self.dtype,
+            )
+
+        # drop the record axes indexed by integers, and put the others in place
+        keptAxes = [axis for axis, k in enumerate(key) if not _isScalarIndex(k)]
+        values = values.reshape(
+            tuple(
+                len(i)
+                for i, k in zip(recordIndices, recordKeys)
+                if not _isScalarIndex(k)
+            )
+            + values.shape[len(recordIndices) :]
+        )
+        keptRecordAxes = [axis for axis in self.recordAxes if axis in keptAxes]
+        values = numpy.moveaxis(
+            values,
+            range(len(keptRecordAxes)),
+            [keptAxes.index(axis) for axis in keptRecordAxes],
+        )
+        # a single value is returned as a scalar, like numpy does
+        return values[()] if values.ndim == 0 else values
+
+    def _expandKey(self, key):
+        """Return a key with one index per axis."""
+        if not isinstance(key, tuple):
+            key = (key,)
+        ellipses = [i for i, k in enumerate(key) if k is Ellipsis]
+        if ellipses:
+            i = ellipses[0]
+            key = key[:i] + (slice(None),) * (self.ndim - len(key) + 1) + key[i + 1 :]
+        if len(key) > self.ndim or any(k is None or k is Ellipsis for k in key):
+            raise IndexError("Invalid index {} for {}".format(key, self))
+        return key + (slice(None),) * (self.ndim - len(key))
+
+
+def _isScalarIndex(index):
+    return not isinstance(index, slice) and numpy.ndim(index) == 0
+
+
+def _indexEachAxis(values, keys):
+    """Index each axis of an array with its own key."""
+    axis = 0
+    for key in keys:
+        values = values[(slice(None),) * axis + (key,)]
+        if not _isScalarIndex(key):
+            axis += 1
+    return values
+
+
+class MappedRecords:
+    """
+    Read-only access to the contents of the records of a binary file, through a memory map.
+
+    See Also
+    --------
+    Stream.skipRecord : gives the position of the contents of a record.
+    """
+
+    def __init__(self, fileName):
+        self.fileName = fileName
+        self._bytes = numpy.memmap(fileName, dtype=numpy.uint8, mode="r")
+
+    def __repr__(self):
+        return "<{} {}>".format(self.__class__.__name__, self.fileName)
+
+    def read(self, offset, numBytes, dtype=float):
+        """Return the values in some bytes of the file, without copying them."""
+        dtype = numpy.dtype(dtype)
+        return numpy.frombuffer(
+            self._bytes, dtype, count=numBytes // dtype.itemsize, offset=offset
+        )
+
+
+def _mapFile(stream):
+    """
+    Return a read-only memory map of an open binary file, to be read in its place.
+
+    Records are then read straight out of the OS page cache rather than through a
+    second, Python-side buffer. Files that cannot be mapped (e.g. empty ones) are read
+    normally.
+    """
+    try:
+        mapped = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+    except (ValueError, OSError):
+        return stream
+    stream.close()
+    return mapped
+
+
 def getBlockBandwidth(m, nintj, nblok):
     """
     Return block bandwidth JL, JU from CCCC interface files.
@@ -34,17 +34,22 @@ Examples
 >>> nuc.micros.fission[7] = fis5*1.01       # you can modify the isotxs too.
 >>> captureEnergy = nuc.isotxsMetadata["ecapt"]
 >>> isotxs.writeBinary(myLib, 'ISOTXS-modified')
+>>> bigLib = isotxs.readBinaryLazy('ISOTXS-big', maxResidentNuclides=100)
 
 """
 
-import traceback
+import collections
 import itertools
+import os
+import struct
+import traceback
 
 import numpy
 from scipy import sparse
 
 from armi import runLog
 from armi.nuclearDataIO import cccc
+from armi.nuclearDataIO import xsCollections
 from armi.nuclearDataIO import xsNuclides
 from armi.nuclearDataIO import xsLibraries
 from armi.utils import properties
@@ -428,19 +433,33 @@ class _IsotxsNuclideIO:
         try:
             self._rw4DRecord()
             self._nuclide.updateBaseNuclide()
-            self._rw5DRecord()
-            if self._metadata["chiFlag"] > 1:
-                self._rw6DRecord()
-
-            # get scatter matrix
-            for blockNumIndex in range(self._maxScatteringBlocks):
-                for subBlock in range(self._subblockingControl):
-                    if self._metadata["ords"][blockNumIndex] > 0:
-                        # ords flag == 1 implies this scatter type of scattering exists on this nuclide.
-                        self._rw7DRecord(blockNumIndex, subBlock)
+            self._rwMicroRecords()
         finally:
             properties.lockImmutableProperties(self._nuclide)
 
+    def _rwMicroRecords(self):
+        """Read or write the cross sections of the nuclide (the 5D to 7D records)."""
+        self._rw5DRecord()
+        if self._metadata["chiFlag"] > 1:
+            self._rw6DRecord()
+
+        # get scatter matrix
+        for blockNumIndex in range(self._maxScatteringBlocks):
+            for subBlock in range(self._subblockingControl):
+                if self._metadata["ords"][blockNumIndex] > 0:
+                    # ords flag == 1 implies this scatter type of scattering exists on this nuclide.
+                    self._rw7DRecord(blockNumIndex, subBlock)
+
+    def _numMicroRecords(self):
+        """Return the number of records that hold the cross sections of the nuclide."""
+        numScatterBlocks = sum(
+            1
+            for blockNumIndex in range(self._maxScatteringBlocks)
+            if self._metadata["ords"][blockNumIndex] > 0
+        )
+        numChiRecords = 1 if self._metadata["chiFlag"] > 1 else 0
+        return 1 + numChiRecords + numScatterBlocks * self._subblockingControl
+
     def _rw4DRecord(self):
         """
         Read 4D ISOTXS record.
@@ -485,20 +504,21 @@ class _IsotxsNuclideIO:
                 self._metadata["ords"], "int", self._maxScatteringBlocks
             )
             # bandwidth of this block: number of groups that scatter into this group, including this one.
+            keys = [
+                (j, n)
+                for n in range(self._maxScatteringBlocks)
+                for j in range(self._numGroups)
+            ]
             jband = self._metadata["jband"] or {}
-            for n in range(self._maxScatteringBlocks):
-                for j in range(self._numGroups):
-                    jband[j, n] = nucRecord.rwInt(jband.get((j, n), None))
-            self._metadata["jband"] = jband
+            jband = nucRecord.rwList([jband.get(key) for key in keys], "int", len(keys))
+            self._metadata["jband"] = dict(zip(keys, jband.tolist()))
 
             # position of in-group scattering for scattering data in group j
             jj = self._metadata["jj"] or {}
             # Some mcc**2 cases seem to just have a bunch of 1's listed here.
             # does this mean we never have upscatter? possibly.
-            for n in range(self._maxScatteringBlocks):
-                for j in range(self._numGroups):
-                    jj[j, n] = nucRecord.rwInt(jj.get((j, n), None))
-            self._metadata["jj"] = jj
+            jj = nucRecord.rwList([jj.get(key) for key in keys], "int", len(keys))
+            self._metadata["jj"] = dict(zip(keys, jj.tolist()))
 
     def _rw5DRecord(self):
         """Read principal microscopic MG XS data for a nuclide."""
@@ -634,22 +654,17 @@ class _IsotxsNuclideIO:
                     jup = g + metadata["jj"][g, blockNumIndex]
                     bandWidth = metadata["jband"][g, blockNumIndex]
                     jdown = jup - bandWidth
-                    if scatter is None:
-                        indptr.append(len(indices) + bandWidth)
-                        # add the indices in reverse
-                        indices.extend(range(jup - 1, jdown - 1, -1))
-                        # read the data as-is
-                        for _ in range(bandWidth):
-                            dataVals.append(record.rwFloat(0.0))
-                    else:
-                        for xs in reversed(scatter[g, jdown:jup].tolist()):
-                            record.rwFloat(xs)
+                    indptr.append(len(indices) + bandWidth)
+                    # add the indices in reverse
+                    indices.extend(range(jup - 1, jdown - 1, -1))
+                    if scatter is not None:
+                        dataVals.extend(reversed(scatter[g, jdown:jup].tolist()))
+            # the data of the whole record is read or written as-is, in one piece
+            dataVals = record.rwList(dataVals, "float", len(indices))
 
         if scatter is None:
             # we're reading.
-            scatter = sparse.csr_matrix(
-                (numpy.array(dataVals), indices, indptr), shape=(ng, ng)
-            )
+            scatter = sparse.csr_matrix((dataVals, indices, indptr), shape=(ng, ng))
             scatter.eliminate_zeros()
             self._setScatterMatrix(blockNumIndex, scatter)
 
@@ -730,3 +745,146 @@ class _IsotxsNuclideIO:
             )
 
         return scatterMatrix
+
+
+def readBinaryLazy(fileName, maxResidentNuclides=None):
+    """
+    Read a binary ISOTXS file, leaving the cross sections of each nuclide in the file until used.
+
+    Only the file-wide records and the 4D record (the metadata) of each nuclide are read up
+    front, along with the byte position of the rest of the records of each nuclide. The
+    ``micros`` of a nuclide are read from the file the first time they are used, so a
+    library can be opened quickly even if only a few of its nuclides are needed.
+
+    Parameters
+    ----------
+    fileName : str
+        Path to the binary ISOTXS file. It must not change while the library is in use.
+    maxResidentNuclides : int, optional
+        The most nuclides to hold cross sections in memory for. Once more have been read,
+        the cross sections of the least recently used nuclides are released, and are read
+        again if they are used again. There is no limit by default.
+
+    Returns
+    -------
+    lib : IsotxsLibrary
+
+    Notes
+    -----
+    Changes made in place to the ``micros`` of a nuclide are lost if they are released, so
+    ``maxResidentNuclides`` should only be used for libraries that are not modified.
+    Assigning new ``micros`` to a nuclide detaches it from the file.
+    """
+    lib = xsLibraries.IsotxsLibrary()
+    rw = _LazyIsotxsIO(
+        os.path.abspath(fileName),
+        lib,
+        lambda containerKey: _LazyXSNuclide(lib, containerKey),
+        maxResidentNuclides,
+    )
+    with rw:
+        rw.readWrite()
+    return lib
+
+
+class _LazyIsotxsIO(IsotxsIO):
+    """
+    Reads the cross sections of the nuclides of an ISOTXS file on demand.
+
+    Reading the file with this only notes where the cross sections of each nuclide are.
+    The nuclides keep a reference to it, and :py:meth:`loadMicros` reopens the file to
+    read them when they are used.
+    """
+
+    def __init__(self, fileName, lib, getNuclideFunc, maxResidentNuclides=None):
+        IsotxsIO.__init__(self, fileName, lib, "rb", getNuclideFunc)
+        self.maxResidentNuclides = maxResidentNuclides
+        self._offsets = {}
+        self._resident = collections.OrderedDict()
+
+    def _getNuclideIO(self):
+        return _IndexingIsotxsNuclideIO
+
+    def addNuclide(self, nuclide, offset):
+        """Note the byte position of the cross section records of a nuclide."""
+        self._offsets[nuclide.containerKey] = offset
+        nuclide._micros = None
+        nuclide._lazyIO = self
+
+    def loadMicros(self, nuclide):
+        """Read and return the cross sections of a nuclide from the file."""
+        runLog.debug("Reading cross sections of {} from {}".format(nuclide, self))
+        micros = nuclide._micros = xsCollections.XSCollection(parent=nuclide)
+        try:
+            with self:
+                self._stream.seek(self._offsets[nuclide.containerKey])
+                _IsotxsNuclideIO(nuclide, self, self._lib)._rwMicroRecords()
+        except:  # noqa: bare-except
+            nuclide._micros = None
+            raise
+        self.touch(nuclide)
+        return micros
+
+    def touch(self, nuclide):
+        """Mark the cross sections of a nuclide as used, releasing the least recently used ones."""
+        if self.maxResidentNuclides is None:
+            return
+        self._resident[nuclide.containerKey] = nuclide
+        self._resident.move_to_end(nuclide.containerKey)
+        if len(self._resident) > self.maxResidentNuclides:
+            # nuclides that were replaced in the library do not take up a place
+            for key, resident in list(self._resident.items()):
+                if self._lib.get(key, None) is not resident:
+                    del self._resident[key]
+        while len(self._resident) > self.maxResidentNuclides:
+            _key, released = self._resident.popitem(last=False)
+            released._micros = None
+
+    def release(self, nuclide):
+        """Stop tracking the cross sections of a nuclide that is detached from the file."""
+        if self._resident.get(nuclide.containerKey) is nuclide:
+            del self._resident[nuclide.containerKey]
+
+
+class _IndexingIsotxsNuclideIO(_IsotxsNuclideIO):
+    """Reads the metadata of a nuclide, but skips over its cross sections."""
+
+    def _rwMicroRecords(self):
+        stream = self._isotxsIO._stream
+        self._isotxsIO.addNuclide(self._nuclide, stream.tell())
+        for _ in range(self._numMicroRecords()):
+            # skip the contents of the record, and the byte count at its end
+            (numBytes,) = struct.unpack("i", stream.read(4))
+            stream.seek(numBytes + 4, os.SEEK_CUR)
+
+
+class _LazyXSNuclide(xsNuclides.XSNuclide):
+    """An XSNuclide whose ``micros`` are read from its ISOTXS file when first used."""
+
+    def __init__(self, xsCollection, xsCollectionKey):
+        self._lazyIO = None
+        self._micros = None
+        xsNuclides.XSNuclide.__init__(self, xsCollection, xsCollectionKey)
+
+    @property
+    def micros(self):
+        micros = self._micros
+        if micros is None:
+            micros = self._lazyIO.loadMicros(self)
+        elif self._lazyIO is not None:
+            self._lazyIO.touch(self)
+        return micros
+
+    @micros.setter
+    def micros(self, value):
+        if self._lazyIO is not None:
+            self._lazyIO.release(self)
+        self._micros = value
+        self._lazyIO = None
+
+    def __getstate__(self):
+        # copies hold all of their cross sections, rather than referring to the file
+        state = self.__dict__.copy()
+        state["_micros"] = self.micros
+        state["_lazyIO"] = None
+        return state
@@ -19,6 +19,8 @@ Examples
 --------
 >>> nhfluxData = NfluxStream.readBinary("NHFLUX")
 >>> NhfluxStream.writeAscii(nhfluxData, "nhflux.ascii")
+>>> bigNhflux = NhfluxStream.readBinaryLazy("NHFLUX-big")
+>>> scalarFlux = bigNhflux.fluxMomentsAll[:, :, 0, :]
 
 """
 import numpy as np
@@ -55,6 +57,14 @@ FILE_SPEC_1D_KEYS_VARIANT11 = (
     "nMoms",
 )
 
+_FLUX_ARRAYS = (
+    "fluxMomentsAll",
+    "partialCurrentsHexAll",
+    "partialCurrentsHex_extAll",
+    "partialCurrentsZAll",
+)
+"""Names of the NHFLUX attributes that can be read lazily"""
+
 
 class NHFLUX(cccc.DataContainer):
     """
@@ -134,6 +144,12 @@ class NHFLUX(cccc.DataContainer):
         This contains all the upward and downward partial currents for all core assemblies
         The assemblies are ordered according to the geodstCoordMap attribute. For DIF3D-VARIANT,
         higher-order data is available for the last axis.
+
+    Notes
+    -----
+    When read with :py:meth:`NhfluxStream.readBinaryLazy`, the flux moments and partial
+    currents are :py:class:`~armi.nuclearDataIO.cccc.cccc.LazyRecordArray` objects,
+    which only read the records of the groups and axial planes that are indexed.
     """
 
     def __init__(self, fName="NHFLUX", variant=False, numDataSetsToRead=1):
@@ -212,10 +228,33 @@ class NHFLUX(cccc.DataContainer):
 
 
 class NhfluxStream(cccc.StreamWithDataContainer):
+    def __init__(self, data: NHFLUX, fileName: str, fileMode: str, lazy=False):
+        cccc.StreamWithDataContainer.__init__(self, data, fileName, fileMode)
+        self._lazy = lazy
+
     @staticmethod
     def _getDataContainer() -> NHFLUX:
         return NHFLUX()
 
+    @classmethod
+    def readBinaryLazy(cls, fileName: str) -> NHFLUX:
+        """
+        Read a binary file, leaving the flux moments and partial currents in it until used.
+
+        Only the file control and geometry records are read up front, along with the byte
+        position of the record of each group and axial plane. The flux moments and
+        partial currents are then read from a memory map of the file, one record at a
+        time, when they are indexed. For instance, ``fluxMomentsAll[:, :, 0, :]`` gives the
+        scalar flux of each node without holding the higher moments in memory.
+
+        The file must not change while the data are in use. Writing the data reads all
+        of it into memory.
+        """
+        data = cls._getDataContainer()
+        with cls(data, fileName, "rb", lazy=True) as rw:
+            rw.readWrite()
+        return data
+
     def readWrite(self):
         r"""
         Read everything from the DIF3D binary file NHFLUX.
@@ -268,6 +307,16 @@ class NhfluxStream(cccc.StreamWithDataContainer):
             self._metadata["npcxy"] - self._metadata["nintxy"] * self._metadata["nSurf"]
         )
 
+        if self._lazy:
+            self._indexFluxRecords()
+            return
+
+        # writing lazily read data needs all of it
+        for name in _FLUX_ARRAYS:
+            values = getattr(self._data, name)
+            if isinstance(values, cccc.LazyRecordArray):
+                setattr(self._data, name, np.asarray(values))
+
         # Typically, flux and current data has units of n/cm^2/s. However, when reading
         # an NHFLUX file produced by VARPOW (where 'iwnhfl'=1), the flux-only data has units
         # of W/cc (there is no current data written to the file).
@@ -340,6 +389,62 @@ class NhfluxStream(cccc.StreamWithDataContainer):
                             self._data.partialCurrentsZAll[:, z, :, gEff, :]
                         )
 
+    def _indexFluxRecords(self):
+        """
+        Note where the flux and current records are, and set up lazy arrays that read them.
+
+        The records are in the same order as :py:meth:`readWrite` reads them. Only the
+        records of the last data set that is read are used.
+        """
+        ng = self._metadata["ngroup"]
+        nz = self._metadata["nintk"]
+        hasCurrents = self._metadata["iwnhfl"] != 1
+
+        fluxOffsets = np.zeros((nz, ng), dtype=int)
+        hexCurrentOffsets = np.zeros((nz, ng), dtype=int)
+        zCurrentOffsets = np.zeros((nz + 1, ng), dtype=int)
+        for _n in range(self._metadata["numDataSetsToRead"]):
+            for g in range(ng):
+                gEff = self._getEnergyGroupIndex(g)
+                for z in range(nz):
+                    fluxOffsets[z, gEff], _numBytes = self.skipRecord()
+                if hasCurrents:
+                    for z in range(nz):
+                        hexCurrentOffsets[z, gEff], _numBytes = self.skipRecord()
+                    for z in range(nz + 1):
+                        zCurrentOffsets[z, gEff], _numBytes = self.skipRecord()
+
+        records = _NhfluxRecords(
+            cccc.MappedRecords(self._fileName),
+            self._metadata,
+            fluxOffsets,
+            hexCurrentOffsets,
+            zCurrentOffsets,
+        )
+        self._data.fluxMomentsAll = cccc.LazyRecordArray(
+            (self._metadata["nintxy"], nz, records.totalMoments, ng),
+            (1, 3),
+            records.readFluxMoments,
+        )
+        if hasCurrents:
+            nAssem = self._metadata["nintxy"]
+            nscoef = self._metadata["nscoef"]
+            self._data.partialCurrentsHexAll = cccc.LazyRecordArray(
+                (nAssem, nz, self._metadata["nSurf"], ng, nscoef),
+                (1, 3),
+                records.readHexPartialCurrents,
+            )
+            self._data.partialCurrentsHex_extAll = cccc.LazyRecordArray(
+                (records.numExternalCurrents, nz, ng, nscoef),
+                (1, 2),
+                records.readExternalPartialCurrents,
+            )
+            self._data.partialCurrentsZAll = cccc.LazyRecordArray(
+                (nAssem, nz + 1, 2, ng, nscoef),
+                (1, 3),
+                records.readZPartialCurrents,
+            )
+
     def _getNumOuterSurfacesHex(self):
         """
         The word "outer" in the method name means along the outside of the core. Thus, this
@@ -552,25 +657,19 @@ class NhfluxStream(cccc.StreamWithDataContainer):
                 - self._metadata["nintxy"] * self._metadata["nSurf"]
             )
 
-            # Loop through all lateral surfaces of all assemblies
-            for i in range(nAssem):
-                for j in range(nSurf):
-                    for m in range(nscoef):
-                        # OUTGOING partial currents on each lateral surface in each assembly.
-                        # If m > 0, other NSCOEF options (i.e., half-angle integrated
-                        # flux when reading DIF3D-Nodal data, and higher current moments
-                        # when reading DIF3D-VARIANT data) are processed.
-                        surfCurrents[i, j, m] = record.rwDouble(surfCurrents[i, j, m])
-
-            for j in range(numPartialCurrentsHex_ext):
-                for m in range(nscoef):
-                    # INCOMING current at each surface of outer core boundary. If m > 0,
-                    # other NSCOEF options (i.e., half-angle integrated flux when
-                    # reading DIF3D-Nodal data, and higher current moments when reading
-                    # DIF3D-VARIANT data) are processed.
-                    externalSurfCurrents[j, m] = record.rwDouble(
-                        externalSurfCurrents[j, m]
-                    )
+            # OUTGOING partial currents on each lateral surface in each assembly, looping
+            # through assemblies, then surfaces. If m > 0 on the last axis, other NSCOEF
+            # options (i.e., half-angle integrated flux when reading DIF3D-Nodal data,
+            # and higher current moments when reading DIF3D-VARIANT data) are processed.
+            surfCurrents[...] = record.rwDoubleMatrix(
+                surfCurrents.T, nAssem, nSurf, nscoef
+            ).T
+
+            # INCOMING current at each surface of outer core boundary, with the same
+            # NSCOEF options.
+            externalSurfCurrents[...] = record.rwDoubleMatrix(
+                externalSurfCurrents.T, numPartialCurrentsHex_ext, nscoef
+            ).T
 
             return surfCurrents, externalSurfCurrents
 
@@ -604,17 +703,14 @@ class NhfluxStream(cccc.StreamWithDataContainer):
             nSurf = 2
             nscoef = self._metadata["nscoef"]
 
-            # Loop through all (up and down) partial currents on all hexes
-            # These loops are in a different order than in the 4D record above!!!
-            # Here we loop through surface FIRST and assemblies SECOND!!!
-            for j in range(nSurf):
-                for i in range(nAssem):
-                    for m in range(nscoef):
-                        # Outward partial current. For m > 0, other NSCOEF options
-                        # (i.e., half-angle integrated flux when reading DIF3D-Nodal
-                        # data, and higher current moments when reading DIF3D-VARIANT
-                        # data) are processed.
-                        surfCurrents[i, j, m] = record.rwDouble(surfCurrents[i, j, m])
+            # All (up and down) partial currents on all hexes. These are in a different
+            # order than in the 4D record above!!! Here we loop through surface FIRST and
+            # assemblies SECOND!!! For m > 0 on the last axis, other NSCOEF options
+            # (i.e., half-angle integrated flux when reading DIF3D-Nodal data, and higher
+            # current moments when reading DIF3D-VARIANT data) are processed.
+            surfCurrents[...] = record.rwDoubleMatrix(
+                surfCurrents.transpose(2, 0, 1), nSurf, nAssem, nscoef
+            ).transpose(1, 2, 0)
 
         return surfCurrents
 
@@ -626,6 +722,67 @@ class NhfluxStream(cccc.StreamWithDataContainer):
         return g
 
 
+class _NhfluxRecords:
+    """
+    Reads the flux moments and partial currents of one group and axial plane of a NHFLUX file.
+
+    The layout of each record is the one read by the ``_rw*`` methods of
+    :py:class:`NhfluxStream`.
+    """
+
+    def __init__(
+        self, records, metadata, fluxOffsets, hexCurrentOffsets, zCurrentOffsets
+    ):
+        self._records = records
+        self._fluxOffsets = fluxOffsets
+        self._hexCurrentOffsets = hexCurrentOffsets
+        self._zCurrentOffsets = zCurrentOffsets
+        self._nAssem = metadata["nintxy"]
+        self._nSurf = metadata["nSurf"]
+        self._nscoef = metadata["nscoef"]
+        self._nMom = metadata["nMom"]
+        self._nMoms = metadata["nMoms"] if metadata["variantFlag"] else 0
+        self.totalMoments = self._nMom + self._nMoms
+        self.numExternalCurrents = metadata["npcxy"] - self._nAssem * self._nSurf
+
+    def _read(self, offset, count):
+        return self._records.read(offset, count * 8)
+
+    def readFluxMoments(self, z, g):
+        """Return the flux moments of each node of an axial plane, for one group."""
+        numValues = self._nAssem * self.totalMoments
+        values = self._read(self._fluxOffsets[z, g], numValues)
+        # the even-parity moments come first, then the odd-parity ones, if any
+        evenParity = values[: self._nAssem * self._nMom].reshape(self._nAssem, -1)
+        if not self._nMoms:
+            return evenParity
+        oddParity = values[self._nAssem * self._nMom :].reshape(self._nAssem, -1)
+        return np.hstack([evenParity, oddParity])
+
+    def _readLateralCurrents(self, z, g):
+        numAssemblyValues = self._nAssem * self._nSurf * self._nscoef
+        numValues = numAssemblyValues + self.numExternalCurrents * self._nscoef
+        values = self._read(self._hexCurrentOffsets[z, g], numValues)
+        return values[:numAssemblyValues], values[numAssemblyValues:]
+
+    def readHexPartialCurrents(self, z, g):
+        """Return the outgoing partial currents of each lateral surface of an axial plane."""
+        values, _external = self._readLateralCurrents(z, g)
+        return values.reshape(self._nAssem, self._nSurf, self._nscoef)
+
+    def readExternalPartialCurrents(self, z, g):
+        """Return the incoming partial currents on the outer boundary of an axial plane."""
+        _values, external = self._readLateralCurrents(z, g)
+        return external.reshape(self.numExternalCurrents, self._nscoef)
+
+    def readZPartialCurrents(self, z, g):
+        """Return the upward and downward partial currents of each node on an axial surface."""
+        values = self._read(
+            self._zCurrentOffsets[z, g], 2 * self._nAssem * self._nscoef
+        )
+        return values.reshape(2, self._nAssem, self._nscoef).transpose(1, 0, 2)
+
+
 class NafluxStream(NhfluxStream):
     """
     NAFLUX is similar in format to the NHFLUX, but contains adjoint flux.
@@ -25,6 +25,8 @@ Examples
 >>> flux = rtflux.RtfluxStream.readBinary("RTFLUX")
 >>> rtflux.RtfluxStream.writeBinary(flux, "RTFLUX2")
 >>> adjointFlux = rtflux.AtfluxStream.readBinary("ATFLUX")
+>>> bigFlux = rtflux.RtfluxStream.readBinaryLazy("RTFLUX-big")
+>>> planeFlux = bigFlux.groupFluxes[:, :, 10, :]
 
 See Also
 --------
@@ -68,7 +70,10 @@ class RtfluxData(cccc.DataContainer):
         cccc.DataContainer.__init__(self)
 
         self.groupFluxes: numpy.ndarray = numpy.array([])
-        """Maps i,j,k,g indices to total real or adjoint flux in n/cm^2-s"""
+        """Maps i,j,k,g indices to total real or adjoint flux in n/cm^2-s
+
+        This is a :py:class:`~armi.nuclearDataIO.cccc.cccc.LazyRecordArray` when read
+        with :py:meth:`RtfluxStream.readBinaryLazy`."""
 
 
 class RtfluxStream(cccc.StreamWithDataContainer):
@@ -85,12 +90,35 @@ class RtfluxStream(cccc.StreamWithDataContainer):
         string indicating if ``fileName`` is being read or written, and
         in ascii or binary format
 
+    lazy: bool
+        whether to leave the fluxes in the file until they are used when reading
     """
 
+    def __init__(self, flux: RtfluxData, fileName: str, fileMode: str, lazy=False):
+        cccc.StreamWithDataContainer.__init__(self, flux, fileName, fileMode)
+        self._lazy = lazy
+
     @staticmethod
     def _getDataContainer() -> RtfluxData:
         return RtfluxData()
 
+    @classmethod
+    def readBinaryLazy(cls, fileName: str) -> RtfluxData:
+        """
+        Read a binary file, leaving the fluxes in it until they are used.
+
+        Only the file control records are read up front, along with the byte position
+        of the records of each group and axial plane. The fluxes are then read from a
+        memory map of the file, one group and plane at a time, when they are indexed.
+
+        The file must not change while the data are in use. Writing the data reads all
+        of it into memory.
+        """
+        data = cls._getDataContainer()
+        with cls(data, fileName, "rb", lazy=True) as rw:
+            rw.readWrite()
+        return data
+
     def readWrite(self):
         """Step through the structure of the file and read/write it."""
         self._rwFileID()
@@ -137,6 +165,14 @@ class RtfluxStream(cccc.StreamWithDataContainer):
         kmax = self._metadata["NINTK"]
         nblck = self._metadata["NBLOK"]
 
+        if self._lazy:
+            self._indexFluxRecords()
+            return
+
+        if isinstance(self._data.groupFluxes, cccc.LazyRecordArray):
+            # writing lazily read data needs all of it
+            self._data.groupFluxes = numpy.asarray(self._data.groupFluxes)
+
         if self._data.groupFluxes.size == 0:
             self._data.groupFluxes = numpy.zeros((imax, jmax, kmax, ng))
 
@@ -158,6 +194,39 @@ class RtfluxStream(cccc.StreamWithDataContainer):
                             imax,
                         )
 
+    def _indexFluxRecords(self):
+        """Note where the flux records are, and set up a lazy array that reads them."""
+        ng = self._metadata["NGROUP"]
+        imax = self._metadata["NINTI"]
+        jmax = self._metadata["NINTJ"]
+        kmax = self._metadata["NINTK"]
+        nblck = self._metadata["NBLOK"]
+
+        # the records of each group and plane hold consecutive bands of j
+        offsets = numpy.zeros((kmax, ng, nblck), dtype=int)
+        for gi in range(ng):
+            gEff = self.getEnergyGroupIndex(gi)
+            for k in range(kmax):
+                for bi in range(nblck):
+                    offsets[k, gEff, bi], _numBytes = self.skipRecord()
+
+        records = cccc.MappedRecords(self._fileName)
+        bands = [cccc.getBlockBandwidth(bi + 1, jmax, nblck) for bi in range(nblck)]
+
+        def readPlane(k, g):
+            return numpy.hstack(
+                [
+                    records.read(offsets[k, g, bi], 8 * imax * (jUp - jLow + 1))
+                    .reshape(jUp - jLow + 1, imax)
+                    .T
+                    for bi, (jLow, jUp) in enumerate(bands)
+                ]
+            )
+
+        self._data.groupFluxes = cccc.LazyRecordArray(
+            (imax, jmax, kmax, ng), (2, 3), readPlane
+        )
+
     def getEnergyGroupIndex(self, g):
         r"""
         Real fluxes stored in RTFLUX have "normal" (or "forward") energy groups.
@@ -13,8 +13,10 @@
 # limitations under the License.
 """Test CCCC."""
 import io
+import pickle
 import unittest
 
+import numpy
 import six
 
 from armi.nuclearDataIO import cccc
@@ -70,6 +72,44 @@ class CcccBinaryRecordTests(unittest.TestCase):
             self.assertEqual(value, reader.rwString(None, size))
         self.assertEqual(size, writer.numBytes)
 
+    def test_writeAndReadLists(self):
+        ints = [1, -2, 3, 123456789]
+        floats = [0.5, -1.25, 3.0e10]
+        doubles = [numpy.pi, -1.0e-30, 7.0]
+        stream = self.streamCls()
+        with self.writerClass(stream) as writer:
+            writer.rwList(ints, "int", len(ints))
+            writer.rwList(numpy.array(floats), "float", len(floats))
+            writer.rwList(doubles, "double", len(doubles))
+        with self.readerClass(self.streamCls(stream.getvalue())) as reader:
+            readInts = reader.rwList(None, "int", len(ints))
+            readFloats = reader.rwList(None, "float", len(floats))
+            readDoubles = reader.rwList(None, "double", len(doubles))
+        self.assertEqual(4 * 7 + 8 * 3, writer.numBytes)
+        self.assertEqual(readInts.tolist(), ints)
+        numpy.testing.assert_allclose(readFloats, floats, rtol=1e-7)
+        numpy.testing.assert_array_equal(readDoubles, doubles)
+
+    def test_writeAndReadMatrices(self):
+        # a (3, 2) matrix in python is written as a FORTRAN (2, 3) matrix
+        matrix = numpy.arange(6.0).reshape(3, 2) - 2.5
+        stream = self.streamCls()
+        with self.writerClass(stream) as writer:
+            writer.rwMatrix(matrix, 2, 3)
+            writer.rwDoubleMatrix(matrix / 3.0, 2, 3)
+            writer.rwIntMatrix((matrix * 2).astype(int), 2, 3)
+            writer.rwList(matrix[:, 0], "float", 3)
+        with self.readerClass(self.streamCls(stream.getvalue())) as reader:
+            readMatrix = reader.rwMatrix(None, 2, 3)
+            readDoubleMatrix = reader.rwDoubleMatrix(None, 2, 3)
+            readIntMatrix = reader.rwIntMatrix(None, 2, 3)
+            # the first column is written first
+            readColumn = reader.rwList(None, "float", 3)
+        numpy.testing.assert_array_equal(readMatrix, matrix)
+        numpy.testing.assert_array_equal(readDoubleMatrix, matrix / 3.0)
+        numpy.testing.assert_array_equal(readIntMatrix, matrix * 2)
+        numpy.testing.assert_array_equal(readColumn, matrix[:, 0])
+
     def test_notReadingAnEntireRecordRaisesException(self):
         # I'm going to create a record with two pieces of data, and only read one...
         stream = self.streamCls()
@@ -105,3 +145,44 @@ class CcccAsciiRecordTests(CcccBinaryRecordTests):
 
     def setUp(self):
         self.streamCls = six.StringIO
+
+
+class LazyRecordArrayTests(unittest.TestCase):
+    def setUp(self):
+        self.values = numpy.arange(4 * 5 * 3 * 6, dtype=float).reshape(4, 5, 3, 6)
+        self.recordsRead = []
+        self.array = cccc.LazyRecordArray(self.values.shape, (1, 3), self._readRecord)
+
+    def _readRecord(self, i, j):
+        self.recordsRead.append((i, j))
+        return self.values[:, i, :, j]
+
+    def test_indexing(self):
+        self.assertEqual(self.array.ndim, 4)
+        self.assertEqual(self.array.size, self.values.size)
+        numpy.testing.assert_array_equal(numpy.asarray(self.array), self.values)
+        for key in [
+            (slice(None), 2, slice(None), 3),
+            (..., 0, slice(None)),
+            (1, slice(1, 4), -1),
+            (slice(None), [0, 3], 1),
+            (..., numpy.array([True, False, True, False, False, True])),
+        ]:
+            numpy.testing.assert_array_equal(self.array[key], self.values[key])
+        self.assertEqual(self.array[1, 4, 2, 5], self.values[1, 4, 2, 5])
+
+        # each index applies to its own axis
+        numpy.testing.assert_array_equal(
+            self.array[:, [0, 2], :, [1, 2]], self.values[:, [0, 2]][..., [1, 2]]
+        )
+        with self.assertRaises(IndexError):
+            self.array[0, 0, 0, 0, 0]
+
+    def test_onlyIndexedRecordsAreRead(self):
+        self.array[:, 1:3, 0, 4]
+        self.assertEqual(self.recordsRead, [(1, 4), (2, 4)])
+
+    def test_pickle(self):
+        copied = pickle.loads(pickle.dumps(self.array))
+        self.assertIsInstance(copied, numpy.ndarray)
+        numpy.testing.assert_array_equal(copied, self.values)
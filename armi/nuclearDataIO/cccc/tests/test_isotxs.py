@@ -12,11 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Tests the workings of the library wrappers."""
+import pickle
 import unittest
 
 from armi import nuclearDataIO
 from armi.nucDirectory import nuclideBases
-from armi.nuclearDataIO import xsLibraries
+from armi.nuclearDataIO import xsLibraries, xsNuclides
 from armi.nuclearDataIO.cccc import isotxs
 from armi.tests import ISOAA_PATH
 from armi.utils.directoryChangers import TemporaryDirectoryChanger
@@ -190,6 +191,74 @@ class TestIsotxs(unittest.TestCase):
             nuclearDataIO.getExpectedGAMISOFileName(cycle=10, xsID="AA")
 
 
+class TestIsotxsLazy(unittest.TestCase):
+    """Tests reading an ISOTXS file with the cross sections left in the file until used."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.lib = isotxs.readBinary(ISOAA_PATH)
+
+    def test_readBinaryLazy(self):
+        lib = isotxs.readBinaryLazy(ISOAA_PATH)
+        self.assertEqual(lib.nuclideLabels, self.lib.nuclideLabels)
+        self.assertIsNone(lib["U235AA"]._micros)
+        self.assertEqual(
+            lib["U235AA"].isotxsMetadata["nuclideId"],
+            self.lib["U235AA"].isotxsMetadata["nuclideId"],
+        )
+
+        # the cross sections are read when used
+        self.assertTrue(isotxs.compare(self.lib, lib))
+        self.assertIsNotNone(lib["U235AA"]._micros)
+
+    def test_maxResidentNuclides(self):
+        lib = isotxs.readBinaryLazy(ISOAA_PATH, maxResidentNuclides=2)
+        for label in ["U235AA", "U238AA", "FEAA"]:
+            self.assertTrue(
+                isotxs.compareNuclideXS(lib[label], self.lib[label]),
+            )
+        # only the two most recently used nuclides keep their cross sections
+        self.assertIsNone(lib["U235AA"]._micros)
+        self.assertIsNotNone(lib["U238AA"]._micros)
+        self.assertIsNotNone(lib["FEAA"]._micros)
+
+        # released cross sections are read again
+        fission = lib["U235AA"].micros.fission
+        self.assertEqual(fission.tolist(), self.lib["U235AA"].micros.fission.tolist())
+        self.assertIsNone(lib["U238AA"]._micros)
+
+        # assigned cross sections are never released
+        lib["U238AA"].micros = self.lib["U238AA"].micros
+        lib["NA23AA"].micros.fission
+        lib["B10AA"].micros.fission
+        self.assertIs(lib["U238AA"].micros, self.lib["U238AA"].micros)
+
+        # and neither detached nor replaced nuclides take up a place
+        lazyIO = lib["B10AA"]._lazyIO
+        self.assertEqual(list(lazyIO._resident), ["NA23AA", "B10AA"])
+        lib["B10AA"].micros = lib["B10AA"].micros
+        lib["FEAA"].micros.fission
+        self.assertIsNotNone(lib["NA23AA"]._micros)
+
+        del lib["FEAA"]
+        lib["FEAA"] = xsNuclides.XSNuclide(lib, "FEAA")
+        lib["U235AA"].micros.fission
+        self.assertIsNotNone(lib["NA23AA"]._micros)
+        self.assertEqual(list(lazyIO._resident), ["NA23AA", "U235AA"])
+
+    def test_writeLazyLibrary(self):
+        with TemporaryDirectoryChanger():
+            isotxs.writeBinary(isotxs.readBinaryLazy(ISOAA_PATH), "lazy.isotxs")
+            isotxs.writeBinary(self.lib, "full.isotxs")
+            with open("lazy.isotxs", "rb") as lazy, open("full.isotxs", "rb") as full:
+                self.assertEqual(lazy.read(), full.read())
+
+    def test_pickleLazyLibrary(self):
+        lib = pickle.loads(pickle.dumps(isotxs.readBinaryLazy(ISOAA_PATH)))
+        self.assertIsNone(lib["U235AA"]._lazyIO)
+        self.assertTrue(isotxs.compare(self.lib, lib))
+
+
 class Isotxs_merge_Tests(unittest.TestCase):
     def test_mergeMccV2FilesRemovesTheFileWideChi(self):
         """Test merging ISOTXS files.
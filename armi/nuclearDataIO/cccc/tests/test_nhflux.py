@@ -121,6 +121,27 @@ class TestNhflux(unittest.TestCase):
             self.nhf.partialCurrentsZ[iNode, iz, j, ig] / 1.6928521e06, 1.0
         )
 
+    def test_readBinaryLazy(self):
+        """The lazily read flux moments and currents match the ones read up front."""
+        lazyNhf = nhflux.NhfluxStream.readBinaryLazy(SIMPLE_HEXZ_NHFLUX)
+        self.assertEqual(lazyNhf.metadata["nintxy"], 19)
+        np.testing.assert_array_equal(lazyNhf.geodstCoordMap, self.nhf.geodstCoordMap)
+        for name in nhflux._FLUX_ARRAYS:
+            np.testing.assert_array_equal(
+                np.asarray(getattr(lazyNhf, name)), getattr(self.nhf, name)
+            )
+        np.testing.assert_array_equal(
+            lazyNhf.fluxMomentsAll[:, 2, 0, 1], self.nhf.fluxMoments[:, 2, 0, 1]
+        )
+        np.testing.assert_array_equal(
+            lazyNhf.partialCurrentsZ, self.nhf.partialCurrentsZ
+        )
+
+        with TemporaryDirectoryChanger():
+            nhflux.NhfluxStream.writeBinary(lazyNhf, "NHFLUX2")
+            with open(SIMPLE_HEXZ_NHFLUX, "rb") as f1, open("NHFLUX2", "rb") as f2:
+                self.assertEqual(f1.read(), f2.read())
+
     def test_write(self):
         """Verify binary equivalence of written binary file."""
         with TemporaryDirectoryChanger():
@@ -180,6 +201,19 @@ class TestNhfluxVariant(unittest.TestCase):
             np.allclose(actualNonzeroFluxMoments, expectedNonzeroFluxMoments)
         )
 
+    def test_readBinaryLazy(self):
+        """The lazily read VARIANT flux moments and currents match the ones read up front."""
+        lazyNhf = nhflux.NafluxStreamVariant.readBinaryLazy(SIMPLE_HEXZ_NHFLUX_VARIANT)
+        adjointNhf = nhflux.NafluxStreamVariant.readBinary(SIMPLE_HEXZ_NHFLUX_VARIANT)
+        for name in nhflux._FLUX_ARRAYS:
+            np.testing.assert_array_equal(
+                np.asarray(getattr(lazyNhf, name)), getattr(adjointNhf, name)
+            )
+        # adjoint groups are reversed
+        np.testing.assert_array_equal(
+            lazyNhf.fluxMomentsAll[:, 2, :, 2], self.nhf.fluxMomentsAll[:, 2, :, 1]
+        )
+
     def test_write(self):
         """Verify binary equivalence of written binary file."""
         with TemporaryDirectoryChanger():
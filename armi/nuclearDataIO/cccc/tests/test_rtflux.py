@@ -52,6 +52,24 @@ class Testrtflux(unittest.TestCase):
                 flux2.groupFluxes[2, 1, 3, 5], flux.groupFluxes[2, 1, 3, 5]
             )
 
+    def test_readBinaryLazy(self):
+        """Ensure a lazily read rtflux matches one read up front."""
+        flux = rtflux.RtfluxStream.readBinary(SIMPLE_RTFLUX)
+        lazyFlux = rtflux.AtfluxStream.readBinaryLazy(SIMPLE_RTFLUX)
+        ng = flux.metadata["NGROUP"]
+        self.assertEqual(lazyFlux.groupFluxes.shape, flux.groupFluxes.shape)
+        self.assertTrue(
+            (lazyFlux.groupFluxes[:, :, 3, :] == flux.groupFluxes[:, :, 3, ::-1]).all()
+        )
+        self.assertEqual(
+            lazyFlux.groupFluxes[2, 1, 3, ng - 6], flux.groupFluxes[2, 1, 3, 5]
+        )
+
+        with TemporaryDirectoryChanger():
+            rtflux.AtfluxStream.writeBinary(lazyFlux, "rtflux2")
+            flux2 = rtflux.RtfluxStream.readBinary("rtflux2")
+            self.assertTrue((flux2.groupFluxes == flux.groupFluxes).all())
+
     def test_rwAscii(self):
         """Ensure that we can read/write in ascii format."""
         with TemporaryDirectoryChanger():
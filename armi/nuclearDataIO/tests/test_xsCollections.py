@@ -16,10 +16,19 @@
 import os
 import unittest
 
+import numpy
+from numpy.testing import assert_allclose
+
 from armi import settings
 from armi.reactor.blocks import HexBlock
 from armi.nuclearDataIO import isotxs
 from armi.nuclearDataIO import xsCollections
+from armi.nuclearDataIO.xsCollections import (
+    BASIC_SCAT_MATRIX,
+    BASIC_XS,
+    DERIVED_XS,
+    TOTAL_XS,
+)
 from armi.tests import ISOAA_PATH
 from armi.utils.directoryChangers import TemporaryDirectoryChanger
 from armi.utils.plotting import plotNucXs
@@ -100,6 +109,57 @@ class TestXsCollections(unittest.TestCase):
         self.assertAlmostEqual(sum(self.mc.macros.fission), totalMacroFissionXs)
         self.assertAlmostEqual(sum(self.mc.macros.absorption), totalMacroAbsXs)
 
+    def test_createMacrosForBlocks(self):
+        """Batched macros match the macros built one block at a time."""
+        blocks = [self.block]
+        for i, nucName in enumerate(["PU239", "NA23", "ZR", "B10"]):
+            block = MockBlock()
+            block.setNumberDensity("U238", 0.01 * (i + 1))
+            block.setNumberDensity(nucName, 0.005)
+            # below the minimum density, so not included
+            block.setNumberDensity("FE", 1e-14)
+            blocks.append(block)
+
+        macros = self.mc.createMacrosForBlocks(self.microLib, blocks)
+
+        self.assertEqual(len(macros), len(blocks))
+        for block, batchMacros in zip(blocks, macros):
+            refMacros = self.mc.createMacrosFromMicros(self.microLib, block)
+            for xsName in BASIC_XS + DERIVED_XS + TOTAL_XS + ["chi"]:
+                assert_allclose(batchMacros[xsName], refMacros[xsName], rtol=1e-12)
+            assert_allclose(
+                batchMacros.diffusionConstants, refMacros.diffusionConstants
+            )
+            for matrixName in BASIC_SCAT_MATRIX + ["totalScatter"]:
+                assert_allclose(
+                    batchMacros[matrixName].toarray(),
+                    refMacros[matrixName].toarray(),
+                    rtol=1e-12,
+                )
+
+        # each scatter matrix has its own index arrays, so it can be changed in place
+        first, second = macros[0].elasticScatter, macros[1].n2nScatter
+        self.assertFalse(numpy.shares_memory(first.indices, second.indices))
+        self.assertFalse(numpy.shares_memory(first.indptr, second.indptr))
+        expected = (2 * first).toarray()
+        first += first
+        first.eliminate_zeros()
+        first.sum_duplicates()
+        first.sort_indices()
+        assert_allclose(first.toarray(), expected)
+        assert_allclose(
+            macros[1].elasticScatter.toarray(),
+            self.mc.createMacrosFromMicros(
+                self.microLib, blocks[1]
+            ).elasticScatter.toarray(),
+            rtol=1e-12,
+        )
+
+    def test_createMacrosForBlocksMissingNuclide(self):
+        self.block.setNumberDensity("XE135", 0.001)
+        with self.assertRaises(ValueError):
+            self.mc.createMacrosForBlocks(self.microLib, [self.block])
+
     def test_collapseCrossSection(self):
         """
         Tests cross section collapsing.
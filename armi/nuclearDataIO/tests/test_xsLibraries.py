@@ -539,6 +539,30 @@ class Combined_merge_Tests(unittest.TestCase):
         )
         self.assertEqual(set(lib.nuclideLabels), set(self.libCombined.nuclideLabels))
 
+    def test_mergeAllXSLibFilesConcurrently(self):
+        serialLib = xsLibraries.IsotxsLibrary()
+        xsLibraries.mergeXSLibrariesInWorkingDirectory(
+            serialLib, alternateDirectory=FIXTURE_DIR, maxWorkers=1
+        )
+
+        lib = xsLibraries.IsotxsLibrary()
+        with TemporaryDirectoryChanger():
+            with mockRunLogs.BufferLog() as log:
+                xsLibraries.mergeXSLibrariesInWorkingDirectory(
+                    lib,
+                    alternateDirectory=FIXTURE_DIR,
+                    maxWorkers=2,
+                    mergedFileName="ISOTXS-merged",
+                )
+                self.assertIn("Read 2 cross section library files", log.getStdout())
+                self.assertIn("Merged 2 cross section libraries", log.getStdout())
+            merged = isotxs.readBinary("ISOTXS-merged")
+
+        # the libraries are merged in the same order however they are read
+        self.assertEqual(lib.nuclideLabels, serialLib.nuclideLabels)
+        self.assertEqual(merged.nuclideLabels, lib.nuclideLabels)
+        self.assertTrue(xsLibraries.compare(merged, serialLib))
+
 
 # Remove the abstract class, so that it does not run (all tests would fail)
 del TestXSlibraryMerging
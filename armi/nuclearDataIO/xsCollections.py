@@ -37,6 +37,8 @@ macroCollection = mc.createMacrosFromMicros(microLib, block)
 blocksWithMacros = mc.createMacrosOnBlocklist(microLib, blocks)
 
 """
+import collections
+
 import numpy
 from scipy import sparse
 
@@ -382,12 +384,153 @@ class MacroscopicCrossSectionCreator:
         self, microLibrary, blockList, nucNames=None, libType="micros"
     ):
         """Create macroscopic cross sections for a list of blocks."""
-        for block in blockList:
-            block.macros = self.createMacrosFromMicros(
-                microLibrary, block, nucNames, libType=libType
-            )
+        macros = self.createMacrosForBlocks(
+            microLibrary, blockList, nucNames, libType=libType
+        )
+        for block, blockMacros in zip(blockList, macros):
+            block.macros = blockMacros
         return blockList
 
+    def createMacrosForBlocks(
+        self, microLibrary, blockList, nucNames=None, libType="micros"
+    ):
+        """
+        Create macroscopic cross sections for many blocks at once.
+
+        This gives the same cross sections as calling :py:meth:`createMacrosFromMicros`
+        on each block, but is much faster for many blocks. The blocks are grouped by
+        their XS suffix, and the microscopic cross sections of each suffix are stacked
+        into (nuclide x group) arrays, so that the macroscopic cross sections of all
+        of the blocks of a suffix are products of their number densities with these
+        arrays. The scatter matrices of a suffix are summed over one common sparsity
+        pattern, so the macroscopic scatter matrices of all of its blocks share the
+        same (read-only) index arrays and only differ by their data.
+
+        Parameters
+        ----------
+        microLibrary : xsLibraries.IsotxsLibrary
+            Input micros
+
+        blockList : list of Block
+            Objects whose number densities should be used to generate macros
+
+        nucNames : list, optional
+            List of nuclides to include in the macros. Defaults to all in each block.
+
+        libType : str, optional
+            The block attribute containing the desired microscopic XS for this block:
+            either "micros" for neutron XS or "gammaXS" for gamma XS.
+
+        Returns
+        -------
+        macros : list of xsCollection.XSCollection
+            A new XSCollection for each block, in the order of ``blockList``.
+        """
+        runLog.debug(
+            "Building macroscopic cross sections for {} blocks".format(len(blockList))
+        )
+        bySuffix = collections.defaultdict(list)
+        for i, block in enumerate(blockList):
+            bySuffix[block.getMicroSuffix()].append(i)
+
+        macros = [None] * len(blockList)
+        for suffix, indices in bySuffix.items():
+            tensors = _MicroTensors(
+                microLibrary, suffix, libType, self.buildScatterMatrix
+            )
+            blocks = [blockList[i] for i in indices]
+            for i, blockMacros in zip(
+                indices, self._createMacrosForSuffix(tensors, blocks, nucNames)
+            ):
+                macros[i] = blockMacros
+        return macros
+
+    def _createMacrosForSuffix(self, tensors, blocks, nucNames):
+        """Create the macros of blocks that all have the suffix of ``tensors``."""
+        lib = tensors.lib
+        column = tensors.column
+        densities = []
+        chiDensities = []
+        skippedNuclides = []
+        for block in blocks:
+            blockNucNames = block.getNuclides() if nucNames is None else nucNames
+            blockDensities = {}
+            for nucName, dens in zip(
+                blockNucNames, block.getNuclideNumberDensities(blockNucNames)
+            ):
+                if dens > self.minimumNuclideDensity and dens:
+                    nucColumn = tensors.getColumn(nucName)
+                    if nucColumn is not None:
+                        blockDensities[nucColumn] = dens
+                    elif nucName not in skippedNuclides:
+                        skippedNuclides.append(nucName)
+            densities.append(blockDensities)
+            # chi is weighted by all of the nuclides in the block
+            chiDensities.append(
+                {
+                    column[nucName]: dens
+                    for nucName, dens in block.getNumberDensities().items()
+                    if nucName in column
+                }
+            )
+
+        if skippedNuclides:
+            msg = "The following nuclides are not in microscopic library {}: {}".format(
+                lib, skippedNuclides
+            )
+            runLog.error(msg, single=True)
+            raise ValueError(msg)
+
+        # blocks only hold some of the nuclides, so the densities are sparse
+        densities = _toSparseRows(densities, len(column))
+        chiDensities = _toSparseRows(chiDensities, len(column))
+
+        vectors = {}
+        for reaction, micro in tensors.vectors.items():
+            macro = densities @ micro.reshape(len(micro), -1)
+            vectors[reaction] = macro.reshape((len(blocks),) + micro.shape[1:])
+        absorption = numpy.zeros((len(blocks), tensors.ng))
+        for reaction in ABSORPTION_XS:
+            absorption += vectors[reaction]
+
+        matrixData = {
+            matrixName: densities @ micro
+            for matrixName, micro in tensors.matrixData.items()
+        }
+        totalScatter = (
+            matrixData["elasticScatter"]
+            + matrixData["inelasticScatter"]
+            + matrixData["n2nScatter"] * 2.0
+        )
+        # outscatter is the column sum of the total scatter matrix minus its diagonal
+        outScatter = (tensors.columnSums @ totalScatter.T).T
+        outScatter[:, tensors.diagonalGroups] -= totalScatter[
+            :, tensors.diagonalPositions
+        ]
+        removal = absorption - vectors[N2N_XS] + outScatter
+
+        weights = chiDensities.multiply(tensors.nuFissionTotal).tocsr()
+        chiNumerators = weights @ tensors.chi
+        chiDenominators = weights.sum(axis=1).getA1()
+
+        macros = []
+        for row, block in enumerate(blocks):
+            m = XSCollection(parent=block)
+            for reaction, values in vectors.items():
+                setattr(m, reaction, values[row])
+            m.absorption = absorption[row]
+            m.removal = removal[row]
+            m.diffusionConstants = 1.0 / (3.0 * m.transport)
+            for matrixName, data in matrixData.items():
+                setattr(m, matrixName, tensors.makeMatrix(data[row]))
+            m.totalScatter = tensors.makeMatrix(totalScatter[row])
+            if chiDenominators[row] != 0.0:
+                m.chi = chiNumerators[row] / chiDenominators[row]
+            else:
+                m.chi = numpy.zeros(lib.numGroups)
+            macros.append(m)
+        return macros
+
     def createMacrosFromMicros(
         self, microLibrary, block, nucNames=None, libType="micros"
     ):
@@ -543,6 +686,149 @@ class MacroscopicCrossSectionCreator:
         self.macros.removal += columnSum - diags
 
 
+def _toSparseRows(rows, numColumns):
+    """Build a CSR matrix from a list of {column: value} dictionaries, one per row."""
+    indptr = numpy.cumsum([0] + [len(row) for row in rows])
+    indices = [column for row in rows for column in row]
+    data = [value for row in rows for value in row.values()]
+    return sparse.csr_matrix(
+        (data, indices, indptr), shape=(len(rows), numColumns), dtype=float
+    )
+
+
+class _MicroTensors:
+    """
+    The microscopic cross sections of all of the nuclides of one XS suffix, as arrays.
+
+    The first axis of every array is the nuclide, in the order given by ``column``, so
+    that the macroscopic cross sections of many blocks are the products of their
+    (block x nuclide) number densities with these arrays.
+
+    The scatter matrices of all nuclides and reactions are laid out over the union of
+    their sparsity patterns, in CSR order. ``matrixData`` holds the (nuclide x entry)
+    values of each reaction, and :py:meth:`makeMatrix` turns a row of values over the
+    pattern back into a sparse matrix.
+    """
+
+    def __init__(self, lib, suffix, libType, buildScatterMatrix):
+        self.lib = lib
+        self.suffix = suffix
+        self.ng = getattr(lib, "numGroups" + _getLibTypeSuffix(libType))
+        nuclides = lib.getNuclides(suffix)
+        self.column = {nuc.name: i for i, nuc in enumerate(nuclides)}
+        self._columnOfNuclide = {id(nuc): i for i, nuc in enumerate(nuclides)}
+        self._columnOfName = {}
+        microCollections = [getattr(nuc, libType) for nuc in nuclides]
+
+        self.vectors = {}
+        for reaction in BASIC_XS + TOTAL_XS:
+            if reaction == NUSIGF:
+                micros = [
+                    numpy.asarray(c.fission) * _getXsMultiplier(nuc, NU, libType)
+                    for nuc, c in zip(nuclides, microCollections)
+                ]
+            else:
+                micros = [numpy.asarray(getattr(c, reaction)) for c in microCollections]
+            self.vectors[reaction] = self._stack(micros)
+
+        # chi is always computed from the neutron cross sections
+        self.chi = self._stack([numpy.asarray(nuc.micros.chi) for nuc in nuclides])
+        self.nuFissionTotal = numpy.array(
+            [
+                sum(nuc.micros.neutronsPerFission * nuc.micros.fission)
+                for nuc in nuclides
+            ]
+        ).reshape(len(nuclides))
+
+        self._buildScatterPattern(microCollections if buildScatterMatrix else [])
+
+    def _stack(self, micros):
+        """Stack per-nuclide arrays, allowing empty ones to have any shape."""
+        if not micros:
+            return numpy.zeros((0, self.ng))
+        shape = micros[0].shape
+        return numpy.stack(
+            [
+                micro if micro.shape == shape or micro.any() else numpy.zeros(shape)
+                for micro in micros
+            ]
+        )
+
+    def _buildScatterPattern(self, microCollections):
+        ng = self.ng
+        coos = {
+            matrixName: [
+                None
+                if getattr(c, matrixName) is None
+                else getattr(c, matrixName).tocoo()
+                for c in microCollections
+            ]
+            for matrixName in BASIC_SCAT_MATRIX
+        }
+        # entries of the union pattern are identified by their row-major flat index
+        allKeys = [
+            coo.row.astype(numpy.int64) * ng + coo.col
+            for matrices in coos.values()
+            for coo in matrices
+            if coo is not None
+        ]
+        keys = numpy.unique(numpy.concatenate(allKeys)) if allKeys else numpy.zeros(0)
+        keys = keys.astype(numpy.int64)
+        rows = keys // ng
+        cols = keys % ng
+
+        self.matrixData = {}
+        for matrixName, matrices in coos.items():
+            data = numpy.zeros((len(self.column), len(keys)))
+            for nucIndex, coo in enumerate(matrices):
+                if coo is not None:
+                    nucKeys = coo.row.astype(numpy.int64) * ng + coo.col
+                    positions = numpy.searchsorted(keys, nucKeys)
+                    numpy.add.at(data[nucIndex], positions, coo.data)
+            self.matrixData[matrixName] = data
+
+        # read-only, since every matrix is built from copies of them
+        self.indices = cols.astype(numpy.int32)
+        self.indptr = numpy.searchsorted(rows, numpy.arange(ng + 1)).astype(numpy.int32)
+        self.indices.flags.writeable = False
+        self.indptr.flags.writeable = False
+
+        entries = numpy.arange(len(keys))
+        self.columnSums = sparse.csr_matrix(
+            (numpy.ones(len(keys)), (cols, entries)), shape=(ng, len(keys))
+        )
+        onDiagonal = rows == cols
+        self.diagonalPositions = entries[onDiagonal]
+        self.diagonalGroups = rows[onDiagonal]
+
+    def getColumn(self, nucName):
+        """
+        Return the column of an ARMI nuclide name, as found by the library.
+
+        This is usually the same as ``column[nucName]``, but goes through
+        ``getNuclide`` so that the library decides which of its nuclides is used.
+        Returns None if the library does not have the nuclide.
+        """
+        if nucName not in self._columnOfName:
+            try:
+                nuc = self.lib.getNuclide(nucName, self.suffix)
+            except KeyError:
+                nuc = None
+            self._columnOfName[nucName] = self._columnOfNuclide.get(id(nuc))
+        return self._columnOfName[nucName]
+
+    def makeMatrix(self, data):
+        """
+        Return the scatter matrix with the given values over the shared pattern.
+
+        The matrix gets its own copy of the index arrays, so it can be modified in place
+        (e.g., with ``eliminate_zeros``) like any other matrix.
+        """
+        return sparse.csr_matrix(
+            (data, self.indices.copy(), self.indptr.copy()), shape=(self.ng, self.ng)
+        )
+
+
 def computeBlockAverageChi(b, isotxsLib):
     r"""
     Return the block average total chi vector based on isotope chi vectors.
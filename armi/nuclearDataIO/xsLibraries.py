@@ -20,6 +20,8 @@ cross sections, but are not necessarily intended to be only neutron and gamma da
 import glob
 import os
 import re
+import time
+from concurrent import futures
 
 from armi import runLog
 from armi.nucDirectory import nuclideBases
@@ -148,6 +150,8 @@ def mergeXSLibrariesInWorkingDirectory(
     xsLibrarySuffix="",
     mergeGammaLibs=False,
     alternateDirectory=None,
+    maxWorkers=None,
+    mergedFileName=None,
 ):
     """
     Merge neutron (ISOTXS) and gamma (GAMISO/PMATRX) library data into the provided library.
@@ -159,6 +163,11 @@ def mergeXSLibrariesInWorkingDirectory(
     it is needed by a non-fuel cross section, but if the convention is not followed then
     this could cause an issue.
 
+    The files are read concurrently in a thread pool. Adding the dummy nuclides and
+    merging are then done in the sorted order of the files, since the dummy nuclide data
+    are taken from the first library that has them. The merge takes the nuclide objects
+    of each library rather than copying them. The time spent in each stage is logged.
+
     Parameters
     ----------
     lib : obj
@@ -176,6 +185,14 @@ def mergeXSLibrariesInWorkingDirectory(
     alternateDirectory : str, optional
         An alternate directory in which to search for files other than the working directory. The main purpose
         of this is for testing, but it could also be useful to users.
+
+    maxWorkers : int, optional
+        The maximum number of threads used to read the files. Defaults to the
+        ``concurrent.futures.ThreadPoolExecutor`` default.
+
+    mergedFileName : str, optional
+        If given, the merged ISOTXS data are written to this file once all libraries
+        have been merged.
     """
     from armi.nuclearDataIO.cccc import isotxs
     from armi.nuclearDataIO.cccc import gamiso
@@ -187,9 +204,8 @@ def mergeXSLibrariesInWorkingDirectory(
     xsLibFiles = getISOTXSLibrariesToMerge(
         xsLibrarySuffix, [iso for iso in glob.glob(globPath)]
     )
-    librariesToMerge = []
-    neutronVelocities = {}  # Dictionary of neutron velocities from each ISOTXS file
-    referenceDummyNuclides = None
+    # (xsID, ISOTXS path, GAMISO path, PMATRX path) for each XS ID to merge
+    libraryPaths = []
     for xsLibFilePath in sorted(xsLibFiles):
         try:
             # get XS ID from the cross section library name
@@ -214,7 +230,35 @@ def mergeXSLibrariesInWorkingDirectory(
             )
             continue
 
-        neutronLibrary = isotxs.readBinary(xsLibFilePath)
+        if mergeGammaLibs:
+            gamisoLibraryPath, pmatrxLibraryPath = _getGammaLibraryPaths(
+                baseDir, xsLibrarySuffix, xsID
+            )
+        else:
+            gamisoLibraryPath = pmatrxLibraryPath = None
+        libraryPaths.append((xsID, xsLibFilePath, gamisoLibraryPath, pmatrxLibraryPath))
+
+    start = time.time()
+    readTasks = []
+    for _xsID, isotxsPath, gamisoPath, pmatrxPath in libraryPaths:
+        readTasks.append((isotxs.readBinary, isotxsPath))
+        if mergeGammaLibs:
+            readTasks.append((gamiso.readBinary, gamisoPath))
+            readTasks.append((pmatrx.readBinary, pmatrxPath))
+    libraries = _readLibraries(readTasks, maxWorkers)
+    runLog.info(
+        "Read {} cross section library files in {:.2f} s".format(
+            len(readTasks), time.time() - start
+        )
+    )
+
+    start = time.time()
+    librariesToMerge = []
+    neutronVelocities = {}  # Dictionary of neutron velocities from each ISOTXS file
+    referenceDummyNuclides = None
+    libraries = iter(libraries)
+    for xsID, _isotxsPath, gamisoLibraryPath, pmatrxLibraryPath in libraryPaths:
+        neutronLibrary = next(libraries)
         neutronVelocities[xsID] = neutronLibrary.neutronVelocity
 
         dummyNuclidesInNeutron = [
@@ -244,40 +288,8 @@ def mergeXSLibrariesInWorkingDirectory(
                 referenceDummyNuclides = dummyNuclidesInNeutron
 
         if mergeGammaLibs:
-            gamisoLibraryPath = os.path.join(
-                baseDir,
-                nuclearDataIO.getExpectedGAMISOFileName(
-                    suffix=xsLibrarySuffix, xsID=xsID
-                ),
-            )
-            pmatrxLibraryPath = os.path.join(
-                baseDir,
-                nuclearDataIO.getExpectedPMATRXFileName(
-                    suffix=xsLibrarySuffix, xsID=xsID
-                ),
-            )
-
-            # Check if the gamiso and pmatrx data paths exist with the xs library suffix so that
-            # these are merged in. If they don't both exist then that is OK and we can just
-            # revert back to expecting the files just based on the XS ID.
-            if not (
-                os.path.exists(gamisoLibraryPath) and os.path.exists(pmatrxLibraryPath)
-            ):
-                runLog.warning(
-                    "One of GAMISO or PMATRX data exist for "
-                    f"XS ID {xsID} with suffix {xsLibrarySuffix}. "
-                    "Attempting to find GAMISO/PMATRX data with "
-                    f"only XS ID {xsID} instead."
-                )
-                gamisoLibraryPath = os.path.join(
-                    baseDir, nuclearDataIO.getExpectedGAMISOFileName(xsID=xsID)
-                )
-                pmatrxLibraryPath = os.path.join(
-                    baseDir, nuclearDataIO.getExpectedPMATRXFileName(xsID=xsID)
-                )
-
             # GAMISO data
-            gammaLibrary = gamiso.readBinary(gamisoLibraryPath)
+            gammaLibrary = next(libraries)
             addedDummyData = gamiso.addDummyNuclidesToLibrary(
                 gammaLibrary, dummyNuclidesInNeutron
             )  # Add DUMMY nuclide data not produced by MC2-3
@@ -290,7 +302,7 @@ def mergeXSLibrariesInWorkingDirectory(
                 librariesToMerge.append(gammaLibrary)
 
             # PMATRX data
-            pmatrxLibrary = pmatrx.readBinary(pmatrxLibraryPath)
+            pmatrxLibrary = next(libraries)
             addedDummyData = pmatrx.addDummyNuclidesToLibrary(
                 pmatrxLibrary, dummyNuclidesInNeutron
             )  # Add DUMMY nuclide data not produced by MC2-3
@@ -301,12 +313,89 @@ def mergeXSLibrariesInWorkingDirectory(
                 librariesToMerge.append(pmatrxLibraryDummyData)
             else:
                 librariesToMerge.append(pmatrxLibrary)
+    runLog.info(
+        "Added dummy nuclide data to cross section libraries in {:.2f} s".format(
+            time.time() - start
+        )
+    )
+
+    start = time.time()
     for library in librariesToMerge:
         lib.merge(library)
+    runLog.info(
+        "Merged {} cross section libraries in {:.2f} s".format(
+            len(librariesToMerge), time.time() - start
+        )
+    )
+
+    if mergedFileName:
+        start = time.time()
+        isotxs.writeBinary(lib, mergedFileName)
+        runLog.info(
+            "Wrote merged ISOTXS library to {} in {:.2f} s".format(
+                mergedFileName, time.time() - start
+            )
+        )
 
     return neutronVelocities
 
 
+def _getGammaLibraryPaths(baseDir, xsLibrarySuffix, xsID):
+    """Return the paths of the GAMISO and PMATRX files to merge for an XS ID."""
+    from armi import nuclearDataIO
+
+    gamisoLibraryPath = os.path.join(
+        baseDir,
+        nuclearDataIO.getExpectedGAMISOFileName(suffix=xsLibrarySuffix, xsID=xsID),
+    )
+    pmatrxLibraryPath = os.path.join(
+        baseDir,
+        nuclearDataIO.getExpectedPMATRXFileName(suffix=xsLibrarySuffix, xsID=xsID),
+    )
+
+    # Check if the gamiso and pmatrx data paths exist with the xs library suffix so that
+    # these are merged in. If they don't both exist then that is OK and we can just
+    # revert back to expecting the files just based on the XS ID.
+    if not (os.path.exists(gamisoLibraryPath) and os.path.exists(pmatrxLibraryPath)):
+        runLog.warning(
+            "One of GAMISO or PMATRX data exist for "
+            f"XS ID {xsID} with suffix {xsLibrarySuffix}. "
+            "Attempting to find GAMISO/PMATRX data with "
+            f"only XS ID {xsID} instead."
+        )
+        gamisoLibraryPath = os.path.join(
+            baseDir, nuclearDataIO.getExpectedGAMISOFileName(xsID=xsID)
+        )
+        pmatrxLibraryPath = os.path.join(
+            baseDir, nuclearDataIO.getExpectedPMATRXFileName(xsID=xsID)
+        )
+    return gamisoLibraryPath, pmatrxLibraryPath
+
+
+def _readLibraries(readTasks, maxWorkers=None):
+    """
+    Read cross section library files concurrently.
+
+    Parameters
+    ----------
+    readTasks : list
+        ``(readFunction, path)`` pairs.
+    maxWorkers : int, optional
+        The maximum number of threads to use.
+
+    Returns
+    -------
+    list
+        The library read by each task, in the order of the tasks.
+    """
+    if len(readTasks) <= 1 or maxWorkers == 1:
+        return [readFunc(path) for readFunc, path in readTasks]
+
+    with futures.ThreadPoolExecutor(max_workers=maxWorkers) as pool:
+        pending = [pool.submit(readFunc, path) for readFunc, path in readTasks]
+        return [future.result() for future in pending]
+
+
 class _XSLibrary:
     """Parent class for Isotxs and Compxs library objects."""
 
@@ -319,8 +408,9 @@ class _XSLibrary:
     )
 
     def __init__(self):
-        # each element is a string such as U235AA
-        self._orderedNuclideLabels = []
+        # each key is a string such as U235AA. A dict rather than a list keeps the
+        # insertion order while making membership checks cheap for large merges.
+        self._orderedNuclideLabels = {}
 
     def __contains__(self, key):
         return key in self._orderedNuclideLabels
@@ -329,13 +419,13 @@ class _XSLibrary:
         if key in self._orderedNuclideLabels:
             raise AttributeError("{} already contains {}".format(self, key))
         value.container = self
-        self._orderedNuclideLabels.append(key)
+        self._orderedNuclideLabels[key] = None
 
     def __getitem__(self, key):
         raise NotImplementedError
 
     def __delitem__(self, key):
-        self._orderedNuclideLabels.remove(key)
+        del self._orderedNuclideLabels[key]
 
     def merge(self, other):
         raise NotImplementedError
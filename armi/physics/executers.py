@@ -15,14 +15,24 @@
 Executors are useful for having a standard way to run physics calculations.
 
 They may involve external codes (with inputs/execution/output) or in-memory
-data pathways.
+data pathways. Many independent executers can be run together with an
+:py:class:`ExecuterPool`.
 """
+import collections
+import glob
 import hashlib
 import os
+import subprocess
+import sys
+import time
+from concurrent import futures
 
+import tabulate
+
+from armi import context
 from armi import runLog
 from armi.context import getFastPath, MPI_RANK
-from armi.utils import directoryChangers, pathTools
+from armi.utils import directoryChangers, outputCache, pathTools
 
 
 class ExecutionOptions:
@@ -68,6 +78,13 @@ class ExecutionOptions:
         Update the in-memory reactor model with results upon completion. Set to False
         when information from a run is needed for auxiliary purposes rather than progressing
         the reactor model.
+    outputCacheLocation : str
+        Folder of an :py:class:`~armi.utils.outputCache.OutputCache` to reuse the outputs
+        of earlier runs with the same executable and inputs from. No cache is used if
+        this is not set.
+    outputCacheMaxBytes : int
+        Size limit of the output cache, beyond which the least recently used outputs are
+        evicted.
     """
 
     def __init__(self, label=None):
@@ -84,13 +101,21 @@ class ExecutionOptions:
         self.paramsToScaleSubset = None
         self.savePhysicsFiles = False
         self.copyOutput = True
+        self.outputCacheLocation = None
+        self.outputCacheMaxBytes = None
 
     def __repr__(self):
         return f"<{self.__class__.__name__}: {self.label}>"
 
     def fromUserSettings(self, cs):
-        """Set options from a particular CaseSettings object."""
-        raise NotImplementedError()
+        """
+        Set options from a particular CaseSettings object.
+
+        Subclasses should extend this with their own options.
+        """
+        from armi.settings.fwSettings.globalSettings import CONF_OUTPUT_CACHE_LOCATION
+
+        self.outputCacheLocation = cs[CONF_OUTPUT_CACHE_LOCATION] or None
 
     def fromReactor(self, reactor):
         """Set options from a particular reactor object."""
@@ -142,6 +167,7 @@ class Executer:
         self.options = options
         self.r = reactor
         self.dcType = directoryChangers.TemporaryDirectoryChanger
+        self._cacheKey = None
 
     def run(self):
         """
@@ -191,6 +217,28 @@ class DefaultExecuter(Executer):
                 By all means, do use ``DirectoryChanger`` and ``ExecuterOptions``
                 and other utilities.
         """
+        dc = self._prepare()
+        with dc:
+            self.options.workingDir = dc.initial
+            self._updateRunDir(dc.destination)
+            if not self._retrieveCachedOutputs():
+                if self._execute():
+                    self._storeCachedOutputs()
+            output = self._readOutput()
+            if self.options.applyResultsToReactor:
+                output.apply(self.r)
+        self._undoGeometryTransformations()
+        return output
+
+    def _prepare(self):
+        """
+        Transform the geometry and write the input, up to changing into the run directory.
+
+        Returns
+        -------
+        dc : DirectoryChanger
+            The directory changer for the run, which has not been entered yet.
+        """
         self.options.resolveDerivedOptions()
         runLog.debug(self.options.describe())
         if self.options.executablePath and not os.path.exists(
@@ -210,20 +258,12 @@ class DefaultExecuter(Executer):
         # must either write input to CWD for analysis and then copy to runDir
         # or not list it in inputs (for optimization)
         self.writeInput()
-        with self.dcType(
+        return self.dcType(
             self.options.runDir,
             filesToMove=inputs,
             filesToRetrieve=outputs,
             outputPath=outputDir,
-        ) as dc:
-            self.options.workingDir = dc.initial
-            self._updateRunDir(dc.destination)
-            self._execute()
-            output = self._readOutput()
-            if self.options.applyResultsToReactor:
-                output.apply(self.r)
-        self._undoGeometryTransformations()
-        return output
+        )
 
     def _updateRunDir(self, directory):
         """
@@ -262,6 +302,82 @@ class DefaultExecuter(Executer):
         outputs.extend(self.options.extraOutputFiles)
         return inputs, outputs
 
+    def _getOutputCache(self):
+        """Return the output cache to use, if there is one."""
+        if not self.options.outputCacheLocation:
+            return None
+        return outputCache.OutputCache(
+            self.options.outputCacheLocation, maxBytes=self.options.outputCacheMaxBytes
+        )
+
+    def _getCacheKeyExtra(self) -> str:
+        """
+        Return anything other than the executable and the input files that changes the
+        outputs, to distinguish runs in the output cache.
+
+        By default, this is the executer class and its command line, with the run
+        directory left out of it since that differs between runs. Executers that pass
+        options to the code in other ways should add them.
+        """
+        extra = [f"{type(self).__module__}.{type(self).__qualname__}"]
+        command = self._getCommand()
+        if command is not None:
+            if isinstance(command, str):
+                command = [command]
+            runDir = self.options.runDir
+            for arg in command:
+                arg = str(arg)
+                extra.append(arg.replace(runDir, ".") if runDir else arg)
+        return "\n".join(extra)
+
+    def _retrieveCachedOutputs(self) -> bool:
+        """
+        Put the outputs of an earlier run with the same inputs into the run directory.
+
+        Returns
+        -------
+        bool
+            Whether cached outputs were found, in which case the code does not need to
+            be executed.
+        """
+        self._cacheKey = None
+        cache = self._getOutputCache()
+        if cache is None:
+            return False
+        try:
+            inputs, _outputs = self._collectInputsAndOutputs()
+            inputs = _expandFileNames(inputs, renamedIndex=1)
+            if not inputs:
+                # nothing to tell runs apart by
+                return False
+            self._cacheKey = cache.getKey(
+                self.options.executablePath, inputs, extra=self._getCacheKeyExtra()
+            )
+            if cache.retrieve(self._cacheKey, os.getcwd()):
+                runLog.info(f"Retrieved cached outputs for {self.options.label}")
+                return True
+        except Exception as e:
+            runLog.warning(f"Failed to check {cache} for {self}: {e}")
+        return False
+
+    def _storeCachedOutputs(self):
+        """Store the outputs in the run directory in the output cache."""
+        cache = self._getOutputCache()
+        if cache is None or self._cacheKey is None:
+            return
+        # unlike _collectInputsAndOutputs, the main output is kept even if not copied
+        outputs = [self.options.outputFile] if self.options.outputFile else []
+        outputs.extend(self.options.extraOutputFiles)
+        try:
+            cache.store(
+                self._cacheKey,
+                _expandFileNames(outputs, renamedIndex=0),
+                label=self.options.label,
+            )
+        except Exception as e:
+            # the cache is only an optimization, so carry on without it
+            runLog.warning(f"Failed to store outputs of {self} in {cache}: {e}")
+
     def _execute(self) -> bool:
         runLog.extra(
             f"Executing {self.options.executablePath}\n"
@@ -269,8 +385,30 @@ class DefaultExecuter(Executer):
             f"\tOutput: {self.options.outputFile}\n"
             f"\tWorking dir: {self.options.runDir}"
         )
+        command = self._getCommand()
+        if command is not None:
+            self._executeCommand(command)
         return True
 
+    def _getCommand(self):
+        """
+        Return the command line that runs the external code, if there is one.
+
+        Executers that run an external code this way can have it run concurrently with
+        others by an :py:class:`ExecuterPool`. Those that return None are executed by
+        ``_execute`` alone.
+        """
+        return None
+
+    def _executeCommand(self, command):
+        """
+        Run a command returned by ``_getCommand`` in the run directory.
+
+        An :py:class:`ExecuterPool` calls this from a worker thread, so it must not
+        change the working directory or touch the reactor.
+        """
+        subprocess.run(command, cwd=self.options.runDir, check=True)
+
     def writeInput(self):
         pass
 
@@ -285,3 +423,268 @@ class DefaultExecuter(Executer):
 
     def _undoGeometryTransformations(self):
         pass
+
+
+def _expandFileNames(fileList, renamedIndex):
+    """
+    Return the names in the current directory of the files in a list of files to move.
+
+    Globs are expanded, and files renamed in transit with a ``(sourceName, destName)``
+    tuple are named by the item at ``renamedIndex``.
+    """
+    names = []
+    for pattern in fileList:
+        if isinstance(pattern, tuple):
+            names.append(pattern[renamedIndex])
+        else:
+            names.extend(sorted(glob.glob(pattern)))
+    return names
+
+
+ExecuterTiming = collections.namedtuple(
+    "ExecuterTiming", ["label", "prepareTime", "queueWait", "runTime", "finishTime"]
+)
+
+
+class ExecuterPool:
+    """
+    Runs many independent executers at once.
+
+    Each :py:class:`DefaultExecuter` that has a command line to run (see
+    ``DefaultExecuter._getCommand``) goes through its usual sequence, but only the
+    external code runs on one of ``numWorkers`` worker threads. Everything that touches
+    the reactor or the working directory stays on the calling thread, so the inputs of
+    the next executers are written and the outputs of finished ones are read while
+    the external codes run. Outputs are read and applied in the order of the executers.
+    Other executers are run in turn on the calling thread.
+
+    Parameters
+    ----------
+    executers : list of Executer
+        The executers to run.
+    numWorkers : int, optional
+        Number of external codes to run at the same time.
+    maxQueued : int, optional
+        Number of executers that may be prepared but not yet finished at any time,
+        which limits the number of run directories that exist at once. Defaults to
+        twice ``numWorkers``.
+    distributeOverMpi : bool, optional
+        Split the executers over the MPI ranks. Each rank runs its share with its own
+        pool, and the outputs are gathered and applied on the primary rank. Executers
+        that are not :py:class:`DefaultExecuter` all run on the primary rank, since
+        they apply their outputs themselves. All ranks must make the same pool and call
+        :py:meth:`run` together.
+
+    Attributes
+    ----------
+    timings : list of ExecuterTiming
+        Seconds spent preparing each executer (geometry transformations, input writing
+        and staging files), waiting for a worker, running, and reading and applying the
+        output, after a :py:meth:`run`.
+
+    Notes
+    -----
+    Executers in the same pool should not transform the geometry of a shared reactor,
+    since several of them may be prepared before the first one is finished. When
+    distributing over MPI, outputs are applied after the geometry transformations are
+    undone, so they must be picklable and refer to the original reactor. Executers
+    that use an output cache only reuse the outputs of runs that finished before they
+    were prepared, so identical runs in the same pool may all be executed.
+    """
+
+    def __init__(
+        self, executers, numWorkers=1, maxQueued=None, distributeOverMpi=False
+    ):
+        self.executers = list(executers)
+        self.numWorkers = max(1, numWorkers)
+        self.maxQueued = max(self.numWorkers, maxQueued or 2 * self.numWorkers)
+        self.distributeOverMpi = distributeOverMpi and context.MPI_SIZE > 1
+        self.timings = []
+
+    def run(self):
+        """
+        Run all of the executers.
+
+        Returns
+        -------
+        outputs : list
+            The output of each executer, in order. When distributing over MPI, only the
+            primary rank gets the outputs; the other ranks get None.
+        """
+        if not self.distributeOverMpi:
+            runs = self._runLocal(list(enumerate(self.executers)), apply=True)
+            self.timings = [r.getTiming() for r in runs]
+            return [r.output for r in runs]
+
+        # other executers apply their own outputs within ``run``, so they can only run
+        # on the primary rank
+        pooled = [
+            (i, ex)
+            for i, ex in enumerate(self.executers)
+            if isinstance(ex, DefaultExecuter)
+        ]
+        local = pooled[context.MPI_RANK :: context.MPI_SIZE]
+        if context.MPI_RANK == 0:
+            local.extend(
+                (i, ex)
+                for i, ex in enumerate(self.executers)
+                if not isinstance(ex, DefaultExecuter)
+            )
+            local.sort(key=lambda indexed: indexed[0])
+        runs = self._runLocal(local, apply=False)
+        results = [(r.index, r.output, r.getTiming()) for r in runs]
+        allResults = context.MPI_COMM.gather(results, root=0)
+        if context.MPI_RANK != 0:
+            self.timings = [timing for _index, _output, timing in results]
+            return None
+
+        outputs = [None] * len(self.executers)
+        self.timings = [None] * len(self.executers)
+        for index, output, timing in (
+            r for rankResults in allResults for r in rankResults
+        ):
+            outputs[index] = output
+            self.timings[index] = timing
+        for executer, output in zip(self.executers, outputs):
+            # other executers apply their own outputs within ``run``
+            if (
+                isinstance(executer, DefaultExecuter)
+                and executer.options.applyResultsToReactor
+            ):
+                output.apply(executer.r)
+        return outputs
+
+    def _runLocal(self, indexedExecuters, apply):
+        """Run executers on this process, finishing them in order."""
+        toStart = collections.deque(_PooledRun(i, ex) for i, ex in indexedExecuters)
+        queued = collections.deque()
+        finished = []
+        with futures.ThreadPoolExecutor(max_workers=self.numWorkers) as pool:
+            try:
+                while toStart or queued:
+                    while toStart and len(queued) < self.maxQueued:
+                        pooledRun = toStart.popleft()
+                        pooledRun.prepare(pool)
+                        queued.append(pooledRun)
+                    pooledRun = queued.popleft()
+                    pooledRun.finish(apply)
+                    finished.append(pooledRun)
+            except BaseException:
+                for pooledRun in queued:
+                    pooledRun.abandon()
+                raise
+        return finished
+
+    def reportTimings(self):
+        """Write a summary of the time spent on each executer of the last run."""
+        rows = [
+            (t.label, t.prepareTime, t.queueWait, t.runTime, t.finishTime)
+            for t in self.timings
+            if t is not None
+        ]
+        runLog.info(
+            "Executer pool timings (s)\n"
+            + tabulate.tabulate(
+                rows,
+                headers=["Executer", "Prepare", "Queue Wait", "Run", "Finish"],
+                tablefmt="armi",
+                floatfmt=".3f",
+            )
+        )
+
+
+class _PooledRun:
+    """The state of one executer as it goes through an :py:class:`ExecuterPool`."""
+
+    def __init__(self, index, executer):
+        self.index = index
+        self.executer = executer
+        self.dc = None
+        self.future = None
+        self.output = None
+        self._prepared = None
+        self._started = None
+        self._ran = None
+        self._prepareTime = 0.0
+        self._finishTime = 0.0
+
+    def prepare(self, pool):
+        """Prepare the run on this thread and submit its command to a worker."""
+        start = time.perf_counter()
+        if not isinstance(self.executer, DefaultExecuter):
+            self.output = self.executer.run()
+            self._prepareTime = time.perf_counter() - start
+            return
+
+        self.dc = self.executer._prepare()
+        self.dc.__enter__()
+        try:
+            self.executer.options.workingDir = self.dc.initial
+            self.executer._updateRunDir(self.dc.destination)
+            command = None
+            if not self.executer._retrieveCachedOutputs():
+                command = self.executer._getCommand()
+                if command is None and self.executer._execute():
+                    self.executer._storeCachedOutputs()
+        except BaseException:
+            self.dc.__exit__(*sys.exc_info())
+            self.dc = None
+            raise
+        self.dc.close()
+        self._prepared = time.perf_counter()
+        self._prepareTime = self._prepared - start
+        if command is not None:
+            runLog.extra(
+                f"Queuing {self.executer.options.executablePath} "
+                f"in {self.executer.options.runDir}"
+            )
+            self.future = pool.submit(self._executeCommand, command)
+
+    def _executeCommand(self, command):
+        self._started = time.perf_counter()
+        self.executer._executeCommand(command)
+        self._ran = time.perf_counter()
+
+    def finish(self, apply):
+        """Wait for the command, then read and apply the output on this thread."""
+        if self.dc is None:
+            # not a DefaultExecuter, so it already ran
+            return
+        if self.future is not None:
+            futures.wait([self.future])
+        start = time.perf_counter()
+        self.dc.open()
+        try:
+            if self.future is not None:
+                self.future.result()
+                self.executer._storeCachedOutputs()
+            self.output = self.executer._readOutput()
+            if apply and self.executer.options.applyResultsToReactor:
+                self.output.apply(self.executer.r)
+        except BaseException:
+            self.dc.__exit__(*sys.exc_info())
+            self.dc = None
+            raise
+        self.dc.__exit__(None, None, None)
+        self.dc = None
+        self.executer._undoGeometryTransformations()
+        self._finishTime = time.perf_counter() - start
+
+    def abandon(self):
+        """Clean up after a run that will not be finished because another one failed."""
+        if self.future is not None:
+            futures.wait([self.future])
+        if self.dc is not None:
+            self.dc.open()
+            self.dc.__exit__(None, None, None)
+            self.dc = None
+
+    def getTiming(self) -> ExecuterTiming:
+        """Return the time spent on each stage of the run."""
+        return ExecuterTiming(
+            label=self.executer.options.label,
+            prepareTime=self._prepareTime,
+            queueWait=self._started - self._prepared if self._started else 0.0,
+            runTime=self._ran - self._started if self._ran else 0.0,
+            finishTime=self._finishTime,
+        )
@@ -0,0 +1,274 @@
+# Copyright 2019 TerraPower, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Lookup tables used by :py:meth:`FuelHandler.findAssembly
+<armi.physics.fuelCycle.fuelHandlers.FuelHandler.findAssembly>` to search the core.
+
+Shuffle logic typically calls ``findAssembly`` many times during a single outage, and
+each call used to loop over every assembly in the core to sort them into rings, read
+their parameters and measure their distance to a point. A :py:class:`CandidateIndex`
+keeps that information between calls instead:
+
+* The locations of the core are numbered once, in the order of
+  :py:meth:`Core.getAssemblies <armi.reactor.reactors.Core.getAssemblies>`, and
+  grouped by ring.
+* The values of each searched parameter (or of its maximum over the blocks of the
+  assembly) are kept in a column, with one value per location. The column is sorted
+  when needed, so that lower and upper bounds on the parameter are found by bisection.
+* The closest location to a point is found with a KD-tree over the location centers.
+
+Since the locations themselves do not change as assemblies are shuffled, moving
+assemblies with :py:meth:`swap` or :py:meth:`replace` only changes which assembly is at
+the affected locations and updates their parameter values. A column is read again if
+its parameter has been set on any object since it was read, which is noted with the
+``SINCE_LAST_INDEXING`` flag of the parameter definition.
+"""
+import bisect
+from typing import Dict, List, Optional, Tuple
+
+import numpy
+from scipy import spatial
+
+from armi.reactor import parameters
+
+
+class CandidateIndex:
+    """
+    Tables of the assemblies in a core, by location, ring and parameter value.
+
+    Notes
+    -----
+    The index is only valid while the core does not change structurally, other than
+    through :py:meth:`swap` and :py:meth:`replace`; :py:meth:`isCurrent` reports whether
+    it is still valid. Parameter values are read the first time a parameter is searched,
+    and after that for the assemblies that are moved, or for all of them once the
+    parameter has been set again. Since that is tracked on the parameter definitions,
+    only one index should be searched at a time.
+    """
+
+    def __init__(self, core):
+        self.core = core
+        self.version = core._structureVersion
+        self.assemblies = list(core.getAssemblies())
+        self._slots = {a: i for i, a in enumerate(self.assemblies)}
+        self._ringSlots: Dict[int, List[int]] = {}
+        for slot, a in enumerate(self.assemblies):
+            ring = a.spatialLocator.getRingPos()[0]
+            self._ringSlots.setdefault(ring, []).append(slot)
+        self._centers = None
+        self._tree = None
+        self._columns: Dict[Tuple[str, bool], _ParamColumn] = {}
+
+    def isCurrent(self) -> bool:
+        """Whether the core has not changed since the index was built or last updated."""
+        return self.version == self.core._structureVersion
+
+    def __contains__(self, a) -> bool:
+        return a in self._slots
+
+    def getAssembliesInRings(
+        self, ringList, typeSpec, exactType=False, exclusions=None, accepted=None
+    ) -> List[List]:
+        """
+        Return the assemblies of a type in each of a list of rings, in core order.
+
+        Parameters
+        ----------
+        ringList : list of int
+            The rings to find assemblies in.
+        typeSpec : Flags or iterable of Flags
+            Flag types to restrict assemblies to.
+        exactType : bool, optional
+            Match the type in typeSpec exactly.
+        exclusions : iterable of Assemblies, optional
+            Exclude these assemblies from the results.
+        accepted : numpy.ndarray, optional
+            Boolean mask over the locations of the index, as returned by
+            :py:meth:`getBoundsMask`. Assemblies at locations where it is False are
+            excluded.
+
+        Returns
+        -------
+        list of lists
+            The assemblies in each ring of ``ringList``. A ring that is listed more than
+            once only gets assemblies the first time.
+        """
+        exclusions = set(exclusions or ())
+        seen = set()
+        assemblyList = []
+        for ring in ringList:
+            assems = []
+            if ring not in seen:
+                seen.add(ring)
+                for slot in self._ringSlots.get(ring, ()):
+                    if accepted is not None and not accepted[slot]:
+                        continue
+                    a = self.assemblies[slot]
+                    if a in exclusions or not a.hasFlags(typeSpec, exact=exactType):
+                        continue
+                    assems.append(a)
+            assemblyList.append(assems)
+        return assemblyList
+
+    def getValue(self, a, paramName: str, blockLevelMax=False) -> float:
+        """Return the (block-level maximum) value of a parameter of an assembly."""
+        return self._getColumn(paramName, blockLevelMax).values[self._slots[a]]
+
+    def getBoundsMask(self, bounds, blockLevelMax=False) -> numpy.ndarray:
+        """
+        Return which locations hold an assembly within bounds on its parameters.
+
+        Parameters
+        ----------
+        bounds : list of tuples
+            ``(paramName, bound, isLower)`` tuples. ``bound`` is either a value or a
+            ``(paramName, multiplier)`` tuple giving the bound relative to another
+            parameter of the same assembly. A value is out of bounds if it is less than a
+            lower bound or greater than an upper bound, so NaN values are never out of
+            bounds.
+        blockLevelMax : bool, optional
+            Use the maximum of each parameter over the blocks of the assembly.
+
+        Returns
+        -------
+        numpy.ndarray
+            Boolean mask over the locations of the index.
+        """
+        accepted = numpy.ones(len(self.assemblies), dtype=bool)
+        for paramName, bound, isLower in bounds:
+            column = self._getColumn(paramName, blockLevelMax)
+            if isinstance(bound, tuple):
+                otherName, multiplier = bound
+                limits = self._getColumn(otherName, blockLevelMax).values * multiplier
+                if isLower:
+                    accepted &= ~(column.values < limits)
+                else:
+                    accepted &= ~(column.values > limits)
+            elif isLower:
+                accepted[column.getSlotsBelow(bound)] = False
+            else:
+                accepted[column.getSlotsAbove(bound)] = False
+        return accepted
+
+    def findClosest(self, x: float, y: float, maxDistanceSquared=1e10):
+        """
+        Return the assembly with the center closest to a point.
+
+        Ties go to the first of the assemblies in core order, and None is returned if
+        there is no assembly within the maximum distance.
+        """
+        if not self.assemblies:
+            return None
+
+        if self._tree is None:
+            self._centers = numpy.array(
+                [a.spatialLocator.getLocalCoordinates()[:2] for a in self.assemblies]
+            )
+            self._tree = spatial.cKDTree(self._centers)
+
+        distance, _ = self._tree.query((x, y))
+        # the tree only narrows down the candidates; the distances are recomputed
+        # the same way for each of them so that ties are broken consistently
+        near = self._tree.query_ball_point((x, y), distance * (1.0 + 1e-9) + 1e-12)
+        minD, slot = min(
+            ((self._centers[s, 1] - y) ** 2 + (self._centers[s, 0] - x) ** 2, s)
+            for s in near
+        )
+        if minD >= maxDistanceSquared:
+            return None
+        return self.assemblies[slot]
+
+    def swap(self, a1, a2):
+        """Record that two assemblies in the core have exchanged locations."""
+        slot1, slot2 = self._slots[a1], self._slots[a2]
+        self._place(a2, slot1)
+        self._place(a1, slot2)
+        self.version = self.core._structureVersion
+
+    def replace(self, outgoing, incoming):
+        """Record that an assembly has been discharged and another put in its place."""
+        slot = self._slots.pop(outgoing)
+        self._place(incoming, slot)
+        self.version = self.core._structureVersion
+
+    def _place(self, a, slot):
+        self.assemblies[slot] = a
+        self._slots[a] = slot
+        for (paramName, blockLevelMax), column in self._columns.items():
+            column.update(slot, _readParam(a, paramName, blockLevelMax))
+
+    def _getColumn(self, paramName, blockLevelMax) -> "_ParamColumn":
+        key = (paramName, blockLevelMax)
+        column = self._columns.get(key)
+        if column is None or column.isStale():
+            if blockLevelMax:
+                collections = {type(b.p) for a in self.assemblies for b in a}
+            else:
+                collections = {type(a.p) for a in self.assemblies}
+            paramDefs = [pc.pDefs[paramName] for pc in collections]
+            # clear the flags first, so that values set while reading are not missed
+            for pd in paramDefs:
+                pd.assigned &= ~parameters.SINCE_LAST_INDEXING
+            column = _ParamColumn(
+                [_readParam(a, paramName, blockLevelMax) for a in self.assemblies],
+                paramDefs,
+            )
+            self._columns[key] = column
+        return column
+
+
+class _ParamColumn:
+    """The values of one parameter at each location, with a lazily sorted copy."""
+
+    def __init__(self, values, paramDefs):
+        self.values = numpy.array(values, dtype=float)
+        self.paramDefs = paramDefs
+        self._order: Optional[numpy.ndarray] = None
+        self._sorted: Optional[List[float]] = None
+
+    def isStale(self) -> bool:
+        """Whether the parameter has been set since the values were read."""
+        return any(
+            pd.assigned & parameters.SINCE_LAST_INDEXING for pd in self.paramDefs
+        )
+
+    def update(self, slot, value):
+        self.values[slot] = value
+        self._order = None
+        self._sorted = None
+
+    def _sort(self):
+        if self._order is None:
+            # NaN values compare false to everything, so they are left out
+            order = numpy.argsort(self.values, kind="stable")
+            numValid = len(self.values) - numpy.isnan(self.values).sum()
+            self._order = order[:numValid]
+            self._sorted = self.values[self._order].tolist()
+
+    def getSlotsBelow(self, value) -> numpy.ndarray:
+        """Return the locations with a value less than the given one."""
+        self._sort()
+        return self._order[: bisect.bisect_left(self._sorted, value)]
+
+    def getSlotsAbove(self, value) -> numpy.ndarray:
+        """Return the locations with a value greater than the given one."""
+        self._sort()
+        return self._order[bisect.bisect_right(self._sorted, value) :]
+
+
+def _readParam(a, paramName, blockLevelMax):
+    if blockLevelMax:
+        return a.getChildParamValues(paramName).max()
+    return a.p[paramName]
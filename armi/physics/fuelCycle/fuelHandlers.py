@@ -33,6 +33,7 @@ import numpy
 
 from armi import runLog
 from armi.physics.fuelCycle import assemblyRotationAlgorithms as rotAlgos
+from armi.physics.fuelCycle.candidateIndex import CandidateIndex
 from armi.physics.fuelCycle.fuelHandlerFactory import fuelHandlerFactory
 from armi.physics.fuelCycle.fuelHandlerInterface import FuelHandlerInterface
 from armi.physics.fuelCycle.settings import CONF_ASSEMBLY_ROTATION_ALG
@@ -58,6 +59,7 @@ class FuelHandler:
         # other interfaces, etc.
         self.o = operator
         self.moved = []
+        self._candidateIndex = None
         self._handleBackwardsCompatibility()
 
     def _handleBackwardsCompatibility(self):
@@ -174,6 +176,7 @@ class FuelHandler:
         # now wipe out the self.moved version so it doesn't transmit the assemblies during distributeState
         moved = self.moved[:]
         self.moved = []
+        self._candidateIndex = None
         return moved
 
     def chooseSwaps(self, shuffleFactors=None):
@@ -364,6 +367,12 @@ class FuelHandler:
         valuable capabilities were added in fuel management studies. For additional expansion,
         it may be worth reconsidering the design of these query operations ;).
 
+        Searches of the core are answered from a
+        :py:class:`~armi.physics.fuelCycle.candidateIndex.CandidateIndex` that is kept for
+        the rest of the outage. Parameter values are read the first time they are
+        searched, and then only again for assemblies moved with :py:meth:`swapAssemblies`
+        or :py:meth:`dischargeSwap`.
+
         Returns
         -------
         Assembly instance or assemList of assembly instances that match criteria, or None if none
@@ -392,12 +401,21 @@ class FuelHandler:
             close, the assembly with the lesser assemNum wins. This should result in a
             more stable comparison than on floating-point comparisons alone.
             """
-            if numpy.isclose(candidate[0], current[0], rtol=1e-8, atol=1e-8):
+            # same as numpy.isclose(rtol=1e-8, atol=1e-8), without its overhead
+            if abs(candidate[0] - current[0]) <= 1e-8 + 1e-8 * abs(current[0]):
                 return candidate[1].p.assemNum < current[1].p.assemNum
             else:
                 return candidate[0] < current[0]
 
+        # the spent fuel pool and circular rings are not indexed
+        if findFromSfp or circularRingFlag:
+            index = None
+        else:
+            index = self._getCandidateIndex()
+
         def getParamWithBlockLevelMax(a, paramName):
+            if index is not None and a in index:
+                return index.getValue(a, paramName, blockLevelMax)
             if blockLevelMax:
                 return a.getChildParamValues(paramName).max()
             return a.p[paramName]
@@ -455,16 +473,8 @@ class FuelHandler:
 
         if coords:
             # find the assembly closest to xt,yt if coords are given without considering params.
-            aTarg = None
-            minD = 1e10
             xt, yt = coords  # assume (x,y) tuple.
-            for a in self.r.core.getAssemblies():
-                x, y, _ = a.spatialLocator.getLocalCoordinates()
-                d = (y - yt) ** 2 + (x - xt) ** 2
-                if d < minD:
-                    minD = d
-                    aTarg = a
-            return aTarg
+            return self._getCandidateIndex().findClosest(xt, yt)
 
         if findFromSfp:
             # hack to enable SFP searching.
@@ -483,57 +493,39 @@ class FuelHandler:
                 for outer in range(width[0]):
                     candidateRings.append(targetRing + outer + 1)
 
-        # get lists of assemblies in each candidate ring. Do it in this order in case we prefer ones in the first.
-        # scan through all assemblies and find the one (or more) that best fits the criteria
-        for ringI, assemsInRings in enumerate(
-            self._getAssembliesInRings(
-                candidateRings, typeSpec, exactType, exclusions, circularRingFlag
-            )
-        ):
-            for a in assemsInRings:
-                innocent = True
-                # Check that this assembly's minParam is > the minimum for each minParam
-                for minIndex, minVal in enumerate(minVals):
-                    minParam = minParams[minIndex]
-                    if minParam:
-                        # a minimum was specified. Check to see if we're ok
-                        if isinstance(minVal, tuple):
-                            # tuple turned in. it's a multiplier and a param
-                            realMinVal = (
-                                getParamWithBlockLevelMax(a, minVal[0]) * minVal[1]
-                            )
-                        else:
-                            realMinVal = minVal
-
-                        if getParamWithBlockLevelMax(a, minParam) < realMinVal:
-                            # this assembly does not meet the minVal specifications. Skip it.
-                            innocent = False
-                            break  # for speed (not a big deal here)
-
-                if not innocent:
-                    continue
-
-                # Check upper bounds, to make sure this assembly doesn't have maxParams>maxVals
-                for maxIndex, maxVal in enumerate(maxVals):
-                    maxParam = maxParams[maxIndex]
-                    if maxParam:
-                        if isinstance(maxVal, tuple):
-                            # tuple turned in. it's a multiplier and a param
-                            realMaxVal = (
-                                getParamWithBlockLevelMax(a, maxVal[0]) * maxVal[1]
-                            )
-                        else:
-                            realMaxVal = maxVal
+        # lower and upper bounds on params, as (param, bound, isLower) tuples
+        bounds = [(p, v, True) for p, v in zip(minParams, minVals) if p] + [
+            (p, v, False) for p, v in zip(maxParams, maxVals) if p
+        ]
 
-                        if getParamWithBlockLevelMax(a, maxParam) > realMaxVal:
-                            # this assembly has a maxParam that's higher than maxVal and therefore
-                            # doesn't qualify. skip it.
-                            innocent = False
-                            break
+        def isWithinBounds(a):
+            for boundParam, bound, isLower in bounds:
+                if isinstance(bound, tuple):
+                    # tuple turned in. it's a multiplier and a param
+                    bound = getParamWithBlockLevelMax(a, bound[0]) * bound[1]
+                value = getParamWithBlockLevelMax(a, boundParam)
+                if (value < bound) if isLower else (value > bound):
+                    return False
+            return True
 
-                if not innocent:
-                    continue
+        # get lists of assemblies in each candidate ring. Do it in this order in case we prefer ones in the first.
+        if index is None:
+            candidates = [
+                [a for a in assems if isWithinBounds(a)]
+                for assems in self._getAssembliesInRings(
+                    candidateRings, typeSpec, exactType, exclusions, circularRingFlag
+                )
+            ]
+        else:
+            # the index applies the bounds to the whole core at once
+            accepted = index.getBoundsMask(bounds, blockLevelMax) if bounds else None
+            candidates = index.getAssembliesInRings(
+                candidateRings, typeSpec, exactType, exclusions, accepted
+            )
 
+        # scan through all assemblies and find the one (or more) that best fits the criteria
+        for ringI, assemsInRings in enumerate(candidates):
+            for a in assemsInRings:
                 # Check to see if this assembly is in the list of candidate locations. if not, skip it.
                 if mandatoryLocations:
                     if a.getLocation() not in mandatoryLocations:
@@ -550,18 +542,19 @@ class FuelHandler:
 
                 # Now find the assembly with the param closest to the target val.
                 if param:
-                    diff = abs(getParamWithBlockLevelMax(a, param) - compVal)
+                    value = getParamWithBlockLevelMax(a, param)
+                    diff = abs(value - compVal)
 
                     if (
                         forceSide == 1
-                        and getParamWithBlockLevelMax(a, param) > compVal
+                        and value > compVal
                         and compareAssem((diff, a), minDiff)
                     ):
                         # forceSide=1, so that means look in rings further out
                         minDiff = (diff, a)
                     elif (
                         forceSide == -1
-                        and getParamWithBlockLevelMax(a, param) < compVal
+                        and value < compVal
                         and compareAssem((diff, a), minDiff)
                     ):
                         # forceSide=-1, so that means look in rings closer in from the targetRing
@@ -613,6 +606,21 @@ class FuelHandler:
         else:
             return minDiff[1]
 
+    def _getCandidateIndex(self, build=True):
+        """
+        Return the index of the core used to search for assemblies during this outage.
+
+        The index is kept from one search to the next, and updated as assemblies are
+        moved by :py:meth:`swapAssemblies` and :py:meth:`dischargeSwap`. It is rebuilt
+        if the core has otherwise changed since, or, with ``build=False``, None is
+        returned instead.
+        """
+        index = self._candidateIndex
+        if index is None or not index.isCurrent():
+            index = CandidateIndex(self.r.core) if build else None
+            self._candidateIndex = index
+        return index
+
     @staticmethod
     def isAssemblyInAZone(zoneList, a):
         """Does the given assembly in one of these zones."""
@@ -754,6 +762,7 @@ class FuelHandler:
             return
 
         runLog.extra("Swapping {} with {}.".format(a1, a2))
+        index = self._getCandidateIndex(build=False)
         # add assemblies into the moved location
         for a in [a1, a2]:
             if a not in self.moved:
@@ -762,6 +771,8 @@ class FuelHandler:
         self._transferStationaryBlocks(a1, a2)
         a1.moveTo(a2.spatialLocator)
         a2.moveTo(oldA1Location)
+        if index is not None and a1 in index and a2 in index:
+            index.swap(a1, a2)
 
     def _transferStationaryBlocks(self, assembly1, assembly2):
         """
@@ -857,6 +868,7 @@ class FuelHandler:
             if a not in self.moved:
                 self.moved.append(a)
 
+        index = self._getCandidateIndex(build=False)
         self._transferStationaryBlocks(incoming, outgoing)
 
         # replace the goingOut guy.
@@ -881,6 +893,8 @@ class FuelHandler:
 
         incoming.p.multiplicity = 1
         self.r.core.add(incoming, loc)
+        if index is not None and outgoing in index and incoming not in index:
+            index.replace(outgoing, incoming)
 
     def swapCascade(self, assemList):
         """
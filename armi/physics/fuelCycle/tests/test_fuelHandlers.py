@@ -414,6 +414,73 @@ class TestFuelHandler(FuelHandlerTestHelper):
         )
         self.assertIsNone(assem)
 
+    def test_findAfterMoves(self):
+        """The search index follows assemblies as they are swapped and discharged."""
+        fh = fuelHandlers.FuelHandler(self.o)
+        highBu = fh.findAssembly(param="percentBu", compareTo=100, blockLevelMax=True)
+        index = fh._candidateIndex
+        center = self.r.core.childrenByLocator[self.r.core.spatialGrid[0, 0, 0]]
+        self.assertIs(fh.findAssembly(coords=(0, 0)), center)
+
+        # move the highest burnup assembly to the center
+        fh.swapAssemblies(highBu, center)
+        self.assertIs(fh._candidateIndex, index)
+        self.assertIs(fh.findAssembly(coords=(0, 0)), highBu)
+        self.assertIs(
+            fh.findAssembly(
+                targetRing=1, param="percentBu", compareTo=100, blockLevelMax=True
+            ),
+            highBu,
+        )
+
+        # replace it with a fresh assembly from the SFP, with less burnup than any other
+        fresh = self.r.sfp.getChildren(Flags.FUEL)[0]
+        for b in fresh:
+            b.p.percentBu = -1.0
+        fh.dischargeSwap(fresh, highBu)
+        self.assertIs(fh._candidateIndex, index)
+        self.assertIs(fh.findAssembly(coords=(0, 0)), fresh)
+        self.assertIsNot(
+            fh.findAssembly(param="percentBu", compareTo=100, blockLevelMax=True),
+            highBu,
+        )
+        self.assertIs(
+            fh.findAssembly(
+                param="percentBu", compareTo=-100, blockLevelMax=True, typeSpec=None
+            ),
+            fresh,
+        )
+        self.assertEqual(
+            fh.findAssembly(
+                param="percentBu",
+                compareTo=0,
+                blockLevelMax=True,
+                maxParam="percentBu",
+                maxVal=0.0,
+                findMany=True,
+            ),
+            [fresh],
+        )
+
+        # parameters set in other ways are read again
+        column = index._columns[("percentBu", True)]
+        fh.findAssembly(param="percentBu", compareTo=100, blockLevelMax=True)
+        self.assertIs(index._columns[("percentBu", True)], column)
+        for b in fresh:
+            b.p.percentBu = 1000.0
+        self.assertIs(
+            fh.findAssembly(param="percentBu", compareTo=1000, blockLevelMax=True),
+            fresh,
+        )
+        self.assertIs(fh._candidateIndex, index)
+        self.assertIsNot(index._columns[("percentBu", True)], column)
+
+        # the index is dropped at the end of the outage
+        fh = fuelHandlers.FuelHandler(self.o)
+        fh.chooseSwaps = lambda factor: fh.findAssembly(coords=(0, 0))
+        fh.outage()
+        self.assertIsNone(fh._candidateIndex)
+
     def runShuffling(self, fh):
         """Shuffle fuel and write out a SHUFFLES.txt file."""
         fh.attachReactor(self.o, self.r)
@@ -48,6 +48,7 @@ class FuelPerformanceOptions(executers.ExecutionOptions):
 
     def fromUserSettings(self, cs):
         """Copy relevant settings values from cs into this object."""
+        executers.ExecutionOptions.fromUserSettings(self, cs)
         self.fuelPerformanceEngine = cs[CONF_FUEL_PERFORMANCE_ENGINE]
         self.axialExpansion = cs[CONF_AXIAL_EXPANSION]
         self.bondRemoval = cs[CONF_BOND_REMOVAL]
@@ -50,18 +50,22 @@ The class diagram is provided in `xsgm-class-diagram`_
 
     Class inheritance diagram for :py:mod:`crossSectionGroupManager`.
 """
+import bisect
 import collections
 import copy
+import itertools
 import os
 import shutil
 import string
 
 import numpy
+from scipy import sparse
 
 from armi import context
 from armi import interfaces
 from armi import runLog
 from armi.physics.neutronics.const import CONF_CROSS_SECTION
+from armi.reactor import composites
 from armi.reactor.components import basicShapes
 from armi.reactor.flags import Flags
 from armi.utils.units import TRACE_NUMBER_DENSITY
@@ -127,6 +131,8 @@ class BlockCollection(list):
         self.allNuclidesInProblem = allNuclidesInProblem
         self.weightingParam = None
         self.averageByComponent = averageByComponent
+        # per-block averaging terms, which may be shared with other collections
+        self.blockTable = None
 
         # allowed to be independent of fuel component temperatures b/c Doppler
         self.avgNucTemperatures = {}
@@ -212,6 +218,23 @@ class BlockCollection(list):
         """
         raise NotImplementedError
 
+    def _getBlockTable(self):
+        """
+        Return the per-block averaging terms of the candidate blocks, and the blocks.
+
+        The ``blockTable`` shared with other collections is used if it has all of the
+        candidate blocks. Otherwise, one is made for just this collection.
+        """
+        blocks = self.getCandidateBlocks()
+        table = self.blockTable
+        if (
+            table is None
+            or table.nuclides != list(self.allNuclidesInProblem)
+            or not table.hasBlocks(blocks)
+        ):
+            table = BlockNuclideTable(blocks, self.allNuclidesInProblem)
+        return table, blocks
+
     def getWeight(self, block):
         """Get value of weighting function for this block."""
         vol = block.getVolume() or 1.0
@@ -350,12 +373,11 @@ class AverageBlockCollection(BlockCollection):
         numberDensities : dict
             nucName, ndens data (atoms/bn-cm)
         """
-        nuclides = self.allNuclidesInProblem
-        blocks = self.getCandidateBlocks()
+        table, blocks = self._getBlockTable()
         weights = numpy.array([self.getWeight(b) for b in blocks])
         weights /= weights.sum()  # normalize by total weight
-        ndens = weights.dot([b.getNuclideNumberDensities(nuclides) for b in blocks])
-        return dict(zip(nuclides, ndens))
+        ndens = weights.dot(table.numberDensities[table.getRows(blocks)])
+        return dict(zip(self.allNuclidesInProblem, ndens))
 
     def _getAverageFuelLFP(self):
         """Compute the average lumped fission products."""
@@ -365,16 +387,10 @@ class AverageBlockCollection(BlockCollection):
 
     def _getNucTempHelper(self):
         """All candidate blocks are used in the average."""
-        nvt = numpy.zeros(len(self.allNuclidesInProblem))
-        nv = numpy.zeros(len(self.allNuclidesInProblem))
-        for block in self.getCandidateBlocks():
-            wt = self.getWeight(block)
-            nvtBlock, nvBlock = getBlockNuclideTemperatureAvgTerms(
-                block, self.allNuclidesInProblem
-            )
-            nvt += nvtBlock * wt
-            nv += nvBlock * wt
-        return nvt, nv
+        table, blocks = self._getBlockTable()
+        weights = numpy.array([self.getWeight(b) for b in blocks])
+        rows = table.getRows(blocks)
+        return weights.dot(table.nvt[rows]), weights.dot(table.nv[rows])
 
     def _getAverageComponentNumberDensities(self, compIndex):
         """
@@ -390,7 +406,7 @@ class AverageBlockCollection(BlockCollection):
         weights = numpy.array([self.getWeight(b) for b in blocks])
         weights /= weights.sum()  # normalize by total weight
         components = [sorted(b.getComponents())[compIndex] for b in blocks]
-        ndens = weights.dot([c.getNuclideNumberDensities(nuclides) for c in components])
+        ndens = weights.dot(composites.getNumberDensityMatrix(components, nuclides))
         return dict(zip(nuclides, ndens))
 
     def _getAverageComponentTemperature(self, compIndex):
@@ -414,19 +430,14 @@ class AverageBlockCollection(BlockCollection):
         weights = numpy.array([self.getWeight(b) / b.getHeight() for b in blocks])
         weights /= weights.sum()  # normalize by total weight
         components = [sorted(b.getComponents())[compIndex] for b in blocks]
-        weightedAvgComponentMass = sum(
-            w * c.getMass() for w, c in zip(weights, components)
-        )
+        temperatures = numpy.array([c.temperatureInC for c in components])
+        masses = numpy.array([c.getMass() for c in components])
+        weightedAvgComponentMass = weights.dot(masses)
         if weightedAvgComponentMass == 0.0:
             # if there is no component mass (e.g., gap), do a regular average
-            return numpy.mean(numpy.array([c.temperatureInC for c in components]))
+            return numpy.mean(temperatures)
         else:
-            return (
-                weights.dot(
-                    numpy.array([c.temperatureInC * c.getMass() for c in components])
-                )
-                / weightedAvgComponentMass
-            )
+            return weights.dot(temperatures * masses) / weightedAvgComponentMass
 
     def _performAverageByComponent(self):
         """
@@ -449,23 +460,75 @@ class AverageBlockCollection(BlockCollection):
         has requested component-level averaging, return True.
         Otherwise, return False.
         """
-        cFlags = dict()
-        for b in self.getCandidateBlocks():
-            cFlags[b] = [c.p.flags for c in sorted(b.getComponents())]
-        refB = b
-        refFlags = cFlags[refB]
-        for b, compFlags in cFlags.items():
-            for c, refC in zip(compFlags, refFlags):
-                if c != refC:
-                    runLog.warning(
-                        "Non-matching block in AverageBlockCollection!\n"
-                        f"{refC} component flags in {refB} does not match {c} in {b}.\n"
-                        f"Number densities will be smeared in representative block."
-                    )
-                    return False
-        else:
+        blocks = self.getCandidateBlocks()
+        cFlags = [tuple(c.p.flags for c in sorted(b.getComponents())) for b in blocks]
+        refB, refFlags = blocks[-1], cFlags[-1]
+        if cFlags.count(refFlags) == len(cFlags):
             return True
 
+        b, compFlags = next(
+            (b, compFlags)
+            for b, compFlags in zip(blocks, cFlags)
+            if compFlags != refFlags
+        )
+        c, refC = next(
+            (c, refC)
+            for c, refC in itertools.zip_longest(compFlags, refFlags)
+            if c != refC
+        )
+        runLog.warning(
+            "Non-matching block in AverageBlockCollection!\n"
+            f"{refC} component flags in {refB} does not match {c} in {b}.\n"
+            f"Number densities will be smeared in representative block."
+        )
+        return False
+
+
+class BlockNuclideTable:
+    """
+    The per-block terms that block collections average, as (blocks x nuclides) arrays.
+
+    The collections of all cross section groups average the same block quantities,
+    only over different blocks and with different weights. Computing them once for
+    all blocks lets each collection just take a weighted sum over its own rows.
+
+    Attributes
+    ----------
+    nuclides : list of str
+        The nuclide of each column.
+    numberDensities : numpy.ndarray
+        Homogenized number densities of each block (atoms/bn-cm).
+    nvt : numpy.ndarray
+        Numerators of the average nuclide temperatures of each block. See
+        :py:func:`getBlockNuclideTemperatureAvgTerms`.
+    nv : numpy.ndarray
+        Denominators of the average nuclide temperatures of each block.
+
+    Notes
+    -----
+    The table is a snapshot; it is not updated when the blocks change.
+    """
+
+    def __init__(self, blocks, allNucNames):
+        self.nuclides = list(allNucNames)
+        # holding on to the blocks keeps their ids unique
+        self._blocks = list(blocks)
+        self._rows = {id(b): row for row, b in enumerate(self._blocks)}
+        self.numberDensities, self.nvt, self.nv = _getBlockNuclideTerms(
+            self._blocks, self.nuclides
+        )
+
+    def __len__(self):
+        return len(self._blocks)
+
+    def hasBlocks(self, blocks):
+        """Whether all of the blocks are in the table."""
+        return all(id(b) in self._rows for b in blocks)
+
+    def getRows(self, blocks):
+        """Return the rows of the blocks."""
+        return numpy.array([self._rows[id(b)] for b in blocks], dtype=int)
+
 
 def getBlockNuclideTemperatureAvgTerms(block, allNucNames):
     """
@@ -476,31 +539,74 @@ def getBlockNuclideTemperatureAvgTerms(block, allNucNames):
     It's important to count zero-density nuclides (i.e. ones like AM242 that are expected to build up)
     as trace values at the proper component temperatures.
     """
+    _ndens, nvt, nv = _getBlockNuclideTerms([block], allNucNames)
+    return nvt[0], nv[0]
 
-    def getNumberDensitiesWithTrace(component, allNucNames):
-        """Needed to make sure temperature of 0-density nuclides in fuel get fuel temperature."""
-        return [
-            component.p.numberDensities[nucName] or TRACE_NUMBER_DENSITY
-            if nucName in component.p.numberDensities
-            else 0.0
-            for nucName in allNucNames
-        ]
 
-    vol = block.getVolume()
-    components, volFracs = zip(*block.getVolumeFractions())
-    # D = CxN matrix of number densities
-    ndens = numpy.array(
-        [getNumberDensitiesWithTrace(c, allNucNames) for c in components]
-    )
-    temperatures = numpy.array(
-        [c.temperatureInC for c in components]
-    )  # C-length temperature array
-    nvBlock = (
-        ndens.T * numpy.array(volFracs) * vol
-    )  # multiply each component's values by volume frac, now NxC
-    nvt = sum((nvBlock * temperatures).T)  # N-length array summing over components.
-    nv = sum(nvBlock.T)  # N-length array
-    return nvt, nv
+def _getBlockNuclideTerms(blocks, allNucNames):
+    """
+    Compute the number densities and nuclide temperature averaging terms of blocks.
+
+    The number densities of all components are gathered into one sparse (components x
+    nuclides) matrix, which is reduced to the blocks with sparse (blocks x components)
+    matrices of component volume fractions.
+
+    Returns
+    -------
+    ndens : numpy.ndarray
+        The homogenized number densities of each block.
+    nvt, nv : numpy.ndarray
+        The numerator and denominator of the average nuclide temperatures of each
+        block (see :py:func:`getBlockNuclideTemperatureAvgTerms`).
+    """
+    nucIndex = {}
+    for nucName in allNucNames:
+        nucIndex.setdefault(nucName, len(nucIndex))
+
+    cols, vals, numNucs = [], [], []
+    blockIndices, volFracs, volumes, temperatures = [], [], [], []
+    for i, b in enumerate(blocks):
+        vol = b.getVolume()
+        for c, volFrac in b.getVolumeFractions():
+            numberDensities = c.p.numberDensities
+            cols.extend([nucIndex.get(nucName, -1) for nucName in numberDensities])
+            vals.extend(numberDensities.values())
+            numNucs.append(len(numberDensities))
+            blockIndices.append(i)
+            volFracs.append(volFrac)
+            volumes.append(vol)
+            temperatures.append(c.temperatureInC)
+
+    rows = numpy.repeat(numpy.arange(len(numNucs)), numNucs)
+    cols = numpy.array(cols, dtype=int)
+    vals = numpy.array(vals, dtype=float)
+    inProblem = cols >= 0
+    rows, cols, vals = rows[inProblem], cols[inProblem], vals[inProblem]
+    # zero-density nuclides in a component should still get its temperature
+    traceVals = numpy.where(vals == 0.0, TRACE_NUMBER_DENSITY, vals)
+
+    shape = (len(volFracs), len(nucIndex))
+    compNdens = sparse.csr_matrix((vals, (rows, cols)), shape=shape)
+    compTraceNdens = sparse.csr_matrix((traceVals, (rows, cols)), shape=shape)
+
+    volFracs = numpy.array(volFracs)
+    nvWeights = volFracs * numpy.array(volumes)
+    comps = numpy.arange(len(volFracs))
+
+    def reduceToBlocks(weights, matrix):
+        toBlocks = sparse.csr_matrix(
+            (weights, (blockIndices, comps)), shape=(len(blocks), len(volFracs))
+        )
+        return (toBlocks @ matrix).toarray()
+
+    ndens = reduceToBlocks(volFracs, compNdens)
+    nv = reduceToBlocks(nvWeights, compTraceNdens)
+    nvt = reduceToBlocks(nvWeights * numpy.array(temperatures), compTraceNdens)
+    if len(nucIndex) != len(allNucNames):
+        # duplicate nuclide names were requested; expand back to the requested columns
+        cols = [nucIndex[nucName] for nucName in allNucNames]
+        ndens, nvt, nv = ndens[:, cols], nvt[:, cols], nv[:, cols]
+    return ndens, nvt, nv
 
 
 class CylindricalComponentsAverageBlockCollection(BlockCollection):
@@ -622,16 +728,10 @@ class CylindricalComponentsAverageBlockCollection(BlockCollection):
 
     def _getNucTempHelper(self):
         """All candidate blocks are used in the average."""
-        nvt = numpy.zeros(len(self.allNuclidesInProblem))
-        nv = numpy.zeros(len(self.allNuclidesInProblem))
-        for block in self.getCandidateBlocks():
-            wt = self.getWeight(block)
-            nvtBlock, nvBlock = getBlockNuclideTemperatureAvgTerms(
-                block, self.allNuclidesInProblem
-            )
-            nvt += nvtBlock * wt
-            nv += nvBlock * wt
-        return nvt, nv
+        table, blocks = self._getBlockTable()
+        weights = numpy.array([self.getWeight(b) for b in blocks])
+        rows = table.getRows(blocks)
+        return weights.dot(table.nvt[rows]), weights.dot(table.nv[rows])
 
 
 class SlabComponentsAverageBlockCollection(BlockCollection):
@@ -810,6 +910,33 @@ class FluxWeightedAverageBlockCollection(AverageBlockCollection):
         self.weightingParam = "flux"
 
 
+def _getReprBlockState(reprBlock, avgNucTemperatures):
+    """
+    Return the properties of a representative block that its cross sections depend on.
+
+    Returns
+    -------
+    labels : tuple
+        What each value is, e.g. ``("ndens", "U235")``.
+    values : numpy.ndarray
+        The number densities and average temperatures of the nuclides, the
+        temperatures and areas of the components, and the height of the block.
+    """
+    labels, values = [], []
+    for nucName, nDens in sorted(reprBlock.getNumberDensities().items()):
+        labels.append(("ndens", nucName))
+        values.append(nDens)
+    for nucName, temp in sorted(avgNucTemperatures.items()):
+        labels.append(("temp", nucName))
+        values.append(temp)
+    for c in reprBlock:
+        labels.extend([("componentTemp", c.name), ("area", c.name)])
+        values.extend([c.temperatureInC, c.getArea()])
+    labels.append(("height",))
+    values.append(reprBlock.getHeight())
+    return tuple(labels), numpy.array(values, dtype=float)
+
+
 class CrossSectionGroupManager(interfaces.Interface):
     """
     Looks at the reactor and updates burnup group information based on current burnup.
@@ -836,6 +963,11 @@ class CrossSectionGroupManager(interfaces.Interface):
         self._buGroupUpdatesEnabled = True
         self._setBuGroupBounds(self.cs["buGroups"])
         self._unrepresentedXSIDs = []
+        self._xsBinsByBlock = {}
+        self._blockCollectionsByXsGroup = {}
+        self._reprBlockStates = {}
+        self._pendingReprBlockStates = {}
+        self._dirtyXsIDs = set()
 
     def interactBOL(self):
         """Called at the Beginning-of-Life of a run, before any cycles start.
@@ -923,6 +1055,11 @@ class CrossSectionGroupManager(interfaces.Interface):
         runLog.extra("Clearing representative blocks")
         self.representativeBlocks = collections.OrderedDict()
         self.avgNucTemperatures = {}
+        self._xsBinsByBlock = {}
+        self._blockCollectionsByXsGroup = {}
+        self._reprBlockStates = {}
+        self._pendingReprBlockStates = {}
+        self._dirtyXsIDs = set()
 
     def _setBuGroupBounds(self, upperBuGroupBounds):
         """
@@ -948,6 +1085,7 @@ class CrossSectionGroupManager(interfaces.Interface):
             if upperBu < lastBu:
                 raise ValueError("Burnup groups must be ascending")
             lastBu = upperBu
+        self._xsBinsByBlock = {}
 
     def _updateBurnupGroups(self, blockList):
         """
@@ -963,19 +1101,86 @@ class CrossSectionGroupManager(interfaces.Interface):
         if self._buGroupUpdatesEnabled and len(self._upperBuGroupBounds) > 1:
             runLog.debug("Updating burnup groups of {0} blocks".format(len(blockList)))
             for block in blockList:
-                bu = block.p.percentBu
-                for buGroupIndex, upperBu in enumerate(self._upperBuGroupBounds):
-                    if bu <= upperBu:
-                        block.p.buGroupNum = buGroupIndex
-                        break
-                else:
-                    raise ValueError("no bu group found for bu={0}".format(bu))
+                block.p.buGroupNum = self._getBuGroupIndex(block.p.percentBu)
         else:
             runLog.debug(
                 "Skipping burnup group update of {0} blocks because it is disabled"
                 "".format(len(blockList))
             )
 
+    def _getBuGroupIndex(self, bu):
+        """Return the index of the burnup group holding a burnup."""
+        buGroupIndex = bisect.bisect_left(self._upperBuGroupBounds, bu)
+        if buGroupIndex == len(self._upperBuGroupBounds):
+            raise ValueError("no bu group found for bu={0}".format(bu))
+        return buGroupIndex
+
+    def _getXsBin(self, block):
+        """
+        Return the XS group of a block, along with what the group was derived from.
+
+        The burnup window is the range of burnup over which the block stays in its
+        burnup group. It is unbounded when the burnup groups are not being updated.
+        """
+        if self._buGroupUpdatesEnabled and len(self._upperBuGroupBounds) > 1:
+            buGroupIndex = block.p.buGroupNum
+            lowerBu = (
+                self._upperBuGroupBounds[buGroupIndex - 1]
+                if buGroupIndex > 0
+                else -numpy.inf
+            )
+            upperBu = self._upperBuGroupBounds[buGroupIndex]
+        else:
+            lowerBu, upperBu = -numpy.inf, numpy.inf
+        return (
+            block,
+            block.p.xsType,
+            block.p.buGroup,
+            lowerBu,
+            upperBu,
+            block.getMicroSuffix(),
+        )
+
+    def _getXsIDs(self, blockList):
+        """
+        Return the XS ID of each block, updating the burnup groups of the blocks that need it.
+
+        The XS group of each block is kept between calls, along with the burnup window
+        of its burnup group. Only the blocks that are new, or whose XS type, burnup
+        group or burnup moved them out of their previous XS group are re-bucketed; the
+        others are known to still be in the same group. Blocks that are not in the list
+        are forgotten.
+        """
+        previousBins = self._xsBinsByBlock
+        xsBins = {}
+        changedBlocks = []
+        for b in blockList:
+            xsBin = previousBins.get(id(b))
+            if xsBin is not None:
+                block, xsType, buGroup, lowerBu, upperBu, _xsID = xsBin
+                if (
+                    block is b
+                    and b.p.xsType == xsType
+                    and b.p.buGroup == buGroup
+                    and lowerBu < b.p.percentBu <= upperBu
+                ):
+                    xsBins[id(b)] = xsBin
+                    continue
+            changedBlocks.append(b)
+
+        if changedBlocks:
+            runLog.debug(
+                "Re-bucketing {0} of {1} blocks into XS groups".format(
+                    len(changedBlocks), len(blockList)
+                )
+            )
+            self._updateBurnupGroups(changedBlocks)
+            for b in changedBlocks:
+                xsBins[id(b)] = self._getXsBin(b)
+
+        self._xsBinsByBlock = xsBins
+        return [xsBins[id(b)][-1] for b in blockList]
+
     def _addXsGroupsFromBlocks(self, blockCollectionsByXsGroup, blockList):
         """
         Build all the cross section groups based on their XS type and BU group.
@@ -983,15 +1188,23 @@ class CrossSectionGroupManager(interfaces.Interface):
         Also ensures that their BU group is up to date with their burnup.
         """
         self._updateBurnupGroups(blockList)
-        for b in blockList:
-            xsID = b.getMicroSuffix()
-            xsSettings = self._initializeXsID(xsID)
-            blockCollectionType = blockCollectionFactory(
-                xsSettings, self.r.blueprints.allNuclidesInProblem
-            )
-            group = blockCollectionsByXsGroup.get(xsID, blockCollectionType)
+        return self._addBlocksToXsGroups(
+            blockCollectionsByXsGroup,
+            blockList,
+            [b.getMicroSuffix() for b in blockList],
+        )
+
+    def _addBlocksToXsGroups(self, blockCollectionsByXsGroup, blockList, xsIDs):
+        """Add each block to the collection of its XS ID, making the collections that are missing."""
+        for b, xsID in zip(blockList, xsIDs):
+            group = blockCollectionsByXsGroup.get(xsID)
+            if group is None:
+                xsSettings = self._initializeXsID(xsID)
+                group = blockCollectionFactory(
+                    xsSettings, self.r.blueprints.allNuclidesInProblem
+                )
+                blockCollectionsByXsGroup[xsID] = group
             group.append(b)
-            blockCollectionsByXsGroup[xsID] = group
         return blockCollectionsByXsGroup
 
     def _initializeXsID(self, xsID):
@@ -1088,6 +1301,11 @@ class CrossSectionGroupManager(interfaces.Interface):
         self._unrepresentedXSIDs = []
         runLog.extra("Generating representative blocks for XS")
         blockCollectionsByXsGroup = self.makeCrossSectionGroups()
+        self._shareBlockTable(
+            collection
+            for xsID, collection in blockCollectionsByXsGroup.items()
+            if not self.xsTypeIsPregenerated(xsID)
+        )
         for xsID, collection in blockCollectionsByXsGroup.items():
             numCandidateBlocks = len(collection.getCandidateBlocks())
             if self.xsTypeIsPregenerated(xsID):
@@ -1111,9 +1329,79 @@ class CrossSectionGroupManager(interfaces.Interface):
         self.representativeBlocks = collections.OrderedDict(
             sorted(representativeBlocks.items())
         )
+        self._updateDirtyXsIDs()
         self._modifyUnrepresentedXSIDs(blockCollectionsByXsGroup)
         self._summarizeGroups(blockCollectionsByXsGroup)
 
+    def _updateDirtyXsIDs(self):
+        """
+        Find the XS IDs whose representative blocks have materially changed.
+
+        Each representative block is compared to the state of the representative block of
+        its XS ID when cross sections were last generated for it (see
+        ``markXsGenerated``), rather than to the previous one, so that small changes
+        cannot add up unnoticed, and changes are not forgotten when no cross sections
+        are generated for them.
+        """
+        from armi.physics.neutronics.settings import CONF_TOLERATE_REPR_BLOCK_CHANGE
+
+        tolerance = self.cs[CONF_TOLERATE_REPR_BLOCK_CHANGE]
+        self._dirtyXsIDs = set()
+        self._pendingReprBlockStates = {}
+        for xsID, reprBlock in self.representativeBlocks.items():
+            labels, values = _getReprBlockState(
+                reprBlock, self.avgNucTemperatures.get(xsID, {})
+            )
+            previous = self._reprBlockStates.get(xsID)
+            if (
+                previous is None
+                or labels != previous[0]
+                or not numpy.allclose(
+                    values, previous[1], rtol=tolerance, atol=0.0, equal_nan=True
+                )
+            ):
+                self._pendingReprBlockStates[xsID] = (labels, values)
+                self._dirtyXsIDs.add(xsID)
+
+        runLog.extra(
+            "XS IDs with changed representative blocks: {}".format(self.getDirtyXsIDs())
+        )
+
+    def getDirtyXsIDs(self):
+        """
+        Return the XS IDs whose representative blocks materially changed when they were last created.
+
+        A representative block has materially changed if its nuclides or components
+        differ from the ones it had when cross sections were last generated for it, or if
+        any of its number densities, nuclide temperatures, component temperatures and
+        areas, or its height, differ by more than the relative ``tolerateReprBlockChange``
+        setting. XS IDs that did not have a representative block then are always changed.
+        Lattice physics does not need to regenerate the cross sections of the other XS IDs.
+
+        Returns
+        -------
+        list
+            The sorted XS IDs (e.g. ``["AA", "BA"]``).
+
+        See Also
+        --------
+        markXsGenerated : moves the reference state forward
+        """
+        return sorted(self._dirtyXsIDs)
+
+    def markXsGenerated(self):
+        """
+        Record that cross sections were generated from the current representative blocks.
+
+        Lattice physics calls this once it has actually generated cross sections. Until
+        then, the representative blocks keep being compared to the state they had the
+        last time cross sections were generated, so a change that did not lead to new
+        cross sections (e.g. because another check skipped them) is still reported.
+        """
+        self._reprBlockStates.update(self._pendingReprBlockStates)
+        self._pendingReprBlockStates = {}
+        self._dirtyXsIDs = set()
+
     def createRepresentativeBlocksUsingExistingBlocks(
         self, blockList, originalRepresentativeBlocks
     ):
@@ -1285,11 +1573,33 @@ class CrossSectionGroupManager(interfaces.Interface):
         return unrepresentedBlocks
 
     def makeCrossSectionGroups(self):
-        """Make cross section groups for all blocks in reactor and unrepresented blocks from blueprints."""
-        bCollectXSGroup = {}  # clear old groups (in case some are no longer existent)
-        bCollectXSGroup = self._addXsGroupsFromBlocks(
-            bCollectXSGroup, self.r.core.getBlocks()
-        )
+        """
+        Make cross section groups for all blocks in reactor and unrepresented blocks from blueprints.
+
+        The collection of an XS ID from the previous call is reused if it still holds the
+        same core blocks, in the same order. Only the collections of XS IDs that blocks
+        moved into or out of are made again.
+        """
+        coreBlocks = self.r.core.getBlocks()
+        blocksByXsID = collections.defaultdict(list)
+        for b, xsID in zip(coreBlocks, self._getXsIDs(coreBlocks)):
+            blocksByXsID[xsID].append(b)
+
+        bCollectXSGroup = {}  # drop old groups (in case some are no longer existent)
+        for xsID, blocks in blocksByXsID.items():
+            collection = self._blockCollectionsByXsGroup.get(xsID)
+            if (
+                collection is not None
+                and len(collection) == len(blocks)
+                and all(b1 is b2 for b1, b2 in zip(collection, blocks))
+            ):
+                # the averaging terms of the blocks may have changed since
+                collection.blockTable = None
+                bCollectXSGroup[xsID] = collection
+            else:
+                self._addBlocksToXsGroups(bCollectXSGroup, blocks, [xsID] * len(blocks))
+        self._blockCollectionsByXsGroup = dict(bCollectXSGroup)
+
         bCollectXSGroup = self._addXsGroupsFromBlocks(
             bCollectXSGroup, self._getUnrepresentedBlocks(bCollectXSGroup)
         )
@@ -1360,6 +1670,34 @@ class CrossSectionGroupManager(interfaces.Interface):
                 else:
                     raise ValueError("No valid group for XS ID {}".format(xsID))
 
+    def _shareBlockTable(self, blockCollections):
+        """
+        Compute the averaging terms of the candidate blocks of many collections at once.
+
+        The resulting :py:class:`BlockNuclideTable` is shared by the collections, so
+        each of them only has to do its own weighted reductions.
+        """
+        blockCollections = [
+            collection
+            for collection in blockCollections
+            if isinstance(
+                collection,
+                (AverageBlockCollection, CylindricalComponentsAverageBlockCollection),
+            )
+        ]
+        blocks = {}
+        for collection in blockCollections:
+            for b in collection.getCandidateBlocks():
+                blocks.setdefault(id(b), b)
+        if not blocks:
+            return
+
+        table = BlockNuclideTable(
+            blocks.values(), self.r.blueprints.allNuclidesInProblem
+        )
+        for collection in blockCollections:
+            collection.blockTable = table
+
     def _getXsIDGroup(self, xsID):
         if self.xsTypeIsPregenerated(xsID):
             return self._PREGEN_GROUP
@@ -1382,6 +1720,7 @@ class CrossSectionGroupManager(interfaces.Interface):
         runLog.extra("Burnup group updating disabled")
         wasEnabled = self._buGroupUpdatesEnabled
         self._buGroupUpdatesEnabled = False
+        self._xsBinsByBlock = {}
         return wasEnabled
 
     def enableBuGroupUpdates(self):
@@ -1394,6 +1733,7 @@ class CrossSectionGroupManager(interfaces.Interface):
         """
         runLog.extra("Burnup group updating enabled")
         self._buGroupUpdatesEnabled = True
+        self._xsBinsByBlock = {}
 
     def getNucTemperature(self, xsID, nucName):
         """
@@ -1433,10 +1773,14 @@ class CrossSectionGroupManager(interfaces.Interface):
                 blockCollectionsByXsGroup.keys()
             )
         )
+        self._shareBlockTable(blockCollectionsByXsGroup.values())
         for xsID, collection in blockCollectionsByXsGroup.items():
             collection.calcAvgNuclideTemperatures()
             self.avgNucTemperatures[xsID] = collection.avgNucTemperatures
             runLog.extra("XS ID: {}, Collection: {}".format(xsID, collection))
+            # the table is a snapshot, so it is not kept on collections that may be
+            # used again
+            collection.blockTable = None
 
 
 # String constants
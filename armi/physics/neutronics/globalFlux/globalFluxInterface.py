@@ -25,6 +25,7 @@ from armi.physics import constants
 from armi.physics import executers
 from armi.physics import neutronics
 from armi.reactor import geometry
+from armi.reactor import parameters
 from armi.reactor import reactors
 from armi.reactor.blocks import Block
 from armi.reactor.converters import geometryConverters
@@ -220,6 +221,11 @@ class GlobalFluxInterfaceUsingExecuters(GlobalFluxInterface):
     provide commonly-used structure useful for many global flux plugins.
     """
 
+    def __init__(self, r, cs):
+        GlobalFluxInterface.__init__(self, r, cs)
+        # uniform mesh converters kept between solves, by whether they are for photons
+        self._uniformMeshConverters = {}
+
     def interactEveryNode(self, cycle, node):
         """
         Calculate flux, power, and keff for this cycle and node.
@@ -288,6 +294,12 @@ class GlobalFluxInterfaceUsingExecuters(GlobalFluxInterface):
         opts = self.getOptionsCls()(label)
         opts.fromUserSettings(self.cs)
         opts.fromReactor(self.r)
+        if opts.keepUniformMeshReactor:
+            if opts.photons not in self._uniformMeshConverters:
+                self._uniformMeshConverters[
+                    opts.photons
+                ] = uniformMesh.converterFactory(opts)
+            opts.uniformMeshConverter = self._uniformMeshConverters[opts.photons]
         return opts
 
     def getExecuter(self, options=None, label=None):
@@ -390,6 +402,8 @@ class GlobalFluxOptions(executers.ExecutionOptions):
         Has any non-uniform assembly flags, from settings
     isRestart : bool
         Restart global flux case using outputs from last time as a guess
+    keepUniformMeshReactor : bool
+        Keep the uniform mesh reactor between solves, from settings
     kernelName : str
         The neutronics / depletion solver for global flux solve.
     loadPadElevation : float
@@ -403,6 +417,9 @@ class GlobalFluxOptions(executers.ExecutionOptions):
         Is this timestamp in the list of savePhysicsFiles in the settings?
     symmetry : str
         Reactor symmetry: full core, third-core, etc
+    uniformMeshConverter : UniformMeshGeometryConverter
+        The uniform mesh converter to use, if one is kept between solves. A new one is
+        made for each solve if this is None.
     xsKernel : str
         Lattice Physics Kernel, from settings
     """
@@ -430,12 +447,16 @@ class GlobalFluxOptions(executers.ExecutionOptions):
         self.geomType: Optional[geometry.GeomType] = None
         self.hasNonUniformAssems: Optional[bool] = None
         self.isRestart: Optional[bool] = None
+        self.keepUniformMeshReactor: Optional[bool] = None
         self.kernelName: Optional[str] = None
         self.loadPadElevation: Optional[float] = None
         self.loadPadLength: Optional[float] = None
         self.maxOuters: Optional[int] = None
         self.savePhysicsFilesList: Optional[bool] = None
         self.symmetry: Optional[str] = None
+        self.uniformMeshConverter: Optional[
+            uniformMesh.UniformMeshGeometryConverter
+        ] = None
         self.xsKernel: Optional[str] = None
 
     def fromUserSettings(self, cs: Settings):
@@ -459,8 +480,10 @@ class GlobalFluxOptions(executers.ExecutionOptions):
             CONF_PHYSICS_FILES,
             CONF_NON_UNIFORM_ASSEM_FLAGS,
             CONF_DETAILED_AXIAL_EXPANSION,
+            CONF_UNIFORM_MESH_PERSISTENT,
         )
 
+        executers.ExecutionOptions.fromUserSettings(self, cs)
         self.kernelName = cs[CONF_NEUTRONICS_KERNEL]
         self.setRunDirFromCaseTitle(cs.caseTitle)
         self.isRestart = cs[CONF_RESTART_NEUTRONICS]
@@ -471,6 +494,7 @@ class GlobalFluxOptions(executers.ExecutionOptions):
             [Flags.fromStringIgnoreErrors(f) for f in cs[CONF_NON_UNIFORM_ASSEM_FLAGS]]
         )
         self.eigenvalueProblem = cs[CONF_EIGEN_PROB]
+        self.keepUniformMeshReactor = cs[CONF_UNIFORM_MESH_PERSISTENT]
 
         # dose/dpa specific (should be separate subclass?)
         self.dpaPerFluence = cs[CONF_DPA_PER_FLUENCE]
@@ -560,7 +584,13 @@ class GlobalFluxExecuter(executers.DefaultExecuter):
         converter = self.geomConverters.get("axial")
         if not converter:
             if self.options.detailedAxialExpansion or self.options.hasNonUniformAssems:
-                converter = uniformMesh.converterFactory(self.options)
+                converter = self.options.uniformMeshConverter
+                if converter is None:
+                    converter = uniformMesh.converterFactory(self.options)
+                elif not self.options.photons:
+                    converter.calcReactionRates = (
+                        self.options.calcReactionRatesOnMeshConversion
+                    )
                 converter.convert(self.r)
                 neutronicsReactor = converter.convReactor
 
@@ -1293,8 +1323,8 @@ def calcReactionRates(obj, keff, lib):
     * n2n
     * absorption
 
-    Scatter could be added as well. This function is quite slow so it is
-    skipped for now as it is uncommonly needed.
+    Scatter could be added as well, but it is skipped for now as it is uncommonly
+    needed.
 
     Reaction rates are:
 
@@ -1311,6 +1341,10 @@ def calcReactionRates(obj, keff, lib):
     .. math::
 
         \sigma_g = \frac{\int_{E g}^{E_{g+1}} \phi(E)  \sigma(E) dE}{\int_{E_g}^{E_{g+1}} \phi(E) dE}
+
+    See Also
+    --------
+    calcReactionRatesBlockList : computes the same rates for many blocks at once.
     """
     rate = {}
     for simple in RX_PARAM_NAMES:
@@ -1360,3 +1394,110 @@ def calcReactionRates(obj, keff, lib):
     vFuel = obj.getComponentAreaFrac(Flags.FUEL) if rate["rateFis"] > 0.0 else 1.0
     obj.p.fisDens = rate["rateFis"] / vFuel
     obj.p.fisDensHom = rate["rateFis"]
+
+
+def calcReactionRatesBlockList(objList, keff, lib):
+    """
+    Compute 1-group reaction rates for many objects (usually blocks) at once.
+
+    This gives the same results as calling :py:func:`calcReactionRates` on each
+    object, but rather than looping over every nuclide and energy group of every
+    object, the objects are grouped by cross section ID and the rates of each group are
+    computed with a few matrix products: the microscopic cross sections of each nuclide
+    are looked up once per group and stacked into ``(nuclides, groups)`` arrays, which
+    are combined with ``(objects, groups)`` flux and ``(objects, nuclides)`` number
+    density arrays. Objects whose flux does not have one value per group of ``lib``
+    (e.g., it was cleared) are computed one at a time with :py:func:`calcReactionRates`.
+
+    Parameters
+    ----------
+    objList : list of Block
+        The objects to compute reaction rates on.
+
+    keff : float
+        The keff of the core.
+
+    lib : XSLibrary
+        Microscopic cross sections to use in computing the reaction rates.
+    """
+    bySuffix = {}
+    for obj in objList:
+        if len(obj.getMgFlux()) != lib.numGroups:
+            calcReactionRates(obj, keff, lib)
+            continue
+        bySuffix.setdefault(obj.getMicroSuffix(), []).append(obj)
+
+    rates = {simple: [] for simple in RX_PARAM_NAMES}
+    objs = []
+    for suffix, suffixObjs in bySuffix.items():
+        for simple, rate in _calcReactionRates(suffixObjs, keff, lib, suffix).items():
+            rates[simple].append(rate)
+        objs.extend(suffixObjs)
+
+    if not objs:
+        return
+
+    pCollections = [obj.p for obj in objs]
+    for paramName, rate in rates.items():
+        # put in #/cm^3/s
+        parameters.setParamValues(pCollections, paramName, numpy.concatenate(rate))
+
+    rateFis = numpy.concatenate(rates["rateFis"])
+    vFuel = numpy.array(
+        [
+            obj.getComponentAreaFrac(Flags.FUEL) if fis > 0.0 else 1.0
+            for obj, fis in zip(objs, rateFis)
+        ]
+    )
+    parameters.setParamValues(pCollections, "fisDens", rateFis / vFuel)
+    parameters.setParamValues(pCollections, "fisDensHom", rateFis)
+
+
+def _calcReactionRates(objs, keff, lib, suffix) -> Dict[str, numpy.ndarray]:
+    """Compute the reaction rates of objects that share a cross section suffix."""
+    numberDensities = [obj.getNumberDensities() for obj in objs]
+    # nuclides with no atoms in any of the objects do not contribute, and may not
+    # even be in the library
+    nucNames = sorted(
+        {nuc for nDens in numberDensities for nuc, dens in nDens.items() if dens != 0.0}
+    )
+    nucIndex = {nucName: i for i, nucName in enumerate(nucNames)}
+    densities = numpy.zeros((len(objs), len(nucNames)))
+    for i, nDens in enumerate(numberDensities):
+        for nucName, dens in nDens.items():
+            if dens != 0.0:
+                densities[i, nucIndex[nucName]] = dens
+
+    # (objects, groups)
+    mgFlux = numpy.array([obj.getMgFlux() for obj in objs], dtype=float)
+    numGroups = lib.numGroups
+
+    # (nuclides, groups) cross sections of each kind of reaction
+    capture = numpy.zeros((len(nucNames), numGroups))
+    fission = numpy.zeros((len(nucNames), numGroups))
+    nuFission = numpy.zeros((len(nucNames), numGroups))
+    n2n = numpy.zeros((len(nucNames), numGroups))
+    for i, nucName in enumerate(nucNames):
+        micros = lib.getNuclide(nucName, suffix).micros
+        for name in RX_ABS_MICRO_LABELS:
+            if name != "fission":
+                capture[i] += micros[name]
+        fission[i] = micros.fission
+        nuFission[i] = micros.fission * micros.neutronsPerFission
+        # this n2n xs is reaction based. Multiply by 2.
+        n2n[i] = 2.0 * micros.n2n
+
+    def rate(xs):
+        # sum over groups and nuclides of N * xs * flux, for each object
+        return (densities * (mgFlux @ xs.T)).sum(axis=1)
+
+    rateCap = rate(capture)
+    rateFis = rate(fission)
+    return {
+        "rateCap": rateCap,
+        "rateFis": rateFis,
+        "rateProdN2n": rate(n2n),
+        "rateProdFis": rate(nuFission) / keff,
+        # absorption is fission + capture (no n2n here)
+        "rateAbs": rateCap + rateFis,
+    }
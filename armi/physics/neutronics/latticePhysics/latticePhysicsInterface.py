@@ -29,6 +29,7 @@ from armi.physics.neutronics.settings import (
     CONF_GEN_XS,
     CONF_CLEAR_XS,
     CONF_TOLERATE_BURNUP_CHANGE,
+    CONF_TOLERATE_REPR_BLOCK_CHANGE,
     CONF_XS_KERNEL,
     CONF_LATTICE_PHYSICS_FREQUENCY,
 )
@@ -46,6 +47,13 @@ def SkippingXsGen_BuChangedLessThanTolerance(tolerance):
     )
 
 
+@important
+def SkippingXsGen_ReprBlocksChangedLessThanTolerance(tolerance):
+    return "Skipping XS Generation because no representative block changed by more than {}".format(
+        tolerance
+    )
+
+
 def setBlockNeutronVelocities(r, neutronVelocities):
     """
     Set the ``mgNeutronVelocity`` parameter for each block using the ``neutronVelocities`` dictionary data.
@@ -83,6 +91,7 @@ class LatticePhysicsInterface(interfaces.Interface):
         # Set to True by default, but should be disabled when perturbed cross sections are generated.
         self._updateBlockNeutronVelocities = True
         self._burnupTolerance = self.cs[CONF_TOLERATE_BURNUP_CHANGE]
+        self._reprBlockTolerance = self.cs[CONF_TOLERATE_REPR_BLOCK_CHANGE]
         self._oldXsIdsAndBurnup = {}
         self.executablePath = self._getExecutablePath()
         self.executableRoot = os.path.dirname(self.executablePath)
@@ -148,6 +157,7 @@ class LatticePhysicsInterface(interfaces.Interface):
                 blockList=representativeBlocks, xsLibrarySuffix=self._getSuffix(cycle)
             )
             self._renameExistingLibrariesForStatepoint(cycle, node)
+            self._markXsGenerated(representativeBlocks)
         else:
             self.readExistingXSLibraries(cycle, node)
 
@@ -407,12 +417,14 @@ class LatticePhysicsInterface(interfaces.Interface):
         #. CONF_GEN_XS setting is turned on
         #. We are beyond any requested skipCycles (restart cycles)
         #. The blocks have changed burnup beyond the burnup threshold
+        #. The representative blocks have changed beyond the representative block threshold
         #. Lattice physics kernel (e.g. MC2) hasn't already been executed for this cycle
            (possible if it runs during fuel handling)
         """
         executeXSGen = bool(self.cs[CONF_GEN_XS] and cycle >= self.cs["skipCycles"])
         idsChangedBurnup = self._checkBurnupThresholds(representativeBlockList)
-        if executeXSGen and not idsChangedBurnup:
+        reprBlocksChanged = self._checkReprBlockChanges()
+        if executeXSGen and not (idsChangedBurnup and reprBlocksChanged):
             executeXSGen = False
 
         if self.r.core._lib is not None:
@@ -486,7 +498,6 @@ class LatticePhysicsInterface(interfaces.Interface):
                 if xsID not in self._oldXsIdsAndBurnup:
                     # Looks like a new ID was found that was not in the old ID's
                     # have to regenerate the cross-sections this time around
-                    self._oldXsIdsAndBurnup[xsID] = b.p.percentBu
                     idsChangedBurnup = True
                 else:
                     # The id was found.  Now it is time to compare the burnups to determine
@@ -496,9 +507,6 @@ class LatticePhysicsInterface(interfaces.Interface):
 
                     if abs(buOld - buNow) > self._burnupTolerance:
                         idsChangedBurnup = True
-                        # update the oldXs burnup to be the about to be newly generated xsBurnup
-                        self._oldXsIdsAndBurnup[xsID] = buNow
-
                         runLog.important(
                             "Burnup has changed in xsID {} from {} to {}. "
                             "Recalculating Cross-sections".format(xsID, buOld, buNow)
@@ -509,6 +517,56 @@ class LatticePhysicsInterface(interfaces.Interface):
 
         return idsChangedBurnup
 
+    def _checkReprBlockChanges(self):
+        """
+        Check whether any representative block has changed materially.
+
+        Changes are found by the cross section group manager, relative to the
+        ``tolerateReprBlockChange`` setting. Since the library holds all XS IDs, it is
+        regenerated as a whole if any of them has changed.
+
+        Returns
+        -------
+        reprBlocksChanged: bool
+            flag regarding whether or not any representative block changed substantially
+
+        See Also
+        --------
+        armi.physics.neutronics.crossSectionGroupManager.CrossSectionGroupManager.getDirtyXsIDs
+        """
+        reprBlocksChanged = True
+        xsGroupManager = self.getInterface("xsGroups")
+        if self._reprBlockTolerance > 0 and xsGroupManager is not None:
+            dirtyXsIDs = xsGroupManager.getDirtyXsIDs()
+            if dirtyXsIDs:
+                runLog.important(
+                    "The representative blocks of xsIDs {} have changed. "
+                    "Recalculating Cross-sections".format(dirtyXsIDs)
+                )
+            else:
+                reprBlocksChanged = False
+                SkippingXsGen_ReprBlocksChangedLessThanTolerance(
+                    self._reprBlockTolerance
+                )
+
+        return reprBlocksChanged
+
+    def _markXsGenerated(self, representativeBlockList):
+        """
+        Record the state that cross sections were just generated for.
+
+        The burnup and representative block checks of ``_newLibraryShouldBeCreated``
+        compare against this state. It is only moved forward here, so that a change
+        is not forgotten when cross sections are not generated for it (e.g. because
+        the other check found no change).
+        """
+        if self._burnupTolerance > 0:
+            for b in representativeBlockList:
+                self._oldXsIdsAndBurnup[b.getMicroSuffix()] = b.p.percentBu
+        xsGroupManager = self.getInterface("xsGroups")
+        if xsGroupManager is not None:
+            xsGroupManager.markXsGenerated()
+
     def _getProcessesPerNode(self):
         raise NotImplementedError
 
@@ -291,6 +291,67 @@ class TestLatticePhysicsLibraryCreation(TestLatticePhysicsInterfaceBase):
             self.assertIn("These will be generated on cycle ", mock.getStdout())
             self.assertTrue(xsGen)
 
+    def test_libCreation_ReprBlocksUnchanged(self):
+        """No representative block changed beyond the tolerance."""
+        self.o.cs[CONF_GEN_XS] = "Neutron"
+        self.o.r.core.lib = None
+        self.latticeInterface._reprBlockTolerance = 0.01
+        self.addCleanup(setattr, self.latticeInterface, "_reprBlockTolerance", 0.0)
+        self.xsGroupInterface._dirtyXsIDs = set()
+        with mockRunLogs.BufferLog() as mock:
+            xsGen = self.latticeInterface._newLibraryShouldBeCreated(
+                1, self.b, self.xsIDs
+            )
+            self.assertIn(
+                "no representative block changed by more than 0.01",
+                mock.getStdout(),
+            )
+            self.assertFalse(xsGen)
+
+        self.xsGroupInterface._dirtyXsIDs = {"AA"}
+        with mockRunLogs.BufferLog() as mock:
+            xsGen = self.latticeInterface._newLibraryShouldBeCreated(
+                1, self.b, self.xsIDs
+            )
+            self.assertIn("The representative blocks of xsIDs ['AA']", mock.getStdout())
+            self.assertTrue(xsGen)
+
+    def test_libCreation_VetoKeepsOtherChange(self):
+        """A change found by one check is kept while the other check skips generation."""
+        self.o.cs[CONF_GEN_XS] = "Neutron"
+        self.o.r.core.lib = None
+        b = self.assembly[0]
+        b.p.percentBu = 0.0
+        for name, value in (("_burnupTolerance", 1.0), ("_reprBlockTolerance", 0.01)):
+            self.addCleanup(
+                setattr,
+                self.latticeInterface,
+                name,
+                getattr(self.latticeInterface, name),
+            )
+            setattr(self.latticeInterface, name, value)
+        self.addCleanup(setattr, self.latticeInterface, "_oldXsIdsAndBurnup", {})
+        self.xsGroupInterface._dirtyXsIDs = set()
+        self.latticeInterface._markXsGenerated(self.b)
+        self.assertEqual(self.latticeInterface._oldXsIdsAndBurnup, {"AA": 0.0})
+
+        # burnup has changed, but the representative blocks have not
+        b.p.percentBu = 2.0
+        self.assertFalse(
+            self.latticeInterface._newLibraryShouldBeCreated(1, self.b, self.xsIDs)
+        )
+        self.assertEqual(self.latticeInterface._oldXsIdsAndBurnup, {"AA": 0.0})
+
+        # later the representative blocks change too; the burnup change still counts
+        b.p.percentBu = 2.5
+        self.xsGroupInterface._dirtyXsIDs = {"AA"}
+        self.assertTrue(
+            self.latticeInterface._newLibraryShouldBeCreated(1, self.b, self.xsIDs)
+        )
+        self.latticeInterface._markXsGenerated(self.b)
+        self.assertEqual(self.latticeInterface._oldXsIdsAndBurnup, {"AA": 2.5})
+        self.assertEqual(self.xsGroupInterface.getDirtyXsIDs(), [])
+
     def _modifyXSType(self):
         self.xsGroupInterface.representativeBlocks = OrderedDict(
             {"BB": self.assembly[0]}
@@ -92,18 +92,12 @@ class MacroXSGenerator(mpiActions.MpiAction):
 
             lib = context.MPI_COMM.bcast(lib, root=0)
 
-            myMacros = [
-                mc.createMacrosFromMicros(lib, b, libType=self.libType)
-                for b in myBlocks
-            ]
+            myMacros = mc.createMacrosForBlocks(lib, myBlocks, libType=self.libType)
 
             allMacros = _gatherList(myMacros)
 
         else:
-            allMacros = [
-                mc.createMacrosFromMicros(lib, b, libType=self.libType)
-                for b in allBlocks
-            ]
+            allMacros = mc.createMacrosForBlocks(lib, allBlocks, libType=self.libType)
 
         if context.MPI_RANK == 0:
             for b, macro in zip(allBlocks, allMacros):
@@ -71,6 +71,7 @@ CONF_MINIMUM_FISSILE_FRACTION = "minimumFissileFraction"
 CONF_MINIMUM_NUCLIDE_DENSITY = "minimumNuclideDensity"
 CONF_INFINITE_DILUTE_CUTOFF = "infiniteDiluteCutoff"
 CONF_TOLERATE_BURNUP_CHANGE = "tolerateBurnupChange"
+CONF_TOLERATE_REPR_BLOCK_CHANGE = "tolerateReprBlockChange"
 CONF_XS_BLOCK_REPRESENTATION = "xsBlockRepresentation"
 CONF_DISABLE_BLOCK_TYPE_EXCLUSION_IN_XS_GENERATION = (
     "disableBlockTypeExclusionInXsGeneration"
@@ -303,6 +304,12 @@ def defineSettings():
             label="Cross Section Burnup Group Tolerance",
             description="Burnup window for computing cross sections. If the prior cross sections were computed within the window, new cross sections will not be generated and the prior calculated cross sections will be used.",
         ),
+        setting.Setting(
+            CONF_TOLERATE_REPR_BLOCK_CHANGE,
+            default=0.0,
+            label="Cross Section Representative Block Tolerance",
+            description="Relative change in the number densities, temperatures and dimensions of the representative blocks below which their cross section groups are not considered changed. If no group has changed since the prior cross sections were computed, new cross sections will not be generated and the prior calculated cross sections will be used. Not used if 0.",
+        ),
         setting.Setting(
             CONF_XS_BLOCK_REPRESENTATION,
             default="Average",
@@ -21,8 +21,9 @@ from io import BytesIO
 import copy
 import os
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
+from numpy.testing import assert_allclose
 from six.moves import cPickle
 
 from armi import settings
@@ -30,6 +31,7 @@ from armi.physics.neutronics import crossSectionGroupManager
 from armi.physics.neutronics.const import CONF_CROSS_SECTION
 from armi.physics.neutronics.crossSectionGroupManager import (
     BlockCollection,
+    BlockNuclideTable,
     FluxWeightedAverageBlockCollection,
 )
 from armi.physics.neutronics.crossSectionGroupManager import (
@@ -41,6 +43,7 @@ from armi.physics.neutronics.fissionProductModel.tests import test_lumpedFission
 from armi.physics.neutronics.settings import (
     CONF_XS_BLOCK_REPRESENTATION,
     CONF_LATTICE_PHYSICS_FREQUENCY,
+    CONF_TOLERATE_REPR_BLOCK_CHANGE,
 )
 from armi.reactor.blocks import HexBlock
 from armi.reactor.flags import Flags
@@ -168,6 +171,50 @@ class TestBlockCollectionAverage(unittest.TestCase):
         self.assertAlmostEqual(newBc.avgNucTemperatures["FE56"], 502.0)
         self.assertAlmostEqual(newBc.avgNucTemperatures["NA23"], 402.0)
 
+    def test_checkBlockSimilarityMissingComponent(self):
+        b = copy.deepcopy(self.blockList[0])
+        b.remove(b.getComponent(Flags.WIRE))
+        self.bc.append(b)
+        with mockRunLogs.BufferLog() as mock:
+            self.assertFalse(self.bc._checkBlockSimilarity())
+            self.assertIn(
+                "Non-matching block in AverageBlockCollection", mock.getStdout()
+            )
+
+    def test_blockNuclideTable(self):
+        nucs = self.bc.allNuclidesInProblem
+        table = BlockNuclideTable(self.blockList, nucs)
+        for b, row in zip(self.blockList, table.getRows(self.blockList)):
+            assert_allclose(
+                table.numberDensities[row], b.getNuclideNumberDensities(nucs)
+            )
+            nvt, nv = crossSectionGroupManager.getBlockNuclideTemperatureAvgTerms(
+                b, nucs
+            )
+            assert_allclose(table.nvt[row], nvt)
+            assert_allclose(table.nv[row], nv)
+        self.assertTrue(table.hasBlocks(self.blockList[1:3]))
+        self.assertFalse(table.hasBlocks([test_blocks.loadTestBlock()]))
+
+    def test_createRepresentativeBlockSharedTable(self):
+        self.bc.averageByComponent = False
+        refB = self.bc.createRepresentativeBlock()
+        refTemps = self.bc.avgNucTemperatures
+
+        # a table with more blocks than are in the collection
+        extraBlock = copy.deepcopy(self.blockList[0])
+        self.bc.blockTable = BlockNuclideTable(
+            [extraBlock] + self.blockList, self.bc.allNuclidesInProblem
+        )
+        with patch.object(crossSectionGroupManager, "BlockNuclideTable") as mockTable:
+            avgB = self.bc.createRepresentativeBlock()
+            mockTable.assert_not_called()
+
+        for nuc, dens in refB.getNumberDensities().items():
+            self.assertAlmostEqual(avgB.getNumberDensity(nuc), dens)
+        for nuc, temp in refTemps.items():
+            self.assertAlmostEqual(self.bc.avgNucTemperatures[nuc], temp)
+
     def test_createRepresentativeBlockDissimilar(self):
         """Test creation of a representative block from a collection with dissimilar blocks."""
         uniqueBlock = test_blocks.loadTestBlock()
@@ -732,6 +779,94 @@ class TestCrossSectionGroupManager(unittest.TestCase):
         self.assertEqual(len(blockCollectionsByXsGroup), 4)
         self.assertIn("AB", blockCollectionsByXsGroup)
 
+    def test_getXsIDsIncremental(self):
+        xsIDs = self.csm._getXsIDs(self.blockList)
+        self.assertEqual(xsIDs, [b.getMicroSuffix() for b in self.blockList])
+        self.assertEqual(xsIDs[:3], ["AA", "AB", "AC"])
+
+        # within the same burnup group, into another one, and another XS type
+        self.blockList[5].p.percentBu += 1.0
+        self.blockList[1].p.percentBu = 12.0
+        self.blockList[7].p.xsType = "B"
+        with patch.object(
+            self.csm,
+            "_updateBurnupGroups",
+            wraps=self.csm._updateBurnupGroups,
+        ) as updateBurnupGroups:
+            xsIDs = self.csm._getXsIDs(self.blockList[:-1])
+        updateBurnupGroups.assert_called_once_with(
+            [self.blockList[1], self.blockList[7]]
+        )
+        self.assertEqual(xsIDs[1], "AC")
+        self.assertEqual(xsIDs[7], "BD")
+        self.assertEqual(xsIDs, [b.getMicroSuffix() for b in self.blockList[:-1]])
+        # blocks that are gone are forgotten
+        self.assertNotIn(id(self.blockList[-1]), self.csm._xsBinsByBlock)
+
+        # changing the burnup groups re-buckets everything
+        self.csm._setBuGroupBounds([50, 100])
+        xsIDs = self.csm._getXsIDs(self.blockList)
+        self.assertEqual(xsIDs[0], "AA")
+        self.assertEqual(xsIDs[-1], "AB")
+
+    def test_makeCrossSectionGroupsIncremental(self):
+        groups = self.csm.makeCrossSectionGroups()
+        self.assertEqual(list(groups)[:4], ["AA", "AB", "AC", "AD"])
+        groups["AD"].blockTable = "stale"
+
+        # moving a block from AB into AC only makes the collections of those again
+        self.blockList[1].p.percentBu = 12.0
+        newGroups = self.csm.makeCrossSectionGroups()
+        self.assertEqual(list(newGroups)[:3], ["AA", "AC", "AD"])
+        self.assertIs(newGroups["AA"], groups["AA"])
+        self.assertIs(newGroups["AD"], groups["AD"])
+        self.assertIsNot(newGroups["AC"], groups["AC"])
+        self.assertIn(self.blockList[1], newGroups["AC"])
+        self.assertIsNone(newGroups["AD"].blockTable)
+
+    def test_getDirtyXsIDs(self):
+        self.assertEqual(self.csm.getDirtyXsIDs(), [])
+        self.csm.createRepresentativeBlocks()
+        xsIDs = list(self.csm.representativeBlocks)
+        self.assertEqual(self.csm.getDirtyXsIDs(), xsIDs)
+
+        # changes are kept until cross sections have been generated for them
+        self.csm.createRepresentativeBlocks()
+        self.assertEqual(self.csm.getDirtyXsIDs(), xsIDs)
+        self.csm.markXsGenerated()
+        self.assertEqual(self.csm.getDirtyXsIDs(), [])
+        self.csm.createRepresentativeBlocks()
+        self.assertEqual(self.csm.getDirtyXsIDs(), [])
+
+        # a small change to a block of AC
+        b = self.blockList[2]
+        self.assertEqual(b.getMicroSuffix(), "AC")
+        fuel = b.getComponent(Flags.FUEL)
+        fuel.setNumberDensity("U235", fuel.getNumberDensity("U235") * 1.001)
+        self.csm.createRepresentativeBlocks()
+        self.assertEqual(self.csm.getDirtyXsIDs(), ["AC"])
+        self.csm.markXsGenerated()
+
+        # changes below the tolerance add up until they are above it
+        self.csm.cs = self.csm.cs.modified(
+            newSettings={CONF_TOLERATE_REPR_BLOCK_CHANGE: 0.01}
+        )
+        fuel.setNumberDensity("U235", fuel.getNumberDensity("U235") * 1.1)
+        self.csm.createRepresentativeBlocks()
+        self.assertEqual(self.csm.getDirtyXsIDs(), ["AC"])
+        self.csm.markXsGenerated()
+        fuel.setNumberDensity("U235", fuel.getNumberDensity("U235") * 1.03)
+        self.csm.createRepresentativeBlocks()
+        self.assertEqual(self.csm.getDirtyXsIDs(), [])
+        self.csm.markXsGenerated()
+        fuel.setNumberDensity("U235", fuel.getNumberDensity("U235") * 1.03)
+        self.csm.createRepresentativeBlocks()
+        self.assertEqual(self.csm.getDirtyXsIDs(), ["AC"])
+
+        self.csm.clearRepresentativeBlocks()
+        self.csm.createRepresentativeBlocks()
+        self.assertEqual(self.csm.getDirtyXsIDs(), xsIDs)
+
     def test_calcWeightedBurnup(self):
         self.blockList[1].p.percentBu = 3.1
         self.blockList[2].p.percentBu = 10.0
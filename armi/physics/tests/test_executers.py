@@ -15,11 +15,15 @@
 """This module provides tests for the generic Executers."""
 import os
 import subprocess
+import sys
+import time
 import unittest
+from unittest import mock
 
+from armi import context, settings
 from armi.physics import executers
 from armi.reactor import geometry
-from armi.utils import directoryChangers
+from armi.utils import directoryChangers, outputCache
 
 
 class MockParams:
@@ -41,6 +45,42 @@ class MockReactor:
         self.core = MockCore()
         self.o = None
         self.p = MockParams()
+        self.results = []
+
+
+class MockOutput:
+    def __init__(self, value):
+        self.value = value
+
+    def apply(self, reactor):
+        reactor.results.append(self.value)
+
+
+class DoublingExecuter(executers.DefaultExecuter):
+    """Runs a little external program that doubles a number after a pause."""
+
+    def __init__(self, value, reactor, pause=0.0):
+        options = executers.ExecutionOptions(label=f"double{value}")
+        options.inputFile = "double.inp"
+        options.outputFile = "double.out"
+        executers.DefaultExecuter.__init__(self, options, reactor)
+        self.value = value
+        self.pause = pause
+
+    def writeInput(self):
+        with open(self.options.inputFile, "w") as f:
+            f.write(str(self.value))
+
+    def _getCommand(self):
+        script = (
+            "import time; time.sleep({}); "
+            "open('{}', 'w').write(str(2 * int(open('{}').read())))"
+        ).format(self.pause, self.options.outputFile, self.options.inputFile)
+        return [sys.executable, "-c", script]
+
+    def _readOutput(self):
+        with open(self.options.outputFile) as f:
+            return MockOutput(int(f.read()))
 
 
 class TestExecutionOptions(unittest.TestCase):
@@ -61,6 +101,179 @@ class TestExecutionOptions(unittest.TestCase):
         e.setRunDirFromCaseTitle(caseTitle="test")
         self.assertEqual(os.path.basename(e.runDir), "9c1c83cb-0")
 
+    def test_fromUserSettings(self):
+        cs = settings.Settings()
+        e = executers.ExecutionOptions()
+        e.fromUserSettings(cs)
+        self.assertIsNone(e.outputCacheLocation)
+
+        e.fromUserSettings(cs.modified(newSettings={"outputCacheLocation": "cache"}))
+        self.assertEqual(e.outputCacheLocation, "cache")
+
+
+class TestExecuterPool(unittest.TestCase):
+    def test_runConcurrently(self):
+        r = MockReactor()
+        pause = 0.5
+        exes = [DoublingExecuter(i, r, pause) for i in range(6)]
+        pool = executers.ExecuterPool(exes, numWorkers=3)
+        with directoryChangers.TemporaryDirectoryChanger():
+            start = time.perf_counter()
+            outputs = pool.run()
+            elapsed = time.perf_counter() - start
+            self.assertTrue(os.path.exists("double.out"))
+
+        # outputs are applied in order, even though the runs overlapped
+        self.assertEqual([o.value for o in outputs], [0, 2, 4, 6, 8, 10])
+        self.assertEqual(r.results, [0, 2, 4, 6, 8, 10])
+        self.assertEqual(
+            [t.label for t in pool.timings], [e.options.label for e in exes]
+        )
+        self.assertTrue(all(t.runTime >= pause for t in pool.timings))
+        self.assertLess(elapsed, sum(t.runTime for t in pool.timings))
+        pool.reportTimings()
+
+    def test_matchesSerialRun(self):
+        r = MockReactor()
+        with directoryChangers.TemporaryDirectoryChanger():
+            serial = DoublingExecuter(21, r).run()
+            pooled = executers.ExecuterPool([DoublingExecuter(21, r)]).run()
+        self.assertEqual(serial.value, pooled[0].value)
+        self.assertEqual(r.results, [42, 42])
+
+    def test_outputCache(self):
+        r = MockReactor()
+        with directoryChangers.TemporaryDirectoryChanger(dumpOnException=False):
+            cacheDir = os.path.abspath("Output_Cache")
+            runs = []
+
+            class CountingExecuter(DoublingExecuter):
+                def _executeCommand(self, command):
+                    runs.append(self.value)
+                    DoublingExecuter._executeCommand(self, command)
+
+            def makeExecuters(values):
+                exes = [CountingExecuter(v, r) for v in values]
+                for exe in exes:
+                    exe.options.outputCacheLocation = cacheDir
+                return exes
+
+            self.assertEqual(makeExecuters([5])[0].run().value, 10)
+            self.assertEqual(makeExecuters([5])[0].run().value, 10)
+            self.assertEqual(runs, [5])
+
+            outputs = executers.ExecuterPool(makeExecuters([5, 6]), 2).run()
+            self.assertEqual([o.value for o in outputs], [10, 12])
+            self.assertEqual(runs, [5, 6])
+            executers.ExecuterPool(makeExecuters([6]), 2).run()
+            self.assertEqual(runs, [5, 6])
+        self.assertEqual(r.results, [10, 10, 10, 12, 12])
+
+    def test_outputCacheKey(self):
+        class OptionExecuter(DoublingExecuter):
+            def __init__(self, value, reactor, option):
+                DoublingExecuter.__init__(self, value, reactor)
+                self.option = option
+
+            def _getCommand(self):
+                return DoublingExecuter._getCommand(self) + [
+                    os.path.join(self.options.runDir, "scratch"),
+                    self.option,
+                ]
+
+        exe = OptionExecuter(5, MockReactor(), "-a")
+        exe.options.runDir = os.path.abspath("run1")
+        key = exe._getCacheKeyExtra()
+        self.assertIn("-a", key)
+        self.assertNotIn(exe.options.runDir, key)
+
+        # the run directory differs between runs, but options do not
+        exe.options.runDir = os.path.abspath("run2")
+        self.assertEqual(key, exe._getCacheKeyExtra())
+        other = OptionExecuter(5, MockReactor(), "-b")
+        other.options.runDir = exe.options.runDir
+        self.assertNotEqual(key, other._getCacheKeyExtra())
+
+    def test_outputCacheFailedExecution(self):
+        class UnfinishedExecuter(DoublingExecuter):
+            def _getCommand(self):
+                return None
+
+            def _execute(self):
+                with open(self.options.outputFile, "w") as f:
+                    f.write("0")
+                return False
+
+        r = MockReactor()
+        with directoryChangers.TemporaryDirectoryChanger(dumpOnException=False):
+            exe = UnfinishedExecuter(5, r)
+            exe.options.outputCacheLocation = os.path.abspath("Output_Cache")
+            self.assertEqual(exe.run().value, 0)
+            self.assertEqual(len(outputCache.OutputCache("Output_Cache")), 0)
+
+    def test_otherExecuters(self):
+        class PlainExecuter(executers.Executer):
+            def run(self):
+                return self.options.label
+
+        exes = [PlainExecuter(executers.ExecutionOptions(label="plain"), None)]
+        pool = executers.ExecuterPool(exes, numWorkers=2)
+        self.assertEqual(pool.run(), ["plain"])
+        self.assertEqual(pool.timings[0].runTime, 0.0)
+
+    def test_distributeOverMpi(self):
+        class PlainExecuter(executers.Executer):
+            def run(self):
+                self.r.results.append(self.options.label)
+                return self.options.label
+
+        class MockComm:
+            def __init__(self, otherResults):
+                self.otherResults = otherResults
+
+            def gather(self, results, root=0):
+                if root != context.MPI_RANK:
+                    return None
+                return [results, self.otherResults]
+
+        def makeExecuters(r):
+            plain = PlainExecuter(executers.ExecutionOptions(label="plain"), r)
+            return [DoublingExecuter(1, r), plain, DoublingExecuter(2, r)]
+
+        with directoryChangers.TemporaryDirectoryChanger():
+            # a worker rank only runs its share of the default executers
+            r = MockReactor()
+            with mock.patch.multiple(
+                context, MPI_SIZE=2, MPI_RANK=1, MPI_COMM=MockComm(None)
+            ):
+                pool = executers.ExecuterPool(makeExecuters(r), distributeOverMpi=True)
+                self.assertIsNone(pool.run())
+            self.assertEqual(r.results, [])
+
+            # and the primary rank runs the rest and applies all of the outputs
+            r = MockReactor()
+            otherResults = [(2, MockOutput(4), None)]
+            with mock.patch.multiple(
+                context, MPI_SIZE=2, MPI_RANK=0, MPI_COMM=MockComm(otherResults)
+            ):
+                pool = executers.ExecuterPool(makeExecuters(r), distributeOverMpi=True)
+                outputs = pool.run()
+            self.assertEqual(outputs[1], "plain")
+            self.assertEqual(outputs[0].value, 2)
+            self.assertEqual(r.results, ["plain", 2, 4])
+
+    def test_failedRun(self):
+        class FailingExecuter(DoublingExecuter):
+            def _getCommand(self):
+                return [sys.executable, "-c", "raise SystemExit(3)"]
+
+        r = MockReactor()
+        exes = [DoublingExecuter(1, r), FailingExecuter(2, r), DoublingExecuter(3, r)]
+        with directoryChangers.TemporaryDirectoryChanger():
+            with self.assertRaises(subprocess.CalledProcessError):
+                executers.ExecuterPool(exes, numWorkers=2).run()
+        self.assertEqual(r.results, [2])
+
 
 class TestExecuters(unittest.TestCase):
     def setUp(self):
@@ -895,6 +895,7 @@ class Block(composites.Composite):
         tempBlock = copy.deepcopy(bReplacement)
         oldParams = self.p
         newParams = self.p = tempBlock.p
+        composites._setParamsOwner(self)
         for paramName in paramsToSkip:
             newParams[paramName] = oldParams[paramName]
 
@@ -114,6 +114,11 @@ class _DimensionLink(tuple):
         return f"{self[0].name}.{self[1]}"
 
 
+def _isComponentLink(val):
+    """Whether a dimension value refers to another component, like a linked dimension."""
+    return isinstance(val, tuple) and bool(val) and isinstance(val[0], Component)
+
+
 class ComponentType(composites.CompositeModelType):
     """
     ComponetType is a metaclass for storing and initializing Component subclass types.
@@ -197,6 +202,11 @@ class Component(composites.Composite, metaclass=ComponentType):
 
     is3D = False  # flag to show that area is 2D by default
 
+    # whether getArea may reuse previous results while the values they were computed from
+    # (see _getAreaCacheKey) are unchanged
+    _CACHE_AREA = False
+    _areaCache = None
+
     _COMP_REPORT_GROUPS = {
         "intercoolant": report.INTERCOOLANT_DIMS,
         "bond": report.BOND_DIMS,
@@ -243,6 +253,16 @@ class Component(composites.Composite, metaclass=ComponentType):
         self.p.mergeWith = mergeWith
         self.p.customIsotopicsName = isotopics
 
+    @property
+    def material(self):
+        """The material of this component."""
+        return self._material
+
+    @material.setter
+    def material(self, mat):
+        self._material = mat
+        self._clearAreaCache()
+
     @property
     def temperatureInC(self):
         """Return the hot temperature in Celsius."""
@@ -252,6 +272,7 @@ class Component(composites.Composite, metaclass=ComponentType):
     def temperatureInC(self, value):
         """Set the hot temperature in Celsius."""
         self.p.temperatureInC = value
+        self._clearAreaCache()
 
     @property
     def temperatureInK(self):
@@ -325,6 +346,7 @@ class Component(composites.Composite, metaclass=ComponentType):
     def setLink(self, key, otherComp, otherCompKey):
         """Set the dimension link."""
         self.p[key] = _DimensionLink((otherComp, otherCompKey))
+        self._clearAreaCache()
 
     def setProperties(self, properties):
         """Apply thermo-mechanical properties of a Material."""
@@ -451,6 +473,13 @@ class Component(composites.Composite, metaclass=ComponentType):
         --------
         block.getVolumeFractions: component coolant is typically the "leftover" and is calculated and set here
         """
+        cacheable = self._CACHE_AREA and not self.is3D
+        if cacheable:
+            key = self._getAreaCacheKey()
+            cached = self._areaCache.get(cold) if self._areaCache else None
+            if cached is not None and cached[0] == key:
+                return cached[1]
+
         area = self.getComponentArea(cold=cold)
         if self.p.get("modArea", None):
             comp, arg = self.p.modArea
@@ -462,8 +491,34 @@ class Component(composites.Composite, metaclass=ComponentType):
                 raise ValueError("Option {} does not exist".format(arg))
 
         self._checkNegativeArea(area, cold)
+        if cacheable:
+            if self._areaCache is None:
+                self._areaCache = {}
+            self._areaCache[cold] = (key, area)
         return area
 
+    def _getAreaCacheKey(self):
+        """
+        Return the values that the area of this component is computed from.
+
+        These are the dimensions and temperatures of this component, and the same values
+        of the components that its dimensions or ``modArea`` are linked to. A cached
+        area is only reused while these are unchanged, so it cannot go stale however they
+        were changed (e.g. parameters read from a database, or a change to a linked
+        component). Setting the material of a component clears its cached areas.
+        """
+        key = [self.p.temperatureInC, self.inputTemperatureInC]
+        for dimName in self.DIMENSION_NAMES:
+            val = self.p[dimName]
+            if _isComponentLink(val):
+                val = (id(val[0]), val[1], val[0]._getAreaCacheKey())
+            key.append(val)
+        modArea = self.p.get("modArea", None)
+        if modArea:
+            comp, arg = modArea
+            key.append((id(comp), arg, comp._getAreaCacheKey()))
+        return tuple(key)
+
     def getVolume(self):
         """
         Return the volume [cm^3] of the component.
@@ -499,6 +554,7 @@ class Component(composites.Composite, metaclass=ComponentType):
         clearLinkedCache: Clears cache of components that depend on this component's dimensions.
         """
         self.p.volume = None
+        self._areaCache = None
         if self.parent:
             self.parent.derivedMustUpdate = True
 
@@ -597,7 +653,7 @@ class Component(composites.Composite, metaclass=ComponentType):
     def setArea(self, val):
         raise NotImplementedError
 
-    def setTemperature(self, temperatureInC):
+    def setTemperature(self, temperatureInC, clearCache=True):
         r"""
         Adjust temperature of this component.
 
@@ -625,13 +681,23 @@ class Component(composites.Composite, metaclass=ComponentType):
 
             f_N  = \frac{d\rho}{\rho} + 1 = \frac{\rho^{\prime}}{\rho}
 
+        Parameters
+        ----------
+        temperatureInC : float
+            The new temperature in C.
+        clearCache : bool, optional
+            Clear the cached dimensions of this component and of the components linked to it. When
+            the temperatures of all of the components of a block are changed at once, it is cheaper
+            to skip this and call ``clearCache`` on each of them afterward.
         """
-        prevTemp, self.temperatureInC = self.temperatureInC, float(temperatureInC)
+        prevTemp = self.temperatureInC
+        self.p.temperatureInC = float(temperatureInC)
         f = self.material.getThermalExpansionDensityReduction(
             prevTemp, self.temperatureInC
         )
         self.changeNDensByFactor(f)
-        self.clearLinkedCache()
+        if clearCache:
+            self.clearLinkedCache()
 
     def getNuclides(self):
         """
@@ -892,14 +958,15 @@ class Component(composites.Composite, metaclass=ComponentType):
         return dimNames
 
     def clearLinkedCache(self):
-        """Clear this cache and any other dependent volumes."""
+        """Clear this cache and those of the components with dimensions that depend on it."""
         self.clearCache()
         if self.parent:
             # changes in dimensions can affect cached variables such as pitch
             self.parent.cached = {}
-            for c in self.getLinkedComponents():
+            for c in self.getDependentComponents():
                 # no clearCache since parent already updated derivedMustUpdate in self.clearCache()
                 c.p.volume = None
+                c._areaCache = None
 
     def getLinkedComponents(self):
         """Find other components that are linked to this component."""
@@ -911,6 +978,39 @@ class Component(composites.Composite, metaclass=ComponentType):
                     dependents.append(child)
         return dependents
 
+    def _clearAreaCache(self):
+        """Clear the cached areas of this component and the components that depend on it."""
+        self._areaCache = None
+        if self.parent:
+            for c in self.getDependentComponents():
+                c._areaCache = None
+
+    def getDependentComponents(self):
+        """
+        Find all components with dimensions that depend on this component.
+
+        This includes components linked to this one directly (by a linked dimension or
+        ``modArea``), and those linked to it through other components (e.g., a gap linked
+        to a liner that is linked to this cladding).
+        """
+        linkedTo = {}
+        for child in self.parent.getChildren():
+            for dimName in child.DIMENSION_NAMES:
+                val = child.p[dimName]
+                if _isComponentLink(val):
+                    linkedTo.setdefault(id(val[0]), []).append(child)
+
+        dependents = []
+        found = {id(self)}
+        toVisit = [self]
+        while toVisit:
+            for child in linkedTo.get(id(toVisit.pop()), []):
+                if id(child) not in found:
+                    found.add(id(child))
+                    dependents.append(child)
+                    toVisit.append(child)
+        return dependents
+
     def getThermalExpansionFactor(self, Tc=None, T0=None):
         """
         Retrieves the material thermal expansion fraction.
@@ -1077,6 +1177,7 @@ class Component(composites.Composite, metaclass=ComponentType):
         linkedDims = self._getLinkedDimsAndValues()
         composites.Composite.restoreBackup(self, paramsToApply)
         self._restoreLinkedDims(linkedDims)
+        self._areaCache = None
 
     def _getLinkedDimsAndValues(self):
         linkedDims = []
@@ -1247,4 +1348,4 @@ class Component(composites.Composite, metaclass=ComponentType):
 class ShapedComponent(Component):
     """A component with well-defined dimensions."""
 
-    pass
+    _CACHE_AREA = True
@@ -33,6 +33,7 @@ import collections
 import itertools
 import operator
 import timeit
+import weakref
 from typing import Dict, Optional, Type, Tuple, List, Union
 
 import numpy
@@ -195,6 +196,119 @@ class FlagSerializer(parameters.Serializer):
         return out
 
 
+def _structureChanged(obj):
+    """
+    Record that the flags, children or location of an object have changed.
+
+    This increments the structure version of the object and of each of its ancestors.
+    Lookup tables of a composite (e.g. ``_FlagIndex`` and ``_PreOrder``) record the
+    version of the composite they were built at, and are rebuilt on their next use once
+    it has moved on, so changes elsewhere in the model leave them alone.
+    """
+    while isinstance(obj, ArmiObject):
+        obj._structureVersion += 1
+        obj = obj.parent
+
+
+def _setParamsOwner(obj):
+    # the flags setter only gets the parameter collection, so it keeps a (weak, to
+    # avoid a reference cycle) reference back to the object to report changes to
+    obj.p.__dict__["_owner"] = weakref.ref(obj)
+
+
+def _setFlags(p, value):
+    p._p_flags = value
+    owner = p.__dict__.get("_owner")
+    if owner is not None:
+        _structureChanged(owner())
+
+
+class _FlagIndex:
+    """
+    Lookup table from flags to the children of a composite that have them.
+
+    Children are grouped by their exact flags. Since there are generally only a few
+    distinct flag values among many children, a query tests each distinct value once
+    rather than calling ``hasFlags`` on each child.
+    """
+
+    def __init__(self, children, childrenAreComponents, version):
+        self.version = version
+        self.children = children
+        self.childrenAreComponents = childrenAreComponents
+        self._byFlags: Dict[int, List[int]] = {}
+        for i, child in enumerate(children):
+            self._byFlags.setdefault(int(child.p.flags), []).append(i)
+
+    def getChildrenWithFlags(self, typeSpec: TypeSpec, exact=False):
+        """
+        Return the children matching a type spec, in order.
+
+        This follows the semantics of ``ArmiObject.hasFlags``. ``None`` is returned if
+        the type spec is not of a type that the table can handle, in which case the
+        caller should fall back to checking each child.
+        """
+        indices = self._getIndices(typeSpec, exact)
+        if indices is None:
+            return None
+        return [self.children[i] for i in indices]
+
+    def _getIndices(self, typeSpec: TypeSpec, exact):
+        if not typeSpec:
+            return [] if exact else range(len(self.children))
+
+        if isinstance(typeSpec, Flags):
+            value = int(typeSpec)
+            if exact:
+                return self._byFlags.get(value, [])
+            groups = [
+                indices
+                for flags, indices in self._byFlags.items()
+                if flags and flags & value == value
+            ]
+        elif isinstance(typeSpec, (list, tuple, set, frozenset)):
+            groups = []
+            for candidate in typeSpec:
+                indices = self._getIndices(candidate, exact)
+                if indices is None:
+                    return None
+                groups.append(indices)
+        else:
+            return None
+
+        if len(groups) == 1:
+            return groups[0]
+        return sorted(set(itertools.chain.from_iterable(groups)))
+
+
+# Orders in which ``Composite.traverse`` can visit the descendants of a composite
+PRE_ORDER = "preorder"
+LEVEL_ORDER = "levelorder"
+
+
+class _PreOrder:
+    """
+    The descendants of a composite, flattened in pre-order, with their depths.
+
+    Like ``_FlagIndex``, this records the structure version of the composite it was
+    built at, and is rebuilt once anything below the composite has changed.
+    """
+
+    def __init__(self, root):
+        self.version = root._structureVersion
+        self.children = root._children
+        self.objects = []
+        self.depths = []
+        stack = [(child, 1) for child in reversed(root._children)]
+        while stack:
+            obj, depth = stack.pop()
+            self.objects.append(obj)
+            self.depths.append(depth)
+            children = getattr(obj, "_children", None)
+            if children:
+                stack.extend((child, depth + 1) for child in reversed(children))
+
+
 def _defineBaseParameters():
     """
     Return parameter definitions that all ArmiObjects must have to function properly.
@@ -231,7 +345,7 @@ def _defineBaseParameters():
             location=parameters.ParamLocation.AVERAGE,
             saveToDB=True,
             default=Flags(0),
-            setter=parameters.NoDefault,
+            setter=_setFlags,
             categories=set(),
             serializer=FlagSerializer,
         )
@@ -323,12 +437,16 @@ class ArmiObject(metaclass=CompositeModelType):
     paramCollectionType: Optional[Type[parameters.ParameterCollection]] = None
     pDefs = _defineBaseParameters()
 
+    # incremented by ``_structureChanged`` when this object or anything below it changes
+    _structureVersion = 0
+
     def __init__(self, name):
         self.name = name
         self.parent = None
         self.cached = {}
         self._backupCache = None
         self.p = self.paramCollectionType()
+        _setParamsOwner(self)
         # TODO: These are not serialized to the database, and will therefore
         # lead to surprising behavior when using databases. We need to devise a
         # way to either represent them in parameters, or otherwise reliably
@@ -393,6 +511,9 @@ class ArmiObject(metaclass=CompositeModelType):
         """
         state = self.__dict__.copy()
         state["parent"] = None
+        # the lookup tables are rebuilt on demand
+        state.pop("_flagIndex", None)
+        state.pop("_preOrder", None)
 
         if "r" in state:
             raise RuntimeError("An ArmiObject should never contain the entire Reactor.")
@@ -411,6 +532,7 @@ class ArmiObject(metaclass=CompositeModelType):
         ``__setstate__`` one should not rely upon ``self.parent``.
         """
         self.__dict__.update(state)
+        _setParamsOwner(self)
 
         if self.spatialGrid is not None:
             self.spatialGrid.armiObject = self
@@ -498,6 +620,7 @@ class ArmiObject(metaclass=CompositeModelType):
 
         """
         self.p = other.p.__class__()
+        _setParamsOwner(self)
         for p, val in other.p.items():
             self.p[p] = val
 
@@ -1257,24 +1380,17 @@ class ArmiObject(metaclass=CompositeModelType):
             :id: I_ARMI_CMP_NUC1
             :implements: R_ARMI_CMP_NUC
         """
+        children = list(self)
+        symmetryFactor = self.getSymmetryFactor() if children else 1.0
         volumes = numpy.array(
-            [
-                c.getVolume() / (c.parent.getSymmetryFactor() if c.parent else 1.0)
-                for c in self
-            ]
+            [c.getVolume() / symmetryFactor for c in children]
         )  # c x 1
         totalVol = volumes.sum()
         if totalVol == 0.0:
             # there are no children so no volume or number density
             return [0.0] * len(nucNames)
 
-        densListForEachComp = []
-        for c in self:
-            numberDensityDict = c.getNumberDensities()
-            densListForEachComp.append(
-                [numberDensityDict.get(nuc, 0.0) for nuc in nucNames]
-            )
-        nucDensForEachComp = numpy.array(densListForEachComp)  # c x n
+        nucDensForEachComp = getNumberDensityMatrix(children, nucNames)  # c x n
 
         return volumes.dot(nucDensForEachComp) / totalVol
 
@@ -2016,7 +2132,7 @@ class ArmiObject(metaclass=CompositeModelType):
 
     def getChildParamValues(self, param):
         """Get the child parameter values in a numpy array."""
-        return numpy.array([child.p[param] for child in self])
+        return parameters.getParamValues((child.p for child in self), param)
 
     def isFuel(self):
         """True if this is a fuel block."""
@@ -2036,8 +2152,13 @@ class ArmiObject(metaclass=CompositeModelType):
             List of nuclide names that exist in this
         """
         nucs = set()
-        for child in self.getChildren():
-            nucs.update(child.getNuclides())
+        stack = list(self.getChildren())
+        while stack:
+            child = stack.pop()
+            if type(child).getNuclides is ArmiObject.getNuclides:
+                stack.extend(child.getChildren())
+            else:
+                nucs.update(child.getNuclides())
         return nucs
 
     def getFissileMass(self):
@@ -2673,6 +2794,9 @@ class Composite(ArmiObject):
         :implements: R_ARMI_CMP
     """
 
+    _flagIndex: Optional[_FlagIndex] = None
+    _preOrder: Optional[_PreOrder] = None
+
     def __init__(self, name):
         ArmiObject.__init__(self, name)
         self.childrenByLocator = {}
@@ -2704,6 +2828,7 @@ class Composite(ArmiObject):
         """Sort the children of this object."""
         # sort the top-level children of this Composite
         self._children.sort()
+        _structureChanged(self)
 
         # recursively sort the children below it.
         for c in self._children:
@@ -2717,10 +2842,12 @@ class Composite(ArmiObject):
     def append(self, obj):
         """Append a child to this object."""
         self._children.append(obj)
+        _structureChanged(self)
 
     def extend(self, seq):
         """Add a list of children to this object."""
         self._children.extend(seq)
+        _structureChanged(self)
 
     def add(self, obj):
         """Add one new child."""
@@ -2732,12 +2859,14 @@ class Composite(ArmiObject):
             )
         obj.parent = self
         self._children.append(obj)
+        _structureChanged(self)
 
     def remove(self, obj):
         """Remove a particular child."""
         obj.parent = None
         obj.spatialLocator = obj.spatialLocator.detachedCopy()
         self._children.remove(obj)
+        _structureChanged(self)
 
     def moveTo(self, locator):
         """Move to specific location in parent. Often in a grid."""
@@ -2747,6 +2876,7 @@ class Composite(ArmiObject):
                 "".format(self, locator.grid.armiObject, self.parent)
             )
         self.spatialLocator = locator
+        _structureChanged(self)
 
     def insert(self, index, obj):
         """Insert an object into the list of children at a particular index."""
@@ -2758,6 +2888,7 @@ class Composite(ArmiObject):
             )
         obj.parent = self
         self._children.insert(index, obj)
+        _structureChanged(self)
 
     def removeAll(self):
         """Remove all children."""
@@ -2811,49 +2942,207 @@ class Composite(ArmiObject):
         [grandchild1, grandchild2, grandchild3]
 
         >>> obj.getChildren(deep=True)
-        [child1, child2, child3, grandchild1, grandchild2, grandchild3]
+        [child1, grandchild1, child2, grandchild2, child3, grandchild3]
 
         # Assuming that grandchild1 and grandchild3 are Component objects
         >>> obj.getChildren(deep=True, predicate=lambda o: isinstance(o, Component))
         [grandchild1, grandchild3]
 
         """
-        _pred = predicate or (lambda x: True)
         if deep and generationNum > 1:
             raise RuntimeError(
                 "Cannot get children with a generation number set and the deep flag set"
             )
 
-        children = []
-        for child in self._children:
-            if generationNum == 1 or deep:
-                if _pred(child):
-                    children.append(child)
-
-            if generationNum > 1 or deep:
-                children.extend(
-                    child.getChildren(
-                        deep=deep,
-                        generationNum=generationNum - 1,
-                        includeMaterials=includeMaterials,
-                        predicate=predicate,
-                    )
+        if deep:
+            return list(
+                self.traverse(predicate=predicate, includeMaterials=includeMaterials)
+            )
+
+        if generationNum == 1 and not includeMaterials:
+            if predicate is None:
+                return list(self._children)
+            return [child for child in self._children if predicate(child)]
+
+        # the materials of this object and all generations in between are included
+        return [
+            obj
+            for obj, depth in self._traverse(
+                PRE_ORDER, predicate, generationNum, includeMaterials
+            )
+            if depth == generationNum or not isinstance(obj, ArmiObject)
+        ]
+
+    def traverse(
+        self, order=PRE_ORDER, predicate=None, maxDepth=None, includeMaterials=False
+    ):
+        """
+        Iterate over the descendants of this composite.
+
+        The tree is walked with an explicit stack (or queue) rather than by recursion,
+        and a full pre-order walk reuses a flattened listing of the descendants that is
+        cached until the structure of the model changes.
+
+        Parameters
+        ----------
+        order : str, optional
+            ``PRE_ORDER`` (the default) yields each object followed by all of its
+            descendants, before moving on to its next sibling. This is the order of
+            ``getChildren(deep=True)``. ``LEVEL_ORDER`` yields all children, then all
+            grandchildren, and so on.
+
+        predicate : callable, optional
+            Only composites for which this returns True are yielded. The descendants of
+            other composites are still visited. It is not called on materials, which
+            are all yielded if ``includeMaterials`` is set.
+
+        maxDepth : int, optional
+            The deepest generation to visit, where 1 means direct children. All
+            generations are visited by default.
+
+        includeMaterials : bool, optional
+            Also yield the material of each object that has one. In pre-order, a
+            material follows the descendants of its object; in level order, it follows
+            the children of its object.
+
+        Examples
+        --------
+        >>> list(block.traverse(predicate=lambda o: o.hasFlags(Flags.FUEL)))
+        [<Circle: fuel>]
+
+        >>> list(core.traverse(order=LEVEL_ORDER, maxDepth=2))
+        [assembly1, assembly2, block1a, block1b, block2a, block2b]
+        """
+        return (
+            obj
+            for obj, _depth in self._traverse(
+                order, predicate, maxDepth, includeMaterials
+            )
+        )
+
+    def _traverse(self, order, predicate, maxDepth, includeMaterials):
+        """Yield ``(object, depth)`` for the descendants of this composite."""
+        if order == PRE_ORDER:
+            if maxDepth is None:
+                walk = self._walkCachedPreOrder(includeMaterials)
+            else:
+                walk = self._walkPreOrder(maxDepth, includeMaterials)
+        elif order == LEVEL_ORDER:
+            walk = self._walkLevelOrder(maxDepth, includeMaterials)
+        else:
+            raise ValueError(
+                "Unknown traversal order `{}`; expected `{}` or `{}`".format(
+                    order, PRE_ORDER, LEVEL_ORDER
                 )
+            )
+
+        if predicate is None:
+            return walk
+        return (
+            (obj, depth)
+            for obj, depth in walk
+            if not isinstance(obj, ArmiObject) or predicate(obj)
+        )
+
+    def _getPreOrder(self) -> _PreOrder:
+        preOrder = self._preOrder
+        if (
+            preOrder is None
+            or preOrder.version != self._structureVersion
+            or preOrder.children is not self._children
+        ):
+            preOrder = _PreOrder(self)
+            self._preOrder = preOrder
+        return preOrder
+
+    def _walkCachedPreOrder(self, includeMaterials):
+        preOrder = self._getPreOrder()
+        if not includeMaterials:
+            yield from zip(preOrder.objects, preOrder.depths)
+        else:
+            # materials are looked up as we go, since replacing one is not a structural
+            # change. Each is yielded once the walk leaves the subtree of its object.
+            pending = []
+            for obj, depth in zip(preOrder.objects, preOrder.depths):
+                while pending and pending[-1][1] > depth:
+                    yield pending.pop()
+                yield obj, depth
+                material = getattr(obj, "material", None)
+                if material:
+                    pending.append((material, depth + 1))
+            while pending:
+                yield pending.pop()
+
         if includeMaterials:
             material = getattr(self, "material", None)
             if material:
-                children.append(material)
+                yield material, 1
 
-        return children
+    def _walkPreOrder(self, maxDepth, includeMaterials):
+        stack = [(child, 1) for child in reversed(self._children)]
+        if includeMaterials:
+            material = getattr(self, "material", None)
+            if material:
+                stack.insert(0, (material, 1))
+        while stack:
+            obj, depth = stack.pop()
+            yield obj, depth
+            if includeMaterials:
+                material = getattr(obj, "material", None)
+                if material and depth < maxDepth:
+                    stack.append((material, depth + 1))
+            children = getattr(obj, "_children", None)
+            if children and depth < maxDepth:
+                stack.extend((child, depth + 1) for child in reversed(children))
+
+    def _walkLevelOrder(self, maxDepth, includeMaterials):
+        queue = collections.deque([(self, 0)])
+        while queue:
+            obj, depth = queue.popleft()
+            if depth:
+                yield obj, depth
+            if maxDepth is not None and depth >= maxDepth:
+                continue
+            children = getattr(obj, "_children", None)
+            if children:
+                queue.extend((child, depth + 1) for child in children)
+            if includeMaterials:
+                material = getattr(obj, "material", None)
+                if material:
+                    queue.append((material, depth + 1))
 
     def getChildrenWithFlags(self, typeSpec: TypeSpec, exactMatch=False):
         """Get all children of a specific type."""
-        children = []
-        for child in self:
-            if child.hasFlags(typeSpec, exact=exactMatch):
-                children.append(child)
+        children = self._getFlagIndex().getChildrenWithFlags(typeSpec, exactMatch)
+        if children is None:
+            children = [
+                child for child in self if child.hasFlags(typeSpec, exact=exactMatch)
+            ]
         return children
 
+    def _getFlagIndex(self) -> _FlagIndex:
+        """
+        Return the lookup table from flags to the children of this composite.
+
+        The table is rebuilt if anything may have changed since it was built: the flags
+        or children of any composite, or the identity of the list of children.
+        """
+        index = self._flagIndex
+        if (
+            index is None
+            or index.version != self._structureVersion
+            or index.children is not self._children
+        ):
+            from armi.reactor.components import Component
+
+            index = _FlagIndex(
+                self._children,
+                all(isinstance(c, Component) for c in self._children),
+                self._structureVersion,
+            )
+            self._flagIndex = index
+        return index
+
     def getChildrenOfType(self, typeName):
         """Get children that have a specific input type name."""
         children = []
@@ -2884,7 +3173,34 @@ class Composite(ArmiObject):
         iterator of Component
             items matching typeSpec and exact criteria
         """
-        return (c for child in self for c in child.iterComponents(typeSpec, exact))
+        if typeSpec is not None:
+            index = self._getFlagIndex()
+            if index.childrenAreComponents:
+                # components only yield themselves, so this is just a flags lookup
+                components = index.getChildrenWithFlags(typeSpec, exact)
+                if components is not None:
+                    return iter(components)
+        return self._iterComponents(typeSpec, exact)
+
+    def _iterComponents(self, typeSpec, exact):
+        """
+        Walk down to the components below this composite with an explicit stack.
+
+        Composites that do not override ``iterComponents`` are walked through directly,
+        rather than nesting a generator for each of them.
+        """
+        from armi.reactor.components import Component
+
+        stack = list(reversed(self._children))
+        while stack:
+            obj = stack.pop()
+            if isinstance(obj, Component):
+                if obj.hasFlags(typeSpec, exact):
+                    yield obj
+            elif type(obj).iterComponents is Composite.iterComponents:
+                stack.extend(reversed(obj._children))
+            else:
+                yield from obj.iterComponents(typeSpec, exact)
 
     def syncMpiState(self):
         """
@@ -2908,28 +3224,33 @@ class Composite(ArmiObject):
 
         startTime = timeit.default_timer()
         # sync parameters...
-        allComps = [self] + self.getChildren(deep=True, includeMaterials=True)
-        allComps = [c for c in allComps if hasattr(c, "p")]
-        sendBuf = [c.p.getSyncData() for c in allComps]
+        allComps = [self]
+        allComps.extend(
+            c for c in self.traverse(includeMaterials=True) if hasattr(c, "p")
+        )
+        sendBuf = _packSyncData(allComps)
+        packTime = timeit.default_timer() - startTime
         runLog.debug("syncMpiState has {} comps".format(len(allComps)))
 
         try:
             context.MPI_COMM.barrier()  # sync up
             allGatherTime = -timeit.default_timer()
-            allSyncData = context.MPI_COMM.allgather(sendBuf)
+            allSyncData = _allgatherSyncData(context.MPI_COMM, sendBuf)
             allGatherTime += timeit.default_timer()
         except:
             msg = ["Failure while trying to allgather."]
-            for ci, compData in enumerate(sendBuf):
-                if compData is not None:
-                    msg += ["sendBuf[{}]: {}".format(ci, compData)]
+            _numComps, packedScalars, others = sendBuf
+            for key, (indices, values) in packedScalars.items():
+                msg += ["sendBuf{}: {} {}".format(key, indices, values)]
+            for ci, paramName, val in others:
+                msg += ["sendBuf[{}]: {}: {}".format(ci, paramName, val)]
             runLog.error("\n".join(msg))
             raise
 
         # key is (comp, paramName) value is conflicting nodes
         errors = collections.defaultdict(list)
         syncCount = 0
-        compsPerNode = {len(nodeSyncData) for nodeSyncData in allSyncData}
+        compsPerNode = {numComps for numComps, _, _ in allSyncData}
 
         if len(compsPerNode) != 1:
             raise ValueError(
@@ -2938,12 +3259,24 @@ class Composite(ArmiObject):
                 )
             )
 
-        for ci, comp in enumerate(allComps):
+        _logSyncDataSizes(allSyncData)
+        applyTime = -timeit.default_timer()
+        allNodeCompData = [
+            _unpackSyncData(nodeSyncData) for nodeSyncData in allSyncData
+        ]
+        changed = set()
+        for nodeCompData in allNodeCompData:
+            changed.update(nodeCompData)
+        for ci in sorted(changed):
+            comp = allComps[ci]
             if not hasattr(comp, "_syncParameters"):
                 # materials don't have Parameters to sync
                 continue
-            data = (nodeSyncData[ci] for nodeSyncData in allSyncData)
+            data = (nodeCompData.get(ci) for nodeCompData in allNodeCompData)
             syncCount += comp._syncParameters(data, errors)
+        # values derived from the parameters of children may be cached anywhere above
+        self.clearCache()
+        applyTime += timeit.default_timer()
 
         if errors:
             errorData = sorted(
@@ -2969,9 +3302,13 @@ class Composite(ArmiObject):
 
         self._markSynchronized()
         runLog.extra(
-            "Synchronized reactor over MPI in {:.4f} seconds, {:.4f} seconds in MPI "
-            "allgather. count:{}".format(
-                timeit.default_timer() - startTime, allGatherTime, syncCount
+            "Synchronized reactor over MPI in {:.4f} seconds, {:.4f} seconds packing, "
+            "{:.4f} seconds in MPI allgather, {:.4f} seconds applying. count:{}".format(
+                timeit.default_timer() - startTime,
+                packTime,
+                allGatherTime,
+                applyTime,
+                syncCount,
             )
         )
 
@@ -3016,7 +3353,7 @@ class Composite(ArmiObject):
         SINCE_LAST_DISTRIBUTE_STATE.
         """
         paramDefs = set()
-        for child in [self] + self.getChildren(deep=True, includeMaterials=True):
+        for child in itertools.chain([self], self.traverse(includeMaterials=True)):
             # Materials don't have a "p" / Parameter attribute to sync
             if hasattr(child, "p"):
                 # below reads as: assigned & everything_but(SINCE_LAST_DISTRIBUTE_STATE)
@@ -3066,6 +3403,8 @@ class Composite(ArmiObject):
         """
         self.p.restoreBackup(paramsToApply)
         self.cached, self._backupCache = self._backupCache
+        # parameters are restored without going through their setters
+        _structureChanged(self)
         if self.spatialGrid:
             self.spatialGrid.restoreBackup()
 
@@ -3247,6 +3586,174 @@ class Composite(ArmiObject):
         return sum(map(getter, self))
 
 
+_PACKABLE_SCALAR_TYPES = {int, float, bool}
+
+
+def _packSyncData(comps):
+    """
+    Pack the parameters that are out of sync on a list of composites for MPI transfer.
+
+    Only composites whose parameters were assigned since the last synchronization are
+    included. Their scalar values are grouped by parameter name and value type into
+    typed numpy arrays, alongside the indices of the composites they came from, which
+    :py:func:`_allgatherSyncData` exchanges as raw buffers. Anything that is not a
+    scalar number (arrays, strings, flags, ...) is sent as-is.
+
+    Parameters
+    ----------
+    comps : list of ArmiObject
+        The composites to pack; they must all have a parameter collection. The same list
+        (in the same order) must be used on every rank.
+
+    Returns
+    -------
+    numComps : int
+        The number of composites that were considered, for consistency checks.
+    packedScalars : dict
+        ``(paramName, valueType)`` keys and ``(compIndices, values)`` numpy array pairs.
+    others : list
+        ``(compIndex, paramName, value)`` tuples for all unpacked values.
+
+    See Also
+    --------
+    _unpackSyncData : the inverse of this function
+    """
+    scalars = collections.defaultdict(lambda: ([], []))
+    others = []
+    for ci, comp in enumerate(comps):
+        if not comp.p.assigned & parameters.SINCE_LAST_DISTRIBUTE_STATE:
+            continue
+        syncData = comp.p.getSyncData()
+        if not syncData:
+            continue
+        for paramName, val in syncData.items():
+            valType = type(val)
+            if valType in _PACKABLE_SCALAR_TYPES or isinstance(
+                val, (numpy.number, numpy.bool_)
+            ):
+                indices, values = scalars[paramName, valType]
+                indices.append(ci)
+                values.append(val)
+            else:
+                others.append((ci, paramName, val))
+
+    packedScalars = {}
+    for (paramName, valType), (indices, values) in scalars.items():
+        try:
+            packedValues = numpy.array(values, dtype=numpy.dtype(valType))
+        except OverflowError:
+            # e.g. Python ints too large for an int64; just send them the slow way
+            others.extend(zip(indices, itertools.repeat(paramName), values))
+            continue
+        packedScalars[paramName, valType] = (
+            numpy.array(indices, dtype=numpy.int64),
+            packedValues,
+        )
+
+    return len(comps), packedScalars, others
+
+
+def _allgatherSyncData(comm, sendBuf):
+    """
+    Exchange the data produced by :py:func:`_packSyncData` between all MPI ranks.
+
+    The packed index and value arrays of each rank are laid end to end in one byte
+    buffer, and those are exchanged with ``Allgatherv``. Only the layout of the buffers,
+    the number of composites and the unpacked values are pickled and sent with
+    ``allgather``.
+
+    Returns
+    -------
+    list
+        The ``(numComps, packedScalars, others)`` data of each rank, in rank order.
+    """
+    numComps, packedScalars, others = sendBuf
+    layout = []
+    buffers = []
+    for (paramName, valType), (indices, values) in packedScalars.items():
+        layout.append((paramName, valType, values.dtype, len(indices)))
+        buffers.append(numpy.ascontiguousarray(indices, dtype=numpy.int64))
+        buffers.append(numpy.ascontiguousarray(values))
+    sendBytes = numpy.concatenate(
+        [numpy.empty(0, dtype=numpy.uint8)]
+        + [buf.reshape(-1).view(numpy.uint8) for buf in buffers]
+    )
+
+    headers = comm.allgather((numComps, layout, others, sendBytes.nbytes))
+    counts = [numBytes for _numComps, _layout, _others, numBytes in headers]
+    recvBytes = numpy.empty(sum(counts), dtype=numpy.uint8)
+    comm.Allgatherv(sendBytes, [recvBytes, counts])
+
+    allSyncData = []
+    offset = 0
+    for nodeNumComps, nodeLayout, nodeOthers, _numBytes in headers:
+        nodePackedScalars = {}
+        for paramName, valType, dtype, count in nodeLayout:
+            indices = numpy.frombuffer(
+                recvBytes, dtype=numpy.int64, count=count, offset=offset
+            )
+            offset += indices.nbytes
+            values = numpy.frombuffer(
+                recvBytes, dtype=dtype, count=count, offset=offset
+            )
+            offset += values.nbytes
+            nodePackedScalars[paramName, valType] = (indices, values)
+        allSyncData.append((nodeNumComps, nodePackedScalars, nodeOthers))
+    return allSyncData
+
+
+def _unpackSyncData(nodeSyncData):
+    """
+    Unpack the data produced by :py:func:`_packSyncData` into per-composite dicts.
+
+    Returns
+    -------
+    dict
+        Composite index keys with ``{paramName: value}`` values for every composite that
+        had something to synchronize. Values have the same type they were packed with.
+    """
+    _numComps, packedScalars, others = nodeSyncData
+    compData = collections.defaultdict(dict)
+    for (paramName, valType), (indices, values) in packedScalars.items():
+        # ``tolist`` converts back to native Python types, numpy scalars are kept as-is
+        values = values.tolist() if valType in _PACKABLE_SCALAR_TYPES else values
+        for ci, val in zip(indices.tolist(), values):
+            compData[ci][paramName] = val
+
+    for ci, paramName, val in others:
+        compData[ci][paramName] = val
+
+    return compData
+
+
+def _logSyncDataSizes(allSyncData):
+    """Report how many values and bytes each parameter contributed to an MPI sync."""
+    counts = collections.Counter()
+    numBytes = collections.Counter()
+    for _numComps, packedScalars, others in allSyncData:
+        for (paramName, _valType), (indices, values) in packedScalars.items():
+            counts[paramName] += len(values)
+            numBytes[paramName] += indices.nbytes + values.nbytes
+        for _ci, paramName, _val in others:
+            counts[paramName] += 1
+
+    runLog.debug(
+        "syncMpiState moved {} bytes of packed scalars over {} parameters".format(
+            sum(numBytes.values()), len(counts)
+        )
+    )
+    if counts:
+        runLog.debug(
+            tabulate.tabulate(
+                [
+                    (paramName, counts[paramName], numBytes.get(paramName, "unpacked"))
+                    for paramName in sorted(counts, key=counts.get, reverse=True)
+                ],
+                headers=["Parameter", "Values", "Packed Bytes"],
+            )
+        )
+
+
 class StateRetainer:
     """
     Retains state during some operations.
@@ -3294,8 +3801,8 @@ class StateRetainer:
     def _enterExitHelper(self, func):
         """Helper method for ``__enter__`` and ``__exit__``. ``func`` is a lambda to either ``backUp()`` or ``restoreBackup()``."""
         paramDefs = set()
-        for child in [self.composite] + self.composite.getChildren(
-            deep=True, includeMaterials=True
+        for child in itertools.chain(
+            [self.composite], self.composite.traverse(includeMaterials=True)
         ):
             if hasattr(child, "p"):
                 # materials don't have Parameters
@@ -3369,6 +3876,105 @@ def getDominantMaterial(
     return None
 
 
+def getNumberDensityMatrix(objects: List[ArmiObject], nucNames) -> numpy.ndarray:
+    """
+    Gather the number densities of many objects into one dense (objects x nuclides) array.
+
+    Each object's number density dict is visited exactly once and only its non-zero
+    entries are scattered into the matrix, rather than looking up every requested
+    nuclide in every object. This makes the cost scale with the number of nuclides
+    actually present rather than with ``len(objects) * len(nucNames)`` dict lookups.
+
+    Parameters
+    ----------
+    objects : list of ArmiObject
+        The objects whose number densities make up the rows of the matrix.
+    nucNames : list of str
+        The nuclides that make up the columns of the matrix. Nuclides that an object
+        does not contain are zero.
+
+    Returns
+    -------
+    numpy.ndarray
+        Number densities in atoms/bn-cm, one row per object and one column per
+        requested nuclide.
+    """
+    nucIndex = {}
+    for nucName in nucNames:
+        nucIndex.setdefault(nucName, len(nucIndex))
+
+    rows, cols, vals = [], [], []
+    for row, obj in enumerate(objects):
+        for nucName, dens in obj.getNumberDensities().items():
+            col = nucIndex.get(nucName)
+            if col is not None:
+                rows.append(row)
+                cols.append(col)
+                vals.append(dens)
+
+    matrix = numpy.zeros((len(objects), len(nucIndex)))
+    matrix[numpy.array(rows, dtype=int), numpy.array(cols, dtype=int)] = vals
+    if len(nucIndex) != len(nucNames):
+        # duplicate nuclide names were requested; expand back to the requested columns
+        matrix = matrix[:, [nucIndex[nucName] for nucName in nucNames]]
+    return matrix
+
+
+def getHomogenizedNumberDensities(objects: List[ArmiObject], nucNames) -> numpy.ndarray:
+    """
+    Compute the volume-weighted number densities of many composites at once.
+
+    This is equivalent to calling :py:meth:`ArmiObject.getNuclideNumberDensities` on
+    each object, but the children of all objects are gathered into a single columnar
+    number density matrix. The homogenization is then a single reduction over the
+    contiguous slice of rows belonging to each object, which is much faster than
+    homogenizing each object on its own when there are many of them (e.g. when
+    collecting block-wise number densities for the whole core).
+
+    Parameters
+    ----------
+    objects : list of ArmiObject
+        The composites to homogenize (e.g. blocks).
+    nucNames : list of str
+        The nuclides to compute number densities for.
+
+    Returns
+    -------
+    numpy.ndarray
+        Number densities in atoms/bn-cm, one row per object and one column per
+        requested nuclide. Objects without any volume are all zeros.
+    """
+    children = []
+    volumes = []
+    starts = numpy.zeros(len(objects), dtype=int)
+    for i, obj in enumerate(objects):
+        starts[i] = len(children)
+        objChildren = list(obj)
+        if objChildren:
+            symmetryFactor = obj.getSymmetryFactor()
+            children.extend(objChildren)
+            volumes.extend(c.getVolume() / symmetryFactor for c in objChildren)
+
+    ndens = numpy.zeros((len(objects), len(nucNames)))
+    if not children:
+        return ndens
+
+    volumes = numpy.array(volumes)
+    weighted = getNumberDensityMatrix(children, nucNames) * volumes[:, numpy.newaxis]
+    counts = numpy.diff(numpy.append(starts, len(children)))
+    hasChildren = counts > 0
+    # empty objects own a zero-length slice, so they are left out of the reduction
+    # entirely; reduceat would otherwise hand them a copy of the next row.
+    totalVols = numpy.zeros(len(objects))
+    totalVols[hasChildren] = numpy.add.reduceat(volumes, starts[hasChildren])
+    ndens[hasChildren] = numpy.add.reduceat(weighted, starts[hasChildren], axis=0)
+
+    hasVolume = totalVols != 0.0
+    ndens[hasVolume] /= totalVols[hasVolume, numpy.newaxis]
+    ndens[~hasVolume] = 0.0
+    return ndens
+
+
 def getReactionRateDict(nucName, lib, xsSuffix, mgFlux, nDens):
     """
     Parameters
@@ -13,14 +13,16 @@
 # limitations under the License.
 """Enable component-wise axial expansion for assemblies and/or a reactor."""
 
+from logging import DEBUG
 from statistics import mean
 from typing import List
 
+import numpy
+
 from armi import runLog
 from armi.materials import material
 from armi.reactor.components import UnshapedComponent
 from armi.reactor.flags import Flags
-from numpy import array
 
 TARGET_FLAGS_IN_PREFERRED_ORDER = [
     Flags.FUEL,
@@ -144,6 +146,8 @@ class AxialExpansionChanger:
         self._detailedAxialExpansion = detailedAxialExpansion
         self.linked = None
         self.expansionData = None
+        # component linkage of each assembly design, see AssemblyAxialLinkage
+        self._linkageTemplates = {}
 
     def performPrescribedAxialExpansion(
         self, a, componentLst: list, percents: list, setFuel=True
@@ -208,6 +212,66 @@ class AxialExpansionChanger:
         self.expansionData.computeThermalExpansionFactors()
         self.axiallyExpandAssembly()
 
+    def performCoreThermalAxialExpansion(
+        self, assems, tempGrid, tempFields, setFuel: bool = True
+    ):
+        """Perform thermal expansion for many assemblies given their axial temperature fields.
+
+        This gives the same result as calling :py:meth:`performThermalAxialExpansion` for each
+        assembly, but the block temperatures of all assemblies are found at once from the stacked
+        temperature fields, and the axial linkage of each assembly design is only determined once.
+
+        Parameters
+        ----------
+        assems : list[:py:class:`Assembly <armi.reactor.assemblies.Assembly>`]
+            ARMI assemblies to be changed
+        tempGrid : numpy array
+            Ascending axial temperature grid (in cm) shared by all assemblies
+        tempFields : numpy array
+            Temperature values (in C) along the grid; one row for each assembly
+        setFuel : boolean, optional
+            Boolean to determine whether or not fuel blocks should have their target components set
+            This is useful when target components within a fuel block need to be determined on-the-fly.
+
+        Raises
+        ------
+        ValueError
+            if no temperature points are found within a block
+        RuntimeError
+            if the shape of tempFields does not match the assemblies and tempGrid
+        """
+        assems = list(assems)
+        tempGrid = numpy.asarray(tempGrid, dtype=float)
+        tempFields = numpy.asarray(tempFields, dtype=float)
+        if tempFields.shape != (len(assems), len(tempGrid)):
+            runLog.error(
+                "tempFields must have one row for each assembly, each the length of tempGrid."
+            )
+            raise RuntimeError
+
+        # running sums along each row give the sum over any range of grid points
+        cumulativeTemps = numpy.zeros((len(assems), len(tempGrid) + 1))
+        numpy.cumsum(tempFields, axis=1, out=cumulativeTemps[:, 1:])
+        for a, cumulative in zip(assems, cumulativeTemps):
+            self.setAssembly(a, setFuel)
+            zBottoms = numpy.array([b.p.zbottom for b in a])
+            zTops = numpy.array([b.p.ztop for b in a])
+            # the grid points within [zbottom, ztop] of each block
+            first = numpy.searchsorted(tempGrid, zBottoms, side="left")
+            last = numpy.searchsorted(tempGrid, zTops, side="right")
+            numPoints = last - first
+            if not numPoints.all():
+                b = a[int(numpy.argmin(numPoints))]
+                raise ValueError(
+                    f"{b} has no temperature points within it!"
+                    "Likely need to increase the refinement of the temperature grid."
+                )
+            blockTemps = (cumulative[last] - cumulative[first]) / numPoints
+            for b, temp in zip(a, blockTemps):
+                self.expansionData.updateBlockTemp(b, temp)
+            self.expansionData.computeThermalExpansionFactors()
+            self.axiallyExpandAssembly()
+
     def reset(self):
         self.linked = None
         self.expansionData = None
@@ -233,7 +297,7 @@ class AxialExpansionChanger:
         the temperature distribution is the primary factor in determining the cumulative loss of mass conservation.
         Additional details will be documented in :ref:`axialExpansion` of the documentation.
         """
-        self.linked = AssemblyAxialLinkage(a)
+        self.linked = AssemblyAxialLinkage(a, self._linkageTemplates)
         self.expansionData = ExpansionData(
             a, setFuel=setFuel, expandFromTinputToThot=expandFromTinputToThot
         )
@@ -281,12 +345,16 @@ class AxialExpansionChanger:
         """Utilizes assembly linkage to do axial expansion."""
         mesh = [0.0]
         numOfBlocks = self.linked.a.countBlocksWithFlags()
-        runLog.debug(
-            "Printing component expansion information (growth percentage and 'target component')"
-            f"for each block in assembly {self.linked.a}."
-        )
+        # only format the messages when they will be printed
+        debug = runLog.getVerbosity() <= DEBUG
+        if debug:
+            runLog.debug(
+                "Printing component expansion information (growth percentage and 'target component')"
+                f"for each block in assembly {self.linked.a}."
+            )
         for ib, b in enumerate(self.linked.a):
-            runLog.debug(msg=f"  Block {b}")
+            if debug:
+                runLog.debug(msg=f"  Block {b}")
             blockHeight = b.getHeight()
             # set bottom of block equal to top of block below it
             # if ib == 0, leave block bottom = 0.0
@@ -296,7 +364,10 @@ class AxialExpansionChanger:
             if not isDummyBlock:
                 for c in getSolidComponents(b):
                     growFrac = self.expansionData.getExpansionFactor(c)
-                    runLog.debug(msg=f"      Component {c}, growFrac = {growFrac:.4e}")
+                    if debug:
+                        runLog.debug(
+                            msg=f"      Component {c}, growFrac = {growFrac:.4e}"
+                        )
                     c.height = growFrac * blockHeight
                     # align linked components
                     if ib == 0:
@@ -313,8 +384,8 @@ class AxialExpansionChanger:
                     c.ztop = c.zbottom + c.height
                     # update component number densities
                     newNumberDensities = {
-                        nuc: c.getNumberDensity(nuc) / growFrac
-                        for nuc in c.getNuclides()
+                        nuc: dens / growFrac
+                        for nuc, dens in c.p.numberDensities.items()
                     }
                     c.setNumberDensities(newNumberDensities)
                     # redistribute block boundaries if on the target component
@@ -335,7 +406,7 @@ class AxialExpansionChanger:
             b.spatialLocator = self.linked.a.spatialGrid[0, 0, ib]
 
         bounds = list(self.linked.a.spatialGrid._bounds)
-        bounds[2] = array(mesh)
+        bounds[2] = numpy.array(mesh)
         self.linked.a.spatialGrid._bounds = tuple(bounds)
 
     def manageCoreMesh(self, r):
@@ -422,20 +493,69 @@ class AssemblyAxialLinkage:
         values --> list of axially linked components; index 0 = lower linked component; index 1: upper linked component.
 
         see also: self._getLinkedComponents
+
+    Notes
+    -----
+    Finding the component linkage compares the dimensions of every pair of solid components in
+    neighboring blocks. If a ``templates`` dictionary is given, the linkage found for an assembly
+    is stored in it by assembly design, i.e., by assembly type, block linkage and the name,
+    class, multiplicity and cold inner and outer diameters of each solid component. These are
+    all that the linkage depends on, so later assemblies of the same design reuse it rather
+    than comparing every pair of components again.
     """
 
-    def __init__(self, StdAssem):
+    def __init__(self, StdAssem, templates=None):
         self.a = StdAssem
         self.linkedBlocks = {}
         self.linkedComponents = {}
-        self._determineAxialLinkage()
+        self._determineAxialLinkage(templates)
 
-    def _determineAxialLinkage(self):
+    def _determineAxialLinkage(self, templates=None):
         """Gets the block and component based linkage."""
-        for b in self.a:
+        blocks = self.a.getChildren()
+        for b in blocks:
             self._getLinkedBlocks(b)
-            for c in getSolidComponents(b):
-                self._getLinkedComponents(b, c)
+        if templates is None:
+            for b in blocks:
+                for c in getSolidComponents(b):
+                    self._getLinkedComponents(b, c)
+            return
+
+        blockIndex = {b: i for i, b in enumerate(blocks)}
+        solids = [getSolidComponents(b) for b in blocks]
+        blockLinks = [
+            tuple(blockIndex.get(linked) for linked in self.linkedBlocks[b])
+            for b in blocks
+        ]
+        design = (
+            self.a.getType(),
+            tuple(blockLinks),
+            tuple(tuple(_getLinkageKey(c) for c in comps) for comps in solids),
+        )
+        template = templates.get(design)
+        if template is None:
+            # find the linkage of the components, and record it as indices
+            template = []
+            for b, comps, links in zip(blocks, solids, blockLinks):
+                for c in comps:
+                    self._getLinkedComponents(b, c)
+                template.append(
+                    [
+                        tuple(
+                            None if linkedC is None else solids[linkedB].index(linkedC)
+                            for linkedB, linkedC in zip(links, self.linkedComponents[c])
+                        )
+                        for c in comps
+                    ]
+                )
+            templates[design] = template
+        else:
+            for comps, links, componentLinks in zip(solids, blockLinks, template):
+                for c, indices in zip(comps, componentLinks):
+                    self.linkedComponents[c] = [
+                        None if i is None else solids[linkedB][i]
+                        for linkedB, i in zip(links, indices)
+                    ]
 
     def _getLinkedBlocks(self, b):
         """Retrieve the axial linkage for block b.
@@ -538,6 +658,18 @@ class AssemblyAxialLinkage:
             )
 
 
+def _getLinkageKey(c):
+    """Return what :py:func:`_determineLinked` compares of a component, with its name."""
+    if isinstance(c, UnshapedComponent):
+        diameters = None
+    else:
+        diameters = (
+            c.getCircleInnerDiameter(cold=True),
+            c.getBoundingCircleOuterDiameter(cold=True),
+        )
+    return (c.name, type(c), c.getDimension("mult"), diameters)
+
+
 def _determineLinked(componentA, componentB):
     """Determine axial component linkage for two components.
 
@@ -702,8 +834,7 @@ class ExpansionData:
                 )
 
             blockAveTemp = mean(tmpMapping)
-            for c in b:
-                self.updateComponentTemp(c, blockAveTemp)
+            self.updateBlockTemp(b, blockAveTemp)
 
     def updateComponentTemp(self, c, temp: float):
         """Update component temperatures with a provided temperature.
@@ -724,6 +855,27 @@ class ExpansionData:
         self.componentReferenceTemperature[c] = c.temperatureInC
         c.setTemperature(temp)
 
+    def updateBlockTemp(self, b, temp: float):
+        """Update the temperatures of all components in a block with a provided temperature.
+
+        This is equivalent to calling :py:meth:`updateComponentTemp` for each component, but the
+        cached dimensions of the block are only cleared once, after all of them are updated.
+
+        Parameters
+        ----------
+        b : :py:class:`Block <armi.reactor.blocks.Block>`
+            block to which the temperature, temp, is to be applied
+        temp : float
+            new component temperature in C
+        """
+        for c in b:
+            self.componentReferenceTemperature[c] = c.temperatureInC
+            c.setTemperature(temp, clearCache=False)
+        # every component of the block changed, so this covers their linked dimensions
+        for c in b:
+            c.clearCache()
+        b.cached = {}
+
     def computeThermalExpansionFactors(self):
         """Computes expansion factors for all components via thermal expansion."""
         for b in self._a:
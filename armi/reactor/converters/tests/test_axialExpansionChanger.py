@@ -26,6 +26,7 @@ from armi.reactor.components import DerivedShape, UnshapedComponent
 from armi.reactor.components.basicShapes import Circle, Hexagon, Rectangle
 from armi.reactor.components.complexShapes import Helix
 from armi.reactor.converters.axialExpansionChanger import (
+    AssemblyAxialLinkage,
     AxialExpansionChanger,
     ExpansionData,
     _determineLinked,
@@ -490,6 +491,60 @@ class TestConservation(AxialExpansionTestBase, unittest.TestCase):
             msg="ACLP ztop has changed. It should not with fuel component only expansion!",
         )
 
+    def test_coreThermalAxialExpansion(self):
+        """Expanding many assemblies at once matches expanding them one at a time."""
+        assems = [buildTestAssemblyWithFakeMaterial(name="FakeMat") for _ in range(3)]
+        refAssems = [
+            buildTestAssemblyWithFakeMaterial(name="FakeMat") for _ in range(3)
+        ]
+        temp = Temperature(self.a.getTotalHeight(), numTempGridPts=11, tempSteps=10)
+        refChanger = AxialExpansionChanger()
+        for idt in range(temp.tempSteps):
+            # a different temperature field for each assembly
+            tempFields = array(
+                [temp.tempField[idt, :] + 10.0 * i for i in range(len(assems))]
+            )
+            self.obj.performCoreThermalAxialExpansion(assems, temp.tempGrid, tempFields)
+            for a, tempField in zip(refAssems, tempFields):
+                refChanger.performThermalAxialExpansion(a, temp.tempGrid, tempField)
+
+        for a, refA in zip(assems, refAssems):
+            for b, refB in zip(a, refA):
+                self.assertAlmostEqual(b.p.ztop, refB.p.ztop, places=10)
+                for c, refC in zip(b, refB):
+                    self.assertAlmostEqual(c.temperatureInC, refC.temperatureInC)
+                    for nuc, refDens in refC.getNumberDensities().items():
+                        self.assertAlmostEqual(
+                            c.getNumberDensity(nuc) / refDens, 1.0, places=12
+                        )
+
+        # the component linkage of the design was only determined once
+        self.assertEqual(len(self.obj._linkageTemplates), 1)
+        for c in getSolidComponents(assems[-1][1]):
+            self.assertIs(self.obj.linked.linkedComponents[c][0].parent, assems[-1][0])
+
+    def test_linkageTemplatesCheckDimensions(self):
+        """Assemblies of the same type, but with different pin dimensions, link differently."""
+        a = buildTestAssemblyWithFakeMaterial(name="FakeMat")
+        other = buildTestAssemblyWithFakeMaterial(name="FakeMat")
+        # the clad of the upper fuel block no longer overlaps with the clad below it
+        clad = other[2].getComponent(Flags.CLAD)
+        clad.setDimension("id", 0.81)
+        clad.setDimension("od", 0.90)
+
+        self.obj.setAssembly(a)
+        self.assertIs(
+            self.obj.linked.linkedComponents[a[2].getComponent(Flags.CLAD)][0],
+            a[1].getComponent(Flags.CLAD),
+        )
+        self.obj.setAssembly(other)
+        self.assertEqual(len(self.obj._linkageTemplates), 2)
+        self.assertIsNone(self.obj.linked.linkedComponents[clad][0])
+        self.assertEqual(
+            self.obj.linked.linkedComponents,
+            AssemblyAxialLinkage(other).linkedComponents,
+        )
+
     def test_reset(self):
         self.obj.setAssembly(self.a)
         self.obj.reset()
@@ -598,6 +653,17 @@ class TestExceptions(AxialExpansionTestBase, unittest.TestCase):
             the_exception = cm.exception
             self.assertEqual(the_exception.error_code, 3)
 
+    def test_coreThermalAxialExpansionErrors(self):
+        tempGrid = [5.0, 15.0, 35.0]
+        with self.assertRaises(RuntimeError):
+            self.obj.performCoreThermalAxialExpansion(
+                [self.a], tempGrid, [linspace(25.0, 310.0, 4)]
+            )
+        with self.assertRaises(ValueError):
+            self.obj.performCoreThermalAxialExpansion(
+                [self.a], tempGrid, [linspace(25.0, 310.0, 3)]
+            )
+
     def test_updateComponentTempsBy1DTempFieldValueError(self):
         tempGrid = [5.0, 15.0, 35.0]
         tempField = linspace(25.0, 310.0, 3)
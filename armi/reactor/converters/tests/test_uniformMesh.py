@@ -19,7 +19,10 @@ import unittest
 
 from armi.nuclearDataIO.cccc import isotxs
 from armi.physics.neutronics.settings import CONF_XS_KERNEL
-from armi.settings.fwSettings.globalSettings import CONF_UNIFORM_MESH_MINIMUM_SIZE
+from armi.settings.fwSettings.globalSettings import (
+    CONF_UNIFORM_MESH_MINIMUM_SIZE,
+    CONF_UNIFORM_MESH_PERSISTENT,
+)
 from armi.reactor.converters import uniformMesh
 from armi.reactor.flags import Flags
 from armi.reactor.tests import test_assemblies
@@ -498,6 +501,107 @@ class TestUniformMesh(unittest.TestCase):
                 self.assertTrue(b.p.rateCap)
 
 
+class TestPersistentUniformMesh(unittest.TestCase):
+    """Tests a uniform mesh converter that keeps its reactor between conversions."""
+
+    @classmethod
+    def setUpClass(cls):
+        random.seed(987324987234)
+
+    def setUp(self):
+        self.o, self.r = loadTestReactor(
+            TEST_ROOT,
+            customSettings={
+                CONF_XS_KERNEL: "MC2v2",
+                CONF_UNIFORM_MESH_PERSISTENT: True,
+            },
+        )
+        reduceTestReactorRings(self.r, self.o.cs, 3)
+        applyNonUniformHeightDistribution(self.r)
+        self.r.core.lib = isotxs.readBinary(ISOAA_PATH)
+        self.r.core.p.keff = 1.0
+
+        self.converter = uniformMesh.NeutronicsUniformMeshConverter(
+            cs=self.o.cs, calcReactionRates=False
+        )
+        self.assertTrue(self.converter.persistent)
+        self.converter.convert(self.r)
+        self.convAssems = {a.getName(): a for a in self.converter.convReactor.core}
+
+    def _solve(self, flux):
+        """Set results on the uniform mesh reactor and map them back."""
+        for b in self.converter.convReactor.core.getBlocks():
+            b.p.flux = flux
+        self.converter.applyStateToOriginal()
+        self.converter.reset()
+
+    def test_updateKeepsAssemblies(self):
+        self._solve(5.0)
+        a = self.r.core.getFirstAssembly(Flags.FUEL)
+        for b in a:
+            b.setNumberDensity("U235", 2.0 * b.getNumberDensity("U235"))
+        self.converter.convert(self.r)
+
+        convCore = self.converter.convReactor.core
+        for convAssem in convCore:
+            self.assertIs(convAssem, self.convAssems[convAssem.getName()])
+        self.assertEqual(self.converter._newAssembliesAdded, [])
+        # results from the last solve are not kept
+        for b in convCore.getBlocks():
+            self.assertEqual(b.p.flux, 0.0)
+
+        newConverter = uniformMesh.NeutronicsUniformMeshConverter(
+            cs=self.o.cs, calcReactionRates=False
+        )
+        newConverter.convert(self.r)
+        for convAssem, newAssem in zip(convCore, newConverter.convReactor.core):
+            self.assertEqual(convAssem.getName(), newAssem.getName())
+            for b, newB in zip(convAssem, newAssem):
+                self.assertEqual(b.getNumberDensities(), newB.getNumberDensities())
+
+    def test_updateAfterShuffle(self):
+        self._solve(5.0)
+        a1, a2 = self.r.core.getAssemblies(Flags.FUEL)[:2]
+        loc1 = a1.spatialLocator
+        a1.moveTo(a2.spatialLocator)
+        a2.moveTo(loc1)
+        a2.getFirstBlock(Flags.FUEL).p.buGroup = "B"
+        self.converter.convert(self.r)
+
+        convCore = self.converter.convReactor.core
+        convA1 = convCore.getAssemblyByName(a1.getName())
+        convA2 = convCore.getAssemblyByName(a2.getName())
+        # moved, but not rebuilt
+        self.assertIs(convA1, self.convAssems[a1.getName()])
+        self.assertEqual(convA1.getLocation(), a1.getLocation())
+        # rebuilt, since the burnup group of one of its blocks changed
+        self.assertIsNot(convA2, self.convAssems[a2.getName()])
+        self.assertEqual(convA2.getLocation(), a2.getLocation())
+        self.assertIn("B", [b.p.buGroup for b in convA2])
+        self.assertEqual(self.converter._newAssembliesAdded, [convA2])
+        self.assertIs(convCore.childrenByLocator[convA1.spatialLocator], convA1)
+        self.assertIs(convCore.childrenByLocator[convA2.spatialLocator], convA2)
+
+    def test_updateAfterMeshChange(self):
+        self._solve(5.0)
+        applyNonUniformHeightDistribution(self.r)
+        a = self.r.core.getAssemblies()[-1]
+        self.r.core.removeAssembly(a, discharge=False)
+        self.converter.convert(self.r)
+
+        convCore = self.converter.convReactor.core
+        self.assertNotIn(a.getName(), [convAssem.getName() for convAssem in convCore])
+        self.assertEqual(len(convCore), len(self.r.core))
+        for convAssem in convCore:
+            self.assertIsNot(convAssem, self.convAssems[convAssem.getName()])
+            self.assertAlmostEqual(
+                convAssem.getTotalHeight(), self.r.core.refAssem.getTotalHeight()
+            )
+        self.assertAlmostEqual(
+            convCore.getMass("U235"), self.r.core.getMass("U235"), delta=1e-6
+        )
+
+
 class TestGammaUniformMesh(unittest.TestCase):
     """
     Tests gamma uniform mesh converter.
@@ -687,6 +791,50 @@ class TestParamConversion(unittest.TestCase):
                 self._cachedBlockParamData[b]["mgNeutronVelocity"],
             )
 
+    def test_getAxialOverlaps(self):
+        overlaps = uniformMesh.getAxialOverlaps(self.sourceAssem, self.destinationAssem)
+        for i, b in enumerate(self.destinationAssem):
+            expected = self.sourceAssem.getBlocksBetweenElevations(
+                b.p.zbottom, b.p.ztop
+            )
+            sourceBlocks = [self.sourceAssem[j] for j in overlaps.getOverlapping(i)]
+            self.assertEqual(sourceBlocks, [sb for sb, _h in expected])
+            self.assertEqual(
+                overlaps.heights[i].data.tolist(), [h for _sb, h in expected]
+            )
+        # the first destination block is made of both source blocks
+        self.assertEqual(overlaps.destinationWeights[0].data.tolist(), [0.3, 0.7])
+        self.assertEqual(overlaps.sourceWeights[0].data.tolist(), [1.0, 1.0])
+
+        # cached while the meshes are unchanged
+        self.assertIs(
+            uniformMesh.getAxialOverlaps(self.sourceAssem, self.destinationAssem),
+            overlaps,
+        )
+        self.sourceAssem[0].setHeight(self.height1 + 1.0)
+        self.sourceAssem.calculateZCoords()
+        self.assertIsNot(
+            uniformMesh.getAxialOverlaps(self.sourceAssem, self.destinationAssem),
+            overlaps,
+        )
+
+    def test_setStateFromOverlapsArrayAndPeakParams(self):
+        self.sourceAssem[0].p.mgFlux = [1.0, 2.0]
+        self.sourceAssem[1].p.mgFlux = [3.0, 4.0]
+        self.sourceAssem[0].p.fluxPeak = 7.0
+        self.sourceAssem[1].p.fluxPeak = 6.0
+        b = self.sourceAssem[0]
+        uniformMesh.UniformMeshGeometryConverter.setAssemblyStateFromOverlaps(
+            self.sourceAssem,
+            self.destinationAssem,
+            paramMapper=uniformMesh.ParamMapper([], ["mgFlux", "fluxPeak"], b),
+        )
+
+        # mgFlux is volume integrated, so the source values are added up
+        destBlock = self.destinationAssem[0]
+        self.assertEqual(destBlock.p.mgFlux.tolist(), [4.0, 6.0])
+        self.assertEqual(destBlock.p.fluxPeak, 7.0)
+
 
 class TestUniformMeshNonUniformAssemFlags(unittest.TestCase):
     """
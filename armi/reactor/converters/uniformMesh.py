@@ -56,22 +56,29 @@ import re
 import glob
 import copy
 import collections
+import functools
+import itertools
 from timeit import default_timer as timer
 
 import numpy
+from scipy import sparse
 
 import armi
 from armi import runLog
 from armi.utils.mathematics import average1DWithinTolerance
 from armi.utils import iterables
 from armi.utils import plotting
+from armi.reactor import composites
 from armi.reactor import grids
 from armi.reactor.reactors import Core
 from armi.reactor.flags import Flags
 from armi.reactor.converters.geometryConverters import GeometryConverter
 from armi.reactor import parameters
 from armi.reactor.reactors import Reactor
-from armi.settings.fwSettings.globalSettings import CONF_UNIFORM_MESH_MINIMUM_SIZE
+from armi.settings.fwSettings.globalSettings import (
+    CONF_UNIFORM_MESH_MINIMUM_SIZE,
+    CONF_UNIFORM_MESH_PERSISTENT,
+)
 
 HEAVY_METAL_PARAMS = ["molesHmBOL", "massHmBOL"]
 
@@ -408,12 +415,21 @@ class UniformMeshGeometryConverter(GeometryConverter):
         self._nonUniformAssemStorage = set()
         self._minimumMeshSize = None
 
+        # If persistent, ``convReactor`` is kept between calls to ``convert``, and is
+        # only updated. These hold the structure and state of each source assembly
+        # when its uniform mesh copy was last built or updated.
+        self.persistent = False
+        self._persistentSourceReactor = None
+        self._assemStructures = {}
+        self._assemStates = {}
+
         if cs is not None:
             self._nonUniformMeshFlags = [
                 Flags.fromStringIgnoreErrors(f) for f in cs["nonUniformAssemFlags"]
             ]
             self._hasNonUniformAssems = any(self._nonUniformMeshFlags)
             self._minimumMeshSize = cs[CONF_UNIFORM_MESH_MINIMUM_SIZE]
+            self.persistent = cs[CONF_UNIFORM_MESH_PERSISTENT]
 
     def convert(self, r=None):
         """
@@ -468,6 +484,12 @@ class UniformMeshGeometryConverter(GeometryConverter):
                 assem.setName(assem.getName() + self._TEMP_STORAGE_NAME_SUFFIX)
                 self._nonUniformAssemStorage.add(assem)
                 self.convReactor.core.add(homogAssem)
+        elif self.persistent and self._canUpdateUniformReactor():
+            runLog.extra(f"Updating the copy of {r} with a uniform axial mesh.")
+            self._updateUniformReactor()
+            self._mapStateFromReactorToOther(
+                self._sourceReactor, self.convReactor, mapBlockParams=False
+            )
         else:
             runLog.extra(f"Building copy of {r} with a uniform axial mesh.")
             self.convReactor = self.initNewReactor(r, self._cs)
@@ -786,21 +808,23 @@ class UniformMeshGeometryConverter(GeometryConverter):
             assembly. Note that this will skip the reaction rate calculations for a block if it does
             not contain a valid multi-group flux.
 
+        The overlap heights between the blocks of the two assemblies are computed once
+        (see :py:func:`getAxialOverlaps`), and each parameter and the number
+        densities are then mapped for all of the destination blocks at once.
+
         See Also
         --------
         setNumberDensitiesFromOverlaps : does this but does smarter caching for number densities.
         """
-        for destBlock in destinationAssembly:
-            zLower = destBlock.p.zbottom
-            zUpper = destBlock.p.ztop
-            destinationBlockHeight = destBlock.getHeight()
-            # Determine which blocks in the uniform mesh source assembly are
-            # within the lower and upper bounds of the destination block.
-            sourceBlocksInfo = sourceAssembly.getBlocksBetweenElevations(zLower, zUpper)
-
-            if abs(zUpper - zLower) < 1e-6 and not sourceBlocksInfo:
-                continue
-            elif not sourceBlocksInfo:
+        sourceBlocks = list(sourceAssembly)
+        destBlocks = list(destinationAssembly)
+        overlaps = getAxialOverlaps(sourceAssembly, destinationAssembly)
+        for i, destBlock in enumerate(destBlocks):
+            if not len(overlaps.getOverlapping(i)):
+                zLower = destBlock.p.zbottom
+                zUpper = destBlock.p.ztop
+                if abs(zUpper - zLower) < 1e-6:
+                    continue
                 raise ValueError(
                     "An error occurred when attempting to map to the "
                     f"results from {sourceAssembly} to {destinationAssembly}. "
@@ -810,43 +834,11 @@ class UniformMeshGeometryConverter(GeometryConverter):
                     "be reported to the developers."
                 )
 
-            if mapNumberDensities:
-                setNumberDensitiesFromOverlaps(destBlock, sourceBlocksInfo)
-
-            # Iterate over each of the blocks that were found in the uniform mesh
-            # source assembly within the lower and upper bounds of the destination
-            # block and perform the parameter mapping.
-            if paramMapper is not None:
-                updatedDestVals = collections.defaultdict(float)
-                for sourceBlock, sourceBlockOverlapHeight in sourceBlocksInfo:
-                    sourceBlockVals = paramMapper.paramGetter(
-                        sourceBlock,
-                        paramMapper.blockParamNames,
-                    )
-                    sourceBlockHeight = sourceBlock.getHeight()
+        if mapNumberDensities:
+            _setNumberDensitiesFromOverlaps(destBlocks, sourceBlocks, overlaps)
 
-                    for paramName, sourceBlockVal in zip(
-                        paramMapper.blockParamNames, sourceBlockVals
-                    ):
-                        if sourceBlockVal is None:
-                            continue
-                        if paramMapper.isPeak[paramName]:
-                            updatedDestVals[paramName] = max(
-                                sourceBlockVal, updatedDestVals[paramName]
-                            )
-                        else:
-                            if paramMapper.isVolIntegrated[paramName]:
-                                denominator = sourceBlockHeight
-                            else:
-                                denominator = destinationBlockHeight
-                            integrationFactor = sourceBlockOverlapHeight / denominator
-                            updatedDestVals[paramName] += (
-                                sourceBlockVal * integrationFactor
-                            )
-
-                paramMapper.paramSetter(
-                    destBlock, updatedDestVals.values(), updatedDestVals.keys()
-                )
+        if paramMapper is not None:
+            _setBlockParamsFromOverlaps(destBlocks, sourceBlocks, overlaps, paramMapper)
 
         # If requested, the reaction rates will be calculated based on the
         # mapped neutron flux and the XS library.
@@ -995,16 +987,193 @@ class UniformMeshGeometryConverter(GeometryConverter):
             f"Creating new assemblies from {self._sourceReactor.core} "
             f"with a uniform mesh of {self._uniformMesh}"
         )
+        self._assemStructures = {}
+        self._assemStates = {}
+        self._persistentSourceReactor = self._sourceReactor if self.persistent else None
         for sourceAssem in self._sourceReactor.core:
-            newAssem = self.makeAssemWithUniformMesh(
-                sourceAssem,
-                self._uniformMesh,
-                paramMapper=self.paramMapper,
-                includePinCoordinates=self.includePinCoordinates,
+            self._buildUniformAssembly(sourceAssem)
+
+    def _buildUniformAssembly(self, sourceAssem):
+        """Build the uniform mesh copy of a source assembly, and add it to the core."""
+        newAssem = self.makeAssemWithUniformMesh(
+            sourceAssem,
+            self._uniformMesh,
+            paramMapper=self.paramMapper,
+            includePinCoordinates=self.includePinCoordinates,
+        )
+        src = sourceAssem.spatialLocator
+        newLoc = self.convReactor.core.spatialGrid[src.i, src.j, 0]
+        self.convReactor.core.add(newAssem, newLoc)
+        if self.persistent:
+            name = sourceAssem.getName()
+            self._assemStructures[name] = self._getAssemStructure(sourceAssem)
+            self._assemStates[name] = self._getAssemState(sourceAssem)
+        return newAssem
+
+    def _canUpdateUniformReactor(self):
+        """Whether the uniform mesh reactor from the last call can be updated in place."""
+        return (
+            self.convReactor is not None
+            and self._persistentSourceReactor is self._sourceReactor
+            and self.convReactor.core.isFullCore == self._sourceReactor.core.isFullCore
+            and set(self._assemStructures).issuperset(
+                a.getName() for a in self.convReactor.core
             )
+        )
+
+    def _updateUniformReactor(self):
+        """
+        Update the uniform mesh reactor from the last call to match the source reactor.
+
+        Notes
+        -----
+        Assemblies whose structure (see ``_getAssemStructure``) has not changed are
+        kept, and moved to the location of their source assembly if it was shuffled.
+        Their number densities and block parameters are only mapped again if those of
+        the source assembly changed. The other assemblies are rebuilt, and the ones
+        that have left the source core are removed. If the common axial mesh changed,
+        every assembly is rebuilt.
+
+        The block parameters that are only mapped out of the uniform mesh reactor are
+        reset to their defaults first, as they would be on a new reactor, so that no
+        result from a previous solve can be mapped out again.
+        """
+        sourceCore = self._sourceReactor.core
+        convCore = self.convReactor.core
+
+        previousMesh = self._uniformMesh
+        self._generateUniformMesh(minimumMeshSize=self._minimumMeshSize)
+        meshChanged = not numpy.array_equal(previousMesh, self._uniformMesh)
+
+        self.convReactor.p.cycle = self._sourceReactor.p.cycle
+        self.convReactor.p.timeNode = self._sourceReactor.p.timeNode
+        self.convReactor.p.maxAssemNum = self._sourceReactor.p.maxAssemNum
+        convCore.p.coupledIteration = sourceCore.p.coupledIteration
+        convCore.lib = sourceCore.lib
+
+        # remove the assemblies that have to be rebuilt or are gone, and take the ones
+        # that moved out of their old location
+        sourceAssems = {a.getName(): a for a in sourceCore}
+        kept, moved, rebuilt = [], [], []
+        for convAssem in convCore.getAssemblies():
+            name = convAssem.getName()
+            sourceAssem = sourceAssems.get(name)
+            if (
+                sourceAssem is None
+                or meshChanged
+                or self._assemStructures[name] != self._getAssemStructure(sourceAssem)
+            ):
+                convCore.removeAssembly(convAssem, discharge=False)
+                self._assemStructures.pop(name)
+                self._assemStates.pop(name)
+                continue
+
+            kept.append((sourceAssem, convAssem))
+            convLoc, src = convAssem.spatialLocator, sourceAssem.spatialLocator
+            if (convLoc.i, convLoc.j) != (src.i, src.j):
+                convCore.childrenByLocator.pop(convAssem.spatialLocator)
+                moved.append((sourceAssem, convAssem))
+
+        for sourceAssem, convAssem in moved:
             src = sourceAssem.spatialLocator
-            newLoc = self.convReactor.core.spatialGrid[src.i, src.j, 0]
-            self.convReactor.core.add(newAssem, newLoc)
+            newLoc = convCore.spatialGrid[src.i, src.j, 0]
+            convAssem.moveTo(newLoc)
+
+        # parameters that are also mapped in are kept, as they are only mapped in again
+        # if the source changed
+        inParamNames = set(self.paramMapper.blockParamNames)
+        self._setParamsToUpdate("out")
+        UniformMeshGeometryConverter.clearStateOnAssemblies(
+            [convAssem for _sourceAssem, convAssem in kept],
+            blockParamNames=[
+                name
+                for name in self.paramMapper.blockParamNames
+                if name not in inParamNames
+            ],
+            cache=False,
+        )
+        self._setParamsToUpdate("in")
+
+        numUpdated = 0
+        for sourceAssem, convAssem in kept:
+            name = sourceAssem.getName()
+            state = self._getAssemState(sourceAssem)
+            if state != self._assemStates[name]:
+                self.setAssemblyStateFromOverlaps(
+                    sourceAssem, convAssem, self.paramMapper, mapNumberDensities=True
+                )
+                self._assemStates[name] = state
+                numUpdated += 1
+
+        for sourceAssem in sourceCore:
+            if sourceAssem.getName() not in self._assemStructures:
+                rebuilt.append(self._buildUniformAssembly(sourceAssem))
+
+        # keep the assemblies in the same order as on a new uniform mesh reactor
+        order = {name: i for i, name in enumerate(sourceAssems)}
+        convCore._children = sorted(
+            convCore._children, key=lambda a: order[a.getName()]
+        )
+        composites._structureChanged(convCore)
+        self._newAssembliesAdded = rebuilt
+
+        runLog.extra(
+            f"Kept {len(kept)} assemblies of {self.convReactor} ({len(moved)} moved, "
+            f"{numUpdated} with updated state) and built {len(rebuilt)} new ones."
+        )
+
+    @staticmethod
+    def _getAssemStructure(sourceAssem):
+        """
+        Return what the uniform mesh copy of an assembly is built from.
+
+        The copy of an assembly only has to be rebuilt when this changes.
+
+        Notes
+        -----
+        The homogenized copies of the blocks share the macroscopic cross sections and
+        lumped fission products of the source blocks (see
+        :py:meth:`~armi.reactor.blocks.HexBlock.createHomogenizedCopy`), so they are
+        compared by identity. The copies hold on to them, so the ids are not reused.
+        """
+        return (
+            sourceAssem.getType(),
+            tuple(
+                (
+                    b.getName(),
+                    b.getType(),
+                    b.p.flags,
+                    b.p.xsType,
+                    b.p.zbottom,
+                    b.p.ztop,
+                    b.getHeight(),
+                    # the pitch of the homogenized copy
+                    b._pitchDefiningComponent[1],
+                    b.p.buGroup,
+                    b.p.nPins,
+                    id(b.macros),
+                    id(b._lumpedFissionProducts),
+                )
+                for b in sourceAssem
+            ),
+        )
+
+    def _getAssemState(self, sourceAssem):
+        """Return the number densities and block parameters mapped into an assembly."""
+        paramNames = self.paramMapper.blockParamNames
+        state = []
+        for b in sourceAssem:
+            paramVals = self.paramMapper.paramGetter(b, paramNames)
+            state.append(
+                (
+                    b.getNumberDensities(),
+                    [
+                        val.tolist() if isinstance(val, numpy.ndarray) else val
+                        for val in paramVals
+                    ],
+                )
+            )
+        return state
 
     def _clearStateOnReactor(self, reactor, cache):
         """
@@ -1068,9 +1237,12 @@ class UniformMeshGeometryConverter(GeometryConverter):
         -----
         If a block in the assembly does not contain any multi-group flux
         than the reaction rate calculation for this block will be skipped.
+        ``assem`` may also be any other collection of blocks, so that the rates of
+        many assemblies can be calculated at once.
         """
         from armi.physics.neutronics.globalFlux import globalFluxInterface
 
+        blocks = []
         for b in assem:
             # Checks if the block has a multi-group flux defined and if it
             # does not then this will skip the reaction rate calculation. This
@@ -1080,7 +1252,8 @@ class UniformMeshGeometryConverter(GeometryConverter):
                 b.getMgFlux()
             except TypeError:
                 continue
-            globalFluxInterface.calcReactionRates(b, keff, lib)
+            blocks.append(b)
+        globalFluxInterface.calcReactionRatesBlockList(blocks, keff, lib)
 
     def updateReactionRates(self):
         """
@@ -1094,15 +1267,14 @@ class UniformMeshGeometryConverter(GeometryConverter):
         calculate updated reaction rates derived from that flux.
         """
         if self._hasNonUniformAssems:
-            for assem in self.convReactor.core.getAssemblies(self._nonUniformMeshFlags):
-                self._calculateReactionRates(
-                    self.convReactor.core.lib, self.convReactor.core.p.keff, assem
-                )
+            assems = self.convReactor.core.getAssemblies(self._nonUniformMeshFlags)
         else:
-            for assem in self.convReactor.core.getAssemblies():
-                self._calculateReactionRates(
-                    self.convReactor.core.lib, self.convReactor.core.p.keff, assem
-                )
+            assems = self.convReactor.core.getAssemblies()
+        self._calculateReactionRates(
+            self.convReactor.core.lib,
+            self.convReactor.core.p.keff,
+            [b for a in assems for b in a],
+        )
 
 
 class NeutronicsUniformMeshConverter(UniformMeshGeometryConverter):
@@ -1402,3 +1574,284 @@ def setNumberDensitiesFromOverlaps(block, overlappingBlockInfo):
     # volume of each component is recomputed.
     for c in block:
         c.p.volume = None
+
+
+class AxialOverlaps:
+    """
+    The heights over which the blocks of two assemblies overlap.
+
+    The overlaps follow the same rules as
+    :py:meth:`~armi.reactor.assemblies.Assembly.getBlocksBetweenElevations`, which they
+    give for every block of the destination assembly at once. Rows are destination
+    blocks, and columns are source blocks.
+
+    Attributes
+    ----------
+    heights : scipy.sparse.csr_matrix
+        The height in cm of each overlap.
+    sourceWeights : scipy.sparse.csr_matrix
+        The overlap heights as fractions of the source block heights, used for
+        volume-integrated quantities.
+    destinationWeights : scipy.sparse.csr_matrix
+        The overlap heights as fractions of the destination block heights, used for
+        densities.
+    pattern : scipy.sparse.csr_matrix
+        1.0 for each overlap.
+    """
+
+    def __init__(self, sourceMesh, destinationMesh):
+        """
+        Parameters
+        ----------
+        sourceMesh, destinationMesh : tuple
+            ``(zbottom, ztop, height)`` of each block of the assemblies.
+        """
+        EPS = 1e-10
+        numDest, numSource = len(destinationMesh), len(sourceMesh)
+        shape = (numDest, numSource)
+        if not numDest or not numSource:
+            self.heights = sparse.csr_matrix(shape)
+            self.sourceWeights = self.destinationWeights = self.pattern = self.heights
+            return
+
+        bottoms, tops, sourceHeights = (numpy.array(v) for v in zip(*sourceMesh))
+        zLower, zUpper, destHeights = (
+            numpy.array(v)[:, numpy.newaxis] for v in zip(*destinationMesh)
+        )
+
+        # at least some of the source block overlaps the destination block
+        candidates = (tops >= zLower) & (bottoms <= zUpper)
+        heightHere = numpy.minimum(tops, zUpper) - numpy.maximum(bottoms, zLower)
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            # Filter out blocks that have an extremely small height fraction
+            overlapping = candidates & (heightHere / sourceHeights > EPS)
+        self._checkHeights(
+            candidates, overlapping, heightHere, bottoms, tops, zLower, zUpper
+        )
+
+        rows, columns = numpy.nonzero(overlapping)
+        indptr = numpy.concatenate(([0], numpy.cumsum(overlapping.sum(axis=1))))
+        data = heightHere[rows, columns]
+        # the weights are divided element by element, so that they are exactly the
+        # ones the overlaps give one at a time
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            matrices = [
+                data,
+                data / sourceHeights[columns],
+                data / destHeights[rows, 0],
+                numpy.ones_like(data),
+            ]
+        for i, values in enumerate(matrices):
+            # these are shared by everything with the same meshes
+            values.flags.writeable = False
+            matrices[i] = sparse.csr_matrix((values, columns, indptr), shape=shape)
+        (
+            self.heights,
+            self.sourceWeights,
+            self.destinationWeights,
+            self.pattern,
+        ) = matrices
+
+    @staticmethod
+    def _checkHeights(
+        candidates, overlapping, heightHere, bottoms, tops, zLower, zUpper
+    ):
+        """
+        Verify that the overlaps add up to the expected height.
+
+        The expected height snaps to the extent of the mesh points of the blocks that
+        touch the destination block.
+        """
+        lowestPoint = numpy.where(
+            candidates, numpy.minimum(bottoms, tops), numpy.inf
+        ).min(axis=1)
+        highestPoint = numpy.where(
+            candidates, numpy.maximum(bottoms, tops), -numpy.inf
+        ).max(axis=1)
+        expectedHeight = numpy.minimum(
+            highestPoint - lowestPoint, (zUpper - zLower)[:, 0]
+        )
+        totalHeight = numpy.where(overlapping, heightHere, 0.0).sum(axis=1)
+        bad = candidates.any(axis=1) & (numpy.abs(totalHeight - expectedHeight) > 1e-5)
+        if bad.any():
+            i = numpy.flatnonzero(bad)[0]
+            raise ValueError(
+                f"The cumulative height of the blocks between {zLower[i, 0]} cm and "
+                f"{zUpper[i, 0]} cm is {totalHeight[i]} cm and does not equal the "
+                f"expected height of {expectedHeight[i]} cm."
+            )
+
+    def getOverlapping(self, destIndex):
+        """Return the indices of the source blocks that overlap a destination block."""
+        return self.heights.indices[
+            self.heights.indptr[destIndex] : self.heights.indptr[destIndex + 1]
+        ]
+
+
+def getAxialOverlaps(sourceAssembly, destinationAssembly):
+    """
+    Return the :py:class:`AxialOverlaps` of the blocks of two assemblies.
+
+    Notes
+    -----
+    The overlaps only depend on the axial meshes of the two assemblies, so they are
+    cached by mesh. The same object is returned as long as neither mesh changes (e.g.
+    across time nodes, or for assemblies of the same design), so it must not be
+    modified.
+    """
+    return _getCachedAxialOverlaps(
+        _getAxialMesh(sourceAssembly), _getAxialMesh(destinationAssembly)
+    )
+
+
+def _getAxialMesh(assembly):
+    return tuple((b.p.zbottom, b.p.ztop, b.getHeight()) for b in assembly)
+
+
+@functools.lru_cache(maxsize=1024)
+def _getCachedAxialOverlaps(sourceMesh, destinationMesh):
+    return AxialOverlaps(sourceMesh, destinationMesh)
+
+
+def _setNumberDensitiesFromOverlaps(destBlocks, sourceBlocks, overlaps):
+    """
+    Set the number densities of many blocks from the blocks they overlap.
+
+    This gives the same results as calling :py:func:`setNumberDensitiesFromOverlaps` on
+    each destination block, with one sparse matrix product for all of them.
+    """
+    sourceDensities = [b.getNumberDensities() for b in sourceBlocks]
+    # every nuclide in the source blocks, each in its own column
+    columns = {
+        nucName: i
+        for i, nucName in enumerate(
+            dict.fromkeys(itertools.chain.from_iterable(sourceDensities))
+        )
+    }
+    densities = numpy.zeros((len(sourceBlocks), len(columns)))
+    for row, blockDensities in zip(densities, sourceDensities):
+        row[[columns[nucName] for nucName in blockDensities]] = list(
+            blockDensities.values()
+        )
+    totalDensities = overlaps.destinationWeights @ densities
+
+    for i, block in enumerate(destBlocks):
+        overlapping = overlaps.getOverlapping(i)
+        if not len(overlapping):
+            continue
+        # keep the nuclides in the order the overlapping blocks have them
+        nucNames = list(
+            dict.fromkeys(
+                itertools.chain.from_iterable(sourceDensities[j] for j in overlapping)
+            )
+        )
+        values = totalDensities[i, [columns[nucName] for nucName in nucNames]]
+        block.clearNumberDensities()
+        block.setNumberDensities(dict(zip(nucNames, values.tolist())))
+        # Set the volume of each component in the block to `None` so that the
+        # volume of each component is recomputed.
+        for c in block:
+            c.p.volume = None
+
+
+_SCALAR_TYPES = (int, float, numpy.integer, numpy.floating, numpy.bool_)
+
+
+def _setBlockParamsFromOverlaps(destBlocks, sourceBlocks, overlaps, paramMapper):
+    """
+    Set the block parameters of many blocks from the blocks they overlap.
+
+    The source values of the scalar parameters are stacked into one array, and those
+    of each array parameter into another, and each is mapped to all of the destination
+    blocks with one sparse matrix product. Source values of ``None`` are skipped, and
+    a destination block only gets a value for a parameter if one of the blocks it
+    overlaps has one. Peak parameters, and values that cannot be stacked into a float
+    array, are mapped one destination block at a time.
+    """
+    paramNames = paramMapper.blockParamNames
+    sourceVals = [paramMapper.paramGetter(b, paramNames) for b in sourceBlocks]
+
+    scalarParams = {True: [], False: []}
+    for paramName, values in zip(paramNames, zip(*sourceVals)):
+        hasValue = [val is not None for val in values]
+        if not any(hasValue):
+            continue
+        values = [val if has else 0.0 for val, has in zip(values, hasValue)]
+        isVolIntegrated = bool(paramMapper.isVolIntegrated[paramName])
+        if paramMapper.isPeak[paramName]:
+            stacked = None
+        elif all(isinstance(val, _SCALAR_TYPES) for val in values):
+            scalarParams[isVolIntegrated].append((paramName, values, hasValue))
+            continue
+        else:
+            stacked = _stackArrayValues(values, hasValue)
+
+        if stacked is None:
+            _setBlockParamByOverlap(
+                destBlocks, values, hasValue, overlaps, paramMapper, paramName
+            )
+            continue
+
+        weights = (
+            overlaps.sourceWeights if isVolIntegrated else overlaps.destinationWeights
+        )
+        mapped = weights @ stacked
+        for i in numpy.flatnonzero(
+            overlaps.pattern @ numpy.array(hasValue, dtype=float)
+        ):
+            # copied out of the result so that the blocks do not share memory
+            destBlocks[i].p[paramName] = numpy.array(mapped[i])
+
+    for isVolIntegrated, params in scalarParams.items():
+        if not params:
+            continue
+        names, values, hasValue = zip(*params)
+        weights = (
+            overlaps.sourceWeights if isVolIntegrated else overlaps.destinationWeights
+        )
+        mapped = (weights @ numpy.array(values, dtype=float).T).tolist()
+        mappedTo = overlaps.pattern @ numpy.array(hasValue, dtype=float).T
+        for i, j in zip(*numpy.nonzero(mappedTo)):
+            destBlocks[i].p[names[j]] = mapped[i][j]
+
+
+def _stackArrayValues(values, hasValue):
+    """Stack array parameter values into a float array, or return None if they can't be."""
+    arrays = [val for val, has in zip(values, hasValue) if has]
+    if not all(isinstance(val, numpy.ndarray) for val in arrays):
+        return None
+    if len({val.shape for val in arrays}) > 1 or arrays[0].dtype.kind not in "biuf":
+        return None
+
+    stacked = numpy.zeros((len(values),) + arrays[0].shape)
+    stacked[hasValue] = arrays
+    return stacked
+
+
+def _setBlockParamByOverlap(
+    destBlocks, values, hasValue, overlaps, paramMapper, paramName
+):
+    """Map a parameter one destination block at a time."""
+    isPeak = paramMapper.isPeak[paramName]
+    if paramMapper.isVolIntegrated[paramName]:
+        weights = overlaps.sourceWeights
+    else:
+        weights = overlaps.destinationWeights
+    for i, destBlock in enumerate(destBlocks):
+        rowSlice = slice(weights.indptr[i], weights.indptr[i + 1])
+        updatedVal = None
+        for j, integrationFactor in zip(
+            weights.indices[rowSlice], weights.data[rowSlice]
+        ):
+            if not hasValue[j]:
+                continue
+            sourceBlockVal = values[j]
+            if updatedVal is None:
+                updatedVal = 0.0
+            if isPeak:
+                updatedVal = max(sourceBlockVal, updatedVal)
+            else:
+                updatedVal += sourceBlockVal * integrationFactor
+
+        if updatedVal is not None:
+            paramMapper.paramSetter(destBlock, [updatedVal], [paramName])
@@ -189,6 +189,8 @@ Design Considerations
 from armi.reactor.parameters.parameterCollections import (
     ParameterCollection,
     collectPluginParameters,
+    getParamValues,
+    setParamValues,
 )
 from armi.reactor.parameters.parameterCollections import applyAllParameters
 from armi.reactor.parameters.parameterDefinitions import (
@@ -198,6 +200,7 @@ from armi.reactor.parameters.parameterDefinitions import (
 
 from armi.reactor.parameters.parameterDefinitions import (
     SINCE_INITIALIZATION,
+    SINCE_LAST_INDEXING,
     SINCE_LAST_DISTRIBUTE_STATE,
     SINCE_LAST_GEOMETRY_TRANSFORMATION,
     SINCE_BACKUP,
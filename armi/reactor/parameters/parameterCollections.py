@@ -21,7 +21,7 @@ import numpy
 import six
 
 from armi import runLog
-from armi.reactor.parameters import parameterDefinitions, exceptions
+from armi.reactor.parameters import parameterDefinitions, parameterTables, exceptions
 from armi.reactor.parameters.parameterDefinitions import (
     SINCE_LAST_DISTRIBUTE_STATE,
     SINCE_BACKUP,
@@ -78,6 +78,7 @@ class _ParameterCollectionType(type):
         attrs["pDefs"] = attrs.get("pDefs") or None
         attrs["_ArmiObject"] = None
         attrs["_allFields"] = []
+        attrs["_table"] = None
 
         return type.__new__(mcl, name, bases, attrs)
 
@@ -130,6 +131,11 @@ class ParameterCollection(metaclass=_ParameterCollectionType):
     # it is used to emulate some of the behaviors of __slots__.
     _slots: Set[str] = set()
 
+    # Whether instances keep their scalar parameters in a table shared by the class,
+    # rather than in their own __dict__. See enableArrayStorage().
+    _useArrayStorage = False
+    _table: Optional[parameterTables.ParamTable] = None
+
     def __init__(self, _state: Optional[List[Any]] = None):
         """
         Create a new ParameterCollection instance.
@@ -150,6 +156,11 @@ class ParameterCollection(metaclass=_ParameterCollectionType):
             "somewhere.".format(type(self))
         )
 
+        if self._useArrayStorage:
+            if self._table is None:
+                type(self)._buildTable()
+            self.__dict__["_row"] = self._table.allocate()
+
         self._backup = None
         # used by the history tracker when a parameter key is a tuple (name, timestep)
         self._hist = {}
@@ -157,8 +168,15 @@ class ParameterCollection(metaclass=_ParameterCollectionType):
         # Initialize all parameter values to **something**. This is crucial to getting
         # the split-key dictionary memory savings in lieu of using __slots__!
         if _state is None:
-            for pDef in self.paramDefs:
+            # the columns of a table are already filled with their defaults
+            pDefs = (
+                self.paramDefs if self._table is None else self._table.otherParamDefs
+            )
+            for pDef in pDefs:
                 setattr(self, pDef.fieldName, pDef.default)
+        elif self._table is not None:
+            for key, val in zip(self._allFields, _state):
+                setattr(self, key, val)
         else:
             for key, val in zip(self._allFields, _state):
                 self.__dict__[key] = val
@@ -262,6 +280,47 @@ class ParameterCollection(metaclass=_ParameterCollectionType):
 
         cls._slots = set(cls._allFields).union({pd.name for pd in cls.pDefs})
 
+    @classmethod
+    def enableArrayStorage(cls):
+        """
+        Keep the scalar parameters of this class (and its subclasses) in typed columns.
+
+        Once enabled, the values of every parameter with a ``float``, ``int`` or
+        ``bool`` default are stored in a :py:class:`~.parameterTables.ParamTable` shared
+        by all instances of the class, with one row per instance. Parameter access
+        through an instance is unchanged, but :py:func:`getParamValues` and
+        :py:func:`setParamValues` can then read and write the values for many
+        instances as whole arrays.
+
+        This must be called before the first instance of the class is created, since
+        existing instances keep their values in their own ``__dict__``.
+        """
+        cls._useArrayStorage = True
+
+    @classmethod
+    def usesArrayStorage(cls) -> bool:
+        """Whether instances keep their scalar parameters in typed columns."""
+        return cls._useArrayStorage
+
+    @classmethod
+    def _buildTable(cls):
+        """Create the table of this class, and bind its columns to the fields."""
+        columns = {"assigned": parameterTables.IntColumn("assigned", NEVER)}
+        paramDefs = {}
+        otherParamDefs = []
+        for pd in cls.pDefs:
+            columnType = parameterTables.columnType(pd.default)
+            if columnType is None:
+                otherParamDefs.append(pd)
+            else:
+                columns[pd.fieldName] = columnType(pd.fieldName, pd.default)
+                paramDefs[pd.name] = pd
+
+        cls._table = parameterTables.ParamTable(columns, paramDefs, otherParamDefs)
+        for fieldName, column in columns.items():
+            setattr(cls, fieldName, column)
+        cls.__del__ = _releaseRow
+
     def __repr__(self):
         return "<{} assigned:{}>".format(self.__class__.__name__, self.assigned)
 
@@ -497,6 +556,107 @@ class ParameterCollection(metaclass=_ParameterCollectionType):
                 self.assigned = SINCE_ANYTHING
 
 
+def _releaseRow(self):
+    """Give the row of a collection back to its table when it is garbage collected."""
+    row = self.__dict__.get("_row")
+    if row is not None:
+        self._table.release(row)
+
+
+def _findRows(paramCollections, name):
+    """
+    Locate the column and rows holding a parameter for many collections.
+
+    Returns ``None`` unless all of the collections are of the same class, and that
+    class keeps the parameter in array storage.
+    """
+    if not paramCollections:
+        return None
+    cls = type(paramCollections[0])
+    table = cls._table
+    if table is None or name not in table.paramDefs:
+        return None
+    if any(type(pc) is not cls for pc in paramCollections):
+        return None
+    rows = numpy.fromiter(
+        (pc._row for pc in paramCollections), numpy.intp, len(paramCollections)
+    )
+    return table, table.paramDefs[name], rows
+
+
+def getParamValues(paramCollections, name) -> numpy.ndarray:
+    """
+    Get the values of a parameter from many parameter collections as an array.
+
+    This is equivalent to ``numpy.array([pc[name] for pc in paramCollections])``, but
+    reads the values straight out of the column when the collections use array
+    storage. As with ``pc[name]``, parameters that were deleted give their default, and
+    parameters that are not defined raise an ``UnknownParameterError``.
+
+    See Also
+    --------
+    ParameterCollection.enableArrayStorage
+    """
+    paramCollections = list(paramCollections)
+    found = _findRows(paramCollections, name)
+    if found is not None:
+        table, pd, rows = found
+        column = table.columns[pd.fieldName]
+        states = column.stateView()[rows]
+        if not (states == parameterTables.OBJECT).any():
+            values = column.view()[rows]
+            values[states == parameterTables.MISSING] = pd.default
+            return values
+
+    return numpy.array([pc[name] for pc in paramCollections])
+
+
+def setParamValues(paramCollections, name, values):
+    """
+    Set the values of a parameter on many parameter collections from an array.
+
+    This is equivalent to assigning ``pc[name] = value`` for each collection and value,
+    but writes the whole column at once when the collections use array storage, the
+    parameter has no custom setter, and the values have the type of the column: a
+    numpy array of the dtype of the column, whose values are then read back as numpy
+    scalars like they would be after assigning them one at a time, or a sequence of
+    values of the Python type of the column.
+
+    See Also
+    --------
+    ParameterCollection.enableArrayStorage
+    """
+    paramCollections = list(paramCollections)
+    if len(paramCollections) != len(values):
+        raise ValueError(
+            "Got {} values for parameter `{}` on {} parameter collections".format(
+                len(values), name, len(paramCollections)
+            )
+        )
+
+    found = _findRows(paramCollections, name)
+    if found is not None and found[1]._defaultSetter:
+        table, pd, rows = found
+        column = table.columns[pd.fieldName]
+        # anything else would be stored differently one value at a time
+        if isinstance(values, numpy.ndarray):
+            state = parameterTables.NUMPY if values.dtype == column.dtype else None
+        elif all(type(value) is column.pytype for value in values):
+            # e.g., ints that are too big for the column give an object array
+            values = numpy.asarray(values)
+            state = parameterTables.STORED if values.dtype == column.dtype else None
+        else:
+            state = None
+        if state is not None:
+            column.setRows(rows, values, state)
+            table.columns["assigned"].setRows(rows, SINCE_ANYTHING)
+            pd.assigned = SINCE_ANYTHING
+            return
+
+    for pc, value in zip(paramCollections, values):
+        pc[name] = value
+
+
 def collectPluginParameters(pm):
     """Apply parameters from plugins to their respective object classes."""
     for pluginParamDefnCollections in pm.hook.defineParameters():
@@ -45,12 +45,15 @@ from armi.reactor.parameters.exceptions import ParameterError, ParameterDefiniti
 # In order for that to happen, the flags need to be cleared when the <time-description>
 # begins.
 SINCE_INITIALIZATION = 1
+# cleared on a parameter definition when its values are read into a search index
+SINCE_LAST_INDEXING = 2
 SINCE_LAST_DISTRIBUTE_STATE = 4
 SINCE_LAST_GEOMETRY_TRANSFORMATION = 8
 SINCE_BACKUP = 16
 SINCE_ANYTHING = (
     SINCE_LAST_DISTRIBUTE_STATE
     | SINCE_INITIALIZATION
+    | SINCE_LAST_INDEXING
     | SINCE_LAST_GEOMETRY_TRANSFORMATION
     | SINCE_BACKUP
 )
@@ -237,6 +240,7 @@ class Parameter:
         "default",
         "_getter",
         "_setter",
+        "_defaultSetter",
         "description",
         "categories",
         "assigned",
@@ -360,6 +364,9 @@ class Parameter:
         ...             raise ValueError("Negative mass is not possible, consider a diet.")
         ...         self._p_speed = value
         """
+        # the default setter only stores the value, which lets it be bypassed when
+        # setting many values at once
+        self._defaultSetter = setter is NoDefault
         if setter is NoDefault:
 
             def paramSetter(p_self, value):
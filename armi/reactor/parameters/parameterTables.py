@@ -0,0 +1,236 @@
+# Copyright 2019 TerraPower, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Struct-of-arrays storage for the scalar parameters of a ParameterCollection class.
+
+Normally each ``ParameterCollection`` keeps its values in its own instance
+dictionary. When array storage is enabled for a collection class (see
+:py:meth:`~armi.reactor.parameters.parameterCollections.ParameterCollection.enableArrayStorage`),
+the values of its ``float``, ``int`` and ``bool`` parameters are instead kept in a
+:py:class:`ParamTable` shared by all instances of the class: one typed column per
+parameter, and one row per instance. Each instance only remembers its row. The columns
+can be viewed as numpy arrays without copying them.
+
+Access through the instance (``b.p.power``, ``b.p["power"]``, ...) is unchanged, but
+the values for many instances can also be read and written as whole arrays with
+:py:func:`~armi.reactor.parameters.parameterCollections.getParamValues` and
+:py:func:`~armi.reactor.parameters.parameterCollections.setParamValues`.
+
+A column only holds values of its own type: the Python type of the default, or the
+numpy scalar type of the column, which is remembered so that each value is read back
+with the type it was assigned with. Anything else assigned to the parameter (e.g.
+``None``, an array, a ``numpy.float32``, or a value that does not fit in the column)
+is kept in a per-column dictionary instead, so any value can still be assigned to any
+parameter and read back unchanged.
+"""
+import array
+from typing import Dict
+
+import numpy
+
+# storage state of each cell of a ParamTable
+MISSING = 0
+"""The parameter has no value (it was deleted)."""
+STORED = 1
+"""The value is in the column."""
+OBJECT = 2
+"""The value does not fit in the column, and is kept in the column's object dict."""
+NUMPY = 3
+"""The value is in the column, and was assigned as a numpy scalar of its dtype."""
+
+
+def columnType(default):
+    """Return the column type to use for a parameter default, or None if it has none."""
+    # exact types; e.g. a bool default should not get an int column
+    return {float: FloatColumn, int: IntColumn, bool: BoolColumn}.get(type(default))
+
+
+class ParamTable:
+    """
+    Typed columns holding the values of some fields of every instance of a collection.
+
+    Attributes
+    ----------
+    columns : dict
+        Field name to the :py:class:`Column` holding it.
+    paramDefs : dict
+        Parameter name to the definition of each parameter with a column.
+    otherParamDefs : list
+        The definitions of the parameters that do not have a column.
+    """
+
+    def __init__(self, columns: Dict[str, "Column"], paramDefs: Dict, otherParamDefs):
+        self.columns = columns
+        self.paramDefs = paramDefs
+        self.otherParamDefs = otherParamDefs
+        self.capacity = 0
+        self.numRows = 0
+        self._freeRows = []
+
+    def allocate(self) -> int:
+        """Return an unused row, filled with the default of each column."""
+        if self._freeRows:
+            row = self._freeRows.pop()
+        else:
+            if self.numRows == self.capacity:
+                self.capacity = max(16, 2 * self.capacity)
+                for column in self.columns.values():
+                    column.resize(self.capacity)
+            row = self.numRows
+            self.numRows += 1
+
+        for column in self.columns.values():
+            column.reset(row)
+        return row
+
+    def release(self, row: int):
+        """Make a row available for reuse."""
+        for column in self.columns.values():
+            column.objects.pop(row, None)
+        self._freeRows.append(row)
+
+
+class Column:
+    """
+    Data descriptor that keeps a ParameterCollection field in a typed column.
+
+    These are bound to the ``_p_<name>`` (and ``assigned``) attributes of a collection
+    class in place of instance attributes, and behave like one: reading a field that
+    has been deleted raises an ``AttributeError``. The row of each instance is its
+    ``_row`` attribute.
+
+    The values are kept in an ``array.array`` rather than a numpy array, since
+    indexing one is much faster for single values. :py:meth:`view` gives a numpy view
+    of them for reading and writing many values at once.
+    """
+
+    __slots__ = ("name", "default", "values", "states", "objects")
+    typecode = None
+    dtype = None
+    pytype = None
+
+    def __init__(self, name: str, default):
+        self.name = name
+        self.default = default
+        self.values = array.array(self.typecode)
+        self.states = bytearray()
+        self.objects = {}
+
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self
+        row = obj._row
+        state = self.states[row]
+        if state == STORED:
+            return self.values[row]
+        if state == NUMPY:
+            return self.dtype(self.values[row])
+        if state == OBJECT:
+            return self.objects[row]
+        raise AttributeError(self.name)
+
+    def __set__(self, obj, value):
+        row = obj._row
+        valueType = type(value)
+        if valueType is self.pytype or valueType is self.dtype:
+            try:
+                # numpy.bool_ can only be stored through its deprecated __index__
+                self.values[row] = self.pytype(value)
+            except (OverflowError, TypeError):
+                pass
+            else:
+                if self.states[row] == OBJECT:
+                    del self.objects[row]
+                self.states[row] = STORED if valueType is self.pytype else NUMPY
+                return
+
+        self.objects[row] = value
+        self.states[row] = OBJECT
+
+    def __delete__(self, obj):
+        row = obj._row
+        state = self.states[row]
+        if state == MISSING:
+            raise AttributeError(self.name)
+        if state == OBJECT:
+            del self.objects[row]
+        self.states[row] = MISSING
+
+    def resize(self, capacity: int):
+        extra = capacity - len(self.states)
+        # new objects, since numpy views may still be holding on to the old buffers
+        self.values = self.values + array.array(self.typecode, [0]) * extra
+        self.states = self.states + bytes(extra)
+
+    def reset(self, row: int):
+        self.objects.pop(row, None)
+        self.values[row] = self.default
+        self.states[row] = STORED
+
+    def view(self) -> numpy.ndarray:
+        """Return a numpy view of the values of the column."""
+        return numpy.frombuffer(self.values, self.dtype)
+
+    def stateView(self) -> numpy.ndarray:
+        """Return a numpy view of the storage state of each value in the column."""
+        return numpy.frombuffer(self.states, numpy.uint8)
+
+    def setRows(self, rows: numpy.ndarray, values, state=STORED):
+        """
+        Store values for many rows at once.
+
+        ``state`` is ``STORED`` for values that should be read back with the Python
+        type of the column, or ``NUMPY`` for values read back as numpy scalars.
+        """
+        states = self.stateView()
+        for row in rows[states[rows] == OBJECT]:
+            del self.objects[int(row)]
+        self.view()[rows] = values
+        states[rows] = state
+
+
+class FloatColumn(Column):
+    __slots__ = ()
+    typecode = "d"
+    dtype = numpy.float64
+    pytype = float
+
+
+class IntColumn(Column):
+    __slots__ = ()
+    typecode = "q"
+    dtype = numpy.int64
+    pytype = int
+
+
+class BoolColumn(Column):
+    __slots__ = ()
+    typecode = "b"
+    dtype = numpy.bool_
+    pytype = bool
+
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self
+        row = obj._row
+        state = self.states[row]
+        if state == STORED:
+            # the array holds 0 or 1
+            return self.values[row] == 1
+        if state == NUMPY:
+            return numpy.bool_(self.values[row])
+        if state == OBJECT:
+            return self.objects[row]
+        raise AttributeError(self.name)
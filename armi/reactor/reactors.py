@@ -41,6 +41,7 @@ from armi.reactor import reactorParameters
 from armi.reactor import zones
 from armi.reactor.assemblyLists import SpentFuelPool
 from armi.reactor.flags import Flags
+from armi.reactor.spatialIndex import CoreSpatialIndex
 from armi.reactor.systemLayoutInput import SystemLayoutInput
 from armi.settings.fwSettings.globalSettings import (
     CONF_MATERIAL_NAMESPACE_ORDER,
@@ -253,6 +254,8 @@ class Core(composites.Composite):
 
     pDefs = reactorParameters.defineCoreParameters()
 
+    _spatialIndex: Optional[CoreSpatialIndex] = None
+
     def __init__(self, name):
         """
         Initialize the reactor object.
@@ -310,6 +313,7 @@ class Core(composites.Composite):
     def __getstate__(self):
         """Applies a settings and parent to the core and components."""
         state = composites.Composite.__getstate__(self)
+        state.pop("_spatialIndex", None)
         return state
 
     def __setstate__(self, state):
@@ -438,6 +442,27 @@ class Core(composites.Composite):
         """Sorts the reactor assemblies by ring and position."""
         sortKey = lambda a: a.spatialLocator.getRingPos()
         self._children = sorted(self._children, key=sortKey)
+        composites._structureChanged(self)
+
+    def getSpatialIndex(self) -> CoreSpatialIndex:
+        """
+        Return lookup tables for the contents of the core by location.
+
+        The index is rebuilt when the core has changed since it was last requested, so
+        it should not be held on to across changes.
+        """
+        if self._spatialIndex is None or not self._spatialIndex.isCurrent():
+            self._spatialIndex = CoreSpatialIndex(self)
+        return self._spatialIndex
+
+    def invalidateSpatialIndex(self):
+        """
+        Discard the spatial index of the core.
+
+        This is only needed after changing the ``spatialLocator`` of an assembly
+        directly; moving it with ``moveTo`` updates the index automatically.
+        """
+        self._spatialIndex = None
 
     def summarizeReactorStats(self):
         """Writes a summary of the reactor to check the mass and volume of all of the blocks."""
@@ -997,22 +1022,12 @@ class Core(composites.Composite):
         assems : list of assemblies
             A list of assemblies that match the criteria within the ring
         """
-        assems = Sequence(self)
+        assems = Sequence(self.getSpatialIndex().getAssembliesInRing(ring))
 
         if exclusions:
             exclusions = set(exclusions)
             assems.drop(lambda a: a in exclusions)
 
-        # filter based on geomType
-        if (
-            self.geomType == geometry.GeomType.CARTESIAN
-        ):  # a ring in cartesian is basically a square.
-            assems.select(
-                lambda a: any(xy == ring for xy in abs(a.spatialLocator.indices[:2]))
-            )
-        else:
-            assems.select(lambda a: (a.spatialLocator.getRingPos()[0] == ring))
-
         # filter based on typeSpec
         if typeSpec:
             assems.select(lambda a: a.hasFlags(typeSpec, exact=exactType))
@@ -1059,17 +1074,15 @@ class Core(composites.Composite):
                 self._circularRingPitch
             )
 
-        assems = Sequence(self)
+        # get assemblies at locations
+        locSet = self.circularRingList[ring]
+        assems = Sequence(self.getSpatialIndex().getAssembliesAtLocations(locSet))
 
         # Remove exclusions
         if exclusions:
             exclusions = set(exclusions)
             assems.drop(lambda a: a in exclusions)
 
-        # get assemblies at locations
-        locSet = self.circularRingList[ring]
-        assems.select(lambda a: a.getLocation() in locSet)
-
         if typeSpec:
             assems.select(lambda a: a.hasFlags(typeSpec, exact=exactType))
 
@@ -1089,18 +1102,13 @@ class Core(composites.Composite):
         runLog.extra(
             "Building a circular ring dictionary with ring pitch {}".format(ringPitch)
         )
-        referenceAssembly = self.childrenByLocator[self.spatialGrid[0, 0, 0]]
-        refLocation = referenceAssembly.spatialLocator
-        pitchFactor = ringPitch / self.spatialGrid.pitch
+        # the rings are centered on the central assembly, which must exist
+        _referenceAssembly = self.childrenByLocator[self.spatialGrid[0, 0, 0]]
+        circularRings = self.getSpatialIndex().getCircularRings(ringPitch)
 
         circularRingDict = collections.defaultdict(set)
-
-        for a in self:
-            dist = a.spatialLocator.distanceTo(refLocation)
-            # To reduce numerical sensitivity, round distance to 6 decimal places
-            # before truncating.
-            index = int(round(dist * pitchFactor, 6)) or 1  # 1 is the smallest ring.
-            circularRingDict[index].add(a.getLocation())
+        for index, locations in circularRings.items():
+            circularRingDict[index] = set(locations)
 
         return circularRingDict
 
@@ -1203,7 +1211,10 @@ class Core(composites.Composite):
         ):
             assems.extend(self.parent.blueprints.assemblies.values())
 
-        assems.extend(a for a in sorted(self, key=sortKey))
+        if sortKey is None:
+            assems.extend(self.getSpatialIndex().getSortedAssemblies())
+        else:
+            assems.extend(sorted(self, key=sortKey))
 
         if includeSFP and self.parent is not None and self.parent.sfp is not None:
             assems.extend(self.parent.sfp.getChildren())
@@ -1310,7 +1321,42 @@ class Core(composites.Composite):
         --------
         getAssemblies : locates the assemblies in the search
         """
-        blocks = [b for a in self.getAssemblies(**kwargs) for b in a]
+        if bType:
+            # use the flag lookup tables of each assembly, rather than checking each
+            # block
+            return [
+                b
+                for a in self.getAssemblies(**kwargs)
+                for b in a.getChildrenWithFlags(bType)
+            ]
+        return [b for a in self.getAssemblies(**kwargs) for b in a]
+
+    def getBlocksInRegion(self, rings=None, zRange=None, bType=None):
+        """
+        Return the blocks within a range of rings and axial positions.
+
+        For example, ``getBlocksInRegion(rings=(3, 5), zRange=(50.0, 120.0))`` returns
+        all blocks in rings 3 through 5 that are at least partially between 50 and
+        120 cm.
+
+        Parameters
+        ----------
+        rings : tuple of int, optional
+            The first and last (inclusive) ring to include. Rings are square or hex
+            rings, as in :py:meth:`getAssembliesInSquareOrHexRing`. All rings are
+            included by default.
+        zRange : tuple of float, optional
+            Bottom and top of the axial range, in cm. Blocks that overlap this range are
+            included. All blocks are included by default.
+        bType : list or Flags, optional
+            Restrict results to a specific block type.
+
+        Returns
+        -------
+        list of Block
+            The blocks, ordered by assembly location and then axially.
+        """
+        blocks = self.getSpatialIndex().getBlocksInRegion(rings=rings, zRange=zRange)
         if bType:
             blocks = [b for b in blocks if b.hasFlags(bType)]
         return blocks
@@ -1499,10 +1545,8 @@ class Core(composites.Composite):
         --------
         makeLocationLookup : allows caching to speed this up if you call it a lot.
         """
-        # Why isn't locContents an attribute of reactor? It could be another
-        # property that is generated on demand
         if not locContents:
-            locContents = self.makeLocationLookup(assemblyLevel)
+            locContents = self.getSpatialIndex().getLocationLookup(assemblyLevel)
         try:
             # now look 'em up
             return [locContents[str(loc)] for loc in locs]
@@ -1520,11 +1564,8 @@ class Core(composites.Composite):
         --------
         getLocationContents : can use this lookup table to go faster.
         """
-        # build a lookup table one time.
-        if assemblyLevel:
-            return {a.getLocation(): a for a in self}
-        else:
-            return {b.getLocation(): b for a in self for b in a}
+        # copy, since the table of the spatial index is shared
+        return dict(self.getSpatialIndex().getLocationLookup(assemblyLevel))
 
     # TODO: Can be cleaned up, but need test case to guard agains breakage
     def getFluxVector(
@@ -0,0 +1,188 @@
+# Copyright 2019 TerraPower, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Location-keyed lookup tables for the assemblies and blocks in a Core.
+
+Many Core queries (assemblies in a ring, the contents of a list of locations, the
+sorted list of assemblies, ...) used to be answered by looping over every assembly in
+the core. A :py:class:`CoreSpatialIndex` answers them from tables instead. The tables
+are built lazily, the first time each kind of query is made, and the whole index is
+discarded whenever anything in the core changes structurally. Adding, removing or
+moving any object (``Core.add``, ``Core.removeAssembly``, ``Assembly.moveTo``, ...)
+does this automatically, so the tables never need to be regenerated by hand.
+"""
+import collections
+from typing import Dict, List, Optional, Tuple
+
+from armi.reactor import geometry
+
+
+class CoreSpatialIndex:
+    """
+    Lookup tables for the contents of a Core, keyed by location.
+
+    Use :py:meth:`armi.reactor.reactors.Core.getSpatialIndex` to get an up-to-date
+    index rather than constructing one directly.
+
+    Notes
+    -----
+    Assigning to an object's ``spatialLocator`` directly, rather than through
+    ``moveTo``, is not noticed by the index. Call
+    :py:meth:`armi.reactor.reactors.Core.invalidateSpatialIndex` after doing so.
+    """
+
+    def __init__(self, core):
+        self.core = core
+        self.version = core._structureVersion
+        self._children = core._children
+        self._assemblies = list(core)
+        self._sorted = None
+        self._rings = None
+        self._ringsOf = None
+        self._order = None
+        self._byLocation = None
+        self._blocksByLocation = None
+        self._circularRings: Dict[float, Dict[int, set]] = {}
+
+    def isCurrent(self) -> bool:
+        """Whether the model has not changed since this index was built."""
+        return (
+            self.version == self.core._structureVersion
+            and self._children is self.core._children
+        )
+
+    def getSortedAssemblies(self) -> List:
+        """Return the assemblies in the core, sorted by location."""
+        if self._sorted is None:
+            self._sorted = sorted(self._assemblies)
+        return self._sorted
+
+    def getAssembliesInRing(self, ring: int) -> List:
+        """
+        Return the assemblies in a square or hex ring, in the order of the core.
+
+        In Cartesian geometry, a ring is the square of locations with either index
+        equal to the ring number. Otherwise the ring of the grid is used.
+        """
+        self._buildRings()
+        return self._rings.get(ring, [])
+
+    def getRings(self, a) -> Tuple[int, ...]:
+        """Return the ring numbers of an assembly in the core."""
+        self._buildRings()
+        return self._ringsOf[a]
+
+    def _buildRings(self):
+        if self._rings is not None:
+            return
+        self._rings = collections.defaultdict(list)
+        self._ringsOf = {}
+        cartesian = self.core.geomType == geometry.GeomType.CARTESIAN
+        for a in self._assemblies:
+            if cartesian:
+                # a location is in the ring of each of its (absolute) indices; the set
+                # keeps e.g. (2, 2) from being listed twice in ring 2
+                rings = tuple(
+                    sorted({abs(int(ij)) for ij in a.spatialLocator.indices[:2]})
+                )
+            else:
+                rings = (a.spatialLocator.getRingPos()[0],)
+            self._ringsOf[a] = rings
+            for ring in rings:
+                self._rings[ring].append(a)
+
+    def getLocationLookup(self, assemblyLevel=False) -> Dict:
+        """
+        Return a table from location labels to the assemblies or blocks there.
+
+        The returned dictionary is shared by later calls, so it should not be modified.
+        """
+        if assemblyLevel:
+            if self._byLocation is None:
+                self._byLocation = {a.getLocation(): a for a in self._assemblies}
+            return self._byLocation
+
+        if self._blocksByLocation is None:
+            self._blocksByLocation = {
+                b.getLocation(): b for a in self._assemblies for b in a
+            }
+        return self._blocksByLocation
+
+    def getAssembliesAtLocations(self, locations) -> List:
+        """Return the assemblies at any of the given location labels, in core order."""
+        if self._order is None:
+            self._order = {a: i for i, a in enumerate(self._assemblies)}
+        byLocation = self.getLocationLookup(assemblyLevel=True)
+        assems = [byLocation[loc] for loc in locations if loc in byLocation]
+        return sorted(assems, key=self._order.__getitem__)
+
+    def getCircularRings(self, ringPitch: float) -> Dict[int, set]:
+        """
+        Return the location labels in each circular ring of the core.
+
+        See Also
+        --------
+        armi.reactor.reactors.Core.buildCircularRingDictionary
+        """
+        if ringPitch not in self._circularRings:
+            center = self.core.spatialGrid[0, 0, 0]
+            pitchFactor = ringPitch / self.core.spatialGrid.pitch
+            rings = collections.defaultdict(set)
+            for a in self._assemblies:
+                dist = a.spatialLocator.distanceTo(center)
+                # To reduce numerical sensitivity, round distance to 6 decimal places
+                # before truncating. 1 is the smallest ring.
+                rings[int(round(dist * pitchFactor, 6)) or 1].add(a.getLocation())
+            self._circularRings[ringPitch] = rings
+        return self._circularRings[ringPitch]
+
+    def getBlocksInRegion(
+        self,
+        rings: Optional[Tuple[int, int]] = None,
+        zRange: Optional[Tuple[float, float]] = None,
+    ) -> List:
+        """
+        Return the blocks within a range of rings and axial positions.
+
+        Parameters
+        ----------
+        rings : tuple of int, optional
+            The first and last (inclusive) square or hex ring to include. All rings are
+            included by default.
+        zRange : tuple of float, optional
+            Bottom and top of the axial range, in cm. Blocks that overlap this range are
+            included. All blocks are included by default.
+
+        Returns
+        -------
+        list of Block
+            The blocks, ordered by assembly location and then axially.
+        """
+        assems = self.getSortedAssemblies()
+        if rings is not None:
+            first, last = rings
+            assems = [
+                a
+                for a in assems
+                if any(first <= ring <= last for ring in self.getRings(a))
+            ]
+
+        if zRange is None:
+            return [b for a in assems for b in a]
+
+        zMin, zMax = zRange
+        # the axial positions are read now, since they change without any structural
+        # change (e.g. with axial expansion)
+        return [b for a in assems for b in a if b.p.ztop > zMin and b.p.zbottom < zMax]
@@ -20,6 +20,7 @@ import unittest
 from armi.materials.material import Material
 from armi.reactor import components
 from armi.reactor import flags
+from armi.reactor.composites import Composite
 from armi.reactor.components import (
     Component,
     UnshapedComponent,
@@ -44,7 +45,7 @@ from armi.reactor.components import (
     ComponentType,
 )
 from armi.reactor.components import materials
-from armi.materials import air, alloy200
+from armi.materials import air, alloy200, inconel600
 
 
 class TestComponentFactory(unittest.TestCase):
@@ -586,6 +587,60 @@ class TestCircle(TestShapedComponent):
         cur = gap.getArea()
         self.assertAlmostEqual(cur, ref)
 
+    def test_areaCacheFollowsLinkedDimensions(self):
+        """Cached areas are cleared when anything upstream of them changes."""
+
+        def ringArea(c):
+            od = c.getDimension("od")
+            idd = c.getDimension("id")
+            return (
+                c.getDimension("mult") * math.pi * ((od / 2.0) ** 2 - (idd / 2.0) ** 2)
+            )
+
+        dims = {"Tinput": 25.0, "Thot": 430.0, "mult": 7}
+        fuel = Circle("fuel", "UZr", od=0.9, id=0.0, **dims)
+        clad = Circle("clad", "HT9", od=1.1, id=1.0, **dims)
+        comps = {"fuel": fuel, "clad": clad}
+        gap = Circle(
+            "gap", "Void", od="clad.id", id="fuel.od", components=comps, **dims
+        )
+        comps["gap"] = gap
+        liner = Circle("liner", "HT9", od=1.2, id="gap.od", components=comps, **dims)
+        pin = Composite("pin")
+        for c in (fuel, clad, gap, liner):
+            pin.add(c)
+
+        self.assertEqual(clad.getDependentComponents(), [gap, liner])
+        self.assertEqual(gap.getDependentComponents(), [liner])
+        self.assertEqual(liner.getDependentComponents(), [])
+
+        for c in pin:
+            self.assertAlmostEqual(c.getArea(), ringArea(c))
+            self.assertIn(False, c._areaCache)
+
+        clad.setDimension("id", 1.02)
+        fuel.temperatureInC = 600.0
+        for c in pin:
+            self.assertIsNone(c._areaCache)
+            self.assertAlmostEqual(c.getArea(), ringArea(c))
+
+        # parameters written directly (e.g. from a database) do not clear the caches of
+        # the dependent components, but their cached areas are not reused
+        clad.p.id = 1.04
+        fuel.p.temperatureInC = 700.0
+        clad.clearCache()
+        for c in pin:
+            self.assertAlmostEqual(c.getArea(), ringArea(c))
+
+        # replacing a material clears the caches too
+        cladArea = clad.getArea()
+        clad.material = inconel600.Inconel600()
+        for c in (clad, gap, liner):
+            self.assertIsNone(c._areaCache)
+        self.assertNotAlmostEqual(clad.getArea(), cladArea)
+        for c in pin:
+            self.assertAlmostEqual(c.getArea(), ringArea(c))
+
     def test_badComponentName(self):
         """This shows that resolveLinkedDims cannot support names with periods in them."""
         nPins = 12
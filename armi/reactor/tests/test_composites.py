@@ -15,7 +15,12 @@
 """Tests for the composite pattern."""
 from copy import deepcopy
 import unittest
+from unittest import mock
 
+import numpy
+from numpy.testing import assert_allclose
+
+from armi import context
 from armi import nuclearDataIO
 from armi import runLog
 from armi import settings
@@ -153,6 +158,104 @@ class TestCompositePattern(unittest.TestCase):
         )
         self.assertEqual(len(onlyLiner), 1)
 
+    def test_traverse(self):
+        ducts = self.container.getChildren()[:5]
+        nested = self.container.getChildren()[5]
+        preOrder = ducts + [nested, self.secondGen, self.thirdGen]
+        self.assertEqual(list(self.container.traverse()), preOrder)
+        self.assertEqual(self.container.getChildren(deep=True), preOrder)
+        self.assertEqual(
+            list(self.container.traverse(order=composites.LEVEL_ORDER)),
+            ducts + [nested, self.secondGen, self.thirdGen],
+        )
+        self.assertEqual(
+            list(self.container.traverse(maxDepth=2)), ducts + [nested, self.secondGen]
+        )
+        self.assertEqual(
+            list(self.container.traverse(predicate=lambda o: o.hasFlags(Flags.CLAD))),
+            [nested],
+        )
+        with self.assertRaises(ValueError):
+            list(self.container.traverse(order="postorder"))
+
+        # the flattened pre-order is reused until the structure changes
+        cached = self.container._getPreOrder()
+        self.assertIs(self.container._getPreOrder(), cached)
+        newLeaf = DummyLeaf("duct 5", 200)
+        self.secondGen.add(newLeaf)
+        self.assertIsNot(self.container._getPreOrder(), cached)
+        self.assertEqual(list(self.container.traverse())[-1], newLeaf)
+
+    def test_traverseWithMaterials(self):
+        b = loadTestBlock()
+        comps = b.getChildren()
+        materials = [c.material for c in comps]
+        pairs = [obj for c in comps for obj in (c, c.material)]
+        self.assertEqual(list(b.traverse(includeMaterials=True)), pairs)
+        self.assertEqual(b.getChildren(deep=True, includeMaterials=True), pairs)
+        self.assertEqual(
+            list(b.traverse(order=composites.LEVEL_ORDER, includeMaterials=True)),
+            comps + materials,
+        )
+
+        # predicates only filter the composites, not their materials
+        fuel = b.getComponent(Flags.FUEL)
+        fuelAndMaterials = [o for o in pairs if o is fuel or o in materials]
+        self.assertEqual(
+            list(
+                b.traverse(
+                    predicate=lambda o: o.hasFlags(Flags.FUEL), includeMaterials=True
+                )
+            ),
+            fuelAndMaterials,
+        )
+
+    def test_getChildrenWithFlags(self):
+        ducts = self.container.getChildren()[:5]
+        clad = self.container.getChildren()[5]
+        self.assertEqual(self.container.getChildrenWithFlags(Flags.DUCT), ducts)
+        self.assertEqual(
+            self.container.getChildrenWithFlags([Flags.CLAD, Flags.DUCT]),
+            ducts + [clad],
+        )
+        self.assertEqual(self.container.getChildrenWithFlags(None), ducts + [clad])
+        self.assertEqual(self.container.getChildrenWithFlags(None, True), [])
+
+        # the lookup table follows changes to children and their flags
+        ducts[1].setType("clad")
+        ducts[3].p.flags |= Flags.INNER
+        self.assertEqual(
+            self.container.getChildrenWithFlags(Flags.DUCT),
+            [ducts[0], ducts[2], ducts[3], ducts[4]],
+        )
+        self.assertEqual(
+            self.container.getChildrenWithFlags(Flags.DUCT, exactMatch=True),
+            [ducts[0], ducts[2], ducts[4]],
+        )
+        self.assertEqual(
+            self.container.getChildrenWithFlags(Flags.CLAD), [ducts[1], clad]
+        )
+        self.container.remove(ducts[0])
+        self.container.remove(ducts[4])
+        self.container.insert(0, ducts[4])
+        self.assertEqual(
+            self.container.getChildrenWithFlags(Flags.DUCT),
+            [ducts[4], ducts[2], ducts[3]],
+        )
+        with self.container.retainState():
+            ducts[2].setType("liner")
+            self.assertEqual(
+                self.container.getChildrenWithFlags(Flags.DUCT), [ducts[4], ducts[3]]
+            )
+        self.assertEqual(
+            self.container.getChildrenWithFlags(Flags.DUCT),
+            [ducts[4], ducts[2], ducts[3]],
+        )
+
+        # tables are not carried along with copies
+        self.assertIsNotNone(self.container._flagIndex)
+        self.assertIsNone(deepcopy(self.container)._flagIndex)
+
     def test_getName(self):
         """Test the getName method.
 
@@ -324,6 +427,134 @@ class TestCompositePattern(unittest.TestCase):
         numSynced = self.container._syncParameters(data, {})
         self.assertEqual(numSynced, 2)
 
+    def test_packSyncData(self):
+        comps = [self.container] + self.container.getChildren(deep=True)
+        self.container._markSynchronized()
+        comps[1].p.type = "packed"
+        comps[2].p.serialNum = 12345
+        comps[4].p.serialNum = numpy.int32(7)
+        comps[4].p.flags = Flags.FUEL
+
+        numComps, packedScalars, others = composites._packSyncData(comps)
+        self.assertEqual(numComps, len(comps))
+        # every modified composite sends all parameters that were modified anywhere
+        indices, values = packedScalars["serialNum", int]
+        self.assertEqual(indices.tolist(), [1, 2])
+        self.assertEqual(values.dtype, numpy.int64)
+        indices, values = packedScalars["serialNum", numpy.int32]
+        self.assertEqual(indices.tolist(), [4])
+        self.assertIn((1, "type", "packed"), others)
+
+        compData = composites._unpackSyncData((numComps, packedScalars, others))
+        for ci, comp in enumerate(comps):
+            if ci not in compData:
+                self.assertIsNone(comp.p.getSyncData())
+                continue
+            self.assertEqual(compData[ci], comp.p.getSyncData())
+            for paramName, val in compData[ci].items():
+                self.assertIs(type(val), type(comp.p[paramName]))
+
+        # integers that do not fit in a numpy array are still sent, just not packed
+        comps[3].p.serialNum = 2**70
+        _numComps, packedScalars, others = composites._packSyncData(comps)
+        self.assertNotIn(("serialNum", int), packedScalars)
+        self.assertIn((2, "serialNum", 12345), others)
+        self.assertIn((3, "serialNum", 2**70), others)
+
+    def test_allgatherSyncData(self):
+        comps = [self.container] + self.container.getChildren(deep=True)
+        self.container._markSynchronized()
+        comps[1].p.serialNum = 12345
+        comps[2].p.serialNum = numpy.int32(7)
+        comps[2].p.type = "gathered"
+        sendBuf = composites._packSyncData(comps)
+
+        other = _LoopbackComm()
+        composites._allgatherSyncData(other, (5, {}, [(0, "type", "other")]))
+        comm = _LoopbackComm([other])
+        allSyncData = composites._allgatherSyncData(comm, sendBuf)
+        self.assertEqual(len(allSyncData), 2)
+        self.assertEqual(
+            composites._unpackSyncData(allSyncData[0]),
+            composites._unpackSyncData(sendBuf),
+        )
+        self.assertEqual(allSyncData[1], (5, {}, [(0, "type", "other")]))
+        # only the layout and the unpacked values are pickled
+        _numComps, layout, others, numBytes = comm.header
+        self.assertIn((2, "type", "gathered"), others)
+        self.assertEqual(
+            [name for name, _type, _dtype, _count in layout], 2 * ["serialNum"]
+        )
+        self.assertEqual(numBytes, 8 + 8 + 8 + 4)
+
+    def test_syncMpiState(self):
+        self.container._markSynchronized()
+        otherComps = [self.container] + self.container.getChildren(deep=True)
+        otherComps[2].p.serialNum = 777
+        other = _LoopbackComm()
+        composites._allgatherSyncData(other, composites._packSyncData(otherComps))
+        otherComps[2].p.serialNum = 1
+        self.container._markSynchronized()
+
+        self.container.getChildren()[0].p.type = "synced"
+        mpiComm = _LoopbackComm([other])
+        with mock.patch.object(context, "MPI_SIZE", 2), mock.patch.object(
+            context, "MPI_COMM", mpiComm
+        ):
+            self.assertEqual(self.container.syncMpiState(), 2)
+            self.assertEqual(otherComps[2].p.serialNum, 777)
+            self.assertIsNone(self.container.getChildren()[0].p.getSyncData())
+
+            # different reactor sizes on different ranks are not allowed
+            composites._allgatherSyncData(other, (1, {}, []))
+            with self.assertRaises(ValueError):
+                self.container.syncMpiState()
+
+    def test_syncMpiStateWithMaterials(self):
+        b = loadTestBlock()
+        b._markSynchronized()
+        fuel = b.getComponent(Flags.FUEL)
+        otherComps = [b] + b.getChildren(deep=True)
+        fuel.p.percentBu = 3.0
+        other = _LoopbackComm()
+        composites._allgatherSyncData(other, composites._packSyncData(otherComps))
+        fuel.p.percentBu = 0.0
+        b._markSynchronized()
+
+        b.p.percentBu = 1.0
+        mpiComm = _LoopbackComm([other])
+        with mock.patch.object(context, "MPI_SIZE", 2), mock.patch.object(
+            context, "MPI_COMM", mpiComm
+        ):
+            self.assertEqual(b.syncMpiState(), 2)
+        self.assertEqual(b.p.percentBu, 1.0)
+        self.assertEqual(fuel.p.percentBu, 3.0)
+
+
+class _LoopbackComm:
+    """
+    Stands in for an MPI communicator, gathering what was sent through it along with
+    what was last sent through the communicators of the other ranks.
+    """
+
+    def __init__(self, otherRanks=()):
+        self.otherRanks = otherRanks
+        self.header = None
+        self.sendBytes = None
+
+    def barrier(self):
+        pass
+
+    def allgather(self, obj):
+        self.header = obj
+        return [obj] + [other.header for other in self.otherRanks]
+
+    def Allgatherv(self, sendBuf, recvBuf):
+        self.sendBytes = sendBuf.copy()
+        recvBuf[0][:] = numpy.concatenate(
+            [sendBuf] + [other.sendBytes for other in self.otherRanks]
+        )
+
 
 class TestCompositeTree(unittest.TestCase):
 
@@ -756,6 +987,31 @@ class TestMiscMethods(unittest.TestCase):
                 self.obj.getNumberDensity(nuc), childDensities[nuc], 4, msg=nuc
             )
 
+    def test_getNumberDensityMatrix(self):
+        children = self.obj.getChildren()
+        nucNames = ["FE", "SI", "FE", "NOT_A_NUC"]
+        matrix = composites.getNumberDensityMatrix(children, nucNames)
+        self.assertEqual(matrix.shape, (len(children), len(nucNames)))
+        for c, row in zip(children, matrix):
+            self.assertEqual(list(row[:3]), c.getNuclideNumberDensities(nucNames[:3]))
+            self.assertEqual(row[3], 0.0)
+
+    def test_getHomogenizedNumberDensities(self):
+        otherBlock = loadTestBlock()
+        otherBlock.getComponent(Flags.FUEL).setNumberDensity("U235", 0.01)
+        emptyBlock = composites.Composite("empty")
+        objs = [self.obj, emptyBlock, otherBlock]
+
+        nucNames = sorted(self.obj.getNuclides())
+        ndens = composites.getHomogenizedNumberDensities(objs, nucNames)
+        self.assertEqual(ndens.shape, (3, len(nucNames)))
+        assert_allclose(ndens[0], self.obj.getNuclideNumberDensities(nucNames))
+        self.assertTrue((ndens[1] == 0.0).all())
+        assert_allclose(ndens[2], otherBlock.getNuclideNumberDensities(nucNames))
+        self.assertNotAlmostEqual(
+            ndens[0][nucNames.index("U235")], ndens[2][nucNames.index("U235")]
+        )
+
     def test_dimensionReport(self):
         report = self.obj.setComponentDimensionsReport()
         self.assertEqual(len(report), len(self.obj))
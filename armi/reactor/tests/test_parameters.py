@@ -14,8 +14,14 @@
 """Tests of the Parameters class."""
 import copy
 import unittest
+import warnings
+
+import numpy
+from numpy.testing import assert_equal
 
 from armi.reactor import parameters
+from armi.reactor.parameters import exceptions
+from armi.reactor.parameters import parameterTables
 
 
 class MockComposite:
@@ -502,3 +508,121 @@ class ParameterTests(unittest.TestCase):
         pcc = MockPCChild()
         with self.assertRaises(AssertionError):
             pcc.whatever = 33
+
+    def test_arrayStorage(self):
+        """Scalar parameters can be kept in numpy columns shared by the class."""
+
+        class MockPC(parameters.ParameterCollection):
+            pDefs = parameters.ParameterDefinitionCollection()
+            with pDefs.createBuilder() as pb:
+                pb.defParam("power", "W", "description", "location", default=0.0)
+                pb.defParam("count", "", "description", "location", default=0)
+                pb.defParam("on", "", "description", "location", default=False)
+                pb.defParam("label", "", "description", "location", default="")
+
+                def doubled(self, value):
+                    self._p_doubled = 2 * value
+
+                pb.defParam(
+                    "doubled",
+                    "",
+                    "description",
+                    "location",
+                    default=0.0,
+                    setter=doubled,
+                )
+
+        MockPC.enableArrayStorage()
+        self.assertTrue(MockPC.usesArrayStorage())
+        pcs = [MockPC() for _ in range(20)]
+        pc = pcs[0]
+
+        # defaults, with their own types
+        self.assertEqual(pc.power, 0.0)
+        self.assertIs(type(pc.count), int)
+        self.assertIs(pc.on, False)
+        self.assertEqual(pc.label, "")
+
+        # values that do not fit the column are kept as they are
+        pc.count = 3
+        pc.power = None
+        pc.on = numpy.array([True, False])
+        self.assertEqual(pc.count, 3)
+        self.assertIsNone(pc.power)
+        self.assertEqual(len(pc.on), 2)
+        pc.on = 1
+        self.assertIs(type(pc.on), int)
+        with warnings.catch_warnings():
+            # storing numpy.bool_ through its deprecated __index__ warns or fails
+            warnings.simplefilter("error")
+            pc.on = numpy.bool_(True)
+        self.assertIs(pc.on, numpy.bool_(True))
+        self.assertEqual(MockPC._p_on.states[pc._row], parameterTables.NUMPY)
+        pc.on = True
+        self.assertIs(pc.on, True)
+
+        # values keep the type they were assigned with
+        for value in (numpy.float64(2.5), numpy.float32(2.5), 2.5):
+            pc.power = value
+            self.assertIs(type(pc.power), type(value))
+            self.assertEqual(pc.power, value)
+        for value in (numpy.int64(4), numpy.int32(4), 4):
+            pc.count = value
+            self.assertIs(type(pc.count), type(value))
+        pc.count = 1.5
+        self.assertEqual(pc.count, 1.5)
+        pc.count = 2**70
+        self.assertEqual(pc.count, 2**70)
+        pc.power = 5.0
+        self.assertEqual(pc.power, 5.0)
+        self.assertEqual(pc.assigned, parameters.SINCE_ANYTHING)
+        pcs[1].doubled = 2.0
+        self.assertEqual(pcs[1].doubled, 4.0)
+
+        # delete, copy, back up and restore
+        del pc["power"]
+        self.assertNotIn("power", pc)
+        self.assertEqual(pc.power, 0.0)
+        pc.power = 7.0
+        pc.backUp()
+        pc.power = 8.0
+        pc.restoreBackup(set())
+        self.assertEqual(pc.power, 7.0)
+        pc2 = copy.deepcopy(pc)
+        self.assertEqual(pc2.power, 7.0)
+        self.assertEqual(pc2.count, 2**70)
+        pc2.power = 9.0
+        self.assertEqual(pc.power, 7.0)
+
+        # whole columns at a time
+        power = numpy.arange(20, dtype=float)
+        parameters.setParamValues(pcs, "power", power)
+        assert_equal(parameters.getParamValues(pcs, "power"), power)
+        self.assertEqual(pcs[3].power, 3.0)
+        self.assertIs(type(pcs[3].power), numpy.float64)
+        parameters.setParamValues(pcs, "power", [float(i) for i in range(20)])
+        self.assertIs(type(pcs[3].power), float)
+        parameters.setParamValues(pcs, "count", numpy.arange(20))
+        self.assertEqual(pc.count, 0)
+        parameters.setParamValues(pcs, "count", numpy.arange(20, dtype=numpy.int32))
+        self.assertIs(type(pcs[3].count), numpy.int32)
+        parameters.setParamValues(pcs, "count", [2**70] * 20)
+        self.assertEqual(pcs[3].count, 2**70)
+
+        # deleted and undefined parameters behave as they do one at a time
+        del pcs[3]["power"]
+        self.assertEqual(parameters.getParamValues(pcs, "power")[3], pcs[3]["power"])
+        with self.assertRaises(exceptions.UnknownParameterError):
+            pcs[3]["whatever"]
+        with self.assertRaises(exceptions.UnknownParameterError):
+            parameters.getParamValues(pcs, "whatever")
+        parameters.setParamValues(pcs, "doubled", power)
+        self.assertEqual(pcs[3].doubled, 6.0)
+        assert_equal(parameters.getParamValues(pcs, "label"), [""] * 20)
+        with self.assertRaises(ValueError):
+            parameters.setParamValues(pcs, "power", power[:3])
+
+        # rows of collections that are gone are reused
+        row = pcs[-1]._row
+        del pcs[-1]
+        self.assertEqual(MockPC()._row, row)
@@ -15,6 +15,7 @@
 import copy
 import logging
 import os
+import time
 import unittest
 from math import sqrt
 from unittest.mock import patch
@@ -354,6 +355,91 @@ class HexReactorTests(ReactorTests):
         with self.assertRaises(ValueError):
             self.r.core.getTotalBlockParam(generationNum=1)
 
+    def test_flagLookups(self):
+        """Flag lookups match a scan, and changes only rebuild the tables above them."""
+        blocks = self.r.core.getBlocks()
+        typeSpecs = [Flags.FUEL, Flags.CLAD, [Flags.DUCT, Flags.COOLANT], Flags.WIRE]
+        self.assertEqual(
+            [b.getComponents(typeSpec) for b in blocks for typeSpec in typeSpecs],
+            [
+                [c for c in b if c.hasFlags(typeSpec)]
+                for b in blocks
+                for typeSpec in typeSpecs
+            ],
+        )
+        self.assertEqual(
+            self.r.core.getBlocks(Flags.FUEL),
+            [b for b in blocks if b.hasFlags(Flags.FUEL)],
+        )
+
+        fuel = self.r.core.getFirstBlock(Flags.FUEL)
+        other = next(
+            b
+            for b in blocks
+            if b.parent is not fuel.parent and len(b.getComponents(Flags.CLAD)) == 1
+        )
+        fuelIndex, otherIndex = fuel._flagIndex, other._flagIndex
+        assemIndex = other.parent._flagIndex
+        self.assertIsNotNone(otherIndex)
+        self.assertIsNotNone(assemIndex)
+
+        # a change to a component rebuilds the table of its block
+        clad = fuel.getComponent(Flags.CLAD)
+        clad.setType("liner")
+        self.assertNotIn(clad, fuel.getComponents(Flags.CLAD))
+        self.assertIn(clad, fuel.getComponents(Flags.LINER))
+        self.assertIsNot(fuel._flagIndex, fuelIndex)
+
+        # but not those of other blocks or assemblies, or of copies elsewhere
+        copied = copy.deepcopy(other)
+        copied.getComponent(Flags.CLAD).setType("liner")
+        self.assertEqual(len(copied.getComponents(Flags.CLAD)), 0)
+        self.assertEqual(len(other.getComponents(Flags.CLAD)), 1)
+        self.assertIs(other._flagIndex, otherIndex)
+        self.assertEqual(
+            other.parent.getChildrenWithFlags(Flags.FUEL),
+            [b for b in other.parent if b.hasFlags(Flags.FUEL)],
+        )
+        self.assertIs(other.parent._flagIndex, assemIndex)
+
+    def test_flagLookupBenchmark(self):
+        """Compare flag lookups through the lookup tables with checking every child."""
+        self.r.core.growToFullCore(self.o.cs)
+        assems = self.r.core.getAssemblies()
+        blocks = self.r.core.getBlocks()
+        typeSpecs = [Flags.FUEL, Flags.CLAD, [Flags.DUCT, Flags.COOLANT], Flags.WIRE]
+
+        def scan():
+            return [
+                [b for a in assems for b in a if b.hasFlags(Flags.FUEL)],
+                [
+                    [c for c in b if c.hasFlags(typeSpec)]
+                    for b in blocks
+                    for typeSpec in typeSpecs
+                ],
+            ]
+
+        def lookUp():
+            return [
+                self.r.core.getBlocks(Flags.FUEL),
+                [b.getComponents(typeSpec) for b in blocks for typeSpec in typeSpecs],
+            ]
+
+        start = time.perf_counter()
+        expected = scan()
+        scanTime = time.perf_counter() - start
+        # the first lookup builds the tables
+        self.assertEqual(lookUp(), expected)
+        start = time.perf_counter()
+        self.assertEqual(lookUp(), expected)
+        lookUpTime = time.perf_counter() - start
+        runLog.info(
+            "Flag lookups on {} blocks: {:.4f} s scanning, {:.4f} s with tables".format(
+                len(blocks), scanTime, lookUpTime
+            )
+        )
+        self.assertLess(lookUpTime, scanTime)
+
     def test_geomType(self):
         self.assertEqual(self.r.core.geomType, geometry.GeomType.HEX)
 
@@ -691,6 +777,49 @@ class HexReactorTests(ReactorTests):
             )
         self.assertSequenceEqual(actualAssemsInRing, expectedAssemsInRing)
 
+    def test_spatialIndex(self):
+        core = self.r.core
+        index = core.getSpatialIndex()
+        self.assertIs(core.getSpatialIndex(), index)
+
+        # range queries match a scan over all blocks
+        blocks = core.getBlocksInRegion(rings=(3, 5), zRange=(50.0, 120.0))
+        expected = [
+            b
+            for b in core.getBlocks()
+            if 3 <= b.parent.spatialLocator.getRingPos()[0] <= 5
+            and b.p.ztop > 50.0
+            and b.p.zbottom < 120.0
+        ]
+        self.assertGreater(len(blocks), 0)
+        self.assertEqual(blocks, expected)
+        self.assertEqual(
+            core.getBlocksInRegion(rings=(3, 5), bType=Flags.FUEL),
+            [
+                b
+                for b in core.getBlocks(Flags.FUEL)
+                if 3 <= b.parent.spatialLocator.getRingPos()[0] <= 5
+            ],
+        )
+
+        # moving assemblies updates the ring and location lookups
+        a1, a2 = core.getAssembliesInRing(2)[0], core.getAssembliesInRing(4)[0]
+        loc1, loc2 = a1.spatialLocator, a2.spatialLocator
+        a1.moveTo(loc2)
+        a2.moveTo(loc1)
+        self.assertIsNot(core.getSpatialIndex(), index)
+        self.assertIn(a1, core.getAssembliesInRing(4))
+        self.assertNotIn(a1, core.getAssembliesInRing(2))
+        self.assertEqual(core.getLocationContents([a1.getLocation()], True), [a1])
+        self.assertEqual(core.getAssemblies(), sorted(core))
+
+        # removing an assembly takes it out of all lookups
+        loc = a2.getLocation()
+        core.removeAssembly(a2)
+        self.assertNotIn(a2, core.getAssembliesInRing(2))
+        self.assertNotIn(a2, core.getAssemblies())
+        self.assertNotIn(loc, core.makeLocationLookup(assemblyLevel=True))
+
     def test_genAssembliesAddedThisCycle(self):
         allAssems = self.r.core.getAssemblies()
         self.assertTrue(
@@ -27,6 +27,9 @@ CONF_DB_STORAGE_AFTER_CYCLE = "dbStorageAfterCycle"
 CONF_ZERO_OUT_NUCLIDES_NOT_IN_DB = "zeroOutNuclidesNotInDB"
 CONF_SYNC_AFTER_WRITE = "syncDbAfterWrite"
 CONF_FORCE_DB_PARAMS = "forceDbParams"
+CONF_DB_COMPRESSION = "dbCompression"
+CONF_DB_PARAM_STORAGE = "dbParamStorageOptions"
+CONF_DB_WRITE_IN_BACKGROUND = "dbWriteInBackground"
 
 
 def defineSettings():
@@ -86,5 +89,46 @@ def defineSettings():
                 "status. This is only honored if the DatabaseInterface is used."
             ),
         ),
+        setting.Setting(
+            CONF_DB_COMPRESSION,
+            default="gzip",
+            label="Database Compression",
+            description="The HDF5 compression filter to use for parameter data.",
+            options=["gzip", "lzf", "none"],
+        ),
+        setting.Setting(
+            CONF_DB_PARAM_STORAGE,
+            default={},
+            label="Database Storage of Parameters",
+            description=(
+                "Storage options for specific parameters, overriding the database "
+                "compression. Maps parameter names to any of `compression` (gzip, lzf, "
+                "or none), `compressionLevel` (0-9, gzip only), and `chunks` (the "
+                "number of objects stored in each HDF5 chunk)."
+            ),
+            schema=vol.Schema(
+                {
+                    str: {
+                        vol.Optional("compression"): vol.In(["gzip", "lzf", "none"]),
+                        vol.Optional("compressionLevel"): vol.All(
+                            vol.Coerce(int), vol.Range(min=0, max=9)
+                        ),
+                        vol.Optional("chunks"): vol.All(
+                            vol.Coerce(int), vol.Range(min=1)
+                        ),
+                    }
+                }
+            ),
+        ),
+        setting.Setting(
+            CONF_DB_WRITE_IN_BACKGROUND,
+            default=False,
+            label="Write Database in Background",
+            description=(
+                "Compress and write parameter data to the database on a background "
+                "thread, so that the run can continue while the previous time node is "
+                "being written."
+            ),
+        ),
     ]
     return settings
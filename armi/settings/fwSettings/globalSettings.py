@@ -112,6 +112,7 @@ CONF_TIGHT_COUPLING_SETTINGS = "tightCouplingSettings"
 CONF_TRACE = "trace"
 CONF_TRACK_ASSEMS = "trackAssems"
 CONF_UNIFORM_MESH_MINIMUM_SIZE = "uniformMeshMinimumSize"
+CONF_UNIFORM_MESH_PERSISTENT = "uniformMeshPersistent"
 CONF_USER_PLUGINS = "userPlugins"
 CONF_VERBOSITY = "verbosity"
 CONF_VERSIONS = "versions"
@@ -173,6 +174,15 @@ def defineSettings() -> List[setting.Setting]:
             "and control material boundaries to be enforced better in uniform mesh.",
             schema=vol.All(vol.Coerce(float), vol.Range(min=0.0, min_included=False)),
         ),
+        setting.Setting(
+            CONF_UNIFORM_MESH_PERSISTENT,
+            default=False,
+            label="Keep the uniform mesh reactor between solves",
+            description="Keep the reactor built by the uniform mesh converter between "
+            "global flux solves. Later solves then only update the state of its "
+            "assemblies, and only rebuild the assemblies whose axial mesh or structure "
+            "changed (e.g. after shuffling or axial expansion).",
+        ),
         setting.Setting(
             CONF_DETAILED_AXIAL_EXPANSION,
             default=False,
@@ -34,22 +34,55 @@ Storing a file to the cache::
 
     crc.store(exe, inp, outFiles)
 
+Content-addressed store
+-----------------------
+:py:class:`OutputCache` is a cache that can be shared by many processes and MPI ranks
+and that stays within a size limit::
+
+    cache = OutputCache(cacheDir, maxBytes=10 * 1024**3)
+    key = cache.getKey(exe, inpFiles)
+    if not cache.retrieve(key, runDir):
+        mc2.run(exe, inp, output)
+        cache.store(key, outFiles)
+
+Each output file is stored once, named by the hash of its contents, and is put back
+with a reflink or hard link where the file system allows instead of a copy. Which
+outputs belong to which run is kept in a SQLite manifest that also records when each
+run was last used, so the least recently used runs are evicted when the cache grows
+beyond its limit. Any :py:class:`~armi.physics.executers.DefaultExecuter` uses it when
+its ``outputCacheLocation`` option is set.
+
 Notes
 -----
 Could probably be, like, a decorate on subprocess but we call subprocess a bunch of
 different ways.
 """
 
+import contextlib
 import hashlib
 import json
 import os
 import shutil
+import sqlite3
 import subprocess
+import time
+import uuid
 
 from armi import runLog
 from armi.utils.pathTools import cleanPath
 
+try:
+    import fcntl
+except ImportError:
+    # not available on Windows, where files are hard linked or copied instead
+    fcntl = None
+
 MANIFEST_NAME = "CRC-manifest.json"
+SQLITE_MANIFEST_NAME = "CRC-manifest.sqlite"
+
+# ioctl request that clones the extents of one file into another on Linux
+_FICLONE = 0x40049409
+_CHUNK_SIZE = 1024 * 1024
 
 
 def retrieveOutput(exePath, inputPaths, cacheDir, locToRetrieveTo=None):
@@ -231,3 +264,325 @@ def cacheCall(
                 _getCachedFolder(executablePath, inputPaths, cacheDir), e
             )
         )
+
+
+def _reflink(src, dst):
+    """Make ``dst`` a copy-on-write clone of ``src``, if the file system supports it."""
+    if fcntl is None:
+        raise OSError("Reflinks are not supported on this platform")
+    with open(src, "rb") as srcF, open(dst, "wb") as dstF:
+        try:
+            fcntl.ioctl(dstF.fileno(), _FICLONE, srcF.fileno())
+        except OSError:
+            dstF.close()
+            os.remove(dst)
+            raise
+
+
+# ways of putting a stored file back, in order of preference. Hard links are left out
+# of "auto" because they share the read-only stored file, and the directory changers
+# copy its mode along with the outputs.
+LINK_MODES = {
+    "auto": (_reflink, shutil.copyfile),
+    "reflink": (_reflink, shutil.copyfile),
+    "hardlink": (os.link, shutil.copyfile),
+    "copy": (shutil.copyfile,),
+}
+
+# hashes of executables, by path, size and modification time
+_exeHashes = {}
+
+
+def _hashFile(path, hasher=None):
+    """Return a SHA-256 hash of a file's contents."""
+    hasher = hasher or hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _hashExecutable(exePath):
+    stat = os.stat(exePath)
+    key = (os.path.abspath(exePath), stat.st_size, stat.st_mtime_ns)
+    if key not in _exeHashes:
+        _exeHashes[key] = _hashFile(exePath)
+    return _exeHashes[key]
+
+
+class OutputCache:
+    """
+    A content-addressed cache of the outputs of external codes.
+
+    Parameters
+    ----------
+    cacheDir : str
+        Folder holding the cache. It is made if it does not exist.
+    maxBytes : int, optional
+        Limit on the total size of the stored files. When a store takes the cache
+        beyond it, the least recently used runs are evicted. Unlimited by default.
+    linkMode : str, optional
+        How stored files are put back, as a key of ``LINK_MODES``. By default, a
+        reflink is tried first, and then a copy. Stored files are read-only, so files
+        that are hard linked out of the cache cannot be changed in place.
+    verify : bool, optional
+        Check the hash of each file that is put back, evicting the run instead of
+        returning it if one does not match. Off by default.
+
+    Notes
+    -----
+    Stored files are only added, replaced or removed while holding the write lock of
+    the SQLite manifest, and a run is added to the manifest in one transaction after
+    all of its files are in place, so several processes can use one cache at the same
+    time. SQLite locking does not work on some network file systems, so the cache
+    should be on a local or cluster file system that supports POSIX locks.
+    """
+
+    def __init__(self, cacheDir, maxBytes=None, linkMode="auto", verify=False):
+        if linkMode not in LINK_MODES:
+            raise ValueError(
+                f"Unknown link mode `{linkMode}`. Choose from {list(LINK_MODES)}"
+            )
+        self.cacheDir = os.path.abspath(cacheDir)
+        self.maxBytes = maxBytes
+        self.verify = verify
+        self._linkers = LINK_MODES[linkMode]
+        self._blobDir = os.path.join(self.cacheDir, "blobs")
+        self._tmpDir = os.path.join(self.cacheDir, "tmp")
+        os.makedirs(self._blobDir, exist_ok=True)
+        os.makedirs(self._tmpDir, exist_ok=True)
+        self._dbPath = os.path.join(self.cacheDir, SQLITE_MANIFEST_NAME)
+        with self._transaction() as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS entries "
+                "(key TEXT PRIMARY KEY, label TEXT, created REAL, lastUsed REAL)"
+            )
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS files "
+                "(key TEXT, name TEXT, blob TEXT, PRIMARY KEY (key, name))"
+            )
+            db.execute("CREATE INDEX IF NOT EXISTS filesByBlob ON files (blob)")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS blobs (hash TEXT PRIMARY KEY, size INTEGER)"
+            )
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.cacheDir}>"
+
+    @contextlib.contextmanager
+    def _transaction(self, write=True):
+        """Open the manifest for one transaction, holding the write lock if writing."""
+        db = sqlite3.connect(self._dbPath, timeout=600.0, isolation_level=None)
+        try:
+            db.execute("BEGIN IMMEDIATE" if write else "BEGIN")
+            try:
+                yield db
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+            db.execute("COMMIT")
+        finally:
+            db.close()
+
+    def _getBlobPath(self, digest):
+        return os.path.join(self._blobDir, digest[:2], digest[2:])
+
+    def getKey(self, exePath, inputPaths, extra=""):
+        """
+        Return the key of a run of an executable on some inputs.
+
+        The key depends on the contents of the executable and of the inputs, and on the
+        names of the inputs, in order. ``extra`` can be used for anything else that
+        changes the outputs, like command line arguments.
+        """
+        hasher = hashlib.sha256()
+        hasher.update(extra.encode("utf-8"))
+        if exePath:
+            hasher.update(_hashExecutable(exePath).encode("utf-8"))
+        for path in inputPaths:
+            hasher.update(os.path.basename(path).encode("utf-8"))
+            hasher.update(_hashFile(path).encode("utf-8"))
+        return hasher.hexdigest()
+
+    def store(self, key, outputPaths, label=""):
+        """
+        Store the outputs of a run.
+
+        Outputs that do not exist are skipped, so ``outputPaths`` may be a greedy list.
+        Files are stored under their base names.
+        """
+        staged = []
+        try:
+            for path in outputPaths:
+                if os.path.exists(path):
+                    staged.append((os.path.basename(path),) + self._stage(path))
+
+            now = time.time()
+            with self._transaction() as db:
+                for _name, digest, size, tmpPath in staged:
+                    blobPath = self._getBlobPath(digest)
+                    if os.path.exists(blobPath):
+                        os.remove(tmpPath)
+                    else:
+                        os.makedirs(os.path.dirname(blobPath), exist_ok=True)
+                        os.chmod(tmpPath, 0o444)
+                        os.replace(tmpPath, blobPath)
+                    db.execute(
+                        "INSERT OR IGNORE INTO blobs VALUES (?, ?)", (digest, size)
+                    )
+                db.execute("DELETE FROM files WHERE key = ?", (key,))
+                db.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                    (key, label, now, now),
+                )
+                db.executemany(
+                    "INSERT INTO files VALUES (?, ?, ?)",
+                    [(key, name, digest) for name, digest, _size, _tmp in staged],
+                )
+        finally:
+            for _name, _digest, _size, tmpPath in staged:
+                if os.path.exists(tmpPath):
+                    os.remove(tmpPath)
+
+        runLog.info(f"Added {len(staged)} outputs for {label or key} to {self}")
+        if self.maxBytes is not None:
+            self.evict(self.maxBytes)
+
+    def _stage(self, path):
+        """Copy a file into the cache under a temporary name, hashing it on the way."""
+        tmpPath = os.path.join(self._tmpDir, uuid.uuid4().hex)
+        hasher = hashlib.sha256()
+        size = 0
+        with open(path, "rb") as src, open(tmpPath, "wb") as dst:
+            for chunk in iter(lambda: src.read(_CHUNK_SIZE), b""):
+                hasher.update(chunk)
+                dst.write(chunk)
+                size += len(chunk)
+        return hasher.hexdigest(), size, tmpPath
+
+    def retrieve(self, key, destination):
+        """
+        Put the stored outputs of a run into a folder.
+
+        Returns
+        -------
+        bool
+            Whether the run was found and all of its outputs were put back.
+        """
+        with self._transaction(write=False) as db:
+            files = db.execute(
+                "SELECT name, blob FROM files WHERE key = ?", (key,)
+            ).fetchall()
+            found = (
+                bool(files)
+                or db.execute("SELECT 1 FROM entries WHERE key = ?", (key,)).fetchone()
+            )
+        if not found:
+            return False
+
+        placed = []
+        try:
+            for name, digest in files:
+                path = os.path.join(destination, name)
+                self._place(self._getBlobPath(digest), path)
+                placed.append(path)
+                if self.verify and _hashFile(path) != digest:
+                    raise ValueError(f"{path} does not match its hash in {self}")
+        except (OSError, ValueError) as e:
+            runLog.warning(
+                f"Failed to retrieve cached outputs for {key} from {self}: {e}. "
+                "Evicting them."
+            )
+            for path in placed:
+                os.remove(path)
+            self.forget(key)
+            return False
+
+        with self._transaction() as db:
+            db.execute(
+                "UPDATE entries SET lastUsed = ? WHERE key = ?", (time.time(), key)
+            )
+        return True
+
+    def _place(self, blobPath, path):
+        """Put a stored file at a path, replacing anything that is there."""
+        tmpPath = f"{path}.{uuid.uuid4().hex[:8]}.tmp"
+        try:
+            for linker in self._linkers:
+                try:
+                    linker(blobPath, tmpPath)
+                    break
+                except FileNotFoundError:
+                    raise
+                except OSError:
+                    if linker is self._linkers[-1]:
+                        raise
+            os.replace(tmpPath, path)
+        finally:
+            if os.path.exists(tmpPath):
+                os.remove(tmpPath)
+
+    def forget(self, key):
+        """Remove a run from the cache."""
+        with self._transaction() as db:
+            self._removeEntry(db, key)
+
+    def evict(self, maxBytes):
+        """
+        Remove the least recently used runs until the stored files fit in a size.
+
+        Returns
+        -------
+        int
+            The number of runs removed.
+        """
+        with self._transaction() as db:
+            total = db.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+            if total <= maxBytes:
+                return 0
+            keys = [
+                k for (k,) in db.execute("SELECT key FROM entries ORDER BY lastUsed")
+            ]
+            numRemoved = 0
+            for key in keys:
+                total -= self._removeEntry(db, key)
+                numRemoved += 1
+                if total <= maxBytes:
+                    break
+
+        runLog.info(f"Evicted {numRemoved} runs from {self}")
+        return numRemoved
+
+    def _removeEntry(self, db, key):
+        """Remove a run and any stored files that no other run uses, returning their size."""
+        digests = [
+            d for (d,) in db.execute("SELECT blob FROM files WHERE key = ?", (key,))
+        ]
+        db.execute("DELETE FROM files WHERE key = ?", (key,))
+        db.execute("DELETE FROM entries WHERE key = ?", (key,))
+        freed = 0
+        for digest in set(digests):
+            if db.execute(
+                "SELECT 1 FROM files WHERE blob = ? LIMIT 1", (digest,)
+            ).fetchone():
+                continue
+            row = db.execute(
+                "SELECT size FROM blobs WHERE hash = ?", (digest,)
+            ).fetchone()
+            db.execute("DELETE FROM blobs WHERE hash = ?", (digest,))
+            freed += row[0] if row else 0
+            blobPath = self._getBlobPath(digest)
+            with contextlib.suppress(FileNotFoundError):
+                # read-only files cannot be removed on Windows
+                os.chmod(blobPath, 0o644)
+                os.remove(blobPath)
+        return freed
+
+    def getSize(self):
+        """Return the total size of the stored files, in bytes."""
+        with self._transaction(write=False) as db:
+            return db.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+
+    def __len__(self):
+        with self._transaction(write=False) as db:
+            return db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
@@ -12,7 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Tests of the output cache tools."""
+from concurrent import futures
+import hashlib
 import os
+import stat
 import time
 import unittest
 
@@ -127,3 +130,125 @@ class TestOutputCache(unittest.TestCase):
                 fakeExe, inputPaths, cacheDir, newFolder
             )
             self.assertFalse(result)
+
+
+class TestContentAddressedCache(unittest.TestCase):
+    def setUp(self):
+        self.td = directoryChangers.TemporaryDirectoryChanger(dumpOnException=False)
+        self.td.__enter__()
+        self.addCleanup(self.td.__exit__, None, None, None)
+        self.cache = outputCache.OutputCache("Output_Cache")
+        for name, text in [("a.inp", "input a"), ("b.inp", "input b")]:
+            with open(name, "w") as f:
+                f.write(text)
+        os.mkdir("run")
+
+    @staticmethod
+    def _write(name, text):
+        with open(name, "w") as f:
+            f.write(text)
+        return name
+
+    def test_storeAndRetrieve(self):
+        key = self.cache.getKey(None, ["a.inp"])
+        self.assertFalse(self.cache.retrieve(key, "run"))
+
+        outputs = [self._write("x.out", "x" * 10), self._write("y.out", "y" * 20)]
+        self.cache.store(key, outputs + ["missing.out"], label="a")
+        self.assertEqual(len(self.cache), 1)
+        self.assertEqual(self.cache.getSize(), 30)
+
+        self.assertTrue(self.cache.retrieve(key, "run"))
+        self.assertEqual(sorted(os.listdir("run")), ["x.out", "y.out"])
+        with open(os.path.join("run", "y.out")) as f:
+            self.assertEqual(f.read(), "y" * 20)
+
+        # identical outputs of another run are only stored once
+        otherKey = self.cache.getKey(None, ["b.inp"])
+        self.assertNotEqual(key, otherKey)
+        self.cache.store(otherKey, outputs)
+        self.assertEqual(len(self.cache), 2)
+        self.assertEqual(self.cache.getSize(), 30)
+
+        # and are kept until neither run uses them
+        self.cache.forget(key)
+        self.assertEqual(self.cache.getSize(), 30)
+        self.cache.forget(otherKey)
+        self.assertEqual(self.cache.getSize(), 0)
+        self.assertFalse(self.cache.retrieve(otherKey, "run"))
+
+    def test_getKey(self):
+        key = self.cache.getKey("a.inp", ["b.inp"])
+        self.assertEqual(key, self.cache.getKey("a.inp", ["b.inp"]))
+        self.assertNotEqual(key, self.cache.getKey("a.inp", ["b.inp"], extra="-v"))
+        self.assertNotEqual(key, self.cache.getKey("b.inp", ["a.inp"]))
+        os.rename("b.inp", "c.inp")
+        self.assertNotEqual(key, self.cache.getKey("a.inp", ["c.inp"]))
+
+    def test_evict(self):
+        keys = []
+        for i in range(4):
+            keys.append(f"key{i}")
+            self.cache.store(keys[-1], [self._write("out", str(i) * 100)])
+            time.sleep(0.01)
+
+        # using a run makes it the most recently used
+        self.assertTrue(self.cache.retrieve(keys[0], "run"))
+        self.assertEqual(self.cache.evict(250), 2)
+        self.assertTrue(self.cache.retrieve(keys[0], "run"))
+        self.assertFalse(self.cache.retrieve(keys[1], "run"))
+        self.assertFalse(self.cache.retrieve(keys[2], "run"))
+        self.assertTrue(self.cache.retrieve(keys[3], "run"))
+
+        limited = outputCache.OutputCache("Output_Cache", maxBytes=100)
+        limited.store("key4", [self._write("out", "4" * 100)])
+        self.assertEqual(len(limited), 1)
+
+    def test_corruptedOutputs(self):
+        self.cache.store("key", [self._write("out", "good")])
+        blob = self.cache._getBlobPath(hashlib.sha256(b"good").hexdigest())
+        os.chmod(blob, 0o644)
+        with open(blob, "w") as f:
+            f.write("bad")
+        # outputs are only checked on request
+        self.assertTrue(self.cache.retrieve("key", "run"))
+        os.remove(os.path.join("run", "out"))
+
+        verifying = outputCache.OutputCache("Output_Cache", verify=True)
+        self.assertFalse(verifying.retrieve("key", "run"))
+        self.assertEqual(os.listdir("run"), [])
+        self.assertEqual(len(self.cache), 0)
+
+    def test_linkModes(self):
+        self.cache.store("key", [self._write("out", "text")])
+        blob = self.cache._getBlobPath(hashlib.sha256(b"text").hexdigest())
+        self.assertEqual(stat.S_IMODE(os.stat(blob).st_mode) & 0o222, 0)
+        for mode in outputCache.LINK_MODES:
+            cache = outputCache.OutputCache("Output_Cache", linkMode=mode)
+            self.assertTrue(cache.retrieve("key", "run"))
+            placed = os.path.join("run", "out")
+            with open(placed) as f:
+                self.assertEqual(f.read(), "text")
+            # only hard links share the read-only stored file
+            sharesBlob = os.path.samefile(placed, blob)
+            self.assertEqual(sharesBlob, mode == "hardlink")
+            writable = bool(stat.S_IMODE(os.stat(placed).st_mode) & 0o200)
+            self.assertNotEqual(writable, sharesBlob)
+        with self.assertRaises(ValueError):
+            outputCache.OutputCache("Output_Cache", linkMode="teleport")
+
+    def test_concurrentUse(self):
+        def work(i):
+            cache = outputCache.OutputCache("Output_Cache")
+            name = self._write(f"out{i}", str(i % 3))
+            for _ in range(5):
+                cache.store(f"key{i % 4}", [name])
+                dest = os.path.join("run", str(i))
+                os.makedirs(dest, exist_ok=True)
+                self.assertTrue(cache.retrieve(f"key{i % 4}", dest))
+
+        with futures.ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(work, range(8)))
+        self.assertEqual(len(self.cache), 4)
+        self.assertEqual(self.cache.getSize(), 3)
+        self.assertEqual(os.listdir(os.path.join("Output_Cache", "tmp")), [])